@@ -1,12 +1,17 @@
+import argparse
 import os
-import requests
-from PIL import Image
-from io import BytesIO
 import json
+import re
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
 
-# Create directories for training data
-os.makedirs("InsectDataset", exist_ok=True)
-for insect in [
+from blob_store import BLOB_DIR, BlobStore
+from dataset_manifest import MANIFEST_DIR, Manifest
+from downloader import MAX_CONCURRENCY, Downloader
+from pipeline_profile import add_profile_argument, profiling, stage
+from preprocess_images import INPUT_SIZE, preprocess_image
+
+INSECTS = [
     "Bumblebee",
     "Honey Bee",
     "Ladybird",
@@ -17,49 +22,324 @@ for insect in [
     "Ant",
     "Fly",
     "Mosquito"
-]:
+]
+
+# iNaturalist API endpoint for observations
+OBSERVATIONS_URL = "https://api.inaturalist.org/v1/observations"
+
+# Photo rendition to download: the API's "url" is the 75x75 "square" one, "medium" is up to 500px
+PHOTO_SIZE = "medium"
+
+# Observations per API page (the API's maximum)
+PAGE_SIZE = 200
+
+# Download attempts (one per run) before a photo is skipped for good
+MAX_PHOTO_ATTEMPTS = 3
+
+# Saved observations re-checked per API request when syncing
+ID_BATCH_SIZE = 200
+
+# Days between full re-checks of every saved id (other syncs only ask for observations updated since the last)
+FULL_CHECK_DAYS = 7
+
+# Create directories for training data
+os.makedirs("InsectDataset", exist_ok=True)
+for insect in INSECTS:
     os.makedirs(f"InsectDataset/{insect}", exist_ok=True)
 
-# Function to download images from iNaturalist API
-def download_insect_images(insect_name, count=100):
-    # iNaturalist API endpoint for observations
-    url = f"https://api.inaturalist.org/v1/observations"
+# Function to fetch one page of an insect's observations, in id order after the cursor
+def fetch_observations_page(downloader, insect_name, id_above=0):
     params = {
         "taxon_name": insect_name,
         "quality_grade": "research",
         "has_photos": "true",
-        "per_page": count
+        "per_page": PAGE_SIZE,
+        "order_by": "id",
+        "order": "asc",
+        "id_above": id_above
     }
-    
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        for i, obs in enumerate(data.get("results", [])):
-            if "photos" in obs and obs["photos"]:
-                photo_url = obs["photos"][0]["url"]
-                try:
-                    img_response = requests.get(photo_url)
-                    if img_response.status_code == 200:
-                        img = Image.open(BytesIO(img_response.content))
-                        # Save image
-                        img.save(f"InsectDataset/{insect_name}/{i}.jpg")
-                except Exception as e:
-                    print(f"Error downloading image for {insect_name}: {e}")
-
-# Download images for each insect
-for insect in [
-    "Bumblebee",
-    "Honey Bee",
-    "Ladybird",
-    "Butterfly",
-    "Dragonfly",
-    "Moth",
-    "Wasp",
-    "Ant",
-    "Fly",
-    "Mosquito"
-]:
-    print(f"Downloading images for {insect}...")
-    download_insect_images(insect)
 
-print("Dataset preparation complete!") 
\ No newline at end of file
+    return downloader.get_json(OBSERVATIONS_URL, params).get("results", [])
+
+# Function to get the URL of an observation's photo at PHOTO_SIZE, large enough to preprocess to INPUT_SIZE
+def photo_url(obs):
+    return re.sub(r"/square(?=\.\w+(?:\?|$))", f"/{PHOTO_SIZE}", obs["photos"][0]["url"])
+
+# Function to fetch saved observations by id, optionally only those updated since a time (deleted ones are simply not returned)
+def fetch_observations_by_id(downloader, observation_ids, since=None):
+    params = {
+        "id": ",".join(str(observation_id) for observation_id in observation_ids),
+        "per_page": ID_BATCH_SIZE
+    }
+    if since:
+        params["updated_since"] = since
+
+    return downloader.get_json(OBSERVATIONS_URL, params).get("results", [])
+
+def photo_still_valid(obs):
+    return obs.get("quality_grade") == "research" and bool(obs.get("photos"))
+
+# Function to decide whether a class's next sync must re-check every saved id
+def needs_full_check(manifest, now):
+    if not manifest.synced_at or not manifest.checked_at:
+        return True
+    return now - datetime.fromisoformat(manifest.checked_at) >= timedelta(days=FULL_CHECK_DAYS)
+
+# Function to bring the saved images up to date with iNaturalist
+def sync_insect_images(downloader, pool, store, insect_names, full=False):
+    """
+    Look up the observations already saved for each class, in batches of ids:
+    photos that were replaced are fetched again, and images whose
+    observations lost their photos or are no longer research grade are
+    removed. Usually only observations updated since the last sync are
+    returned; every FULL_CHECK_DAYS days (or with full) every saved id is
+    re-checked, which is the only way to notice deleted observations (they
+    are no longer returned). A batch that fails is left as it is and checked
+    again by the next sync.
+    """
+    now = datetime.now(timezone.utc)
+    started = now.isoformat(timespec="seconds")
+    manifests = {name: Manifest(name) for name in insect_names}
+    # Class -> updated_since of its lookups (None for a full re-check)
+    since = {name: None if full or needs_full_check(manifest, now) else manifest.synced_at
+             for name, manifest in manifests.items()}
+    failed = set()
+    refetch = []
+    prune = []
+
+    with stage("observations API"):
+        batches = []
+        for name, manifest in manifests.items():
+            ids = sorted(manifest.entries)
+            batches.extend((name, ids[i:i + ID_BATCH_SIZE]) for i in range(0, len(ids), ID_BATCH_SIZE))
+
+        for (name, ids), observations, error in downloader.map(
+                lambda batch: fetch_observations_by_id(downloader, batch[1], since[batch[0]]), batches):
+            if not error and not observations and not since[name]:
+                # More likely an API hiccup than a whole batch deleted at once
+                error = "no observations returned"
+            if error:
+                print(f"Error re-checking observations for {name}: {error}")
+                failed.add(name)
+                continue
+            manifest = manifests[name]
+            found = set()
+            for obs in observations:
+                found.add(obs["id"])
+                entry = manifest.entries.get(obs["id"])
+                if entry is None:
+                    continue
+                if not photo_still_valid(obs):
+                    prune.append((name, obs["id"]))
+                elif obs["photos"][0].get("id") != entry["photo"]:
+                    refetch.append((name, obs))
+                elif obs.get("updated_at") != entry["updated_at"]:
+                    manifest.add(obs["id"], entry["photo"], obs.get("updated_at"), entry["file"], entry.get("sha256"))
+            if not since[name]:
+                # In a full re-check every saved observation is returned unless it was deleted
+                prune.extend((name, observation_id) for observation_id in ids if observation_id not in found)
+
+    with stage("download images"):
+        # Preprocess each photo in the process pool as soon as it arrives
+        processing = []
+        for (name, obs), content, error in downloader.map(
+                lambda item: downloader.fetch(photo_url(item[1])), refetch):
+            if error:
+                print(f"Error downloading image for {name}: {error}")
+                failed.add(name)
+                continue
+            processing.append((name, obs, pool.submit(preprocess_image, content)))
+
+        for name, obs, future in processing:
+            manifest = manifests[name]
+            try:
+                image = future.result()
+                path = manifest.entries[obs["id"]]["file"]
+                # A new blob, relinked into place: the old image may be shared with other layouts
+                digest = store.save(image, path)
+                manifest.add(obs["id"], obs["photos"][0].get("id"), obs.get("updated_at"), path, digest)
+            except Exception as e:
+                print(f"Error preprocessing image for {name}: {e}")
+                failed.add(name)
+
+    for name, observation_id in prune:
+        manifest = manifests[name]
+        entry = manifest.entries.get(observation_id)
+        if entry is None:
+            continue
+        if os.path.exists(entry["file"]):
+            os.remove(entry["file"])
+        manifest.remove(observation_id)
+
+    for name, manifest in manifests.items():
+        print(f"{name}: {sum(1 for n, _ in refetch if n == name)} photos updated, "
+              f"{manifest.removed} images removed, {len(manifest)} images"
+              f"{'' if since[name] else ' (full re-check)'}"
+              f"{' (sync incomplete, will retry)' if name in failed else ''}")
+        manifest.close()
+        if name not in failed:
+            manifest.synced_at = started
+            if not since[name]:
+                manifest.checked_at = started
+
+class ClassHarvest:
+    """Cursor and progress of one insect class."""
+
+    def __init__(self, insect_name, target):
+        self.insect_name = insect_name
+        self.target = target
+        self.manifest = Manifest(insect_name)
+        self.cursor = self.manifest.resume_cursor
+        self.in_flight = 0
+        self.page_pending = False
+        self.exhausted = False
+
+    @property
+    def wanted(self):
+        """Photos still to queue to reach the target."""
+        return self.target - len(self.manifest) - self.in_flight
+
+# Function to download images for all insects at once from iNaturalist
+def download_insect_images(downloader, pool, store, insect_names, count=100):
+    """
+    Page through each insect's observations with an id_above cursor until the
+    class has `count` images, downloading photos while the next pages load
+    and preprocessing them in the process pool while more download.
+    Observations already in the manifest are never fetched again; photos
+    that fail are retried on later runs, up to MAX_PHOTO_ATTEMPTS times.
+    """
+    harvests = [ClassHarvest(name, count) for name in insect_names]
+    pending = {}
+
+    def photo_failed(harvest, obs, action, error):
+        # The photo stays pending, so the next run resumes from it, until it has failed too often
+        manifest = harvest.manifest
+        if manifest.pending.get(obs["id"], 0) >= MAX_PHOTO_ATTEMPTS:
+            manifest.skip(obs["id"])
+            print(f"Error {action} image for {harvest.insect_name}: {error} (giving up on observation {obs['id']})")
+        else:
+            print(f"Error {action} image for {harvest.insect_name}: {error} (will retry next run)")
+
+    def request_page(harvest):
+        harvest.page_pending = True
+        future = downloader.submit(fetch_observations_page, downloader, harvest.insect_name, harvest.cursor)
+        pending[future] = ("page", harvest, harvest.cursor)
+
+    for harvest in harvests:
+        print(f"{harvest.insect_name}: {len(harvest.manifest)} images already saved, target {count}")
+        if harvest.wanted > 0:
+            request_page(harvest)
+
+    with stage("harvest"):
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, harvest, obs = pending.pop(future)
+                insect_name = harvest.insect_name
+
+                if kind == "page":
+                    # A page of observations after the cursor in obs: queue their photos
+                    after = obs
+                    harvest.page_pending = False
+                    try:
+                        observations = future.result()
+                    except Exception as e:
+                        print(f"Error fetching observations for {insect_name}: {e}")
+                        continue
+                    for obs in observations:
+                        if harvest.wanted <= 0:
+                            break
+                        harvest.cursor = obs["id"]
+                        if obs["id"] in harvest.manifest or obs["id"] in harvest.manifest.skipped or not obs.get("photos"):
+                            continue
+                        harvest.manifest.mark_pending(obs["id"])
+                        harvest.in_flight += 1
+                        pending[downloader.submit(downloader.fetch, photo_url(obs))] = ("photo", harvest, obs)
+                    else:
+                        # A short page is the last one
+                        harvest.exhausted = len(observations) < PAGE_SIZE
+                    # Pending photos the page went past without returning (deleted, downgraded or photo removed)
+                    upto = float("inf") if harvest.exhausted else harvest.cursor
+                    returned = {obs["id"] for obs in observations if obs.get("photos")}
+                    gone = [i for i in harvest.manifest.pending if after < i <= upto and i not in returned]
+                    for observation_id in gone:
+                        harvest.manifest.skip(observation_id)
+                        print(f"Observation {observation_id} for {insect_name} is no longer available, skipping it")
+                elif kind == "photo":
+                    # A downloaded photo: resize it in the process pool
+                    try:
+                        content = future.result()
+                        pending[pool.submit(preprocess_image, content)] = ("image", harvest, obs)
+                    except Exception as e:
+                        harvest.in_flight -= 1
+                        photo_failed(harvest, obs, "downloading", e)
+                else:
+                    # A preprocessed image: save it and record it in the manifest
+                    harvest.in_flight -= 1
+                    try:
+                        image = future.result()
+                        path = f"InsectDataset/{insect_name}/{obs['id']}.jpg"
+                        # Save image to the blob store, linked into the class folder
+                        digest = store.save(image, path)
+                        harvest.manifest.add(obs["id"], obs["photos"][0].get("id"), obs.get("updated_at"), path,
+                                             digest)
+                    except Exception as e:
+                        photo_failed(harvest, obs, "preprocessing", e)
+
+                # Keep one page request ahead while the class still needs images
+                if harvest.wanted > 0 and not harvest.page_pending and not harvest.exhausted:
+                    request_page(harvest)
+
+    for harvest in harvests:
+        harvest.manifest.close()
+        print(f"{harvest.insect_name}: {len(harvest.manifest)} images"
+              f"{' (no more observations)' if len(harvest.manifest) < count and harvest.exhausted else ''}")
+
+# Function to record the class folders as a layout in the blob store
+def save_dataset_layout(store, insect_names):
+    """
+    Write blobs/layouts/InsectDataset.json from the class folders. Images
+    whose manifest entry has their digest and that already link to the blob
+    are not re-hashed; older images are hard-linked into the store.
+    """
+    known = {}
+    for name in insect_names:
+        for entry in Manifest(name).entries.values():
+            if entry.get("sha256"):
+                known[entry["file"]] = entry["sha256"]
+    with stage("blob store"):
+        layout = store.ingest_tree("InsectDataset", known)
+        store.write_layout("InsectDataset", layout)
+    print(f"Saved layout InsectDataset to {BLOB_DIR}/ ({len(layout)} images, {len(set(layout.values()))} distinct)")
+
+# Guarded so the worker processes that preprocess images can import this file without re-running it
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Download insect photos from iNaturalist for training")
+    parser.add_argument("--count", type=int, default=100,
+                        help="Images to have per insect; later runs only fetch the missing ones (default: %(default)s)")
+    parser.add_argument("--sync", action="store_true",
+                        help="First update or remove the images already saved to match iNaturalist, then top up")
+    parser.add_argument("--full-sync", action="store_true",
+                        help=f"With --sync, re-check every saved observation to find deleted ones "
+                             f"(done anyway every {FULL_CHECK_DAYS} days)")
+    parser.add_argument("--workers", type=int, default=MAX_CONCURRENCY,
+                        help="Downloads in flight at once (default: %(default)s)")
+    parser.add_argument("--processes", type=int,
+                        help="Processes resizing images to the classifier's input size (default: one per CPU)")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiling("PrepareDataset", args.profile):
+        # Download images for every insect on one pool, resuming from manifests/
+        print(f"Downloading images for {len(INSECTS)} insects (progress in {MANIFEST_DIR}/)...")
+        print(f"Images are resized to {INPUT_SIZE}x{INPUT_SIZE} (earlier images: python preprocess_images.py)")
+        with Downloader(args.workers) as downloader, ProcessPoolExecutor(args.processes) as pool:
+            store = BlobStore()
+            if args.sync:
+                sync_insect_images(downloader, pool, store, INSECTS, args.full_sync)
+            download_insect_images(downloader, pool, store, INSECTS, args.count)
+            downloader.print_report()
+        save_dataset_layout(store, INSECTS)
+
+    print("Dataset preparation complete!")
+    print("To update the app's copy: python blob_store.py materialize InsectDataset InsectIdentifier/InsectDataset")
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Content-addressed storage for the dataset images.
+Every image is stored once in blobs/objects/, named by the SHA-256 of its
+bytes. A layout (blobs/layouts/<name>.json) maps each class-folder path,
+e.g. "Ant/123.jpg", to a blob. The InsectDataset folders that Create ML's
+labeledDirectories reads are hard links to the blobs, so the dataset trees
+and any variants share storage, and a layout can be rebuilt without copying.
+Blobs are read-only and are never changed in place: an image is updated by
+storing the new bytes and relinking the file.
+"""
+
+import argparse
+import errno
+import hashlib
+import json
+import os
+import shutil
+import stat
+import tempfile
+from typing import Dict, Optional
+
+from dataset_manifest import write_atomic
+
+BLOB_DIR = 'blobs'
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+# How materialized files point at their blobs
+LINK_MODES = ('hardlink', 'symlink', 'copy')
+
+# Bytes read at a time when hashing a file
+HASH_CHUNK_SIZE = 1 << 20
+
+Layout = Dict[str, str]
+
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def link_or_copy(source: str, target: str, mode: str = 'hardlink') -> bool:
+    """Create target pointing at source; returns False if it had to be copied (e.g. across filesystems)."""
+    if mode == 'symlink':
+        os.symlink(os.path.relpath(source, os.path.dirname(target) or '.'), target)
+        return True
+    if mode == 'hardlink':
+        try:
+            os.link(source, target)
+            return True
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                raise
+    shutil.copyfile(source, target)
+    return False
+
+
+def replace_with_link(source: str, target: str) -> bool:
+    """Atomically replace target with a hard link to source (or a copy, if linking is not possible)."""
+    directory = os.path.dirname(target) or '.'
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, f".{os.path.basename(target)}.tmp")
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    linked = link_or_copy(source, tmp_path)
+    os.replace(tmp_path, target)
+    return linked
+
+
+class BlobStore:
+    """Images stored once by SHA-256, plus named layouts of class folders built from them."""
+
+    def __init__(self, directory: str = BLOB_DIR):
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, 'objects')
+        self.layouts_dir = os.path.join(directory, 'layouts')
+
+    def path(self, digest: str, extension: str = '.jpg') -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest + extension)
+
+    def __contains__(self, digest: str):
+        return os.path.exists(self.path(digest))
+
+    def put_bytes(self, data: bytes, extension: str = '.jpg') -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest, extension)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(tmp_path, path)
+        return digest
+
+    def save(self, data: bytes, target: str) -> str:
+        """Store the bytes and (re)point target at them; returns the digest."""
+        extension = os.path.splitext(target)[1].lower() or '.jpg'
+        digest = self.put_bytes(data, extension)
+        replace_with_link(self.path(digest, extension), target)
+        return digest
+
+    def put_file(self, path: str) -> str:
+        """
+        Add an existing image to the store. A new image becomes the blob
+        itself (hard-linked, so nothing is copied); a copy of an image already
+        stored is replaced with a link to the stored blob, freeing its space.
+        """
+        extension = os.path.splitext(path)[1].lower()
+        digest = file_digest(path)
+        blob = self.path(digest, extension)
+        if not os.path.exists(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            link_or_copy(path, blob)
+            os.chmod(blob, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        elif not os.path.samefile(path, blob):
+            replace_with_link(blob, path)
+        return digest
+
+    def ingest_tree(self, root: str, known: Optional[Dict[str, str]] = None) -> Layout:
+        """
+        Layout of a class-folder tree, adding its images to the store. Paths in
+        `known` (path -> digest) that already link to their blob are not re-hashed.
+        """
+        known = known or {}
+        layout = {}
+        for label in sorted(os.listdir(root)):
+            folder = os.path.join(root, label)
+            if not os.path.isdir(folder):
+                continue
+            for name in sorted(os.listdir(folder)):
+                if not name.lower().endswith(IMAGE_EXTENSIONS):
+                    continue
+                path = os.path.join(folder, name)
+                digest = known.get(path)
+                blob = digest and self.path(digest, os.path.splitext(name)[1].lower())
+                if not (blob and os.path.exists(blob) and os.path.samefile(path, blob)):
+                    digest = self.put_file(path)
+                layout[f"{label}/{name}"] = digest
+        return layout
+
+    def layout_path(self, name: str) -> str:
+        return os.path.join(self.layouts_dir, f"{name.replace(os.sep, '_')}.json")
+
+    def layouts(self) -> Dict[str, Layout]:
+        if not os.path.isdir(self.layouts_dir):
+            return {}
+        result = {}
+        for file_name in sorted(os.listdir(self.layouts_dir)):
+            if file_name.endswith('.json'):
+                with open(os.path.join(self.layouts_dir, file_name), 'r', encoding='utf-8') as f:
+                    result[file_name[:-len('.json')]] = json.load(f)
+        return result
+
+    def load_layout(self, name: str) -> Layout:
+        with open(self.layout_path(name), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def write_layout(self, name: str, layout: Layout):
+        write_atomic(self.layout_path(name), json.dumps(layout, indent=1, sort_keys=True))
+
+    def materialize(self, layout: Layout, target: str, mode: str = 'hardlink') -> int:
+        """
+        Build the class folders for a layout at target, replacing what is
+        there only once the new tree is complete. Returns the number of files
+        that had to be copied rather than linked.
+        """
+        building = target.rstrip(os.sep) + '.building'
+        if os.path.lexists(building):
+            shutil.rmtree(building)
+        copied = 0
+        for relative_path, digest in sorted(layout.items()):
+            path = os.path.join(building, *relative_path.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            blob = os.path.abspath(self.path(digest, os.path.splitext(path)[1].lower()))
+            if not link_or_copy(blob, path, mode):
+                copied += 1
+
+        old = target.rstrip(os.sep) + '.old'
+        if os.path.lexists(old):
+            shutil.rmtree(old)
+        if os.path.lexists(target):
+            os.replace(target, old)
+        os.replace(building, target)
+        if os.path.lexists(old):
+            shutil.rmtree(old)
+        return copied
+
+    def blobs(self):
+        """(path, size, links) of every stored blob."""
+        if not os.path.isdir(self.objects_dir):
+            return
+        for prefix in os.listdir(self.objects_dir):
+            folder = os.path.join(self.objects_dir, prefix)
+            for name in os.listdir(folder):
+                path = os.path.join(folder, name)
+                info = os.stat(path)
+                yield path, info.st_size, info.st_nlink
+
+    def collect_garbage(self) -> int:
+        """Delete blobs that no layout refers to and no dataset file links to; returns the number removed."""
+        referenced = {digest for layout in self.layouts().values() for digest in layout.values()}
+        removed = 0
+        for path, _, links in list(self.blobs()):
+            digest = os.path.splitext(os.path.basename(path))[0]
+            if digest not in referenced and links == 1:
+                os.remove(path)
+                removed += 1
+        return removed
+
+
+def print_status(store: BlobStore):
+    count = total = 0
+    for _, size, _ in store.blobs():
+        count += 1
+        total += size
+    print(f"{count} images, {total / 1e6:.1f} MB in {store.objects_dir}")
+    for name, layout in store.layouts().items():
+        print(f"  {name}: {len(layout)} files, {len(set(layout.values()))} distinct images")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Content-addressed storage for the insect dataset images")
+    parser.add_argument("--store", default=BLOB_DIR, help="Blob store folder (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="Add a class-folder tree to the store and save its layout")
+    ingest.add_argument("root", help="Dataset folder with one sub-folder per class")
+    ingest.add_argument("--name", help="Layout name (default: the folder path)")
+
+    materialize = commands.add_parser("materialize", help="Build the class folders of a saved layout")
+    materialize.add_argument("name", help="Layout name")
+    materialize.add_argument("target", help="Folder to build (replaced once complete)")
+    materialize.add_argument("--mode", choices=LINK_MODES, default="hardlink",
+                             help="How files point at the store (default: %(default)s)")
+
+    commands.add_parser("status", help="Show stored images and layouts")
+    commands.add_parser("gc", help="Delete images no layout or dataset file uses")
+    args = parser.parse_args()
+
+    store = BlobStore(args.store)
+    if args.command == "ingest":
+        name = args.name or args.root
+        layout = store.ingest_tree(args.root)
+        store.write_layout(name, layout)
+        print(f"Saved layout {name}: {len(layout)} files, {len(set(layout.values()))} distinct images")
+    elif args.command == "materialize":
+        layout = store.load_layout(args.name)
+        copied = store.materialize(layout, args.target, args.mode)
+        print(f"Built {args.target} from {args.name}: {len(layout)} files ({copied} copied)")
+    elif args.command == "status":
+        print_status(store)
+    elif args.command == "gc":
+        print(f"Removed {store.collect_garbage()} unused images")
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+On-disk record of the iNaturalist observations already saved for each insect
+class, one JSON object per line in manifests/<class>.jsonl. Lines are appended
+and flushed as each image is saved, so an interrupted harvest resumes after
+the last observation it completed instead of starting again. Photos are
+marked pending before they are downloaded, so ones that failed or were cut
+off by an interruption are fetched again on the next run. Removed
+observations are appended as tombstones and dropped when the file is compacted;
+the times of the last sync and of the last full re-check are kept in
+manifests/<class>.state.json.
+"""
+
+import json
+import os
+import tempfile
+from typing import Dict, Optional, Set
+
+MANIFEST_DIR = 'manifests'
+
+
+class Manifest:
+    """Observation id -> {observation, photo, updated_at, file, sha256} for one class."""
+
+    def __init__(self, name: str, directory: str = MANIFEST_DIR):
+        self.name = name
+        self.path = os.path.join(directory, f"{name}.jsonl")
+        self.state_path = os.path.join(directory, f"{name}.state.json")
+        self.entries: Dict[int, dict] = {}
+        # Observation id -> download attempts, for photos not saved yet; ids given up on
+        self.pending: Dict[int, int] = {}
+        self.skipped: Set[int] = set()
+        self.file = None
+        self.removed = 0
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Half-written last line from an interrupted run
+                        continue
+                    observation_id = entry['observation']
+                    if entry.get('pending'):
+                        self.pending[observation_id] = self.pending.get(observation_id, 0) + entry.get('attempts', 1)
+                        continue
+                    self.pending.pop(observation_id, None)
+                    if entry.get('skipped'):
+                        self.skipped.add(observation_id)
+                    elif entry.get('removed'):
+                        self.entries.pop(observation_id, None)
+                        self.removed += 1
+                    else:
+                        self.entries[observation_id] = entry
+        self.state = {}
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, observation_id: int):
+        return observation_id in self.entries
+
+    @property
+    def last_observation_id(self) -> int:
+        return max(self.entries, default=0)
+
+    @property
+    def resume_cursor(self) -> int:
+        """
+        Harvest cursor: observations are fetched in id order, so resume just
+        before the first photo still pending, else after the last one settled.
+        """
+        if self.pending:
+            return min(self.pending) - 1
+        return max(self.last_observation_id, max(self.skipped, default=0))
+
+    @property
+    def synced_at(self) -> Optional[str]:
+        """When the class was last known to be up to date (ISO 8601, UTC), or None if never."""
+        return self.state.get('synced_at')
+
+    @synced_at.setter
+    def synced_at(self, value: str):
+        self.state['synced_at'] = value
+        write_atomic(self.state_path, json.dumps(self.state, indent=2))
+
+    @property
+    def checked_at(self) -> Optional[str]:
+        """When every saved observation was last re-checked, so deletions were seen (ISO 8601, UTC)."""
+        return self.state.get('checked_at')
+
+    @checked_at.setter
+    def checked_at(self, value: str):
+        self.state['checked_at'] = value
+        write_atomic(self.state_path, json.dumps(self.state, indent=2))
+
+    def add(self, observation_id: int, photo_id: Optional[int], updated_at: Optional[str], file: str,
+            sha256: Optional[str] = None):
+        entry = {'observation': observation_id, 'photo': photo_id, 'updated_at': updated_at, 'file': file,
+                 'sha256': sha256}
+        self._append(entry)
+        self.entries[observation_id] = entry
+        self.pending.pop(observation_id, None)
+
+    def mark_pending(self, observation_id: int):
+        """Record a download attempt before it starts; saving the photo clears it."""
+        self._append({'observation': observation_id, 'pending': True})
+        self.pending[observation_id] = self.pending.get(observation_id, 0) + 1
+
+    def skip(self, observation_id: int):
+        """Never fetch the observation again (its photo keeps failing, or it was removed); the cursor moves past it."""
+        self._append({'observation': observation_id, 'skipped': True})
+        self.pending.pop(observation_id, None)
+        self.skipped.add(observation_id)
+
+    def remove(self, observation_id: int):
+        self._append({'observation': observation_id, 'removed': True})
+        self.entries.pop(observation_id, None)
+        self.pending.pop(observation_id, None)
+        self.removed += 1
+
+    def _append(self, entry: dict):
+        if self.file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.file = open(self.path, 'a', encoding='utf-8')
+        self.file.write(json.dumps(entry) + '\n')
+        self.file.flush()
+
+    def compact(self):
+        """Rewrite the file with one line per current entry (drops tombstones and superseded lines)."""
+        self._close_file()
+        lines = [json.dumps(entry) for entry in self.entries.values()]
+        lines += [json.dumps({'observation': observation_id, 'pending': True, 'attempts': attempts})
+                  for observation_id, attempts in self.pending.items()]
+        lines += [json.dumps({'observation': observation_id, 'skipped': True}) for observation_id in sorted(self.skipped)]
+        write_atomic(self.path, ''.join(line + '\n' for line in lines))
+        self.removed = 0
+
+    def close(self):
+        self._close_file()
+        if self.removed:
+            self.compact()
+
+    def _close_file(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def write_atomic(path: str, text: str):
+    """Write via a temporary file so a crash never leaves a half-written file."""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Pack the insect dataset into a few large shards for fast sequential loading.
+Each shard is a .npy file holding a (count, size, size, 3) uint8 array of
+decoded images; index.json lists the shards and classes, and labels.npy has
+the class of every image. Images are decoded in a process pool and shuffled
+once at export, so a sequential read of the shards gives mixed classes.
+Images are only ever scaled down: the default size is the smallest image side
+in the dataset (at most the classifier's input size), and images smaller
+than an explicit --size are left out. ShardedDataset memory-maps the shards,
+and its images and batches are views into the mapped files rather than
+copies. `benchmark` compares its throughput and size with the loose
+class-folder files.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageOps
+
+from blob_store import IMAGE_EXTENSIONS
+from pipeline_profile import add_profile_argument, profiling, stage
+from preprocess_images import INPUT_SIZE, fit_image, to_rgb
+
+SHARD_DIR = 'shards'
+
+# Images per shard file (299x299x3 images are 268 KB each, so about 550 MB per shard)
+IMAGES_PER_SHARD = 2048
+
+# Images per batch when iterating or benchmarking
+BATCH_SIZE = 64
+
+# Images sent to a worker process at a time
+CHUNK_SIZE = 16
+
+
+def load_image_array(path: str, size: int = INPUT_SIZE) -> np.ndarray:
+    """
+    A (size, size, 3) uint8 array of an image, cropped and resized the way
+    preprocess_images.py does. Images smaller than size raise ValueError
+    rather than being scaled up.
+    """
+    with Image.open(path) as img:
+        if min(img.size) < size:
+            raise ValueError(f"{img.width}x{img.height} image is smaller than {size}px")
+        img.draft('RGB', (size, size))
+        img = fit_image(to_rgb(ImageOps.exif_transpose(img)), size)
+        if img.size != (size, size):
+            img = img.resize((size, size), Image.LANCZOS)
+        return np.asarray(img, dtype=np.uint8)
+
+
+def dataset_image_size(paths: List[str], limit: int = INPUT_SIZE) -> int:
+    """Shortest image side in the dataset, at most limit: the largest size no image has to be scaled up to."""
+    size = limit
+    for path in paths:
+        try:
+            # Only the header is read
+            with Image.open(path) as img:
+                size = min(size, *img.size)
+        except Exception:
+            # Reported when the export decodes it
+            continue
+    return size
+
+
+def _load_task(task):
+    path, size = task
+    try:
+        return load_image_array(path, size), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def list_labelled_images(root: str) -> Tuple[List[str], List[Tuple[str, int]]]:
+    """Class names and (path, class index) for every image in a class-folder tree."""
+    classes = sorted(label for label in os.listdir(root) if os.path.isdir(os.path.join(root, label)))
+    images = []
+    for label_index, label in enumerate(classes):
+        folder = os.path.join(root, label)
+        images.extend((os.path.join(folder, name), label_index) for name in sorted(os.listdir(folder))
+                      if name.lower().endswith(IMAGE_EXTENSIONS))
+    return classes, images
+
+
+def export_shards(root: str, output: str, size: Optional[int] = None, per_shard: int = IMAGES_PER_SHARD,
+                  workers: Optional[int] = None, seed: int = 0):
+    """
+    Decode every image under root into shards at output, replacing it once
+    complete. Images that cannot be decoded (or are smaller than size) are
+    reported and left out; size defaults to dataset_image_size.
+    """
+    classes, images = list_labelled_images(root)
+    if size is None:
+        with stage("image size"):
+            size = dataset_image_size([path for path, _ in images])
+    order = np.random.default_rng(seed).permutation(len(images))
+    images = [images[i] for i in order]
+    print(f"Packing {len(images)} images of {len(classes)} classes from {root} into {output}/ "
+          f"({size}x{size}, {per_shard} per shard)...")
+
+    building = output.rstrip(os.sep) + '.building'
+    if os.path.lexists(building):
+        shutil.rmtree(building)
+    os.makedirs(building)
+
+    start = time.perf_counter()
+    shards = []
+    # Images actually packed, in shard order, so labels.npy and files match the shards
+    packed = []
+    failed = 0
+    try:
+        with stage("decode + pack images"), ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_load_task, ((path, size) for path, _ in images), chunksize=CHUNK_SIZE)
+            shard = None
+            for position, ((path, label), (array, error)) in enumerate(zip(images, results)):
+                if error:
+                    print(f"Error decoding {path}: {error}")
+                    failed += 1
+                    continue
+                if shard is None:
+                    # Sized for the images left; a shard cut short by failures is trimmed below
+                    file_name = f"shard-{len(shards):05d}.npy"
+                    shard = np.lib.format.open_memmap(os.path.join(building, file_name), mode='w+', dtype=np.uint8,
+                                                      shape=(min(per_shard, len(images) - position), size, size, 3))
+                    count = 0
+                shard[count] = array
+                count += 1
+                packed.append((path, label))
+                if count == len(shard):
+                    shard.flush()
+                    shard = None
+                    shards.append({'file': file_name, 'count': count})
+            if shard is not None:
+                trimmed = np.array(shard[:count])
+                shard = None
+                np.save(os.path.join(building, file_name), trimmed)
+                shards.append({'file': file_name, 'count': count})
+
+        np.save(os.path.join(building, 'labels.npy'), np.array([label for _, label in packed], dtype=np.int16))
+        index = {
+            'size': size,
+            'classes': classes,
+            'shards': shards,
+            'files': [os.path.relpath(path, root) for path, _ in packed],
+        }
+        with open(os.path.join(building, 'index.json'), 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=1)
+    except BaseException:
+        shutil.rmtree(building, ignore_errors=True)
+        raise
+
+    old = output.rstrip(os.sep) + '.old'
+    if os.path.lexists(old):
+        shutil.rmtree(old)
+    if os.path.lexists(output):
+        os.replace(output, old)
+    os.replace(building, output)
+    if os.path.lexists(old):
+        shutil.rmtree(old)
+
+    seconds = time.perf_counter() - start
+    total = sum(os.path.getsize(os.path.join(output, shard['file'])) for shard in shards)
+    print(f"Wrote {len(packed)} images to {len(shards)} shards ({total / 1e6:.1f} MB, {failed} failed) "
+          f"in {seconds:.1f}s ({len(images) / seconds if seconds else 0:.0f} images/s)")
+
+
+class ShardedDataset:
+    """Memory-mapped view of exported shards: images are (size, size, 3) uint8 arrays backed by the files."""
+
+    def __init__(self, directory: str = SHARD_DIR):
+        with open(os.path.join(directory, 'index.json'), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        self.size = index['size']
+        self.classes: List[str] = index['classes']
+        self.files: List[str] = index['files']
+        self.labels = np.load(os.path.join(directory, 'labels.npy'), mmap_mode='r')
+        self.shards = [np.load(os.path.join(directory, shard['file']), mmap_mode='r') for shard in index['shards']]
+        self.offsets = np.cumsum([0] + [len(shard) for shard in self.shards])
+
+    def __len__(self):
+        return int(self.offsets[-1])
+
+    def __getitem__(self, i: int) -> Tuple[np.ndarray, int]:
+        if i < 0:
+            i += len(self)
+        shard = int(np.searchsorted(self.offsets, i, side='right')) - 1
+        return self.shards[shard][i - self.offsets[shard]], int(self.labels[i])
+
+    def batches(self, batch_size: int = BATCH_SIZE, shuffle: bool = False,
+                seed: Optional[int] = None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        (images, labels) batches, each a contiguous slice of one shard, so no
+        image is copied. shuffle reorders the shards and the batches within
+        them (the images were already shuffled at export).
+        """
+        rng = np.random.default_rng(seed)
+        shard_order = rng.permutation(len(self.shards)) if shuffle else range(len(self.shards))
+        for shard_index in shard_order:
+            shard = self.shards[shard_index]
+            starts = np.arange(0, len(shard), batch_size)
+            if shuffle:
+                rng.shuffle(starts)
+            for start in starts:
+                images = shard[start:start + batch_size]
+                first = int(self.offsets[shard_index]) + start
+                yield images, self.labels[first:first + len(images)]
+
+
+def benchmark(root: str, directory: str = SHARD_DIR, batch_size: int = BATCH_SIZE):
+    """
+    Images/s reading every image as a uint8 array: loose files (decoded) vs
+    memory-mapped shards. Shards read recently come from the page cache, so
+    run it after dropping caches for cold-disk numbers.
+    """
+    dataset = ShardedDataset(directory)
+    # The files packed into the shards (undecodable ones were left out)
+    paths = [os.path.join(root, name) for name in dataset.files]
+    loose_bytes = sum(os.path.getsize(path) for path in paths)
+    shard_bytes = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+    with stage("loose files"):
+        start = time.perf_counter()
+        checksum = 0
+        for path in paths:
+            checksum += int(load_image_array(path, dataset.size).max())
+        loose_seconds = time.perf_counter() - start
+
+    with stage("shards"):
+        start = time.perf_counter()
+        shard_checksum = 0
+        for batch, _ in dataset.batches(batch_size):
+            # Touches every byte, so the pages are really read
+            shard_checksum += int(batch.max(axis=(1, 2, 3)).sum())
+        shard_seconds = time.perf_counter() - start
+
+    loose_rate = len(paths) / loose_seconds if loose_seconds else 0
+    shard_rate = len(dataset) / shard_seconds if shard_seconds else 0
+    print(f"Loose files ({root}): {len(paths)} images, {loose_bytes / 1e6:.1f} MB, "
+          f"in {loose_seconds:.2f}s ({loose_rate:.0f} images/s)")
+    print(f"Shards ({directory}): {len(dataset)} images at {dataset.size}x{dataset.size}, {shard_bytes / 1e6:.1f} MB "
+          f"({shard_bytes / loose_bytes if loose_bytes else 0:.1f}x the loose files), in {shard_seconds:.2f}s "
+          f"({shard_rate:.0f} images/s, "
+          f"{len(dataset) * dataset.size * dataset.size * 3 / 1e6 / shard_seconds if shard_seconds else 0:.0f} MB/s)")
+    if loose_rate:
+        print(f"Shards are {shard_rate / loose_rate:.1f}x faster")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack the insect dataset into memory-mappable shards")
+    parser.add_argument("--shards", default=SHARD_DIR, help="Shard folder (default: %(default)s)")
+    add_profile_argument(parser)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Decode a class-folder tree into shards")
+    export.add_argument("root", nargs="?", default="InsectDataset", help="Dataset folder (default: %(default)s)")
+    export.add_argument("--size", type=int,
+                        help=f"Image side in pixels; smaller images are left out, never scaled up "
+                             f"(default: the smallest image side in the dataset, at most {INPUT_SIZE})")
+    export.add_argument("--per-shard", type=int, default=IMAGES_PER_SHARD,
+                        help="Images per shard file (default: %(default)s)")
+    export.add_argument("--workers", type=int, help="Decoding processes (default: one per CPU)")
+    export.add_argument("--seed", type=int, default=0, help="Seed of the export shuffle (default: %(default)s)")
+
+    bench = commands.add_parser("benchmark", help="Compare reading the shards with decoding the loose files")
+    bench.add_argument("root", nargs="?", default="InsectDataset", help="Dataset folder (default: %(default)s)")
+    bench.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Images per batch (default: %(default)s)")
+    args = parser.parse_args()
+
+    with profiling(f"dataset_shards-{args.command}", args.profile):
+        if args.command == "export":
+            export_shards(args.root, args.shards, args.size, args.per_shard, args.workers, args.seed)
+        else:
+            benchmark(args.root, args.shards, args.batch_size)
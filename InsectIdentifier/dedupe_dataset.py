@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Find duplicate and near-duplicate images in the insect dataset.
+Each image gets a 64-bit perceptual hash (DCT of a 32x32 greyscale copy),
+computed across a process pool. The hashes go into a multi-index hash table,
+so only images that share a hash chunk are compared, rather than every pair.
+Images within the Hamming threshold are clustered and written to a CSV, and
+--remove deletes the extra copies, drops them from the harvest manifests (so
+PrepareDataset.py tops the class up instead of fetching them again) and from
+the saved blob store layouts. Each dataset tree (InsectDataset and the app's
+InsectIdentifier/InsectDataset) is cleaned on its own.
+"""
+
+import argparse
+import csv
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from blob_store import BlobStore
+from dataset_manifest import MANIFEST_DIR, Manifest
+from pipeline_profile import add_profile_argument, profiling, stage
+
+DATASET_ROOTS = ['InsectDataset', 'InsectIdentifier/InsectDataset']
+REPORT_FILE = 'duplicate_images.csv'
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+# Hashes this many bits apart or fewer are treated as the same image
+HAMMING_THRESHOLD = 6
+
+# Side of the greyscale image the DCT is taken of, and of the low-frequency block kept (8x8 = 64 bits)
+HASH_IMAGE_SIZE = 32
+HASH_SIZE = 8
+HASH_BITS = HASH_SIZE * HASH_SIZE
+
+# Images sent to a worker process at a time
+CHUNK_SIZE = 64
+
+
+def dct_matrix(size: int) -> np.ndarray:
+    """Orthonormal DCT-II matrix, so the 2-D DCT of X is D @ X @ D.T."""
+    k = np.arange(size)[:, None]
+    i = np.arange(size)[None, :]
+    matrix = np.cos(np.pi * (2 * i + 1) * k / (2 * size)) * np.sqrt(2 / size)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+_DCT = dct_matrix(HASH_IMAGE_SIZE)
+
+
+def perceptual_hash(path: str) -> Optional[int]:
+    """64-bit pHash of an image file, or None if it cannot be read."""
+    try:
+        with Image.open(path) as img:
+            # JPEGs are decoded at a reduced scale, close to the size needed
+            img.draft('L', (HASH_IMAGE_SIZE * 2, HASH_IMAGE_SIZE * 2))
+            pixels = np.asarray(img.convert('L').resize((HASH_IMAGE_SIZE, HASH_IMAGE_SIZE), Image.LANCZOS),
+                                dtype=np.float64)
+    except Exception:
+        return None
+    low = (_DCT @ pixels @ _DCT.T)[:HASH_SIZE, :HASH_SIZE].flatten()
+    # Median of the AC coefficients (the DC term only reflects overall brightness)
+    bits = low > np.median(low[1:])
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+
+class MultiIndexHash:
+    """
+    Hashes split into threshold + 1 chunks, one lookup table per chunk. Two
+    hashes within `threshold` bits of each other must match exactly on at
+    least one chunk (pigeonhole), so a query only compares the hashes that
+    share a chunk with it.
+    """
+
+    def __init__(self, threshold: int = HAMMING_THRESHOLD, bits: int = HASH_BITS):
+        self.threshold = threshold
+        chunks = min(threshold + 1, bits)
+        sizes = [bits // chunks + (1 if i < bits % chunks else 0) for i in range(chunks)]
+        shifts = [sum(sizes[i + 1:]) for i in range(chunks)]
+        self.chunks = [(shift, (1 << size) - 1) for shift, size in zip(shifts, sizes)]
+        self.tables: List[Dict[int, List[int]]] = [defaultdict(list) for _ in self.chunks]
+        self.hashes: List[int] = []
+        self.compared = 0
+
+    def add(self, value: int) -> int:
+        index = len(self.hashes)
+        self.hashes.append(value)
+        for table, (shift, mask) in zip(self.tables, self.chunks):
+            table[(value >> shift) & mask].append(index)
+        return index
+
+    def query(self, value: int) -> List[Tuple[int, int]]:
+        """(index, distance) of every stored hash within the threshold."""
+        candidates = set()
+        for table, (shift, mask) in zip(self.tables, self.chunks):
+            candidates.update(table.get((value >> shift) & mask, ()))
+        self.compared += len(candidates)
+        matches = []
+        for index in candidates:
+            distance = (self.hashes[index] ^ value).bit_count()
+            if distance <= self.threshold:
+                matches.append((index, distance))
+        return matches
+
+
+class UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int):
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+
+def list_images(roots: List[str]) -> List[Tuple[str, str, str]]:
+    """(root, class, path) for every image under each root's class folders."""
+    images = []
+    for root in roots:
+        if not os.path.isdir(root):
+            continue
+        for label in sorted(os.listdir(root)):
+            folder = os.path.join(root, label)
+            if not os.path.isdir(folder):
+                continue
+            names = [name for name in os.listdir(folder) if name.lower().endswith(IMAGE_EXTENSIONS)]
+            # Natural order, so 2.jpg is kept over 10.jpg
+            names.sort(key=lambda name: (len(name), name))
+            images.extend((root, label, os.path.join(folder, name)) for name in names)
+    return images
+
+
+def hash_images(paths: List[str], workers: Optional[int] = None) -> List[Optional[int]]:
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(perceptual_hash, paths, chunksize=CHUNK_SIZE))
+
+
+def find_clusters(hashes: List[Optional[int]], threshold: int = HAMMING_THRESHOLD):
+    """Clusters (lists of image indexes) of near-identical hashes, and each image's closest distance."""
+    index = MultiIndexHash(threshold)
+    positions = []
+    clusters = UnionFind(len(hashes))
+    closest: Dict[int, int] = {}
+    for image, value in enumerate(hashes):
+        if value is None:
+            continue
+        for other, distance in index.query(value):
+            other = positions[other]
+            clusters.union(image, other)
+            closest[image] = min(closest.get(image, HASH_BITS), distance)
+            closest[other] = min(closest.get(other, HASH_BITS), distance)
+        index.add(value)
+        positions.append(image)
+
+    groups = defaultdict(list)
+    for image in closest:
+        groups[clusters.find(image)].append(image)
+    return sorted((sorted(members) for members in groups.values()), key=lambda c: (-len(c), c[0])), closest, index
+
+
+def plan_removals(images: List[Tuple[str, str, str]], clusters: List[List[int]],
+                  remove_conflicts: bool = False) -> Dict[int, str]:
+    """
+    Action for every clustered image, per dataset tree: the first copy in each
+    class is kept and the rest removed. Clusters spanning classes are label
+    conflicts; with remove_conflicts every copy of them is removed.
+    """
+    actions = {}
+    for members in clusters:
+        by_root = defaultdict(list)
+        for image in members:
+            by_root[images[image][0]].append(image)
+        for root_members in by_root.values():
+            conflict = len({images[image][1] for image in root_members}) > 1
+            kept_classes = set()
+            for image in root_members:
+                label = images[image][1]
+                if conflict and remove_conflicts:
+                    actions[image] = 'remove (label conflict)'
+                elif label in kept_classes:
+                    actions[image] = 'remove'
+                else:
+                    kept_classes.add(label)
+                    actions[image] = 'keep (label conflict)' if conflict else 'keep'
+    return actions
+
+
+def forget_removed(removed: List[Tuple[str, str, str]], store: BlobStore,
+                   manifest_dir: str = MANIFEST_DIR) -> Tuple[int, int]:
+    """
+    Drop removed (root, class, path) images from the class manifests, marked
+    skipped so they are not downloaded again, and from each root's saved
+    layout. Returns the number of manifests and layouts changed.
+    """
+    manifests: Dict[str, Manifest] = {}
+    layouts: Dict[str, Optional[dict]] = {}
+    changed_manifests, changed_layouts = set(), set()
+    for root, label, path in removed:
+        name = os.path.basename(path)
+        stem = os.path.splitext(name)[0]
+        # PrepareDataset.py names images after their observation id
+        if stem.isdigit():
+            if label not in manifests:
+                manifests[label] = Manifest(label, manifest_dir)
+            entry = manifests[label].entries.get(int(stem))
+            if entry and os.path.normpath(entry['file']) == os.path.normpath(path):
+                manifests[label].remove(int(stem))
+                manifests[label].skip(int(stem))
+                changed_manifests.add(label)
+        if root not in layouts:
+            layouts[root] = store.load_layout(root) if os.path.exists(store.layout_path(root)) else None
+        if layouts[root] is not None and layouts[root].pop(f"{label}/{name}", None):
+            changed_layouts.add(root)
+
+    for manifest in manifests.values():
+        manifest.close()
+    for root in changed_layouts:
+        store.write_layout(root, layouts[root])
+    return len(changed_manifests), len(changed_layouts)
+
+
+def dedupe_dataset(roots: List[str] = DATASET_ROOTS, threshold: int = HAMMING_THRESHOLD,
+                   workers: Optional[int] = None, remove: bool = False, remove_conflicts: bool = False,
+                   report_file: str = REPORT_FILE):
+    images = list_images(roots)
+    print(f"Hashing {len(images)} images in {', '.join(roots)} on {workers or os.cpu_count()} processes...")
+
+    start = time.perf_counter()
+    with stage("perceptual hashes"):
+        hashes = hash_images([path for _, _, path in images], workers)
+    unreadable = sum(1 for value in hashes if value is None)
+    print(f"Hashed in {time.perf_counter() - start:.2f}s ({unreadable} unreadable)")
+
+    start = time.perf_counter()
+    with stage("find near-duplicates"):
+        clusters, closest, index = find_clusters(hashes, threshold)
+    hashed = len(hashes) - unreadable
+    print(f"{index.compared} candidate pairs compared (all pairs would be {hashed * (hashed - 1) // 2}) "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    actions = plan_removals(images, clusters, remove_conflicts)
+
+    with open(report_file, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['Cluster', 'Root', 'Class', 'File', 'Distance', 'Action'])
+        for number, members in enumerate(clusters, 1):
+            for image in members:
+                root, label, path = images[image]
+                writer.writerow([number, root, label, path, closest[image], actions[image]])
+
+    cross_class = sum(1 for members in clusters
+                      if len({(images[i][0], images[i][1]) for i in members}) > len({images[i][0] for i in members}))
+    shared = sum(1 for members in clusters if len({images[i][0] for i in members}) > 1)
+    to_remove = [image for image, action in actions.items() if action.startswith('remove')]
+    print(f"{len(clusters)} duplicate groups ({sum(len(c) for c in clusters)} images): "
+          f"{cross_class} span classes, {shared} span dataset trees")
+    print(f"{len(to_remove)} images {'removed' if remove else 'would be removed (run with --remove)'}; "
+          f"details in {report_file}")
+
+    if remove:
+        for image in to_remove:
+            os.remove(images[image][2])
+        manifest_count, layout_count = forget_removed([images[image] for image in to_remove], BlobStore())
+        print(f"Updated {manifest_count} manifests and {layout_count} layouts")
+    return clusters
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find and remove near-duplicate images in the insect dataset")
+    parser.add_argument("roots", nargs="*", default=DATASET_ROOTS,
+                        help="Dataset folders with one sub-folder per class (default: %(default)s)")
+    parser.add_argument("--threshold", type=int, default=HAMMING_THRESHOLD,
+                        help="Maximum differing hash bits for a duplicate (default: %(default)s)")
+    parser.add_argument("--workers", type=int, help="Hashing processes (default: one per CPU)")
+    parser.add_argument("--remove", action="store_true", help="Delete all but the first copy in each class")
+    parser.add_argument("--remove-conflicts", action="store_true",
+                        help="Also delete every copy of images found under more than one class")
+    parser.add_argument("--report", default=REPORT_FILE, help="CSV of duplicate groups (default: %(default)s)")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiling("dedupe_dataset", args.profile):
+        dedupe_dataset(args.roots, args.threshold, args.workers, args.remove, args.remove_conflicts, args.report)
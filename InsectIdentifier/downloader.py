@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Concurrent HTTP downloads for PrepareDataset.py.
+One shared thread pool is the global concurrency budget. A single requests
+Session keeps a bounded connection pool per host, retries connection errors
+and 429/5xx responses with exponential backoff (honouring Retry-After), and
+hosts with a rate cap, such as the iNaturalist API, get their requests spaced out.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Requests in flight at once, across all classes
+MAX_CONCURRENCY = 16
+
+# Connections kept open per host (further requests to that host wait for one)
+CONNECTIONS_PER_HOST = 8
+
+# Retries for connection errors and these statuses; waits 0.5s, 1s, 2s, 4s...
+MAX_RETRIES = 4
+BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Minimum seconds between requests to a host (iNaturalist asks for at most ~1 API request per second)
+HOST_RATE_LIMITS = {
+    'api.inaturalist.org': 1.0,
+}
+
+# Seconds to wait for a connection or a response
+REQUEST_TIMEOUT = 30
+
+USER_AGENT = 'InsectIdentifier-PrepareDataset/1.0'
+
+
+class RateLimiter:
+    """Spaces calls at least `interval` seconds apart, across threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_time)
+            self.next_time = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class Downloader:
+    def __init__(self, max_workers: int = MAX_CONCURRENCY, connections_per_host: int = CONNECTIONS_PER_HOST,
+                 rate_limits: Optional[Dict[str, float]] = None, retries: int = MAX_RETRIES):
+        retry = Retry(total=retries, backoff_factor=BACKOFF_FACTOR, status_forcelist=RETRY_STATUSES,
+                      allowed_methods=frozenset(['GET']), respect_retry_after_header=True, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=connections_per_host,
+                              pool_block=True, max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = USER_AGENT
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.limiters = {host: RateLimiter(interval)
+                         for host, interval in (HOST_RATE_LIMITS if rate_limits is None else rate_limits).items()}
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='download')
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        self.bytes = 0
+        self.started = time.perf_counter()
+
+    def get(self, url: str, params: Optional[dict] = None) -> requests.Response:
+        """GET with pooling, retries and the host's rate cap; raises for error statuses."""
+        limiter = self.limiters.get(urlparse(url).hostname)
+        if limiter is not None:
+            limiter.wait()
+        try:
+            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+        except requests.RequestException:
+            with self.lock:
+                self.requests += 1
+                self.failures += 1
+            raise
+        with self.lock:
+            self.requests += 1
+            self.bytes += len(response.content)
+        return response
+
+    def get_json(self, url: str, params: Optional[dict] = None) -> dict:
+        return self.get(url, params).json()
+
+    def fetch(self, url: str) -> bytes:
+        return self.get(url).content
+
+    def submit(self, function: Callable, *args) -> Future:
+        """Run one task on the shared pool."""
+        return self.executor.submit(function, *args)
+
+    def map(self, function: Callable, items: Iterable) -> Iterator[Tuple[object, object, Optional[Exception]]]:
+        """
+        Run function(item) for every item on the shared pool and yield
+        (item, result, error) in completion order, so the caller can handle
+        each result while the rest are still downloading.
+        """
+        futures = {self.executor.submit(function, item): item for item in items}
+        try:
+            for future in as_completed(futures):
+                error = future.exception()
+                yield futures[future], None if error else future.result(), error
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def print_report(self):
+        seconds = time.perf_counter() - self.started
+        megabytes = self.bytes / 1e6
+        print(f"Downloaded {megabytes:.1f} MB in {self.requests} requests ({self.failures} failed) "
+              f"in {seconds:.1f}s ({megabytes / seconds if seconds else 0:.2f} MB/s)")
+
+    def close(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
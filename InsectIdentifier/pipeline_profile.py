@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling for the pipeline scripts. The implementation is shared by
+every project in the repository: see ../shared/pipeline_profile.py.
+  python3 pipeline_profile.py PrepareDataset.py [its arguments]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.pipeline_profile import (PROFILE_DIR, PROFILE_ENV, add_profile_argument, main,  # noqa: E402
+                                     profiling, stage)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Shrink dataset images to the classifier's input size across a process pool.
+JPEGs are decoded with draft(), so libjpeg scales them down by up to 8x while
+decoding instead of producing full-size pixels. Each image is turned upright
+from its EXIF orientation, converted to RGB (CMYK, palette, greyscale and
+transparent images), centre-cropped to a square and resized, then written as
+a baseline JPEG without metadata. PrepareDataset.py runs this on every
+download; run this script to convert images already saved.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Optional
+
+from PIL import Image, ImageOps
+
+from blob_store import BlobStore, IMAGE_EXTENSIONS
+from pipeline_profile import add_profile_argument, profiling, stage
+
+# Side of the square images the classifier is trained on (Create ML's image feature extractor uses 299x299)
+INPUT_SIZE = 299
+
+JPEG_QUALITY = 90
+
+# EXIF tag holding the orientation (1 = already upright)
+EXIF_ORIENTATION = 0x0112
+
+# Images sent to a worker process at a time
+CHUNK_SIZE = 16
+
+
+def to_rgb(img: Image.Image) -> Image.Image:
+    """RGB copy of the image, with any transparency flattened onto white."""
+    if img.mode == 'RGB':
+        return img
+    if img.mode in ('P', 'PA'):
+        img = img.convert('RGBA')
+    if img.mode in ('RGBA', 'LA', 'RGBa', 'La'):
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img.convert('RGBA'), mask=img.getchannel('A'))
+        return background
+    return img.convert('RGB')
+
+
+def fit_image(img: Image.Image, size: int = INPUT_SIZE, crop: bool = True) -> Image.Image:
+    """Centre-crop to a square (unless crop is False) and scale the shorter side down to size."""
+    if crop and img.width != img.height:
+        side = min(img.width, img.height)
+        left, top = (img.width - side) // 2, (img.height - side) // 2
+        img = img.crop((left, top, left + side, top + side))
+    scale = size / min(img.width, img.height)
+    if scale < 1:
+        img = img.resize((max(1, round(img.width * scale)), max(1, round(img.height * scale))),
+                         Image.LANCZOS, reducing_gap=3.0)
+    return img
+
+
+def is_preprocessed(img: Image.Image, size: int = INPUT_SIZE, crop: bool = True) -> bool:
+    if img.format != 'JPEG' or img.mode != 'RGB' or img.getexif().get(EXIF_ORIENTATION, 1) != 1:
+        return False
+    if crop:
+        return img.width == img.height <= size
+    return min(img.width, img.height) <= size
+
+
+def preprocess(img: Image.Image, size: int = INPUT_SIZE, crop: bool = True) -> bytes:
+    # Only decode as many pixels as the output needs (JPEG only; a no-op for other formats)
+    img.draft('RGB', (size, size))
+    img = ImageOps.exif_transpose(img)
+    img = fit_image(to_rgb(img), size, crop)
+    output = BytesIO()
+    img.save(output, format='JPEG', quality=JPEG_QUALITY, optimize=True)
+    return output.getvalue()
+
+
+def preprocess_image(content: bytes, size: int = INPUT_SIZE, crop: bool = True) -> bytes:
+    """A downloaded photo as a normalised JPEG of the classifier's input size."""
+    with Image.open(BytesIO(content)) as img:
+        return preprocess(img, size, crop)
+
+
+def preprocess_file(path: str, size: int = INPUT_SIZE, crop: bool = True) -> Optional[bytes]:
+    """The preprocessed image, or None if the file is already preprocessed."""
+    with Image.open(path) as img:
+        if is_preprocessed(img, size, crop):
+            return None
+        return preprocess(img, size, crop)
+
+
+def _preprocess_file_task(task):
+    path, size, crop = task
+    try:
+        return preprocess_file(path, size, crop), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def preprocess_tree(root: str, store: BlobStore, size: int = INPUT_SIZE, crop: bool = True,
+                    workers: Optional[int] = None, layout_name: Optional[str] = None):
+    """
+    Preprocess every image in a class-folder tree in place. Each converted
+    image is a new blob relinked into place, so other layouts sharing the
+    original are unaffected.
+    """
+    paths = []
+    for label in sorted(os.listdir(root)):
+        folder = os.path.join(root, label)
+        if os.path.isdir(folder):
+            paths.extend(os.path.join(folder, name) for name in sorted(os.listdir(folder))
+                         if name.lower().endswith(IMAGE_EXTENSIONS))
+    print(f"Preprocessing {len(paths)} images in {root} to {size}x{size} on {workers or os.cpu_count()} processes...")
+
+    start = time.perf_counter()
+    converted = skipped = failed = 0
+    bytes_before = bytes_after = 0
+    with stage("preprocess images"), ProcessPoolExecutor(max_workers=workers) as pool:
+        tasks = ((path, size, crop) for path in paths)
+        for path, (content, error) in zip(paths, pool.map(_preprocess_file_task, tasks, chunksize=CHUNK_SIZE)):
+            if error:
+                print(f"Error preprocessing {path}: {error}")
+                failed += 1
+                continue
+            if content is None:
+                skipped += 1
+                continue
+            bytes_before += os.path.getsize(path)
+            bytes_after += len(content)
+            # JPEG content under a .png name would confuse Create ML, so converted images are always .jpg
+            target = os.path.splitext(path)[0] + '.jpg'
+            store.save(content, target)
+            if target != path:
+                os.remove(path)
+            converted += 1
+
+    seconds = time.perf_counter() - start
+    print(f"Converted {converted} images ({skipped} already done, {failed} failed) in {seconds:.1f}s "
+          f"({len(paths) / seconds if seconds else 0:.0f} images/s): "
+          f"{bytes_before / 1e6:.1f} MB -> {bytes_after / 1e6:.1f} MB")
+
+    with stage("blob store"):
+        layout = store.ingest_tree(root)
+        store.write_layout(layout_name or root, layout)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resize the insect dataset to the classifier's input size")
+    parser.add_argument("roots", nargs="*", default=["InsectDataset"],
+                        help="Dataset folders with one sub-folder per class (default: %(default)s)")
+    parser.add_argument("--size", type=int, default=INPUT_SIZE, help="Output side in pixels (default: %(default)s)")
+    parser.add_argument("--no-crop", action="store_true",
+                        help="Keep the aspect ratio, only scaling the shorter side down to --size")
+    parser.add_argument("--workers", type=int, help="Processes (default: one per CPU)")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    store = BlobStore()
+    with profiling("preprocess_images", args.profile):
+        for root in args.roots:
+            preprocess_tree(root, store, args.size, not args.no_crop, args.workers)
@@ -4,6 +4,7 @@ Advanced geocoding script that tries multiple services to get coordinates
 for venues that don't have them yet.
 """
 
+import argparse
 import csv
 import json
 import time
@@ -11,134 +12,155 @@ import urllib.request
 import urllib.parse
 import urllib.error
 
+from geocode_metrics import EMPTY, ERROR, METRICS_FILE, OUTSIDE_UK, SUCCESS, GeocodeCache, GeocodeMetrics
+from uk_coordinates import is_coordinate_in_uk
+from venue_store import CSV_FILE, VENUE_DB_FILE, VenueDatabase
+
 class GeocodingService:
-    def __init__(self, name, rate_limit_delay=1.0):
+    def __init__(self, name, rate_limit_delay=1.0, metrics=None):
         self.name = name
         self.rate_limit_delay = rate_limit_delay
         self.last_request_time = 0
+        self.metrics = metrics or GeocodeMetrics()
+        self.cache = GeocodeCache()
+    
+    @property
+    def enabled(self):
+        """Services that need an API key are skipped without one."""
+        return True
     
     def wait_for_rate_limit(self):
         """Ensure we don't exceed rate limits."""
         current_time = time.time()
         time_since_last = current_time - self.last_request_time
         if time_since_last < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last)
+            wait = self.rate_limit_delay - time_since_last
+            time.sleep(wait)
+            self.metrics.record_wait(self.name, wait)
         self.last_request_time = time.time()
-
-class NominatimGeocoder(GeocodingService):
-    def __init__(self):
-        super().__init__("Nominatim", 1.2)  # 1 request per second
     
     def geocode(self, address):
-        """Geocode using OpenStreetMap Nominatim."""
-        try:
-            self.wait_for_rate_limit()
-            
-            url = f"https://nominatim.openstreetmap.org/search?format=json&q={urllib.parse.quote(address)}&limit=1&countrycodes=gb&addressdetails=1"
-            
-            req = urllib.request.Request(url)
-            req.add_header('User-Agent', 'VenueMapApp/1.0 (contact@example.com)')
-            
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode())
-                    if data and len(data) > 0:
-                        lat = float(data[0]['lat'])
-                        lng = float(data[0]['lon'])
-                        return lat, lng
+        """Geocode an address, using the cache and recording metrics. Returns (lat, lng) or (None, None)."""
+        if not self.enabled:
             return None, None
+        
+        found, result = self.cache.get(address)
+        self.metrics.record_cache(self.name, found)
+        if found:
+            return result
+        
+        self.wait_for_rate_limit()
+        start = time.perf_counter()
+        try:
+            lat, lng = self.request(address)
         except Exception as e:
-            print(f"  ⚠️  Nominatim error: {e}")
+            self.metrics.record_request(self.name, ERROR, time.perf_counter() - start)
+            print(f"  ⚠️  {self.name} error: {e}")
             return None, None
+        
+        if lat is None or lng is None:
+            outcome = EMPTY
+        elif is_coordinate_in_uk(lat, lng):
+            outcome = SUCCESS
+        else:
+            outcome = OUTSIDE_UK
+        self.metrics.record_request(self.name, outcome, time.perf_counter() - start)
+        self.metrics.maybe_flush()
+        
+        # Only answers are cached; errors (raised by request) return above, so the address is retried
+        self.cache.put(address, (lat, lng))
+        return lat, lng
+
+class NominatimGeocoder(GeocodingService):
+    def __init__(self, metrics=None):
+        super().__init__("Nominatim", 1.2, metrics)  # 1 request per second
+    
+    def request(self, address):
+        """Geocode using OpenStreetMap Nominatim."""
+        url = f"https://nominatim.openstreetmap.org/search?format=json&q={urllib.parse.quote(address)}&limit=1&countrycodes=gb&addressdetails=1"
+        
+        req = urllib.request.Request(url)
+        req.add_header('User-Agent', 'VenueMapApp/1.0 (contact@example.com)')
+        
+        with urllib.request.urlopen(req, timeout=10) as response:
+            if response.status == 200:
+                data = json.loads(response.read().decode())
+                if data and len(data) > 0:
+                    lat = float(data[0]['lat'])
+                    lng = float(data[0]['lon'])
+                    return lat, lng
+        return None, None
 
 class GoogleGeocoder(GeocodingService):
-    def __init__(self, api_key=None):
-        super().__init__("Google Maps", 0.1)  # 10 requests per second
+    def __init__(self, api_key=None, metrics=None):
+        super().__init__("Google Maps", 0.1, metrics)  # 10 requests per second
         self.api_key = api_key
     
-    def geocode(self, address):
+    @property
+    def enabled(self):
+        return bool(self.api_key)
+    
+    def request(self, address):
         """Geocode using Google Maps API (requires API key)."""
-        if not self.api_key:
-            return None, None
+        url = f"https://maps.googleapis.com/maps/api/geocode/json?address={urllib.parse.quote(address)}&key={self.api_key}&region=gb"
         
-        try:
-            self.wait_for_rate_limit()
-            
-            url = f"https://maps.googleapis.com/maps/api/geocode/json?address={urllib.parse.quote(address)}&key={self.api_key}&region=gb"
-            
-            with urllib.request.urlopen(url, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode())
-                    if data.get('status') == 'OK' and data.get('results'):
-                        location = data['results'][0]['geometry']['location']
-                        return location['lat'], location['lng']
-            return None, None
-        except Exception as e:
-            print(f"  ⚠️  Google Maps error: {e}")
-            return None, None
+        with urllib.request.urlopen(url, timeout=10) as response:
+            if response.status == 200:
+                data = json.loads(response.read().decode())
+                if data.get('status') == 'OK' and data.get('results'):
+                    location = data['results'][0]['geometry']['location']
+                    return location['lat'], location['lng']
+                # ZERO_RESULTS is an empty answer; other statuses (quota, denied key) are errors
+                if data.get('status') != 'ZERO_RESULTS':
+                    raise RuntimeError(f"Google status {data.get('status')}: {data.get('error_message', '')}")
+        return None, None
 
 class MapboxGeocoder(GeocodingService):
-    def __init__(self, access_token=None):
-        super().__init__("Mapbox", 0.1)  # 10 requests per second
+    def __init__(self, access_token=None, metrics=None):
+        super().__init__("Mapbox", 0.1, metrics)  # 10 requests per second
         self.access_token = access_token
     
-    def geocode(self, address):
+    @property
+    def enabled(self):
+        return bool(self.access_token)
+    
+    def request(self, address):
         """Geocode using Mapbox API (requires access token)."""
-        if not self.access_token:
-            return None, None
+        url = f"https://api.mapbox.com/geocoding/v5/mapbox.places/{urllib.parse.quote(address)}.json?access_token={self.access_token}&country=GB&limit=1"
         
-        try:
-            self.wait_for_rate_limit()
-            
-            url = f"https://api.mapbox.com/geocoding/v5/mapbox.places/{urllib.parse.quote(address)}.json?access_token={self.access_token}&country=GB&limit=1"
-            
-            with urllib.request.urlopen(url, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode())
-                    if data.get('features') and len(data['features']) > 0:
-                        coords = data['features'][0]['center']
-                        return coords[1], coords[0]  # Mapbox returns [lng, lat]
-            return None, None
-        except Exception as e:
-            print(f"  ⚠️  Mapbox error: {e}")
-            return None, None
+        with urllib.request.urlopen(url, timeout=10) as response:
+            if response.status == 200:
+                data = json.loads(response.read().decode())
+                if data.get('features') and len(data['features']) > 0:
+                    coords = data['features'][0]['center']
+                    return coords[1], coords[0]  # Mapbox returns [lng, lat]
+        return None, None
 
 class BingGeocoder(GeocodingService):
-    def __init__(self, api_key=None):
-        super().__init__("Bing Maps", 0.1)  # 10 requests per second
+    def __init__(self, api_key=None, metrics=None):
+        super().__init__("Bing Maps", 0.1, metrics)  # 10 requests per second
         self.api_key = api_key
     
-    def geocode(self, address):
+    @property
+    def enabled(self):
+        return bool(self.api_key)
+    
+    def request(self, address):
         """Geocode using Bing Maps API (requires API key)."""
-        if not self.api_key:
-            return None, None
+        url = f"https://dev.virtualearth.net/REST/v1/Locations?q={urllib.parse.quote(address)}&key={self.api_key}&c=GB"
         
-        try:
-            self.wait_for_rate_limit()
-            
-            url = f"https://dev.virtualearth.net/REST/v1/Locations?q={urllib.parse.quote(address)}&key={self.api_key}&c=GB"
-            
-            with urllib.request.urlopen(url, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode())
-                    if data.get('resourceSets') and data['resourceSets'][0].get('resources'):
-                        coords = data['resourceSets'][0]['resources'][0]['point']['coordinates']
-                        return coords[0], coords[1]  # Bing returns [lat, lng]
-            return None, None
-        except Exception as e:
-            print(f"  ⚠️  Bing Maps error: {e}")
-            return None, None
-
-def is_coordinate_in_uk(lat, lng):
-    """Check if coordinates are within the UK bounding box."""
-    try:
-        lat = float(lat)
-        lng = float(lng)
-        return (49.8 <= lat <= 60.9 and -8.2 <= lng <= 1.8)
-    except (ValueError, TypeError):
-        return False
+        with urllib.request.urlopen(url, timeout=10) as response:
+            if response.status == 200:
+                # Bing answers throttled requests with empty results and this header set
+                if response.headers.get('X-MS-BM-WS-INFO') == '1':
+                    raise RuntimeError("Bing Maps is throttling requests")
+                data = json.loads(response.read().decode())
+                if data.get('resourceSets') and data['resourceSets'][0].get('resources'):
+                    coords = data['resourceSets'][0]['resources'][0]['point']['coordinates']
+                    return coords[0], coords[1]  # Bing returns [lat, lng]
+        return None, None
 
-def advanced_geocode_venues():
+def advanced_geocode_venues(metrics_file=METRICS_FILE):
     """
     Try to geocode venues using multiple services.
     """
@@ -147,29 +169,34 @@ def advanced_geocode_venues():
     # Get Google Maps API key from user
     google_api_key = input("Enter your Google Maps API key: ").strip()
     
-    # Initialize geocoding services
+    # Initialize geocoding services (sharing one set of metrics)
+    metrics = GeocodeMetrics(metrics_file)
     geocoders = [
-        GoogleGeocoder(google_api_key),  # Google Maps (most accurate)
-        NominatimGeocoder(),  # Free fallback
+        GoogleGeocoder(google_api_key, metrics),  # Google Maps (most accurate)
+        NominatimGeocoder(metrics),  # Free fallback
         # Uncomment these if you have other API keys:
-        # MapboxGeocoder("YOUR_MAPBOX_ACCESS_TOKEN"),
-        # BingGeocoder("YOUR_BING_API_KEY"),
+        # MapboxGeocoder("YOUR_MAPBOX_ACCESS_TOKEN", metrics),
+        # BingGeocoder("YOUR_BING_API_KEY", metrics),
     ]
     
-    # Read venues that need geocoding from the restored CSV
-    venues_to_geocode = []
-    with open('JW and Smirnoff Venues - Sheet1_with_coords.csv', 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            if not row.get('Latitude') or not row.get('Longitude'):
-                venues_to_geocode.append(row)
+    # Read venues that need geocoding, keyed by venue id (venues.db) or row position (the restored CSV)
+    if VenueDatabase.exists():
+        print(f"🗄️  Using {VENUE_DB_FILE}")
+        with VenueDatabase() as db:
+            venues_to_geocode = [(venue.id, venue.to_csv_row()) for venue in db.venues('latitude IS NULL')]
+    else:
+        with open(CSV_FILE, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            venues_to_geocode = [(position, row) for position, row in enumerate(reader)
+                                 if not row.get('Latitude') or not row.get('Longitude')]
     
     print(f"📍 Found {len(venues_to_geocode)} venues that need geocoding")
     
     geocoded_count = 0
     failed_count = 0
     
-    for i, venue in enumerate(venues_to_geocode, 1):
+    new_coordinates = {}
+    for i, (key, venue) in enumerate(venues_to_geocode, 1):
         print(f"\n🔄 Processing {i}/{len(venues_to_geocode)}: {venue.get('Name', 'Unknown')[:50]}...")
         
         # Build address
@@ -195,8 +222,7 @@ def advanced_geocode_venues():
             
             if lat and lng and is_coordinate_in_uk(lat, lng):
                 # Found valid UK coordinates
-                venue['Latitude'] = str(lat)
-                venue['Longitude'] = str(lng)
+                new_coordinates[key] = (lat, lng)
                 print(f"  ✅ Success with {geocoder.name}: {lat:.4f}, {lng:.4f}")
                 geocoded_count += 1
                 success = True
@@ -210,41 +236,44 @@ def advanced_geocode_venues():
             print(f"  ❌ All geocoding services failed")
             failed_count += 1
     
-    # Save updated CSV - preserve all venues
+    # Save the new coordinates - only the geocoded venues are written to the database
     print(f"\n💾 Saving updated coordinates...")
     
-    # Load all venues from the restored CSV
-    with open('JW and Smirnoff Venues - Sheet1_with_coords.csv', 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        fieldnames = reader.fieldnames
-        all_venues = list(reader)
-    
-    # Create a lookup for geocoded venues
-    geocoded_venues = {v.get('Name', ''): v for v in venues_to_geocode if v.get('Latitude') and v.get('Longitude')}
-    
-    # Update venues with new coordinates
-    updated_count = 0
-    for venue in all_venues:
-        name = venue.get('Name', '')
-        if name in geocoded_venues:
-            venue['Latitude'] = geocoded_venues[name]['Latitude']
-            venue['Longitude'] = geocoded_venues[name]['Longitude']
-            updated_count += 1
-    
-    # Save the updated CSV
-    with open('JW and Smirnoff Venues - Sheet1_with_coords.csv', 'w', newline='', encoding='utf-8') as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_venues)
+    if VenueDatabase.exists():
+        with VenueDatabase() as db:
+            updated_count = db.set_coordinates(new_coordinates)
+            total_venues = len(db)
+    else:
+        # Load all venues from the restored CSV
+        with open(CSV_FILE, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            fieldnames = reader.fieldnames
+            all_venues = list(reader)
+        
+        # Update venues by row position (names are not unique)
+        for position, (lat, lng) in new_coordinates.items():
+            all_venues[position]['Latitude'] = str(lat)
+            all_venues[position]['Longitude'] = str(lng)
+        updated_count = len(new_coordinates)
+        total_venues = len(all_venues)
+        
+        # Save the updated CSV
+        with open(CSV_FILE, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(all_venues)
     
     print(f"✅ Updated {updated_count} venues with new coordinates")
-    print(f"📊 Total venues preserved: {len(all_venues)}")
+    print(f"📊 Total venues preserved: {total_venues}")
     
     print(f"\n🎉 Advanced geocoding complete!")
     print(f"✅ Successfully geocoded: {geocoded_count} venues")
     print(f"❌ Failed to geocode: {failed_count} venues")
     print(f"📊 Success rate: {(geocoded_count / len(venues_to_geocode)) * 100:.1f}%")
     
+    metrics.close()
+    metrics.print_report()
+    
     return geocoded_count, failed_count
 
 def show_api_key_instructions():
@@ -256,10 +285,15 @@ def show_api_key_instructions():
     print("\nThen uncomment the relevant lines in this script and add your keys.")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Geocode venues without coordinates using multiple services")
+    parser.add_argument('--metrics', default=METRICS_FILE,
+                        help="Metrics output file, JSON or Prometheus text for .prom (default: %(default)s)")
+    args = parser.parse_args()
+    
     show_api_key_instructions()
     
     try:
-        geocoded, failed = advanced_geocode_venues()
+        geocoded, failed = advanced_geocode_venues(args.metrics)
         
         print(f"\n🔄 Regenerating venue data...")
         import subprocess
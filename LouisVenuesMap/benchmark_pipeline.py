@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Benchmark the data pipeline on synthetic venue sheets of increasing size.
+Each size runs every stage in order in a scratch copy of this directory and
+records wall time, peak RSS (the stage and any script it runs itself) and
+the size of the files it wrote, then compares them with the stored
+baselines so scaling regressions show up before they reach the real sheet.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from generate_synthetic_venues import CSV_FILE, generate_venues, write_venues
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINES_FILE = os.path.join(SCRIPT_DIR, 'benchmark_baselines.json')
+RESULTS_FILE = 'benchmark_results.json'
+
+DEFAULT_SIZES = [10000, 100000]
+
+# Pipeline stages in the order they normally run: (name, script, arguments)
+STAGES = [
+    ('add_county_data', 'add_county_data.py', []),
+    ('fix_phone_numbers', 'fix_phone_numbers.py', []),
+    ('clean_coordinates', 'clean_coordinates.py', []),
+    ('regenerate_data', 'regenerate_data.py', []),
+    ('create_regional_groups', 'create_regional_groups.py', []),
+]
+
+# Support files the stages read (copied into the scratch directory when present)
+SUPPORT_FILES = ['uk_numbering_plan.csv', 'postcode_districts.csv', 'postcode_district_centroids.csv']
+SUPPORT_DIRS = ['boundaries']
+
+# A measurement regresses if it exceeds baseline * tolerance + slack
+TIME_TOLERANCE, TIME_SLACK_SECONDS = 1.5, 0.5
+RSS_TOLERANCE, RSS_SLACK_MB = 1.3, 20.0
+OUTPUT_TOLERANCE, OUTPUT_SLACK_MB = 1.1, 0.1
+
+
+def prepare_workdir(rows: int, seed: int) -> str:
+    """Scratch copy of the scripts plus a synthetic sheet of the requested size."""
+    # Laid out like the repository, so pipeline_profile.py finds ../shared
+    root = tempfile.mkdtemp(prefix=f'venue-bench-{rows}-')
+    shutil.copytree(os.path.join(os.path.dirname(SCRIPT_DIR), 'shared'), os.path.join(root, 'shared'))
+    workdir = os.path.join(root, os.path.basename(SCRIPT_DIR))
+    os.makedirs(workdir)
+    for name in os.listdir(SCRIPT_DIR):
+        if name.endswith('.py') or name in SUPPORT_FILES:
+            shutil.copy2(os.path.join(SCRIPT_DIR, name), workdir)
+    for name in SUPPORT_DIRS:
+        if os.path.isdir(os.path.join(SCRIPT_DIR, name)):
+            shutil.copytree(os.path.join(SCRIPT_DIR, name), os.path.join(workdir, name))
+
+    write_venues(generate_venues(rows, seed), os.path.join(workdir, CSV_FILE))
+    return workdir
+
+
+def snapshot(workdir: str) -> Dict[str, tuple]:
+    files = {}
+    for root, _, names in os.walk(workdir):
+        for name in names:
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            files[path] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def run_stage(workdir: str, name: str, script: str, args: List[str]) -> dict:
+    """Run one stage and measure it (os.wait4 reports the peak RSS of the stage and its children)."""
+    before = snapshot(workdir)
+    log_path = os.path.join(workdir, f'{name}.log')
+    with open(log_path, 'w', encoding='utf-8') as log:
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, script, *args], cwd=workdir, stdout=log, stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    after = snapshot(workdir)
+    written = sum(size for path, (mtime, size) in after.items()
+                  if path != log_path and before.get(path) != (mtime, size))
+
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    rss_bytes = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+    return {
+        'seconds': round(elapsed, 3),
+        'peak_rss_mb': round(rss_bytes / 1e6, 1),
+        'output_mb': round(written / 1e6, 2),
+        'ok': process.returncode == 0,
+        'log': log_path,
+    }
+
+
+def compare(measured: dict, baseline: Optional[dict]) -> List[str]:
+    """Names of the metrics that regressed against the baseline."""
+    if not baseline:
+        return []
+    regressions = []
+    for metric, tolerance, slack in (('seconds', TIME_TOLERANCE, TIME_SLACK_SECONDS),
+                                     ('peak_rss_mb', RSS_TOLERANCE, RSS_SLACK_MB),
+                                     ('output_mb', OUTPUT_TOLERANCE, OUTPUT_SLACK_MB)):
+        if metric in baseline and measured[metric] > baseline[metric] * tolerance + slack:
+            regressions.append(metric)
+    return regressions
+
+
+def load_baselines(path: str = BASELINES_FILE) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def benchmark_pipeline(sizes: List[int], seed: int = 42, update_baselines: bool = False, keep: bool = False) -> bool:
+    print(f"⏱️  Benchmarking the venue pipeline at {', '.join(f'{s:,}' for s in sizes)} rows...")
+    baselines = load_baselines()
+    if baselines.get('machine'):
+        machine = baselines['machine']
+        print(f"📌 Baselines recorded with Python {machine['python']} on {machine['cpus']} CPUs ({machine['machine']})")
+    results = {'python': platform.python_version(), 'machine': platform.machine(),
+               'cpus': os.cpu_count(), 'seed': seed, 'sizes': {}}
+    failures = 0
+    regressions = 0
+
+    for rows in sizes:
+        start = time.perf_counter()
+        workdir = prepare_workdir(rows, seed)
+        print(f"\n📊 {rows:,} rows (sheet generated in {time.perf_counter() - start:.1f}s, {workdir})")
+        print(f"  {'stage':<24}{'time':>10}{'peak RSS':>12}{'output':>11}   vs baseline")
+
+        size_results = {}
+        for name, script, args in STAGES:
+            measured = run_stage(workdir, name, script, args)
+            baseline = baselines.get(str(rows), {}).get(name)
+            regressed = compare(measured, baseline)
+
+            if not measured['ok']:
+                failures += 1
+                note = f"❌ failed - see {measured['log']}"
+            elif regressed:
+                regressions += 1
+                note = "⚠️  regressed: " + ', '.join(
+                    f"{metric} {measured[metric]:g} vs {baseline[metric]:g}" for metric in regressed)
+            elif baseline:
+                note = f"✅ {measured['seconds'] / max(baseline['seconds'], 1e-3):.2f}x time"
+            else:
+                note = "(no baseline)"
+
+            print(f"  {name:<24}{measured['seconds']:>9.2f}s{measured['peak_rss_mb']:>9.1f} MB"
+                  f"{measured['output_mb']:>8.2f} MB   {note}")
+            size_results[name] = {key: measured[key] for key in ('seconds', 'peak_rss_mb', 'output_mb')}
+
+        results['sizes'][str(rows)] = size_results
+        if not keep and failures == 0:
+            shutil.rmtree(os.path.dirname(workdir), ignore_errors=True)
+
+    with open(RESULTS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n📁 Results written to {RESULTS_FILE}")
+
+    if update_baselines and failures == 0:
+        baselines.update(results['sizes'])
+        baselines['machine'] = {key: results[key] for key in ('python', 'machine', 'cpus')}
+        with open(BASELINES_FILE, 'w', encoding='utf-8') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+        print(f"📌 Baselines updated in {BASELINES_FILE}")
+
+    if failures or regressions:
+        print(f"❌ {failures} stage failures, {regressions} regressions")
+        return False
+    print("✅ No regressions")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the venue pipeline on synthetic data")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="Row counts to benchmark (default: %(default)s; add 1000000 for the full run)")
+    parser.add_argument('--seed', type=int, default=42, help="Synthetic data seed (default: %(default)s)")
+    parser.add_argument('--update-baselines', action='store_true', help="Store these results as the new baselines")
+    parser.add_argument('--keep', action='store_true', help="Keep the scratch directories for inspection")
+    args = parser.parse_args()
+
+    if not benchmark_pipeline(args.sizes, args.seed, args.update_baselines, args.keep):
+        raise SystemExit(1)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Build the trigram search index used by the map's search box.
+Venue names, addresses, towns, counties, postcodes and account managers are
+normalised and split into character trigrams; each trigram maps to the
+(delta-encoded) positions of the venues containing it. The index is written
+to search-index.js next to venue-data.js.
+"""
+
+import json
+import re
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from venue_store import VENUE_DATA_FILE, load_venue_data
+
+SEARCH_INDEX_FILE = 'search-index.js'
+
+# Venue fields that the search box matches against
+SEARCH_FIELDS = ['name', 'fullAddress', 'town', 'county', 'postCode', 'accountManager']
+
+NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_search_text(text: str) -> str:
+    """Lower-case and collapse punctuation/whitespace to single spaces (script.js does the same)."""
+    return NON_ALPHANUMERIC.sub(' ', (text or '').lower()).strip()
+
+
+def venue_search_text(venue: dict) -> str:
+    return normalize_search_text(' '.join(str(venue.get(field) or '') for field in SEARCH_FIELDS))
+
+
+def trigrams(text: str) -> List[str]:
+    """Distinct trigrams of ' text ' (padding lets word starts/ends match)."""
+    padded = f' {text} '
+    return list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+
+def encode_postings(positions: List[int]) -> str:
+    """Sorted positions as comma-separated base-36 gaps ('0,1,a' = 0, 1, 11)."""
+    parts = []
+    previous = 0
+    for position in positions:
+        parts.append(to_base36(position - previous))
+        previous = position
+    return ','.join(parts)
+
+
+def to_base36(value: int) -> str:
+    digits = '0123456789abcdefghijklmnopqrstuvwxyz'
+    if value == 0:
+        return '0'
+    encoded = ''
+    while value:
+        value, remainder = divmod(value, 36)
+        encoded = digits[remainder] + encoded
+    return encoded
+
+
+def build_index(venues: List[dict]) -> Dict[str, object]:
+    postings = defaultdict(list)
+    for position, venue in enumerate(venues):
+        for gram in trigrams(venue_search_text(venue)):
+            postings[gram].append(position)
+    return {
+        'count': len(venues),
+        'fields': SEARCH_FIELDS,
+        'grams': {gram: encode_postings(positions) for gram, positions in sorted(postings.items())},
+    }
+
+
+def write_search_index(venues: List[dict], path: str = SEARCH_INDEX_FILE) -> Dict[str, object]:
+    index = build_index(venues)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("// Trigram search index generated by build_search_index.py\n")
+        f.write(f"const VENUE_SEARCH_INDEX = {json.dumps(index, separators=(',', ':'))};\n")
+    return index
+
+
+def build_search_index(data_file: str = VENUE_DATA_FILE, output_file: str = SEARCH_INDEX_FILE):
+    print("🔎 Building venue search index...")
+    start = time.perf_counter()
+    venues = load_venue_data(data_file)
+    index = write_search_index(venues, output_file)
+    print(f"✅ Indexed {len(venues)} venues: {len(index['grams'])} trigrams "
+          f"in {(time.perf_counter() - start) * 1000:.0f}ms")
+    print(f"📁 Updated {output_file}")
+
+
+if __name__ == "__main__":
+    build_search_index()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Cross-check venue coordinates against the centroid of their postcode district.
+Geocoders sometimes return a point inside the UK but in the wrong town; any
+venue too far from its own district centroid is flagged (and optionally
+re-queued for geocoding by clearing its coordinates).
+"""
+
+import argparse
+import csv
+import os
+import statistics
+import time
+
+from postcode_index import split_postcode
+from spatial_index import SphereKDTree, haversine_km
+from venue_record import row_coordinates
+from venue_store import VENUE_DB_FILE, VenueDatabase
+
+CSV_FILE = 'JW and Smirnoff Venues - Sheet1_with_coords.csv'
+
+# Optional postcode district centroids (e.g. a "postcode districts" CSV with Postcode, Latitude, Longitude)
+CENTROIDS_FILE = 'postcode_district_centroids.csv'
+
+# Report of flagged venues
+REPORT_FILE = 'geocode_flags.csv'
+
+# Column names accepted for the district in a centroids CSV
+DISTRICT_COLUMNS = ['Postcode', 'District', 'Postcode District', 'pcd']
+
+# Venues further than this from their district centroid are flagged
+MAX_DISTANCE_KM = 10.0
+
+# Minimum venues per district before the sheet itself is trusted for a centroid
+MIN_VENUES_PER_DISTRICT = 3
+
+
+def load_district_centroids(path: str = CENTROIDS_FILE):
+    """Read district -> (lat, lng) from a centroids CSV."""
+    centroids = {}
+    with open(path, 'r', encoding='utf-8-sig') as file:
+        reader = csv.DictReader(file)
+        district_column = next((c for c in DISTRICT_COLUMNS if c in (reader.fieldnames or [])), None)
+        if district_column is None:
+            raise ValueError(f"{path} has no postcode district column (expected one of {', '.join(DISTRICT_COLUMNS)})")
+        for row in reader:
+            coordinates = row_coordinates(row)
+            district, _ = split_postcode(row[district_column] or '')
+            if coordinates and district:
+                centroids[district] = coordinates
+    return centroids
+
+
+def centroids_from_venues(venues, min_venues: int = MIN_VENUES_PER_DISTRICT):
+    """
+    Estimate district centroids from the sheet itself (median of each district's
+    venues), so a single bad geocode cannot drag its own centroid away.
+    """
+    points = {}
+    for venue in venues:
+        coordinates = row_coordinates(venue)
+        district, _ = split_postcode(venue.get('PostCode', ''))
+        if coordinates and district:
+            points.setdefault(district, []).append(coordinates)
+    return {district: (statistics.median(p[0] for p in pts), statistics.median(p[1] for p in pts))
+            for district, pts in points.items() if len(pts) >= min_venues}
+
+
+def check_geocodes(venues, centroids, max_km: float = MAX_DISTANCE_KM):
+    """
+    Return a list of flag dicts for venues more than max_km from their own
+    district centroid, plus the number of venues that could be checked.
+    """
+    districts = list(centroids)
+    tree = SphereKDTree([centroids[d] for d in districts])
+
+    flags = []
+    checked = 0
+    for index, venue in enumerate(venues):
+        coordinates = row_coordinates(venue)
+        district, _ = split_postcode(venue.get('PostCode', ''))
+        if not coordinates or district not in centroids:
+            continue
+
+        checked += 1
+        distance = haversine_km(*coordinates, *centroids[district])
+        if distance > max_km:
+            nearest_km, nearest = tree.nearest(*coordinates, k=1)[0]
+            flags.append({
+                'row': index,
+                'Name': venue.get('Name', ''),
+                'PostCode': venue.get('PostCode', ''),
+                'Latitude': venue.get('Latitude', ''),
+                'Longitude': venue.get('Longitude', ''),
+                'district_km': round(distance, 1),
+                'nearest_district': districts[nearest],
+                'nearest_km': round(nearest_km, 1),
+            })
+
+    return flags, checked
+
+
+def check_postcode_centroids(max_km: float = MAX_DISTANCE_KM, requeue: bool = False):
+    print(f"📮 Checking geocodes against postcode district centroids (> {max_km:g} km is flagged)...")
+
+    # venues.db is the source of truth once it exists (advanced_geocode.py reads it)
+    use_db = VenueDatabase.exists()
+    if use_db:
+        print(f"🗄️  Using {VENUE_DB_FILE}")
+        with VenueDatabase() as db:
+            rows = list(db.sheet_rows())
+        venue_ids = [venue_id for venue_id, _ in rows]
+        venues = [row for _, row in rows]
+    else:
+        with open(CSV_FILE, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            fieldnames = reader.fieldnames
+            venues = list(reader)
+
+    start = time.perf_counter()
+    if os.path.exists(CENTROIDS_FILE):
+        centroids = load_district_centroids(CENTROIDS_FILE)
+        print(f"📁 Loaded {len(centroids)} district centroids from {CENTROIDS_FILE}")
+    else:
+        centroids = centroids_from_venues(venues)
+        print(f"📁 {CENTROIDS_FILE} not found - estimated {len(centroids)} district centroids from the venues")
+
+    flags, checked = check_geocodes(venues, centroids, max_km)
+    elapsed = time.perf_counter() - start
+
+    for flag in flags[:10]:
+        print(f"  ⚠️  {flag['Name']} ({flag['PostCode']}): {flag['district_km']} km from its district, "
+              f"nearest district {flag['nearest_district']}")
+    if len(flags) > 10:
+        print(f"  ... and {len(flags) - 10} more")
+
+    with open(REPORT_FILE, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=['row', 'Name', 'PostCode', 'Latitude', 'Longitude',
+                                                  'district_km', 'nearest_district', 'nearest_km'])
+        writer.writeheader()
+        writer.writerows(flags)
+
+    print(f"✅ Checked {checked}/{len(venues)} venues in {elapsed * 1000:.1f}ms")
+    print(f"🚩 {len(flags)} venues flagged - see {REPORT_FILE}")
+
+    if requeue and flags:
+        # Clearing coordinates makes advanced_geocode.py pick these venues up again
+        if use_db:
+            with VenueDatabase() as db:
+                db.set_coordinates({venue_ids[flag['row']]: (None, None) for flag in flags})
+        else:
+            for flag in flags:
+                venues[flag['row']]['Latitude'] = ''
+                venues[flag['row']]['Longitude'] = ''
+            with open(CSV_FILE, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.DictWriter(file, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(venues)
+        print(f"🔁 Cleared coordinates for {len(flags)} venues - run advanced_geocode.py to re-geocode them")
+
+    return flags
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Flag venues geocoded far from their postcode district")
+    parser.add_argument('--max-km', type=float, default=MAX_DISTANCE_KM,
+                        help="Distance from the district centroid that counts as wrong (default: %(default)s)")
+    parser.add_argument('--requeue', action='store_true',
+                        help="Clear the coordinates of flagged venues so they are geocoded again")
+    args = parser.parse_args()
+
+    check_postcode_centroids(args.max_km, args.requeue)
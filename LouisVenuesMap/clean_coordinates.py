@@ -4,30 +4,13 @@ Clean up incorrect coordinates that are outside the UK.
 Remove coordinates that are clearly in other countries.
 """
 
+import argparse
 import csv
 import json
 
-def is_coordinate_in_uk(lat, lng):
-    """
-    Check if coordinates are within the UK bounding box.
-    UK approximate bounds:
-    - Latitude: 49.8 to 60.9 (Shetland Islands)
-    - Longitude: -8.2 to 1.8 (Northern Ireland to East Anglia)
-    """
-    try:
-        lat = float(lat)
-        lng = float(lng)
-        
-        # UK bounding box
-        uk_lat_min = 49.8
-        uk_lat_max = 60.9
-        uk_lng_min = -8.2
-        uk_lng_max = 1.8
-        
-        return (uk_lat_min <= lat <= uk_lat_max and 
-                uk_lng_min <= lng <= uk_lng_max)
-    except (ValueError, TypeError):
-        return False
+from pipeline_profile import add_profile_argument, profiling, stage
+from uk_coordinates import validate_coordinates
+from venue_store import VENUE_DB_FILE, VenueDatabase
 
 def clean_coordinates():
     """
@@ -35,36 +18,35 @@ def clean_coordinates():
     """
     print("🧹 Cleaning coordinates outside the UK...")
     
+    if VenueDatabase.exists():
+        return clean_coordinates_in_db()
+    
     # Read the CSV with coordinates
-    venues = []
-    with open('JW and Smirnoff Venues - Sheet1_with_coords.csv', 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        fieldnames = reader.fieldnames
-        
-        for row in reader:
-            # Check if coordinates exist and are valid
-            lat = row.get('Latitude', '').strip()
-            lng = row.get('Longitude', '').strip()
-            
-            if lat and lng:
-                if is_coordinate_in_uk(lat, lng):
-                    # Coordinates are in UK - keep them
-                    venues.append(row)
-                else:
-                    # Coordinates are outside UK - remove them
-                    print(f"❌ Removing coordinates for {row.get('Name', 'Unknown')}: {lat}, {lng}")
-                    row['Latitude'] = ''
-                    row['Longitude'] = ''
-                    venues.append(row)
-            else:
-                # No coordinates - keep as is
-                venues.append(row)
+    with stage('read CSV'):
+        with open('JW and Smirnoff Venues - Sheet1_with_coords.csv', 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            fieldnames = reader.fieldnames
+            venues = list(reader)
+    
+    # Validate every coordinate pair at once
+    with stage('validate coordinates'):
+        lats = [row.get('Latitude', '').strip() for row in venues]
+        lngs = [row.get('Longitude', '').strip() for row in venues]
+        in_uk = validate_coordinates(lats, lngs)
+    
+        for row, lat, lng, valid in zip(venues, lats, lngs, in_uk):
+            if lat and lng and not valid:
+                # Coordinates are outside UK - remove them
+                print(f"❌ Removing coordinates for {row.get('Name', 'Unknown')}: {lat}, {lng}")
+                row['Latitude'] = ''
+                row['Longitude'] = ''
     
     # Save the cleaned CSV
-    with open('JW and Smirnoff Venues - Sheet1_with_coords.csv', 'w', newline='', encoding='utf-8') as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(venues)
+    with stage('write CSV'):
+        with open('JW and Smirnoff Venues - Sheet1_with_coords.csv', 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(venues)
     
     # Count results
     total_venues = len(venues)
@@ -79,6 +61,39 @@ def clean_coordinates():
     
     return venues_with_coords, venues_without_coords
 
+def clean_coordinates_in_db():
+    """
+    Clear the coordinates outside the UK in venues.db; only those venues are written.
+    """
+    print(f"🗄️  Using {VENUE_DB_FILE}")
+    
+    with VenueDatabase() as db:
+        with stage('validate coordinates'):
+            rows = db.rows('name', 'latitude', 'longitude', where='latitude IS NOT NULL')
+            in_uk = validate_coordinates([row[2] for row in rows], [row[3] for row in rows])
+        
+            removed = {}
+            for (position, name, lat, lng), valid in zip(rows, in_uk):
+                if not valid:
+                    print(f"❌ Removing coordinates for {name or 'Unknown'}: {lat}, {lng}")
+                    removed[position] = (None, None)
+        
+        with stage('update venues.db'):
+            db.set_coordinates(removed)
+        
+        total_venues = len(db)
+    
+    venues_with_coords = len(rows) - len(removed)
+    venues_without_coords = total_venues - venues_with_coords
+    
+    print(f"✅ Coordinate cleaning complete!")
+    print(f"📊 Total venues: {total_venues}")
+    print(f"📍 Venues with valid UK coordinates: {venues_with_coords}")
+    print(f"🌍 Venues without coordinates: {venues_without_coords}")
+    print(f"📁 Updated: {VENUE_DB_FILE} ({len(removed)} venues)")
+    
+    return venues_with_coords, venues_without_coords
+
 def show_problematic_coordinates():
     """
     Show examples of coordinates that were removed.
@@ -86,39 +101,45 @@ def show_problematic_coordinates():
     print("\n🔍 Checking for problematic coordinates...")
     
     with open('JW and Smirnoff Venues - Sheet1_with_coords.csv', 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        
-        problematic_count = 0
-        for row in reader:
-            lat = row.get('Latitude', '').strip()
-            lng = row.get('Longitude', '').strip()
-            
-            if lat and lng:
-                if not is_coordinate_in_uk(lat, lng):
-                    problematic_count += 1
-                    if problematic_count <= 10:  # Show first 10 examples
-                        print(f"  - {row.get('Name', 'Unknown')}: {lat}, {lng}")
-        
-        if problematic_count > 10:
-            print(f"  ... and {problematic_count - 10} more")
-        
-        print(f"Found {problematic_count} venues with coordinates outside UK")
+        rows = [row for row in csv.DictReader(file)
+                if row.get('Latitude', '').strip() and row.get('Longitude', '').strip()]
+    
+    in_uk = validate_coordinates([row['Latitude'].strip() for row in rows],
+                                 [row['Longitude'].strip() for row in rows])
+    
+    problematic_count = 0
+    for row, valid in zip(rows, in_uk):
+        if not valid:
+            problematic_count += 1
+            if problematic_count <= 10:  # Show first 10 examples
+                print(f"  - {row.get('Name', 'Unknown')}: {row['Latitude']}, {row['Longitude']}")
+    
+    if problematic_count > 10:
+        print(f"  ... and {problematic_count - 10} more")
+    
+    print(f"Found {problematic_count} venues with coordinates outside UK")
 
 if __name__ == "__main__":
-    # First show what we're about to clean
-    show_problematic_coordinates()
-    
-    # Clean the coordinates
-    coords_count, no_coords_count = clean_coordinates()
-    
-    print(f"\n🔄 Regenerating venue data...")
-    import subprocess
-    result = subprocess.run(['python3', 'regenerate_data.py'], capture_output=True, text=True)
-    if result.returncode == 0:
-        print("✅ Venue data regenerated successfully!")
-        print("🌐 Your map will now only show venues with correct UK coordinates!")
-    else:
-        print("⚠️  Error regenerating venue data:")
-        print(result.stderr)
+    parser = argparse.ArgumentParser(description="Remove venue coordinates that are outside the UK")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    
+    with profiling('clean_coordinates', args.profile):
+        # First show what we're about to clean (the database run lists them as it goes)
+        if not VenueDatabase.exists():
+            show_problematic_coordinates()
+    
+        # Clean the coordinates
+        coords_count, no_coords_count = clean_coordinates()
+    
+        print(f"\n🔄 Regenerating venue data...")
+        import subprocess
+        result = subprocess.run(['python3', 'regenerate_data.py'], capture_output=True, text=True)
+        if result.returncode == 0:
+            print("✅ Venue data regenerated successfully!")
+            print("🌐 Your map will now only show venues with correct UK coordinates!")
+        else:
+            print("⚠️  Error regenerating venue data:")
+            print(result.stderr)
 
 
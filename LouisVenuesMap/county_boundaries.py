@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Assign venues to counties by point-in-polygon against the ONS county boundaries.
+Boundaries are loaded from a local GeoJSON file into an STR-packed R-tree, so each
+venue is only tested against the few polygons whose bounding box contains it.
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import time
+import urllib.request
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from add_county_data import get_county_from_postcode
+from venue_record import row_coordinates
+from venue_store import VENUE_DB_FILE, VenueDatabase
+
+# Local copy of the boundaries script.js loads from GitHub
+BOUNDARIES_FILE = 'Counties_and_Unitary_Authorities_December_2022_UK_BFC.geojson'
+BOUNDARIES_URL = ('https://raw.githubusercontent.com/ONSdigital/geoportal-ons-borders/master/'
+                  'geoportal/Counties_and_Unitary_Authorities_December_2022_UK_BFC.geojson')
+
+# Feature properties that hold the county name, in order of preference
+NAME_PROPERTIES = ['CTYUA22NM', 'NAME', 'name', 'county']
+
+CSV_FILE = 'JW and Smirnoff Venues - Sheet1_with_coords.csv'
+
+
+def download_boundaries(path: str = BOUNDARIES_FILE, url: str = BOUNDARIES_URL):
+    """Download the ONS county boundaries once so later runs work offline."""
+    print(f"⬇️  Downloading county boundaries to {path}...")
+    req = urllib.request.Request(url)
+    req.add_header('User-Agent', 'VenueMapApp/1.0 (contact@example.com)')
+    with urllib.request.urlopen(req, timeout=300) as response, open(path, 'wb') as file:
+        while True:
+            chunk = response.read(1 << 20)
+            if not chunk:
+                break
+            file.write(chunk)
+    print(f"✅ Saved {os.path.getsize(path) / 1e6:.1f} MB")
+
+
+def load_geojson(path: str = BOUNDARIES_FILE) -> dict:
+    """Load a GeoJSON FeatureCollection from disk."""
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def feature_name(feature: dict) -> str:
+    """Return the county name of a boundary feature."""
+    properties = feature.get('properties') or {}
+    for key in NAME_PROPERTIES:
+        if properties.get(key):
+            return properties[key]
+    # Fall back to any ONS-style '..NM' name column
+    for key, value in properties.items():
+        if key.upper().endswith('NM') and value:
+            return value
+    return 'Unknown'
+
+
+def iter_polygons(geometry: dict):
+    """Yield each polygon of a Polygon/MultiPolygon geometry as a list of rings."""
+    if not geometry:
+        return
+    if geometry['type'] == 'Polygon':
+        yield geometry['coordinates']
+    elif geometry['type'] == 'MultiPolygon':
+        yield from geometry['coordinates']
+
+
+def ring_bbox(ring) -> Tuple[float, float, float, float]:
+    """Bounding box (min_x, min_y, max_x, max_y) of a ring of [x, y] points."""
+    xs = [point[0] for point in ring]
+    ys = [point[1] for point in ring]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+class PreparedPolygon:
+    """
+    A polygon (exterior ring plus holes) prepared for repeated point-in-polygon tests.
+    Edges are bucketed into horizontal slabs the first time the polygon is queried,
+    so a test only crosses the edges that span the point's latitude.
+    """
+
+    def __init__(self, rings, name: str):
+        self.rings = rings
+        self.name = name
+        self.bbox = ring_bbox(rings[0])
+        self._slabs = None
+
+    def _prepare(self):
+        min_y, max_y = self.bbox[1], self.bbox[3]
+        edge_count = sum(len(ring) for ring in self.rings)
+        self._slab_count = max(1, min(4096, int(math.sqrt(edge_count))))
+        self._slab_height = (max_y - min_y) / self._slab_count or 1.0
+        slabs = [array('d') for _ in range(self._slab_count)]
+
+        for ring in self.rings:
+            for start, end in zip(ring, ring[1:] + ring[:1]):
+                x1, y1, x2, y2 = start[0], start[1], end[0], end[1]
+                if y1 == y2:
+                    continue  # Horizontal edges never cross a horizontal ray
+                first = self._slab_index(min(y1, y2))
+                last = self._slab_index(max(y1, y2))
+                for slab in range(first, last + 1):
+                    slabs[slab].extend((x1, y1, x2, y2))
+
+        self._slabs = slabs
+
+    def _slab_index(self, y: float) -> int:
+        index = int((y - self.bbox[1]) / self._slab_height)
+        return min(max(index, 0), self._slab_count - 1)
+
+    def contains(self, x: float, y: float) -> bool:
+        """Even-odd ray cast from (x, y) towards +x."""
+        min_x, min_y, max_x, max_y = self.bbox
+        if not (min_x <= x <= max_x and min_y <= y <= max_y):
+            return False
+        if self._slabs is None:
+            self._prepare()
+
+        edges = self._slabs[self._slab_index(y)]
+        inside = False
+        for i in range(0, len(edges), 4):
+            x1, y1, x2, y2 = edges[i], edges[i + 1], edges[i + 2], edges[i + 3]
+            if (y1 > y) != (y2 > y):
+                if x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                    inside = not inside
+        return inside
+
+
+class STRTree:
+    """
+    Static R-tree bulk-loaded with the Sort-Tile-Recursive algorithm.
+    Items are (bbox, payload) pairs; queries return payloads whose bbox contains a point.
+    """
+
+    def __init__(self, items: List[Tuple[Tuple[float, float, float, float], object]], node_capacity: int = 10):
+        self.node_capacity = node_capacity
+        self.size = len(items)
+        # Leaves are (bbox, payload, None); internal nodes are (bbox, None, children)
+        level = [(bbox, payload, None) for bbox, payload in items]
+        while len(level) > node_capacity:
+            level = self._pack(level)
+        self.root = (self._union([node[0] for node in level]), None, level) if level else None
+
+    def _pack(self, nodes):
+        """Group one level of nodes into parents of node_capacity children."""
+        capacity = self.node_capacity
+        parent_count = math.ceil(len(nodes) / capacity)
+        slice_count = math.ceil(math.sqrt(parent_count))
+        slice_size = slice_count * capacity
+
+        nodes = sorted(nodes, key=lambda node: (node[0][0] + node[0][2]) / 2)
+        parents = []
+        for start in range(0, len(nodes), slice_size):
+            vertical_slice = sorted(nodes[start:start + slice_size], key=lambda node: (node[0][1] + node[0][3]) / 2)
+            for group_start in range(0, len(vertical_slice), capacity):
+                children = vertical_slice[group_start:group_start + capacity]
+                parents.append((self._union([child[0] for child in children]), None, children))
+        return parents
+
+    @staticmethod
+    def _union(bboxes):
+        return (min(b[0] for b in bboxes), min(b[1] for b in bboxes),
+                max(b[2] for b in bboxes), max(b[3] for b in bboxes))
+
+    def query_point(self, x: float, y: float) -> List[object]:
+        """Return the payloads of every item whose bounding box contains (x, y)."""
+        results = []
+        stack = [self.root] if self.root else []
+        while stack:
+            (min_x, min_y, max_x, max_y), payload, children = stack.pop()
+            if not (min_x <= x <= max_x and min_y <= y <= max_y):
+                continue
+            if children is None:
+                results.append(payload)
+            else:
+                stack.extend(children)
+        return results
+
+
+class CountyLocator:
+    """Point-in-polygon county lookup over a set of boundary features."""
+
+    def __init__(self, features: Iterable[dict]):
+        polygons = []
+        for feature in features:
+            name = feature_name(feature)
+            for rings in iter_polygons(feature.get('geometry')):
+                if rings and len(rings[0]) >= 3:
+                    polygons.append(PreparedPolygon(rings, name))
+        self.polygons = polygons
+        self.tree = STRTree([(polygon.bbox, polygon) for polygon in polygons])
+
+    @classmethod
+    def from_file(cls, path: str = BOUNDARIES_FILE):
+        return cls(load_geojson(path).get('features', []))
+
+    def locate(self, lat: float, lng: float) -> Optional[str]:
+        """Return the name of the county containing the point, or None."""
+        for polygon in self.tree.query_point(lng, lat):
+            if polygon.contains(lng, lat):
+                return polygon.name
+        return None
+
+    def locate_many(self, points: Iterable[Tuple[float, float]]) -> List[Optional[str]]:
+        """Locate a batch of (lat, lng) points."""
+        return [self.locate(lat, lng) for lat, lng in points]
+
+
+def assign_counties_from_boundaries(boundaries_file: str = BOUNDARIES_FILE):
+    """
+    Set the County column of every geocoded venue to the boundary polygon that
+    contains it. Venues without coordinates (or outside every polygon) keep a
+    postcode-derived county.
+    """
+    print("🗺️  Assigning counties from boundary polygons...")
+
+    start = time.perf_counter()
+    locator = CountyLocator.from_file(boundaries_file)
+    print(f"📐 Loaded {len(locator.polygons)} polygons in {time.perf_counter() - start:.2f}s")
+
+    # venues.db is the source of truth once it exists (regenerate_data.py reads it)
+    use_db = VenueDatabase.exists()
+    if use_db:
+        with VenueDatabase() as db:
+            rows = list(db.sheet_rows())
+        venue_ids = [venue_id for venue_id, _ in rows]
+        venues = [row for _, row in rows]
+    else:
+        with open(CSV_FILE, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            fieldnames = reader.fieldnames
+            venues = list(reader)
+
+        if 'County' not in fieldnames:
+            fieldnames.append('County')
+
+    start = time.perf_counter()
+    polygon_count = 0
+    changed_count = 0
+    for row in venues:
+        coordinates = row_coordinates(row)
+        county = locator.locate(*coordinates) if coordinates else None
+        if county:
+            polygon_count += 1
+        else:
+            county = row.get('County') or get_county_from_postcode(row.get('PostCode', ''))
+        if county != row.get('County'):
+            changed_count += 1
+        row['County'] = county
+    elapsed = time.perf_counter() - start
+
+    if use_db:
+        with VenueDatabase() as db:
+            db.update_column('county', {venue_id: row['County'] for venue_id, row in zip(venue_ids, venues)})
+    else:
+        with open(CSV_FILE, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(venues)
+
+    print(f"✅ Located {polygon_count}/{len(venues)} venues inside a county polygon in {elapsed * 1000:.0f}ms")
+    print(f"🔁 {changed_count} venues changed county")
+    print(f"📮 {len(venues) - polygon_count} venues kept their postcode county")
+    print(f"📁 Updated: {VENUE_DB_FILE if use_db else CSV_FILE}")
+
+    return polygon_count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Assign venues to counties using ONS boundary polygons")
+    parser.add_argument('--boundaries', default=BOUNDARIES_FILE, help="Local county boundaries GeoJSON")
+    parser.add_argument('--download', action='store_true', help="Download the boundaries if the file is missing")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.boundaries):
+        if args.download:
+            download_boundaries(args.boundaries)
+        else:
+            print(f"❌ Boundaries file not found: {args.boundaries}")
+            print("Run again with --download to fetch it from the ONS geoportal repository.")
+            raise SystemExit(1)
+
+    assign_counties_from_boundaries(args.boundaries)
@@ -4,7 +4,14 @@ Create 10 regional groupings of UK counties for the venue map.
 Each group should have similar venue counts and contain geographically adjacent counties.
 """
 
-import json
+import argparse
+import os
+import time
+
+from pipeline_profile import add_profile_argument, profiling, stage
+from regional_partition import (adjacency_from_boundaries, county_centroids_from_venues,
+                                partition_counties)
+from venue_store import VENUE_DB_FILE, VenueDatabase, load_venues as load_venue_records, write_venue_data
 
 # Define 10 regional groups based on geography and venue distribution
 REGIONAL_GROUPS = {
@@ -50,27 +57,75 @@ REGIONAL_GROUPS = {
     }
 }
 
-def create_county_to_region_mapping():
+def create_county_to_region_mapping(groups=None):
     """Create a mapping from individual counties to regional groups."""
+    groups = groups or REGIONAL_GROUPS
     county_to_region = {}
     
-    for region_name, region_data in REGIONAL_GROUPS.items():
+    for region_name, region_data in groups.items():
         for county in region_data["counties"]:
+            if county in county_to_region:
+                print(f"⚠️  {county} is listed in both {county_to_region[county]} and {region_name}")
             county_to_region[county] = region_name
     
     return county_to_region
 
-def analyze_regional_distribution():
+def load_venues():
+    """Load the venue list from venue-data.js."""
+    return load_venue_records()
+
+def create_automatic_groups(region_count, boundaries_file=None, venues=None):
+    """
+    Partition counties into region_count contiguous regions balanced by venue count.
+    Adjacency comes from the county boundary polygons if available, otherwise
+    from the nearest venue centroids of each county.
+    """
+    start_time = time.perf_counter()
+    venues = venues if venues is not None else load_venues()
+    
+    venue_counts = {}
+    for venue in venues:
+        county = venue.get('county', 'Unknown')
+        venue_counts[county] = venue_counts.get(county, 0) + 1
+    venue_counts.pop('Unknown', None)
+    
+    graph = None
+    centroids = county_centroids_from_venues(venues)
+    if boundaries_file and os.path.exists(boundaries_file):
+        from county_boundaries import load_geojson
+        graph, boundary_centroids = adjacency_from_boundaries(load_geojson(boundaries_file)['features'])
+        missing = [county for county in venue_counts if county not in boundary_centroids]
+        if missing:
+            print(f"⚠️  {len(missing)} venue counties are not in {boundaries_file} "
+                  f"(e.g. {', '.join(missing[:3])}) - using venue centroids instead")
+            graph = None
+        else:
+            centroids = boundary_centroids
+    centroids.pop('Unknown', None)
+    
+    with stage('partition counties'):
+        regions = partition_counties(venue_counts, region_count, graph=graph, centroids=centroids)
+    target = round(sum(venue_counts.values()) / len(regions))
+    
+    groups = {}
+    for counties in regions:
+        # Name each region after its busiest county
+        name = f"{counties[0]} Region"
+        groups[name] = {
+            "counties": counties,
+            "target_venues": target,
+        }
+    
+    print(f"🧮 Partitioned {len(centroids)} counties into {len(groups)} regions "
+          f"in {(time.perf_counter() - start_time) * 1000:.0f}ms")
+    return groups
+
+def analyze_regional_distribution(groups=None, venues=None):
     """Analyze how venues would be distributed across regional groups."""
-    # Load venue data
-    with open('venue-data.js', 'r') as f:
-        content = f.read()
-        start = content.find('[')
-        end = content.rfind(']') + 1
-        venues = json.loads(content[start:end])
+    venues = venues if venues is not None else load_venues()
     
     # Create county to region mapping
-    county_to_region = create_county_to_region_mapping()
+    county_to_region = create_county_to_region_mapping(groups)
     
     # Count venues per region
     region_counts = {}
@@ -89,48 +144,60 @@ def analyze_regional_distribution():
     
     return county_to_region
 
-def update_venue_data_with_regions():
+def update_venue_data_with_regions(groups=None, venues=None):
     """Update venue data to include regional group information."""
-    # Load venue data
-    with open('venue-data.js', 'r') as f:
-        content = f.read()
-        start = content.find('[')
-        end = content.rfind(']') + 1
-        venues = json.loads(content[start:end])
+    venues = venues if venues is not None else load_venues()
     
     # Create county to region mapping
-    county_to_region = create_county_to_region_mapping()
+    county_to_region = create_county_to_region_mapping(groups)
     
     # Add region to each venue
     for venue in venues:
         county = venue.get('county', 'Unknown')
-        venue['region'] = county_to_region.get(county, 'Other')
-    
-    # Generate updated JavaScript
-    js_code = f"""
-// Venue data with regional groupings
-// {len(venues)} venues across {len(set(v['region'] for v in venues))} regional groups
-const VENUE_DATA = {json.dumps(venues, indent=2)};
-"""
-    
-    # Write to JavaScript file
-    with open('venue-data.js', 'w', encoding='utf-8') as f:
-        f.write(js_code)
+        venue.region = county_to_region.get(county, 'Other')
+    
+    # Write the updated JavaScript a venue at a time
+    region_count = len(set(v.region for v in venues))
+    with stage('JSON dump + write venue-data.js'):
+        write_venue_data(venues, [
+            "Venue data with regional groupings",
+            f"{len(venues)} venues across {region_count} regional groups",
+        ])
+    
+    # Keep the database in step so the next regenerate keeps the regions
+    if VenueDatabase.exists():
+        with stage('update venues.db'):
+            with VenueDatabase() as db:
+                changed = db.update_column('region', {venue.id: venue.region for venue in venues})
+        print(f"🗄️  Updated {changed} regions in {VENUE_DB_FILE}")
     
     print(f"✅ Updated venue-data.js with regional groupings!")
     print(f"📊 Processed {len(venues)} venues")
-    print(f"🌍 Created {len(set(v['region'] for v in venues))} regional groups")
+    print(f"🌍 Created {region_count} regional groups")
 
 if __name__ == "__main__":
-    print("🗺️  Creating regional groupings for UK venues...")
-    
-    # Analyze current distribution
-    county_to_region = analyze_regional_distribution()
-    
-    print("\n" + "="*50)
-    print("Updating venue data with regional groups...")
-    
-    # Update venue data
-    update_venue_data_with_regions()
-    
-    print("\n🎉 Regional grouping complete!")
+    parser = argparse.ArgumentParser(description="Group counties into regions and tag venues with them")
+    parser.add_argument('--auto', type=int, metavar='K',
+                        help="Compute K balanced, contiguous regions instead of using REGIONAL_GROUPS")
+    parser.add_argument('--boundaries', default='Counties_and_Unitary_Authorities_December_2022_UK_BFC.geojson',
+                        help="County boundaries GeoJSON used for adjacency with --auto (optional)")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    
+    with profiling('create_regional_groups', args.profile):
+        print("🗺️  Creating regional groupings for UK venues...")
+        
+        # Load the venues once for every step
+        venues = load_venues()
+        groups = create_automatic_groups(args.auto, args.boundaries, venues) if args.auto else REGIONAL_GROUPS
+        
+        # Analyze current distribution
+        county_to_region = analyze_regional_distribution(groups, venues)
+        
+        print("\n" + "="*50)
+        print("Updating venue data with regional groups...")
+        
+        # Update venue data
+        update_venue_data_with_regions(groups, venues)
+        
+        print("\n🎉 Regional grouping complete!")
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Find likely duplicate venues (the same place under slightly different names).
+Candidates are only compared within blocks - the same postcode, or nearby
+~100m grid cells - so the work grows with the number of venues rather than
+its square. Matching pairs are joined into clusters and written to a CSV.
+"""
+
+import argparse
+import csv
+import math
+import re
+import time
+from collections import defaultdict
+from itertools import combinations
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from postcode_index import normalize_postcode, split_postcode
+from venue_record import row_coordinates
+
+CSV_FILE = 'JW and Smirnoff Venues - Sheet1_with_coords.csv'
+OUTPUT_FILE = 'duplicate_venues.csv'
+
+# Size of the spatial grid cells used for blocking
+CELL_METRES = 100
+
+# Blocks larger than this are compared with a sorted-name window instead of all pairs
+MAX_BLOCK_SIZE = 100
+SORTED_WINDOW = 20
+
+# Similarity thresholds (trigram Jaccard, 0-1)
+NAME_THRESHOLD = 0.6
+MATCH_THRESHOLD = 0.65
+NAME_WEIGHT = 0.7
+
+METRES_PER_DEGREE = 111320
+LNG_SCALE = math.cos(math.radians(54.0))
+
+NON_WORD_CHARS = re.compile(r'[^a-z0-9 ]+')
+STOP_WORDS = {'the', 'ltd', 'limited'}
+
+
+def normalize_text(text: str) -> str:
+    """Lower-case, '&' -> 'and', drop punctuation and filler words."""
+    text = NON_WORD_CHARS.sub(' ', (text or '').lower().replace('&', ' and '))
+    return ' '.join(word for word in text.split() if word not in STOP_WORDS)
+
+
+def normalize_name(name: str) -> str:
+    """Venue names often carry a ' | Town' suffix; compare the name part only."""
+    return normalize_text((name or '').split('|')[0])
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Character trigrams of a padded string."""
+    if not text:
+        return frozenset()
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str], minimum: float = 0.0) -> float:
+    """Jaccard index of two sets; 0.0 early if it cannot reach minimum."""
+    if not a or not b:
+        return 0.0
+    # Size filter: the Jaccard index can never exceed the ratio of the set sizes
+    if min(len(a), len(b)) < minimum * max(len(a), len(b)):
+        return 0.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+class UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int):
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+
+class DuplicateFinder:
+    """
+    Blocks venues by postcode and grid cell, scores candidate pairs by name and
+    address similarity and clusters the matches.
+    """
+
+    def __init__(self, venues: List[dict], cell_metres: float = CELL_METRES,
+                 threshold: float = MATCH_THRESHOLD):
+        self.venues = venues
+        self.threshold = threshold
+        self.cell_lat = cell_metres / METRES_PER_DEGREE
+        self.cell_lng = cell_metres / (METRES_PER_DEGREE * LNG_SCALE)
+
+        self.names = [normalize_name(v.get('Name', '')) for v in venues]
+        self.name_grams = [trigrams(name) for name in self.names]
+        self.address_grams = [trigrams(normalize_text(v.get('Address1', ''))) for v in venues]
+        self.districts = [split_postcode(v.get('PostCode', ''))[0] for v in venues]
+        self.compared = set()
+        self.matches: Dict[Tuple[int, int], float] = {}
+
+    def blocks(self):
+        """Yield candidate blocks: one per postcode and one per cell + its neighbours."""
+        by_postcode = defaultdict(list)
+        by_cell = defaultdict(list)
+        for index, venue in enumerate(self.venues):
+            postcode = normalize_postcode(venue.get('PostCode', ''))
+            if postcode:
+                by_postcode[postcode].append(index)
+            cell = self.cell(venue)
+            if cell:
+                by_cell[cell].append(index)
+
+        yield from by_postcode.values()
+
+        # Each cell with its "forward" neighbours, so every adjacent pair of cells is visited once
+        for (row, col), members in by_cell.items():
+            block = list(members)
+            for d_row, d_col in ((0, 1), (1, -1), (1, 0), (1, 1)):
+                block.extend(by_cell.get((row + d_row, col + d_col), ()))
+            yield block
+
+    def cell(self, venue: dict) -> Optional[Tuple[int, int]]:
+        coordinates = row_coordinates(venue)
+        if coordinates is None:
+            return None
+        lat, lng = coordinates
+        return math.floor(lat / self.cell_lat), math.floor(lng / self.cell_lng)
+
+    def candidate_pairs(self, block: List[int]):
+        if len(block) <= MAX_BLOCK_SIZE:
+            return combinations(block, 2)
+        # Oversized block (e.g. a shopping centre postcode): compare neighbours in name order only
+        ordered = sorted(block, key=lambda i: self.names[i])
+        return ((ordered[i], ordered[j]) for i in range(len(ordered))
+                for j in range(i + 1, min(i + 1 + SORTED_WINDOW, len(ordered))))
+
+    def score(self, a: int, b: int) -> float:
+        # Many geocoder fallbacks share one point, so a known postcode in another district rules a pair out
+        if self.districts[a] and self.districts[b] and self.districts[a] != self.districts[b]:
+            return 0.0
+        name = jaccard(self.name_grams[a], self.name_grams[b], NAME_THRESHOLD)
+        if name < NAME_THRESHOLD:
+            return 0.0
+        if not self.address_grams[a] or not self.address_grams[b]:
+            return name
+        address = jaccard(self.address_grams[a], self.address_grams[b])
+        return NAME_WEIGHT * name + (1 - NAME_WEIGHT) * address
+
+    def find(self) -> List[List[int]]:
+        """Return clusters of duplicate row indices (largest first)."""
+        for block in self.blocks():
+            if len(block) < 2:
+                continue
+            for a, b in self.candidate_pairs(block):
+                if a == b:
+                    continue
+                pair = (a, b) if a < b else (b, a)
+                if pair in self.compared:
+                    continue
+                self.compared.add(pair)
+                score = self.score(a, b)
+                if score >= self.threshold:
+                    self.matches[pair] = score
+
+        clusters = UnionFind(len(self.venues))
+        for a, b in self.matches:
+            clusters.union(a, b)
+        groups = defaultdict(list)
+        for a, b in self.matches:
+            groups[clusters.find(a)].extend((a, b))
+        return sorted((sorted(set(members)) for members in groups.values()), key=lambda c: (-len(c), c[0]))
+
+
+def find_duplicate_venues(threshold: float = MATCH_THRESHOLD, cell_metres: float = CELL_METRES):
+    print("🔍 Looking for duplicate venues...")
+
+    with open(CSV_FILE, 'r', encoding='utf-8') as file:
+        venues = list(csv.DictReader(file))
+
+    start = time.perf_counter()
+    finder = DuplicateFinder(venues, cell_metres, threshold)
+    clusters = finder.find()
+    elapsed = time.perf_counter() - start
+
+    print(f"⚡ {len(finder.compared)} candidate pairs compared for {len(venues)} venues "
+          f"(all pairs would be {len(venues) * (len(venues) - 1) // 2}) in {elapsed:.2f}s")
+
+    best = defaultdict(float)
+    for (a, b), score in finder.matches.items():
+        best[a] = max(best[a], score)
+        best[b] = max(best[b], score)
+
+    with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['Cluster', 'Row', 'OriginalOrder', 'Name', 'Address1', 'Town', 'PostCode',
+                         'Latitude', 'Longitude', 'Score'])
+        for number, members in enumerate(clusters, 1):
+            for index in members:
+                venue = venues[index]
+                writer.writerow([number, index, venue.get('OriginalOrder', ''), venue.get('Name', ''),
+                                 venue.get('Address1', ''), venue.get('Town', ''), venue.get('PostCode', ''),
+                                 venue.get('Latitude', ''), venue.get('Longitude', ''), round(best[index], 2)])
+
+    for members in clusters[:10]:
+        print("  👯 " + " / ".join(f"{venues[i].get('Name', '')} ({venues[i].get('PostCode', '')})" for i in members))
+    if len(clusters) > 10:
+        print(f"  ... and {len(clusters) - 10} more")
+
+    # Rows sharing an exact name overwrite each other when geocoding results are merged by Name
+    names = defaultdict(int)
+    for venue in venues:
+        names[venue.get('Name', '').strip()] += 1
+    shared = sum(1 for name, count in names.items() if name and count > 1)
+    if shared:
+        print(f"⚠️  {shared} names are used by more than one row")
+
+    print(f"✅ {len(clusters)} likely duplicate groups ({sum(len(c) for c in clusters)} venues) written to {OUTPUT_FILE}")
+    return clusters
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find likely duplicate venues")
+    parser.add_argument('--threshold', type=float, default=MATCH_THRESHOLD,
+                        help="Minimum combined name/address similarity (default: %(default)s)")
+    parser.add_argument('--cell-metres', type=float, default=CELL_METRES,
+                        help="Grid cell size used to block nearby venues (default: %(default)s)")
+    args = parser.parse_args()
+
+    find_duplicate_venues(args.threshold, args.cell_metres)
@@ -3,113 +3,112 @@
 Fix phone numbers to ensure they all begin with '0' (UK format).
 """
 
+import argparse
 import csv
-import re
+
+from phone_normalizer import (EMPTY, GEOGRAPHIC, INVALID, MOBILE, NON_GEOGRAPHIC,
+                              PhoneNormalizer)
+from pipeline_profile import add_profile_argument, profiling, stage
+from venue_changes import load_changed_ids
+from venue_record import with_venue_ids
+from venue_store import VENUE_DB_FILE, VenueDatabase, id_condition
+
+CSV_FILE = 'JW and Smirnoff Venues - Sheet1_with_coords.csv'
+
+_normalizer = None
+
+def get_normalizer():
+    """Shared normaliser (numbering plan loaded once)."""
+    global _normalizer
+    if _normalizer is None:
+        _normalizer = PhoneNormalizer()
+    return _normalizer
 
 def fix_phone_number(phone):
     """
     Fix a phone number to ensure it starts with '0'.
-    Handles various formats and removes non-numeric characters.
+    Numbers that are not valid UK numbers are returned unchanged.
     """
     if not phone or not phone.strip():
         return phone
-    
-    # Remove all non-numeric characters
-    cleaned = re.sub(r'[^\d]', '', phone.strip())
-    
-    # If empty after cleaning, return original
-    if not cleaned:
-        return phone
-    
-    # If it starts with '0', return as is
-    if cleaned.startswith('0'):
-        return cleaned
-    
-    # If it starts with '44' (UK country code), replace with '0'
-    if cleaned.startswith('44'):
-        return '0' + cleaned[2:]
-    
-    # If it starts with '+44', replace with '0'
-    if cleaned.startswith('+44'):
-        return '0' + cleaned[3:]
-    
-    # If it's a valid UK mobile number (11 digits starting with 7), add '0'
-    if len(cleaned) == 10 and cleaned.startswith('7'):
-        return '0' + cleaned
-    
-    # If it's a valid UK landline (10 digits), add '0'
-    if len(cleaned) == 10:
-        return '0' + cleaned
-    
-    # If it's already 11 digits and doesn't start with '0', add '0'
-    if len(cleaned) == 11 and not cleaned.startswith('0'):
-        return '0' + cleaned
-    
-    # For other cases, just add '0' if it doesn't start with '0'
-    if not cleaned.startswith('0'):
-        return '0' + cleaned
-    
-    return cleaned
+    return get_normalizer().normalize(phone)[0]
 
-def fix_phone_numbers_in_csv():
-    """Fix phone numbers in the CSV file."""
+def fix_phone_numbers_in_csv(clear_invalid=False, only_ids=None):
+    """
+    Fix phone numbers in the CSV file in a single pass: every number is
+    normalised, validated and counted as the rows are read (only the venues
+    in only_ids if given).
+    """
     print("📞 Fixing phone numbers to ensure they start with '0'...")
     
+    if VenueDatabase.exists():
+        return fix_phone_numbers_in_db(clear_invalid, only_ids)
+    
+    normalizer = PhoneNormalizer(get_normalizer().plan)
+    invalid = []
+    
     # Read the CSV
     venues = []
-    with open('JW and Smirnoff Venues - Sheet1_with_coords.csv', 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        fieldnames = reader.fieldnames
+    with stage('read CSV + normalise'):
+        with open(CSV_FILE, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            fieldnames = reader.fieldnames
         
-        for row in reader:
-            # Fix the phone number
-            original_phone = row.get('Phone Number', '').strip()
-            fixed_phone = fix_phone_number(original_phone)
-            row['Phone Number'] = fixed_phone
-            venues.append(row)
+            for venue_id, row in with_venue_ids(reader):
+                venues.append(row)
+                if only_ids is not None and venue_id not in only_ids:
+                    continue
+                
+                # Fix the phone number
+                fixed_phone, phone_type = normalizer.normalize(row.get('Phone Number', ''))
+                if phone_type == INVALID:
+                    invalid.append((row.get('Name', ''), fixed_phone))
+                    if clear_invalid:
+                        fixed_phone = ''
+                row['Phone Number'] = fixed_phone
     
     # Save the updated CSV
-    with open('JW and Smirnoff Venues - Sheet1_with_coords.csv', 'w', newline='', encoding='utf-8') as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(venues)
-    
-    print(f"✅ Phone numbers fixed and saved to CSV")
+    with stage('write CSV'):
+        with open(CSV_FILE, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(venues)
+    
+    print(f"✅ Phone numbers fixed and saved to CSV ({normalizer.changed} changed)")
+    print_phone_stats(normalizer, invalid, clear_invalid)
     return len(venues)
 
-def analyze_phone_numbers():
-    """Analyze phone number formats before and after fixing."""
-    print("\n🔍 Analyzing phone number formats...")
-    
-    # Count different phone number patterns
-    patterns = {
-        'starts_with_0': 0,
-        'starts_with_44': 0,
-        'starts_with_+44': 0,
-        'starts_with_7': 0,
-        'empty': 0,
-        'other': 0
-    }
-    
-    with open('JW and Smirnoff Venues - Sheet1_with_coords.csv', 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            phone = row.get('Phone Number', '').strip()
-            
-            if not phone:
-                patterns['empty'] += 1
-            elif phone.startswith('0'):
-                patterns['starts_with_0'] += 1
-            elif phone.startswith('44'):
-                patterns['starts_with_44'] += 1
-            elif phone.startswith('+44'):
-                patterns['starts_with_+44'] += 1
-            elif phone.startswith('7'):
-                patterns['starts_with_7'] += 1
-            else:
-                patterns['other'] += 1
+def fix_phone_numbers_in_db(clear_invalid=False, only_ids=None):
+    """Fix phone numbers in venues.db (or only those in only_ids), writing only the numbers that change."""
+    print(f"🗄️  Using {VENUE_DB_FILE}")
+    
+    normalizer = PhoneNormalizer(get_normalizer().plan)
+    invalid = []
+    fixed = {}
+    
+    with VenueDatabase() as db:
+        with stage('read + normalise'):
+            where, params = id_condition(only_ids) if only_ids is not None else ('', ())
+            rows = db.rows('name', 'phone', where=where, params=params)
+            for position, name, phone in rows:
+                fixed_phone, phone_type = normalizer.normalize(phone)
+                if phone_type == INVALID:
+                    invalid.append((name, fixed_phone))
+                    if clear_invalid:
+                        fixed_phone = ''
+                fixed[position] = fixed_phone
+        
+        with stage('update venues.db'):
+            changed = db.update_column('phone', fixed)
     
-    print(f"📊 Phone number analysis:")
+    print(f"✅ Phone numbers fixed and saved to {VENUE_DB_FILE} ({changed} changed)")
+    print_phone_stats(normalizer, invalid, clear_invalid)
+    return len(rows)
+
+def print_phone_stats(normalizer, invalid, cleared=False):
+    """Print the statistics collected while fixing (no second read of the CSV)."""
+    patterns = normalizer.patterns
+    print(f"\n📊 Phone numbers before fixing:")
     print(f"  ✅ Starts with '0': {patterns['starts_with_0']}")
     print(f"  🇬🇧 Starts with '44': {patterns['starts_with_44']}")
     print(f"  🌍 Starts with '+44': {patterns['starts_with_+44']}")
@@ -117,14 +116,26 @@ def analyze_phone_numbers():
     print(f"  ❌ Empty: {patterns['empty']}")
     print(f"  ❓ Other: {patterns['other']}")
     
-    return patterns
+    stats = normalizer.stats
+    print(f"\n📊 Phone numbers after fixing:")
+    print(f"  📱 Mobile: {stats[MOBILE]}")
+    print(f"  🏠 Geographic: {stats[GEOGRAPHIC]}")
+    print(f"  ☎️  Non-geographic: {stats[NON_GEOGRAPHIC]}")
+    print(f"  ❌ Empty: {stats[EMPTY]}")
+    print(f"  ⚠️  Invalid: {stats[INVALID]}{' (cleared)' if cleared else ''}")
+    
+    for name, phone in invalid[:5]:
+        print(f"    {name}: {phone!r}")
+    if len(invalid) > 5:
+        print(f"    ... and {len(invalid) - 5} more")
 
 def regenerate_venue_data():
     """Regenerate the venue-data.js file with fixed phone numbers."""
     print("\n🔄 Regenerating venue data with fixed phone numbers...")
     
     import subprocess
-    result = subprocess.run(['python3', 'regenerate_data.py'], capture_output=True, text=True)
+    with stage('regenerate_data.py'):
+        result = subprocess.run(['python3', 'regenerate_data.py'], capture_output=True, text=True)
     if result.returncode == 0:
         print("✅ Venue data regenerated successfully!")
         return True
@@ -134,29 +145,30 @@ def regenerate_venue_data():
         return False
 
 if __name__ == "__main__":
-    try:
-        # Analyze phone numbers before fixing
-        print("🔍 Analyzing phone numbers before fixing...")
-        before_patterns = analyze_phone_numbers()
-        
-        # Fix phone numbers
-        venue_count = fix_phone_numbers_in_csv()
-        
-        # Analyze phone numbers after fixing
-        print("\n🔍 Analyzing phone numbers after fixing...")
-        after_patterns = analyze_phone_numbers()
+    parser = argparse.ArgumentParser(description="Normalise venue phone numbers to UK national format")
+    parser.add_argument('--clear-invalid', action='store_true',
+                        help="Blank numbers that are not valid UK numbers instead of keeping them")
+    parser.add_argument('--changed', action='store_true',
+                        help="Only the venues added or modified by the last venue_changes.py run")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiling('fix_phone_numbers', args.profile):
+        try:
+            # Fix, validate and analyse phone numbers in one pass
+            venue_count = fix_phone_numbers_in_csv(args.clear_invalid, load_changed_ids() if args.changed else None)
         
-        # Regenerate venue data
-        if regenerate_venue_data():
-            print(f"\n🎉 Phone number standardization complete!")
-            print(f"📊 Processed {venue_count} venues")
-            print(f"✅ All phone numbers now start with '0' (UK format)")
-        else:
-            print(f"\n⚠️  Phone numbers fixed but failed to regenerate venue data")
+            # Regenerate venue data
+            if regenerate_venue_data():
+                print(f"\n🎉 Phone number standardization complete!")
+                print(f"📊 Processed {venue_count} venues")
+                print(f"✅ All valid phone numbers now start with '0' (UK format)")
+            else:
+                print(f"\n⚠️  Phone numbers fixed but failed to regenerate venue data")
             
-    except Exception as e:
-        print(f"❌ Error during phone number fixing: {e}")
-        import traceback
-        traceback.print_exc()
+        except Exception as e:
+            print(f"❌ Error during phone number fixing: {e}")
+            import traceback
+            traceback.print_exc()
 
 
@@ -4,21 +4,36 @@ Free Geocoding Script for Venue Data
 This script clears existing coordinates and geocodes all venues using free services
 """
 
+import argparse
 import json
 import time
 import requests
 from typing import Dict, List, Tuple, Optional
 
+from geocode_metrics import EMPTY, ERROR, METRICS_FILE, OUTSIDE_UK, SUCCESS, GeocodeCache, GeocodeMetrics
+from uk_coordinates import is_coordinate_in_uk
+
 class FreeGeocoder:
-    def __init__(self):
+    name = "Nominatim"
+    
+    def __init__(self, metrics: Optional[GeocodeMetrics] = None):
+        self.metrics = metrics or GeocodeMetrics()
+        self.cache = GeocodeCache()
         self.geocoded_count = 0
         self.failed_count = 0
         self.rate_limit_delay = 1.0  # 1 second delay between requests
+        # Outcome of the last request, so errors are not cached
+        self.last_outcome = None
         
+    def record_request(self, outcome: str, start: float):
+        self.last_outcome = outcome
+        self.metrics.record_request(self.name, outcome, time.perf_counter() - start)
+    
     def geocode_with_nominatim(self, address: str) -> Optional[Tuple[float, float]]:
         """
         Geocode using OpenStreetMap Nominatim (free service)
         """
+        start = time.perf_counter()
         try:
             # Use Nominatim API
             url = "https://nominatim.openstreetmap.org/search"
@@ -44,20 +59,25 @@ class FreeGeocoder:
                 lat = float(result['lat'])
                 lng = float(result['lon'])
                 
-                # Verify the result is in the UK (rough bounds)
-                if 49.5 <= lat <= 61.0 and -8.0 <= lng <= 2.0:
+                # Verify the result is on UK land
+                if is_coordinate_in_uk(lat, lng):
+                    self.record_request(SUCCESS, start)
                     return (lat, lng)
                 else:
+                    self.record_request(OUTSIDE_UK, start)
                     print(f"⚠️  Geocoded result outside UK bounds: {address} -> ({lat}, {lng})")
                     return None
             else:
+                self.record_request(EMPTY, start)
                 print(f"❌ No results found for: {address}")
                 return None
                 
         except requests.exceptions.RequestException as e:
+            self.record_request(ERROR, start)
             print(f"❌ Request error for {address}: {e}")
             return None
         except Exception as e:
+            self.record_request(ERROR, start)
             print(f"❌ Unexpected error for {address}: {e}")
             return None
     
@@ -72,7 +92,8 @@ class FreeGeocoder:
             # Clear existing coordinates
             venue['latitude'] = None
             venue['longitude'] = None
-            venue['coordinates'] = None
+            # The map derives coordinates from latitude/longitude
+            venue.pop('coordinates', None)
             
             # Create full address for geocoding
             address_parts = []
@@ -94,14 +115,19 @@ class FreeGeocoder:
             print(f"[{i:3d}/{len(venues)}] Geocoding: {venue['name']}")
             print(f"         Address: {full_address}")
             
-            # Geocode the address
-            coordinates = self.geocode_with_nominatim(full_address)
+            # Geocode the address (repeated addresses come from the cache without a request)
+            cached, coordinates = self.cache.get(full_address)
+            self.metrics.record_cache(self.name, cached)
+            if not cached:
+                coordinates = self.geocode_with_nominatim(full_address)
+                # Failed requests are retried for the address's next venue; empty answers are kept
+                if self.last_outcome != ERROR:
+                    self.cache.put(full_address, coordinates)
             
             if coordinates:
                 lat, lng = coordinates
                 venue['latitude'] = lat
                 venue['longitude'] = lng
-                venue['coordinates'] = [lat, lng]
                 venue['fullAddress'] = full_address
                 
                 self.geocoded_count += 1
@@ -111,7 +137,10 @@ class FreeGeocoder:
                 print(f"         ❌ Failed to geocode")
             
             # Rate limiting (Nominatim requires 1 second between requests)
-            time.sleep(self.rate_limit_delay)
+            if not cached:
+                time.sleep(self.rate_limit_delay)
+                self.metrics.record_wait(self.name, self.rate_limit_delay)
+            self.metrics.maybe_flush()
             print()
         
         return venues
@@ -125,6 +154,8 @@ class FreeGeocoder:
         print(f"❌ Failed to geocode: {self.failed_count}")
         print(f"📈 Success rate: {(self.geocoded_count / (self.geocoded_count + self.failed_count)) * 100:.1f}%")
         print("=" * 60)
+        self.metrics.close()
+        self.metrics.print_report()
 
 def load_venue_data() -> List[Dict]:
     """Load venue data from venue-data.js"""
@@ -165,7 +196,7 @@ def save_venue_data(venues: List[Dict]):
     try:
         # Create the JavaScript content
         js_content = f"""// Venue data embedded from CSV
-// {sum(1 for v in venues if v.get('coordinates'))} venues have coordinates, {sum(1 for v in venues if not v.get('coordinates'))} need geocoding
+// {sum(1 for v in venues if v.get('latitude') is not None)} venues have coordinates, {sum(1 for v in venues if v.get('latitude') is None)} need geocoding
 const VENUE_DATA = {json.dumps(venues, indent=2)};
 
 // Export for use in other scripts
@@ -181,7 +212,7 @@ if (typeof module !== 'undefined' && module.exports) {{
     except Exception as e:
         print(f"❌ Error saving venue data: {e}")
 
-def main():
+def main(metrics_file: str = METRICS_FILE):
     print("🗺️  Free Geocoding for Venue Data")
     print("=" * 60)
     print("Using OpenStreetMap Nominatim (free service)")
@@ -205,7 +236,7 @@ def main():
         return
     
     # Initialize geocoder
-    geocoder = FreeGeocoder()
+    geocoder = FreeGeocoder(GeocodeMetrics(metrics_file))
     
     # Geocode all venues
     updated_venues = geocoder.geocode_venues(venues)
@@ -220,6 +251,11 @@ def main():
     print("You can now refresh your map to see the updated coordinates.")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Geocode all venues with OpenStreetMap Nominatim")
+    parser.add_argument('--metrics', default=METRICS_FILE,
+                        help="Metrics output file, JSON or Prometheus text for .prom (default: %(default)s)")
+    args = parser.parse_args()
+    
+    main(args.metrics)
 
 
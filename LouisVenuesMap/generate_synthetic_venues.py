@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Generate realistic synthetic venue sheets for scale testing.
+Postcode districts (and where venues sit within them) follow the real sheet
+when it is available; names, account managers and phone numbers follow the
+patterns seen in the real data, including the messy ones the pipeline has
+to clean up. Output is deterministic for a given seed.
+"""
+
+import argparse
+import csv
+import random
+import statistics
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+from postcode_index import split_postcode
+from venue_record import row_coordinates
+from postcode_index import split_postcode
+
+CSV_FILE = 'JW and Smirnoff Venues - Sheet1_with_coords.csv'
+
+FIELDNAMES = ['OriginalOrder', 'Type', 'SheetName', 'Name', 'Address1', 'Address2', 'Town', 'PostCode',
+              'Country', 'Account Manager Name', 'Account Manager Email', 'Account Manager Number',
+              'Phone Number', 'Quantity', '', 'Latitude', 'Longitude', 'County']
+
+# Used when the real sheet is not available: district -> (lat, lng, town, weight)
+# (the sheet name defaults to the town)
+FALLBACK_DISTRICTS = {
+    'B1': (52.479, -1.903, 'Birmingham', 8), 'WV1': (52.586, -2.128, 'Wolverhampton', 6),
+    'M1': (53.478, -2.236, 'Manchester', 8), 'L1': (53.402, -2.981, 'Liverpool', 5),
+    'LS1': (53.797, -1.548, 'Leeds', 5), 'S1': (53.380, -1.470, 'Sheffield', 4),
+    'NE1': (54.972, -1.614, 'Newcastle upon Tyne', 4), 'G1': (55.861, -4.250, 'Glasgow', 7),
+    'EH1': (55.951, -3.189, 'Edinburgh', 6), 'CF10': (51.476, -3.178, 'Cardiff', 4),
+    'BS1': (51.454, -2.593, 'Bristol', 4), 'NG1': (52.954, -1.150, 'Nottingham', 3),
+    'W1D': (51.513, -0.133, 'London', 10), 'N1': (51.538, -0.099, 'London', 6),
+    'SE1': (51.500, -0.091, 'London', 6), 'E1': (51.517, -0.059, 'London', 5),
+    'BT1': (54.600, -5.929, 'Belfast', 3), 'PL1': (50.370, -4.142, 'Plymouth', 2),
+    'NR1': (52.628, 1.297, 'Norwich', 2), 'AB10': (57.144, -2.099, 'Aberdeen', 2),
+}
+
+NAME_FIRST = ['Red', 'White', 'Black', 'Golden', 'Royal', 'Kings', 'Queens', 'Old', 'New', 'Rose and',
+              'Crown and', 'Fox and', 'Hare and', 'George and', 'Three', 'Green', 'Blue', 'Grey', 'Jolly', 'Wheatsheaf']
+NAME_SECOND = ['Lion', 'Horse', 'Swan', 'Hart', 'Bull', 'Crown', 'Anchor', 'Plough', 'Bell', 'Oak',
+               'Arms', 'Head', 'Inn', 'Tavern', 'Star', 'Sailor', 'Hounds', 'Dragon', 'Feathers', 'Compasses']
+NAME_OTHER = ['Social Club', 'Bar', 'Lounge', 'Sports Bar', 'Cocktail Bar', 'Tap Room', 'Hotel', 'Club']
+STREETS = ['High Street', 'Church Street', 'Station Road', 'Main Street', 'Market Place', 'London Road',
+           'Victoria Road', 'Park Road', 'Bridge Street', 'Mill Lane', 'The Green', 'King Street']
+FIRST_NAMES = ['Adam', 'Amy', 'Chris', 'Dan', 'Emily', 'Grace', 'Hannah', 'Jack', 'Jason', 'Katie',
+               'Kyle', 'Laura', 'Matt', 'Michael', 'Nick', 'Oli', 'Priya', 'Ruth', 'Sam', 'Zara']
+LAST_NAMES = ['Ahmed', 'Brown', 'Campbell', 'Davies', 'Evans', 'Green', 'Hughes', 'Jones', 'Khan', 'Lewis',
+              'Murphy', 'Patel', 'Roberts', 'Smith', 'Taylor', 'Thomas', 'Walker', 'White', 'Wilson', 'Wright']
+
+# Roughly one manager per this many venues, as in the real sheet
+VENUES_PER_MANAGER = 20
+
+# Value mixes seen in the real sheet
+COUNTRIES = [('', 40), ('UK', 37), ('United Kingdom', 13), ('England', 8), ('Scotland', 2)]
+QUANTITIES = [('1', 89), ('2', 6), ('', 4), ('3', 1)]
+JW_SHARE = 0.25
+
+
+def load_district_profile(path: str = CSV_FILE) -> Dict[str, Tuple[float, float, str, str, float]]:
+    """District -> (median lat, median lng, most common town, most common sheet, weight) from the real sheet."""
+    points = defaultdict(list)
+    towns = defaultdict(lambda: defaultdict(int))
+    sheets = defaultdict(lambda: defaultdict(int))
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            for row in csv.DictReader(file):
+                district, _ = split_postcode(row.get('PostCode', ''))
+                coordinates = row_coordinates(row)
+                if coordinates is None:
+                    continue
+                if district:
+                    points[district].append(coordinates)
+                    towns[district][row.get('Town', '').strip()] += 1
+                    sheets[district][row.get('SheetName', '').strip()] += 1
+    except FileNotFoundError:
+        pass
+
+    if not points:
+        return {d: (lat, lng, town, town, weight) for d, (lat, lng, town, weight) in FALLBACK_DISTRICTS.items()}
+    profile = {}
+    for district, pts in points.items():
+        town = max(towns[district].items(), key=lambda item: item[1])[0]
+        sheet = max(sheets[district].items(), key=lambda item: item[1])[0]
+        profile[district] = (statistics.median(p[0] for p in pts), statistics.median(p[1] for p in pts),
+                             town, sheet, len(pts))
+    return profile
+
+
+def weighted_choice(rng: random.Random, options):
+    values, weights = zip(*options)
+    return rng.choices(values, weights=weights)[0]
+
+
+def random_phone(rng: random.Random) -> str:
+    """Phone numbers in the proportions and shapes seen in the real sheet (and a few worse)."""
+    roll = rng.random()
+    mobile = f"7{rng.randint(100000000, 999999999)}"
+    if roll < 0.62:
+        return '0' + mobile
+    if roll < 0.70:
+        return f"+44 {mobile[:4]} {mobile[4:]}"
+    if roll < 0.74:
+        return '44' + mobile
+    if roll < 0.77:
+        return mobile
+    if roll < 0.82:
+        return f"0{rng.choice(['121', '161', '131', '141', '113', '117'])} {rng.randint(100, 999)} {rng.randint(1000, 9999)}"
+    if roll < 0.84:
+        return '00' + mobile
+    if roll < 0.86:
+        return '#ERROR'
+    if roll < 0.88:
+        return f"00{rng.randint(1, 9)}"
+    return ''
+
+
+def random_name(rng: random.Random, town: str, postcode: str) -> str:
+    roll = rng.random()
+    if roll < 0.6:
+        name = f"{rng.choice(['The ', ''])}{rng.choice(NAME_FIRST)} {rng.choice(NAME_SECOND)}"
+    else:
+        name = f"{rng.choice(LAST_NAMES)}'s {rng.choice(NAME_OTHER)}"
+    # The real sheet often disambiguates with the town or postcode
+    suffix = rng.random()
+    if suffix < 0.3 and town:
+        name += f" | {town}"
+    elif suffix < 0.45:
+        name += f" | {postcode}"
+    return name
+
+
+def generate_venues(rows: int, seed: int = 42, profile=None) -> List[dict]:
+    rng = random.Random(seed)
+    profile = profile or load_district_profile()
+    districts = list(profile)
+    weights = [profile[d][4] for d in districts]
+
+    # Managers cover a patch: each district gets enough of them for ~VENUES_PER_MANAGER venues each
+    managers = []
+    district_managers = {}
+    used = defaultdict(int)
+    total_weight = sum(weights)
+    for district, weight in zip(districts, weights):
+        expected = rows * weight / total_weight
+        district_managers[district] = []
+        for _ in range(max(1, round(expected / VENUES_PER_MANAGER))):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            used[(first, last)] += 1
+            number = used[(first, last)]
+            email = f"{first.lower()}.{last.lower()}{number if number > 1 else ''}@example.co.uk"
+            district_managers[district].append(len(managers))
+            managers.append((f"{first} {last}", email, f"07{rng.randint(100000000, 999999999)}"))
+
+    venues = []
+    chosen = rng.choices(districts, weights=weights, k=rows)
+    for index, district in enumerate(chosen):
+        lat, lng, town, sheet, _ = profile[district]
+        postcode = f"{district} {rng.randint(1, 9)}{rng.choice('ABDEFGHJLNPQRSTUWXYZ')}{rng.choice('ABDEFGHJLNPQRSTUWXYZ')}"
+        manager = managers[rng.choice(district_managers[district])]
+        venue_type = 'JW' if rng.random() < JW_SHARE else 'Smirnoff'
+
+        coordinates = rng.random()
+        if coordinates < 0.02:
+            latitude = longitude = ''
+        elif coordinates < 0.03:
+            # Geocoder mistakes the cleaning stage has to catch
+            latitude, longitude = rng.choice([(40.7128, -74.006), (48.8566, 2.3522), (0.0, 0.0)])
+        else:
+            latitude = round(rng.gauss(lat, 0.02), 7)
+            longitude = round(rng.gauss(lng, 0.03), 7)
+
+        venues.append({
+            'OriginalOrder': index + 1,
+            'Type': venue_type,
+            'SheetName': sheet,
+            'Name': random_name(rng, town, postcode),
+            'Address1': f"{rng.randint(1, 250)} {rng.choice(STREETS)}",
+            'Address2': '',
+            'Town': town if rng.random() < 0.8 else '',
+            'PostCode': postcode if rng.random() < 0.98 else postcode.replace(' ', ''),
+            'Country': weighted_choice(rng, COUNTRIES),
+            'Account Manager Name': manager[0],
+            'Account Manager Email': manager[1],
+            'Account Manager Number': manager[2],
+            'Phone Number': random_phone(rng),
+            'Quantity': weighted_choice(rng, QUANTITIES),
+            '': '',
+            'Latitude': latitude,
+            'Longitude': longitude,
+            'County': '',
+        })
+    return venues
+
+
+def write_venues(venues: List[dict], path: str):
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(venues)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic venue CSV for scale testing")
+    parser.add_argument('--rows', type=int, default=10000, help="Number of venues (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed (default: %(default)s)")
+    parser.add_argument('--output', default='synthetic_venues.csv', help="Output CSV (default: %(default)s)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    venues = generate_venues(args.rows, args.seed)
+    write_venues(venues, args.output)
+    print(f"✅ Generated {len(venues)} synthetic venues in {time.perf_counter() - start:.1f}s -> {args.output}")
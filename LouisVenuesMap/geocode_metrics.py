@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Metrics for the geocoding scripts.
+Records per-provider request counts, latency histograms, outcomes (success,
+empty, outside the UK, error), rate-limit waits and address cache hits, and
+writes them as JSON or Prometheus text (by file extension) during the run and
+when it finishes, so it is clear where the geocoding time goes.
+"""
+
+import json
+import os
+import time
+from bisect import bisect_left
+from typing import Dict, Optional, Tuple
+
+METRICS_FILE = 'geocode_metrics.json'
+
+# Request outcomes
+SUCCESS = 'success'
+EMPTY = 'empty'
+OUTSIDE_UK = 'outside_uk'
+ERROR = 'error'
+OUTCOMES = [SUCCESS, EMPTY, OUTSIDE_UK, ERROR]
+
+# Latency histogram bucket upper bounds (seconds)
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+# Write the metrics file at most this often while a run is in progress
+FLUSH_INTERVAL_SECONDS = 15.0
+
+
+class ProviderMetrics:
+    def __init__(self):
+        self.outcomes = dict.fromkeys(OUTCOMES, 0)
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)  # last bucket is +Inf
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def requests(self) -> int:
+        return sum(self.outcomes.values())
+
+    def to_dict(self) -> dict:
+        requests = self.requests
+        lookups = self.cache_hits + self.cache_misses
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(LATENCY_BUCKETS + ['+Inf'], self.buckets):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            'requests': requests,
+            'outcomes': dict(self.outcomes),
+            'rates': {outcome: round(count / requests, 4) if requests else 0.0
+                      for outcome, count in self.outcomes.items()},
+            'latency_seconds': {
+                'sum': round(self.latency_sum, 3),
+                'mean': round(self.latency_sum / requests, 4) if requests else 0.0,
+                'max': round(self.latency_max, 4),
+                'buckets': buckets,
+            },
+            'rate_limit': {'waits': self.waits, 'seconds': round(self.wait_seconds, 3)},
+            'cache': {'hits': self.cache_hits, 'misses': self.cache_misses,
+                      'hit_ratio': round(self.cache_hits / lookups, 4) if lookups else 0.0},
+        }
+
+
+class GeocodeMetrics:
+    """
+    Collects geocoding metrics for one run. With a path the metrics are written
+    there (Prometheus text for .prom files, JSON otherwise) every
+    FLUSH_INTERVAL_SECONDS via maybe_flush() and finally by close().
+    """
+
+    def __init__(self, path: Optional[str] = None, flush_interval: float = FLUSH_INTERVAL_SECONDS):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.providers: Dict[str, ProviderMetrics] = {}
+        self.started = time.time()
+        self._start = time.perf_counter()
+        self._last_flush = self._start
+
+    def provider(self, name: str) -> ProviderMetrics:
+        if name not in self.providers:
+            self.providers[name] = ProviderMetrics()
+        return self.providers[name]
+
+    def record_request(self, provider: str, outcome: str, seconds: float):
+        metrics = self.provider(provider)
+        metrics.outcomes[outcome] += 1
+        metrics.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        metrics.latency_sum += seconds
+        metrics.latency_max = max(metrics.latency_max, seconds)
+
+    def record_wait(self, provider: str, seconds: float):
+        if seconds > 0:
+            metrics = self.provider(provider)
+            metrics.waits += 1
+            metrics.wait_seconds += seconds
+
+    def record_cache(self, provider: str, hit: bool):
+        metrics = self.provider(provider)
+        if hit:
+            metrics.cache_hits += 1
+        else:
+            metrics.cache_misses += 1
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start
+
+    def to_dict(self) -> dict:
+        return {
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+            'elapsed_seconds': round(self.elapsed(), 3),
+            'providers': {name: metrics.to_dict() for name, metrics in sorted(self.providers.items())},
+        }
+
+    def to_prometheus(self) -> str:
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ','.join(f'{key}="{escape_label(val)}"' for key, val in labels)
+                lines.append(f"{name}{{{label_text}}} {value:g}" if label_text else f"{name} {value:g}")
+
+        providers = sorted(self.providers.items())
+        metric('geocode_requests_total', 'counter', 'Geocoding requests by provider and outcome',
+               [((('provider', name), ('outcome', outcome)), count)
+                for name, m in providers for outcome, count in m.outcomes.items()])
+
+        lines.append("# HELP geocode_request_duration_seconds Geocoding request latency (excluding rate-limit waits)")
+        lines.append("# TYPE geocode_request_duration_seconds histogram")
+        for name, m in providers:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ['+Inf'], m.buckets):
+                cumulative += count
+                lines.append(f'geocode_request_duration_seconds_bucket{{provider="{escape_label(name)}",le="{bound}"}} {cumulative}')
+            lines.append(f'geocode_request_duration_seconds_sum{{provider="{escape_label(name)}"}} {m.latency_sum:g}')
+            lines.append(f'geocode_request_duration_seconds_count{{provider="{escape_label(name)}"}} {m.requests}')
+
+        metric('geocode_rate_limit_waits_total', 'counter', 'Times a request waited for the rate limit',
+               [((('provider', name),), m.waits) for name, m in providers])
+        metric('geocode_rate_limit_wait_seconds_total', 'counter', 'Time spent waiting for the rate limit',
+               [((('provider', name),), m.wait_seconds) for name, m in providers])
+        metric('geocode_cache_lookups_total', 'counter', 'Address cache lookups by result',
+               [((('provider', name), ('result', result)), count)
+                for name, m in providers for result, count in (('hit', m.cache_hits), ('miss', m.cache_misses))])
+        metric('geocode_run_elapsed_seconds', 'gauge', 'Time since the geocoding run started',
+               [((), self.elapsed())])
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: Optional[str] = None):
+        """Write the metrics atomically (readers never see a half-written file)."""
+        path = path or self.path
+        if not path:
+            return
+        if path.endswith('.prom'):
+            content = self.to_prometheus()
+        else:
+            content = json.dumps(self.to_dict(), indent=2) + '\n'
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+        self._last_flush = time.perf_counter()
+
+    def maybe_flush(self):
+        if self.path and time.perf_counter() - self._last_flush >= self.flush_interval:
+            self.write()
+
+    def close(self):
+        self.write()
+
+    def print_report(self):
+        """Where the time went, per provider."""
+        elapsed = self.elapsed()
+        print(f"⏱️  Geocoding time breakdown ({elapsed:.1f}s total)")
+        for name, m in sorted(self.providers.items()):
+            requests = m.requests
+            lookups = m.cache_hits + m.cache_misses
+            print(f"  {name}: {requests} requests, {m.latency_sum:.1f}s in requests "
+                  f"({m.latency_sum / max(elapsed, 1e-9) * 100:.0f}%, mean {m.latency_sum / max(requests, 1) * 1000:.0f}ms, "
+                  f"max {m.latency_max * 1000:.0f}ms), {m.wait_seconds:.1f}s waiting for the rate limit "
+                  f"({m.wait_seconds / max(elapsed, 1e-9) * 100:.0f}%)")
+            print(f"    " + ', '.join(f"{outcome} {count}" for outcome, count in m.outcomes.items()) +
+                  (f", cache hit ratio {m.cache_hits / lookups * 100:.0f}%" if lookups else ''))
+        if self.path:
+            print(f"📁 Metrics written to {self.path}")
+
+
+class GeocodeCache:
+    """In-memory address -> result cache (the sheet repeats addresses, e.g. JW and Smirnoff rows)."""
+
+    def __init__(self):
+        self.results: Dict[str, Optional[Tuple[float, float]]] = {}
+
+    @staticmethod
+    def key(address: str) -> str:
+        return ' '.join(address.lower().split())
+
+    def get(self, address: str):
+        """(found, result) - result may be None for addresses that failed before."""
+        key = self.key(address)
+        if key in self.results:
+            return True, self.results[key]
+        return False, None
+
+    def put(self, address: str, result: Optional[Tuple[float, float]]):
+        self.results[self.key(address)] = result
+
+
+def escape_label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -4,25 +4,40 @@ Google Maps Geocoding Script for Venue Data
 This script clears existing coordinates and geocodes all venues using Google Maps API
 """
 
+import argparse
 import json
 import time
 import requests
 import csv
 from typing import Dict, List, Tuple, Optional
 
+from geocode_metrics import EMPTY, ERROR, METRICS_FILE, OUTSIDE_UK, SUCCESS, GeocodeCache, GeocodeMetrics
+from uk_coordinates import is_coordinate_in_uk
+
 class GoogleGeocoder:
-    def __init__(self, api_key: str):
+    name = "Google Maps"
+    
+    def __init__(self, api_key: str, metrics: Optional[GeocodeMetrics] = None):
+        self.metrics = metrics or GeocodeMetrics()
+        self.cache = GeocodeCache()
         self.api_key = api_key
         self.base_url = "https://maps.googleapis.com/maps/api/geocode/json"
         self.geocoded_count = 0
         self.failed_count = 0
         self.rate_limit_delay = 0.1  # 100ms delay between requests
+        # Outcome of the last request, so errors are not cached
+        self.last_outcome = None
         
+    def record_request(self, outcome: str, start: float):
+        self.last_outcome = outcome
+        self.metrics.record_request(self.name, outcome, time.perf_counter() - start)
+    
     def geocode_address(self, address: str) -> Optional[Tuple[float, float]]:
         """
         Geocode a single address using Google Maps API
         Returns (latitude, longitude) or None if failed
         """
+        start = time.perf_counter()
         try:
             params = {
                 'address': address,
@@ -40,20 +55,27 @@ class GoogleGeocoder:
                 lat = location['lat']
                 lng = location['lng']
                 
-                # Verify the result is in the UK (rough bounds)
-                if 49.5 <= lat <= 61.0 and -8.0 <= lng <= 2.0:
+                # Verify the result is on UK land
+                if is_coordinate_in_uk(lat, lng):
+                    self.record_request(SUCCESS, start)
                     return (lat, lng)
                 else:
+                    self.record_request(OUTSIDE_UK, start)
                     print(f"⚠️  Geocoded result outside UK bounds: {address} -> ({lat}, {lng})")
                     return None
             else:
+                # ZERO_RESULTS is an empty answer; other statuses (quota, denied) are errors
+                outcome = EMPTY if data['status'] == 'ZERO_RESULTS' else ERROR
+                self.record_request(outcome, start)
                 print(f"❌ Geocoding failed for: {address} - Status: {data['status']}")
                 return None
                 
         except requests.exceptions.RequestException as e:
+            self.record_request(ERROR, start)
             print(f"❌ Request error for {address}: {e}")
             return None
         except Exception as e:
+            self.record_request(ERROR, start)
             print(f"❌ Unexpected error for {address}: {e}")
             return None
     
@@ -68,7 +90,8 @@ class GoogleGeocoder:
             # Clear existing coordinates
             venue['latitude'] = None
             venue['longitude'] = None
-            venue['coordinates'] = None
+            # The map derives coordinates from latitude/longitude
+            venue.pop('coordinates', None)
             
             # Create full address for geocoding
             address_parts = []
@@ -90,14 +113,19 @@ class GoogleGeocoder:
             print(f"[{i:3d}/{len(venues)}] Geocoding: {venue['name']}")
             print(f"         Address: {full_address}")
             
-            # Geocode the address
-            coordinates = self.geocode_address(full_address)
+            # Geocode the address (repeated addresses come from the cache without a request)
+            cached, coordinates = self.cache.get(full_address)
+            self.metrics.record_cache(self.name, cached)
+            if not cached:
+                coordinates = self.geocode_address(full_address)
+                # Failed requests are retried for the address's next venue; empty answers are kept
+                if self.last_outcome != ERROR:
+                    self.cache.put(full_address, coordinates)
             
             if coordinates:
                 lat, lng = coordinates
                 venue['latitude'] = lat
                 venue['longitude'] = lng
-                venue['coordinates'] = [lat, lng]
                 venue['fullAddress'] = full_address
                 
                 self.geocoded_count += 1
@@ -107,7 +135,10 @@ class GoogleGeocoder:
                 print(f"         ❌ Failed to geocode")
             
             # Rate limiting
-            time.sleep(self.rate_limit_delay)
+            if not cached:
+                time.sleep(self.rate_limit_delay)
+                self.metrics.record_wait(self.name, self.rate_limit_delay)
+            self.metrics.maybe_flush()
             print()
         
         return venues
@@ -121,6 +152,8 @@ class GoogleGeocoder:
         print(f"❌ Failed to geocode: {self.failed_count}")
         print(f"📈 Success rate: {(self.geocoded_count / (self.geocoded_count + self.failed_count)) * 100:.1f}%")
         print("=" * 60)
+        self.metrics.close()
+        self.metrics.print_report()
 
 def load_venue_data() -> List[Dict]:
     """Load venue data from venue-data.js"""
@@ -212,7 +245,7 @@ def save_venue_data(venues: List[Dict]):
     try:
         # Create the JavaScript content
         js_content = f"""// Venue data embedded from CSV
-// {sum(1 for v in venues if v.get('coordinates'))} venues have coordinates, {sum(1 for v in venues if not v.get('coordinates'))} need geocoding
+// {sum(1 for v in venues if v.get('latitude') is not None)} venues have coordinates, {sum(1 for v in venues if v.get('latitude') is None)} need geocoding
 const VENUE_DATA = {json.dumps(venues, indent=2)};
 
 // Export for use in other scripts
@@ -228,7 +261,7 @@ if (typeof module !== 'undefined' && module.exports) {{
     except Exception as e:
         print(f"❌ Error saving venue data: {e}")
 
-def main():
+def main(metrics_file: str = METRICS_FILE):
     print("🗺️  Google Maps Geocoding for Venue Data")
     print("=" * 60)
     
@@ -254,7 +287,7 @@ def main():
         return
     
     # Initialize geocoder
-    geocoder = GoogleGeocoder(api_key)
+    geocoder = GoogleGeocoder(api_key, GeocodeMetrics(metrics_file))
     
     # Geocode all venues
     updated_venues = geocoder.geocode_venues(venues)
@@ -269,4 +302,9 @@ def main():
     print("You can now refresh your map to see the updated coordinates.")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Geocode all venues with the Google Maps API")
+    parser.add_argument('--metrics', default=METRICS_FILE,
+                        help="Metrics output file, JSON or Prometheus text for .prom (default: %(default)s)")
+    args = parser.parse_args()
+    
+    main(args.metrics)
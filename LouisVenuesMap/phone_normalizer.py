@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Batch normaliser for UK phone numbers.
+Each number is cleaned with precompiled rules, converted to national format
+(leading '0'), checked against a local copy of the UK numbering plan and
+classified, while input/output statistics are collected in the same pass.
+"""
+
+import csv
+import os
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+PLAN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uk_numbering_plan.csv')
+
+MOBILE = 'mobile'
+GEOGRAPHIC = 'geographic'
+NON_GEOGRAPHIC = 'non_geographic'
+INVALID = 'invalid'
+EMPTY = 'empty'
+
+# International prefix for the UK, optionally followed by the national '(0)'; a bare '44' only before '(0)'
+INTERNATIONAL_PREFIX = re.compile(r'^(?:(?:\+|00)\s*44\s*(?:\(\s*0\s*\)\s*)?|44\s*\(\s*0\s*\)\s*)')
+
+# Trailing extensions: 'ext 123', 'x123', 'extn. 4'
+EXTENSION = re.compile(r'\s*(?:ext|extn|x)\.?\s*\d+\s*$', re.IGNORECASE)
+
+NON_DIGITS = re.compile(r'\D')
+
+
+def load_numbering_plan(path: str = PLAN_FILE) -> Dict[str, Tuple[str, Tuple[int, ...]]]:
+    """Read prefix -> (type, allowed lengths) from the numbering plan CSV."""
+    plan = {}
+    with open(path, 'r', encoding='utf-8') as file:
+        for row in csv.DictReader(file):
+            lengths = tuple(int(length) for length in row['Lengths'].split('|'))
+            plan[row['Prefix'].strip()] = (row['Type'].strip(), lengths)
+    return plan
+
+
+def input_pattern(phone: str) -> str:
+    """Bucket a raw value the way the old before/after analysis did."""
+    if not phone:
+        return 'empty'
+    for prefix in ('0', '44', '+44', '7'):
+        if phone.startswith(prefix):
+            return f'starts_with_{prefix}'
+    return 'other'
+
+
+class PhoneNormalizer:
+    """
+    Normalise and classify phone numbers in bulk.
+    Results are memoised (sheets repeat the same numbers a lot) and counted in
+    .stats (output types) and .patterns (raw input shapes).
+    """
+
+    def __init__(self, plan: Optional[Dict[str, Tuple[str, Tuple[int, ...]]]] = None):
+        self.plan = plan if plan is not None else load_numbering_plan()
+        self.prefix_lengths = sorted({len(prefix) for prefix in self.plan}, reverse=True)
+        self.stats = Counter()
+        self.patterns = Counter()
+        self.changed = 0
+        self._cache: Dict[str, Tuple[str, str]] = {}
+
+    def to_national(self, phone: str) -> str:
+        """Digits in national format ('0' + national number), or '' if nothing usable."""
+        phone = EXTENSION.sub('', phone)
+        phone = INTERNATIONAL_PREFIX.sub('0', phone)
+        digits = NON_DIGITS.sub('', phone)
+        if not digits:
+            return ''
+
+        if digits.startswith('44') and len(digits) in (11, 12):
+            # Country code without '+' / '00'
+            return '0' + digits[2:]
+        if digits.startswith('440') and len(digits) in (12, 13):
+            # ...followed by the trunk '0' ('44 0 7...')
+            return digits[2:]
+        if digits.startswith('00'):
+            # Duplicated trunk prefix ('007...') left by earlier clean-ups
+            return '0' + digits.lstrip('0')
+        if not digits.startswith('0') and len(digits) in (9, 10):
+            return '0' + digits
+        return digits
+
+    def classify(self, number: str) -> str:
+        """Number type from the longest matching numbering plan prefix."""
+        for length in self.prefix_lengths:
+            entry = self.plan.get(number[:length])
+            if entry:
+                number_type, lengths = entry
+                return number_type if len(number) in lengths else INVALID
+        return INVALID
+
+    def normalize(self, phone: str) -> Tuple[str, str]:
+        """
+        Return (number, type). Valid numbers come back in national format;
+        invalid ones are returned unchanged so nothing is lost.
+        """
+        phone = (phone or '').strip()
+        self.patterns[input_pattern(phone)] += 1
+
+        result = self._cache.get(phone)
+        if result is None:
+            if not phone:
+                result = (phone, EMPTY)
+            else:
+                number = self.to_national(phone)
+                number_type = self.classify(number) if number else INVALID
+                result = (number if number_type != INVALID else phone, number_type)
+            self._cache[phone] = result
+
+        self.stats[result[1]] += 1
+        if result[0] != phone:
+            self.changed += 1
+        return result
+
+    def normalize_many(self, phones: Iterable[str]) -> List[Tuple[str, str]]:
+        return [self.normalize(phone) for phone in phones]
+
+
+# Raw values seen in the sheet -> (number, type) they must normalise to
+EXAMPLES = [
+    ('07752 461937', ('07752461937', MOBILE)),
+    ('7752461937', ('07752461937', MOBILE)),
+    ('447752461937', ('07752461937', MOBILE)),
+    ('+44 7752 461937', ('07752461937', MOBILE)),
+    ('+44 (0)7752 461937', ('07752461937', MOBILE)),
+    ('0044 7752 461937', ('07752461937', MOBILE)),
+    ('44 (0)7752461937', ('07752461937', MOBILE)),
+    ('44 0 7752 461937', ('07752461937', MOBILE)),
+    ('007752461937', ('07752461937', MOBILE)),
+    ('0131 556 1234 ext 12', ('01315561234', GEOGRAPHIC)),
+    ('0800 123 4567', ('08001234567', NON_GEOGRAPHIC)),
+    ('F&T Scotland KAM001', ('F&T Scotland KAM001', INVALID)),
+    ('#ERROR!', ('#ERROR!', INVALID)),
+    ('', ('', EMPTY)),
+]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Normalise UK phone numbers (checks the examples without arguments)")
+    parser.add_argument('phones', nargs='*', help="Numbers to normalise")
+    args = parser.parse_args()
+
+    normalizer = PhoneNormalizer()
+    if args.phones:
+        for phone in args.phones:
+            number, number_type = normalizer.normalize(phone)
+            print(f"{phone!r} -> {number!r} ({number_type})")
+    else:
+        results = [(phone, expected, normalizer.normalize(phone)) for phone, expected in EXAMPLES]
+        failures = [result for result in results if result[2] != result[1]]
+        for phone, expected, actual in failures:
+            print(f"❌ {phone!r}: expected {expected}, got {actual}")
+        print(f"{'❌' if failures else '✅'} {len(EXAMPLES) - len(failures)}/{len(EXAMPLES)} examples normalised as expected")
+        raise SystemExit(1 if failures else 0)
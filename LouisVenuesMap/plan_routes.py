@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Plan visit routes for each account manager's venues.
+For every manager a haversine distance matrix is built with NumPy, a
+nearest-neighbour tour is improved with 2-opt and Or-opt moves, and the
+ordered stops (optionally split into days) are written to a CSV.
+"""
+
+import argparse
+import csv
+import time
+from collections import defaultdict
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from spatial_index import EARTH_RADIUS_KM, haversine_km
+from venue_query import VenueIndex
+from venue_store import VENUE_DATA_FILE, load_venue_data, venue_coordinates
+
+OUTPUT_FILE = 'visit_routes.csv'
+
+# Or-opt moves segments of up to this many stops
+OR_OPT_SEGMENT = 3
+
+# Stop improving once a full pass gains less than this (km)
+MIN_IMPROVEMENT_KM = 1e-6
+
+
+def distance_matrix(points: np.ndarray) -> np.ndarray:
+    """All-pairs great-circle distances (km) for an (n, 2) array of lat/lng degrees."""
+    lat = np.radians(points[:, 0])[:, None]
+    lng = np.radians(points[:, 1])[:, None]
+    a = (np.sin((lat - lat.T) / 2) ** 2 +
+         np.cos(lat) * np.cos(lat.T) * np.sin((lng - lng.T) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def route_length(route: List[int], dist: np.ndarray) -> float:
+    return float(dist[route[:-1], route[1:]].sum()) if len(route) > 1 else 0.0
+
+
+def nearest_neighbour_route(dist: np.ndarray, start: int = 0) -> List[int]:
+    """Greedy open route from start, always visiting the closest unvisited stop."""
+    n = len(dist)
+    visited = np.zeros(n, dtype=bool)
+    route = [start]
+    visited[start] = True
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, dist[route[-1]])
+        nxt = int(row.argmin())
+        route.append(nxt)
+        visited[nxt] = True
+    return route
+
+
+def two_opt(route: List[int], dist: np.ndarray) -> List[int]:
+    """
+    2-opt for an open route with a fixed first stop: reverse route[i..j] when it
+    shortens the route. All j for a given i are evaluated at once.
+    """
+    route = np.array(route)
+    n = len(route)
+    if n < 4:
+        return route.tolist()
+
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, n - 1):
+            a, b = route[i - 1], route[i]
+            c = route[i + 1:]                       # candidate segment ends (j = i+1 .. n-1)
+            e = np.append(route[i + 2:], -1)        # stop after each candidate end (-1 = route end)
+            has_next = e >= 0
+            delta = dist[a, c] - dist[a, b]
+            delta += np.where(has_next, dist[b, np.where(has_next, e, 0)] - dist[c, np.where(has_next, e, 0)], 0.0)
+            best = int(delta.argmin())
+            if delta[best] < -MIN_IMPROVEMENT_KM:
+                j = i + 1 + best
+                route[i:j + 1] = route[i:j + 1][::-1]
+                improved = True
+    return route.tolist()
+
+
+def or_opt(route: List[int], dist: np.ndarray, max_segment: int = OR_OPT_SEGMENT) -> List[int]:
+    """Move short segments (either orientation) to the cheapest other position."""
+    route = list(route)
+    improved = True
+    while improved:
+        improved = False
+        for length in range(1, max_segment + 1):
+            i = 1
+            while i + length <= len(route):
+                segment = route[i:i + length]
+                prev = route[i - 1]
+                nxt = route[i + length] if i + length < len(route) else None
+                removed = dist[prev, segment[0]] + (dist[segment[-1], nxt] - dist[prev, nxt] if nxt is not None else 0.0)
+
+                rest = route[:i] + route[i + length:]
+                rest_arr = np.array(rest)
+                left = rest_arr                     # insert after left[p]
+                right = np.append(rest_arr[1:], -1)  # ...and before right[p] (-1 = route end)
+                has_right = right >= 0
+                safe_right = np.where(has_right, right, 0)
+
+                best_gain, best = 0.0, None
+                for seg in (segment, segment[::-1]):
+                    added = dist[left, seg[0]] + np.where(has_right, dist[seg[-1], safe_right] - dist[left, safe_right], 0.0)
+                    p = int(added.argmin())
+                    gain = removed - added[p]
+                    if gain > best_gain + MIN_IMPROVEMENT_KM:
+                        best_gain, best = gain, (p, seg)
+
+                if best is not None:
+                    p, seg = best
+                    route = rest[:p + 1] + list(seg) + rest[p + 1:]
+                    improved = True
+                else:
+                    i += 1
+    return route
+
+
+def plan_route(points: np.ndarray, start: Optional[Tuple[float, float]] = None) -> Tuple[List[int], float]:
+    """
+    Order the points into a short open route.
+    With a start location the route begins there; otherwise at the westernmost stop.
+    Returns (point order, total km).
+    """
+    if start is not None:
+        points = np.vstack([np.asarray(start, dtype=float)[None, :], points])
+        first = 0
+    else:
+        first = int(points[:, 1].argmin())
+
+    dist = distance_matrix(points)
+    route = nearest_neighbour_route(dist, first)
+    previous = np.inf
+    length = route_length(route, dist)
+    while length < previous - MIN_IMPROVEMENT_KM:
+        previous = length
+        route = or_opt(two_opt(route, dist), dist)
+        length = route_length(route, dist)
+
+    if start is not None:
+        route = [stop - 1 for stop in route[1:]]
+    return route, length
+
+
+def split_days(route: List[int], daily_cap: Optional[int]) -> List[List[int]]:
+    if not daily_cap:
+        return [route]
+    return [route[i:i + daily_cap] for i in range(0, len(route), daily_cap)]
+
+
+def plan_routes(manager: Optional[str] = None, daily_cap: Optional[int] = None,
+                start_postcode: Optional[str] = None, data_file: str = VENUE_DATA_FILE):
+    print("🚗 Planning visit routes per account manager...")
+    venues = load_venue_data(data_file)
+
+    start = None
+    if start_postcode:
+        start = VenueIndex(venues).locate_postcode(start_postcode)
+        if start is None:
+            print(f"❌ Could not locate start postcode {start_postcode}")
+            return None
+        print(f"🏁 Routes start at {start_postcode.upper()}")
+
+    # Group case-insensitively ('Oli Wilson' / 'Oli wilson'), keeping the first spelling seen
+    portfolios = defaultdict(list)
+    names = {}
+    for venue in venues:
+        name = venue.get('accountManager', '').strip()
+        if name and venue_coordinates(venue) and (not manager or name.lower() == manager.lower()):
+            key = names.setdefault(name.lower(), name)
+            portfolios[key].append(venue)
+
+    if not portfolios:
+        print("❌ No geocoded venues found for that account manager")
+        return None
+
+    overall_start = time.perf_counter()
+    rows = []
+    for name, portfolio in sorted(portfolios.items()):
+        manager_start = time.perf_counter()
+        points = np.array([venue_coordinates(venue) for venue in portfolio])
+        order, _ = plan_route(points, start)
+        days = split_days(order, daily_cap)
+        total_km = 0.0
+
+        for day_number, day in enumerate(days, 1):
+            previous = start
+            for stop_number, index in enumerate(day, 1):
+                venue = portfolio[index]
+                point = venue_coordinates(venue)
+                leg = haversine_km(*previous, *point) if previous else 0.0
+                rows.append([name, day_number, stop_number, venue.get('name', ''), venue.get('postCode', ''),
+                             point[0], point[1], round(leg, 2)])
+                previous = point
+                total_km += leg
+
+        print(f"  👤 {name}: {len(portfolio)} stops, {total_km:.1f} km"
+              f"{f' over {len(days)} days' if daily_cap else ''} "
+              f"({(time.perf_counter() - manager_start) * 1000:.0f}ms)")
+
+    with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['Account Manager', 'Day', 'Stop', 'Name', 'PostCode', 'Latitude', 'Longitude', 'Leg km'])
+        writer.writerows(rows)
+
+    print(f"✅ Planned {len(portfolios)} routes in {time.perf_counter() - overall_start:.2f}s - see {OUTPUT_FILE}")
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plan visit routes for each account manager")
+    parser.add_argument('--manager', help="Only plan the route for this account manager")
+    parser.add_argument('--daily-cap', type=int, help="Maximum visits per day (splits each route into days)")
+    parser.add_argument('--start-postcode', help="Start every route (and every day) from this postcode")
+    parser.add_argument('--data', default=VENUE_DATA_FILE, help="Venue data file (default: %(default)s)")
+    args = parser.parse_args()
+
+    plan_routes(args.manager, args.daily_cap, args.start_postcode, args.data)
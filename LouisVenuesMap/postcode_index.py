@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Longest-prefix postcode index for assigning counties from UK postcodes.
+Lookups probe the sector, outward code, district and area of each postcode
+against a compiled prefix table, so the most specific known prefix wins.
+"""
+
+import csv
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+
+# Characters that are never part of a postcode (spaces, punctuation, etc.)
+NON_POSTCODE_CHARS = re.compile(r'[^A-Z0-9]')
+
+# Leading letters of an outward code ('SW1A' -> 'SW')
+AREA_PATTERN = re.compile(r'[A-Z]*')
+
+# Column names recognised when loading an external postcode-district file
+PREFIX_COLUMNS = ['Prefix', 'Sector', 'Postcode District', 'District', 'Outward', 'Postcode', 'pcd']
+COUNTY_COLUMNS = ['County', 'County Name', 'county', 'CTYUA22NM', 'Region']
+
+
+def normalize_postcode(postcode: str) -> str:
+    """
+    Upper-case a postcode and strip everything except letters and digits.
+    'ne 1 4ep' -> 'NE14EP'
+    """
+    if not postcode:
+        return ''
+    return NON_POSTCODE_CHARS.sub('', postcode.upper())
+
+
+def split_postcode(postcode: str):
+    """
+    Split a postcode into (outward, inward) codes.
+    A full postcode always ends in a three character inward code (digit + two letters),
+    anything shorter is treated as an outward code on its own.
+    """
+    cleaned = normalize_postcode(postcode)
+    if len(cleaned) >= 5 and cleaned[-3].isdigit() and cleaned[-2:].isalpha():
+        return cleaned[:-3], cleaned[-3:]
+    return cleaned, ''
+
+
+def outward_prefixes(outward: str, sector: str = '') -> List[str]:
+    """
+    Return the lookup keys for an outward code (and optional sector digit), most specific first.
+    ('SW1A', '1') -> ['SW1A 1', 'SW1A', 'SW1', 'SW']
+    ('DY10', '')  -> ['DY10', 'DY']
+    """
+    if not outward:
+        return []
+
+    prefixes = [f"{outward} {sector}"] if sector else []
+    prefixes.append(outward)
+
+    # Sub-districts such as SW1A / W1D fall back to their numeric district
+    if len(outward) > 2 and outward[-1].isalpha() and outward[-2].isdigit():
+        prefixes.append(outward[:-1])
+
+    area = AREA_PATTERN.match(outward).group(0)
+    if area and area != outward:
+        prefixes.append(area)
+
+    return prefixes
+
+
+def postcode_prefixes(postcode: str) -> List[str]:
+    """
+    Return the lookup keys for a postcode, most specific first.
+    'SW1A 1AA' -> ['SW1A 1', 'SW1A', 'SW1', 'SW']
+    """
+    outward, inward = split_postcode(postcode)
+    return outward_prefixes(outward, inward[:1])
+
+
+def normalize_prefix(prefix: str) -> str:
+    """
+    Normalise a table key to the form used by lookups.
+    Full postcodes are reduced to their sector ('sw1a 1aa' -> 'SW1A 1'),
+    sectors keep their space ('SW1A  1' -> 'SW1A 1') and outward codes/areas are compacted.
+    """
+    outward, inward = split_postcode(prefix)
+    if inward:
+        return f"{outward} {inward[0]}"
+
+    parts = prefix.upper().split()
+    if len(parts) == 2 and parts[1].isdigit():
+        return f"{normalize_postcode(parts[0])} {parts[1]}"
+    return outward
+
+
+class PostcodeIndex:
+    """
+    Compiled longest-prefix lookup from postcode sectors, outward codes,
+    districts and areas to county names.
+    """
+
+    def __init__(self, table: Optional[Dict[str, str]] = None, default: str = 'Unknown'):
+        self.default = default
+        self.prefixes: Dict[str, str] = {}
+        self._cache: Dict[str, str] = {}
+        if table:
+            self.update(table)
+
+    def __len__(self):
+        return len(self.prefixes)
+
+    def update(self, table: Dict[str, str]):
+        """Add or override prefix -> county entries."""
+        for prefix, county in table.items():
+            key = normalize_prefix(prefix)
+            if key and county:
+                self.prefixes[key] = county.strip()
+        self._cache.clear()
+
+    def lookup(self, postcode: str) -> str:
+        """
+        Return the county for a postcode using the longest matching prefix,
+        or the default ('Unknown') if nothing matches.
+        """
+        outward, inward = split_postcode(postcode)
+        if not outward:
+            return self.default
+
+        # Results only depend on the outward code and sector digit
+        sector = inward[:1]
+        cache_key = f"{outward} {sector}"
+        county = self._cache.get(cache_key)
+        if county is None:
+            county = self.default
+            for prefix in outward_prefixes(outward, sector):
+                if prefix in self.prefixes:
+                    county = self.prefixes[prefix]
+                    break
+            self._cache[cache_key] = county
+        return county
+
+    def assign(self, postcodes: Iterable[str]) -> List[str]:
+        """
+        Assign counties to a whole column of postcodes at once.
+        Each distinct outward code / sector is resolved only once.
+        """
+        lookup = self.lookup
+        return [lookup(postcode) for postcode in postcodes]
+
+    @classmethod
+    def from_file(cls, path: str, prefix_column: Optional[str] = None,
+                  county_column: Optional[str] = None, base: Optional[Dict[str, str]] = None):
+        """
+        Load a postcode-district file (CSV with a header row).
+        The prefix column may hold areas ('SW'), outward codes ('SW1A')
+        or sectors ('SW1A 1'); entries in the file override the base table.
+        """
+        index = cls(base)
+        index.update(load_postcode_file(path, prefix_column, county_column))
+        return index
+
+
+def load_postcode_file(path: str, prefix_column: Optional[str] = None,
+                       county_column: Optional[str] = None) -> Dict[str, str]:
+    """Read a postcode-district CSV into a prefix -> county dict."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Postcode file not found: {path}")
+
+    table = {}
+    with open(path, 'r', encoding='utf-8-sig') as file:
+        reader = csv.DictReader(file)
+        fieldnames = reader.fieldnames or []
+
+        prefix_column = prefix_column or next((c for c in PREFIX_COLUMNS if c in fieldnames), None)
+        county_column = county_column or next((c for c in COUNTY_COLUMNS if c in fieldnames), None)
+        if not prefix_column or not county_column:
+            raise ValueError(f"Could not find postcode/county columns in {path}: {fieldnames}")
+
+        for row in reader:
+            prefix = (row.get(prefix_column) or '').strip()
+            county = (row.get(county_column) or '').strip()
+            if prefix and county:
+                table[prefix] = county
+
+    return table
@@ -4,13 +4,27 @@ Regenerate venue-data.js from the CSV file with coordinate support.
 This script will use the CSV file with coordinates if available, otherwise fall back to the original.
 """
 
+import argparse
 import csv
-import json
 import os
 
+from build_search_index import SEARCH_INDEX_FILE, write_search_index
+from pipeline_profile import add_profile_argument, profiling, stage
+from venue_record import Venue, with_venue_ids
+from venue_store import VENUE_DB_FILE, VenueDatabase, write_venue_data
+
 def regenerate_venue_data():
     csv_file = None
     
+    # The venue database is the source of truth when there is one
+    if VenueDatabase.exists():
+        print(f"🗄️  Using {VENUE_DB_FILE}")
+        with stage('read venues.db'):
+            with VenueDatabase() as db:
+                venues = list(db.venues())
+        write_venue_outputs(venues)
+        return
+    
     # Try to find the CSV file with coordinates first
     if os.path.exists('JW and Smirnoff Venues - Sheet1_with_coords.csv'):
         csv_file = 'JW and Smirnoff Venues - Sheet1_with_coords.csv'
@@ -24,70 +38,51 @@ def regenerate_venue_data():
     
     venues = []
     
-    with open(csv_file, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        
-        for index, row in enumerate(reader):
-            # Clean up the data
-            venue = {
-                'id': index,
-                'name': row.get('Name', '').strip() or 'Unknown Venue',
-                'address1': row.get('Address1', '').strip(),
-                'address2': row.get('Address2', '').strip(),
-                'town': row.get('Town', '').strip(),
-                'postCode': row.get('PostCode', '').strip(),
-                'county': row.get('County', '').strip() or 'Unknown',
-                'country': row.get('Country', '').strip() or 'UK',
-                'type': row.get('Type', '').strip() or 'Unknown',
-                'accountManager': row.get('Account Manager Name', '').strip(),
-                'accountManagerEmail': row.get('Account Manager Email', '').strip(),
-                'phone': row.get('Phone Number', '').strip(),
-                'quantity': row.get('Quantity', '').strip() or '1'
-            }
-            
-            # Add coordinates if available
-            if 'Latitude' in row and 'Longitude' in row:
-                lat = row.get('Latitude', '').strip()
-                lng = row.get('Longitude', '').strip()
-                if lat and lng:
-                    try:
-                        venue['latitude'] = float(lat)
-                        venue['longitude'] = float(lng)
-                    except ValueError:
-                        print(f"⚠️  Invalid coordinates for {venue['name']}: {lat}, {lng}")
+    with stage('read CSV + transform'):
+        with open(csv_file, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
             
-            # Build full address
-            address_parts = [
-                venue['address1'],
-                venue['address2'],
-                venue['town'],
-                venue['postCode'],
-                venue['country']
-            ]
-            venue['fullAddress'] = ', '.join([part for part in address_parts if part])
-            
-            venues.append(venue)
+            for venue_id, row in with_venue_ids(reader):
+                # Clean up the data (Venue keeps one interned copy of repeated values)
+                venue = Venue.from_csv_row(row, venue_id)
+                
+                lat = (row.get('Latitude') or '').strip()
+                lng = (row.get('Longitude') or '').strip()
+                if lat and lng and venue.latitude is None:
+                    print(f"⚠️  Invalid coordinates for {venue.get('name')}: {lat}, {lng}")
+                
+                venues.append(venue)
     
+    write_venue_outputs(venues)
+
+def write_venue_outputs(venues):
+    """Write venue-data.js and the search index for the map."""
     # Count venues with coordinates
-    venues_with_coords = sum(1 for v in venues if 'latitude' in v and 'longitude' in v)
+    venues_with_coords = sum(1 for v in venues if v.latitude is not None)
     
-    # Generate JavaScript code
-    js_code = f"""
-// Venue data embedded from CSV
-// {venues_with_coords} venues have coordinates, {len(venues) - venues_with_coords} need geocoding
-const VENUE_DATA = {json.dumps(venues, indent=2)};
-"""
+    # Write the JavaScript file a venue at a time
+    with stage('JSON dump + write venue-data.js'):
+        write_venue_data(venues, [
+            "Venue data embedded from CSV",
+            f"{venues_with_coords} venues have coordinates, {len(venues) - venues_with_coords} need geocoding",
+        ])
     
-    # Write to JavaScript file
-    with open('venue-data.js', 'w', encoding='utf-8') as f:
-        f.write(js_code)
+    # Keep the search box index in step with the venue list
+    with stage('search index'):
+        write_search_index(venues)
     
     print(f"✅ Successfully regenerated venue-data.js!")
     print(f"📊 Processed {len(venues)} venues")
     print(f"📍 {venues_with_coords} venues have coordinates")
     print(f"🌍 {len(venues) - venues_with_coords} venues need geocoding")
     print(f"📁 Updated venue-data.js")
+    print(f"🔎 Updated {SEARCH_INDEX_FILE}")
 
 if __name__ == "__main__":
-    regenerate_venue_data()
+    parser = argparse.ArgumentParser(description="Regenerate venue-data.js and search-index.js from the venue CSV")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    
+    with profiling('regenerate_data', args.profile):
+        regenerate_venue_data()
 
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Partition UK counties into K contiguous regions with balanced venue counts.
+Regions are grown from spread-out seed counties over a county adjacency graph,
+then refined by moving border counties between neighbouring regions.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from spatial_index import haversine_km
+
+# Vertex rounding used to detect counties that share a border (about 1m)
+VERTEX_PRECISION = 5
+
+# Neighbours per county when adjacency is inferred from centroids
+CENTROID_NEIGHBOURS = 4
+
+
+def adjacency_from_boundaries(features: Iterable[dict]) -> Tuple[Dict[str, Set[str]], Dict[str, Tuple[float, float]]]:
+    """
+    Build a county adjacency graph from boundary polygons: two counties are
+    neighbours if their rings share a vertex. Also returns a (lat, lng)
+    centroid per county (vertex mean of its largest ring).
+    """
+    from county_boundaries import feature_name, iter_polygons
+
+    vertex_owners: Dict[Tuple[float, float], Set[str]] = {}
+    centroids = {}
+    largest_ring = {}
+
+    for feature in features:
+        name = feature_name(feature)
+        for rings in iter_polygons(feature.get('geometry')):
+            exterior = rings[0]
+            if len(exterior) > largest_ring.get(name, 0):
+                largest_ring[name] = len(exterior)
+                centroids[name] = (sum(p[1] for p in exterior) / len(exterior),
+                                   sum(p[0] for p in exterior) / len(exterior))
+            for ring in rings:
+                for point in ring:
+                    key = (round(point[0], VERTEX_PRECISION), round(point[1], VERTEX_PRECISION))
+                    vertex_owners.setdefault(key, set()).add(name)
+
+    graph = {name: set() for name in centroids}
+    for owners in vertex_owners.values():
+        if len(owners) > 1:
+            for county in owners:
+                graph[county].update(owners - {county})
+
+    return graph, centroids
+
+
+def adjacency_from_centroids(centroids: Dict[str, Tuple[float, float]],
+                             neighbours: int = CENTROID_NEIGHBOURS) -> Dict[str, Set[str]]:
+    """Approximate adjacency by linking each county to its nearest centroids."""
+    graph = {county: set() for county in centroids}
+    counties = list(centroids)
+    for county in counties:
+        lat, lng = centroids[county]
+        nearest = sorted((haversine_km(lat, lng, *centroids[other]), other)
+                         for other in counties if other != county)
+        for _, other in nearest[:neighbours]:
+            graph[county].add(other)
+            graph[other].add(county)
+    return graph
+
+
+def connect_components(graph: Dict[str, Set[str]], centroids: Dict[str, Tuple[float, float]]):
+    """
+    Join disconnected parts of the graph (islands, Northern Ireland) to the
+    mainland by linking the closest pair of counties between components.
+    """
+    while True:
+        components = connected_components(graph, graph.keys())
+        if len(components) <= 1:
+            return graph
+        components.sort(key=len, reverse=True)
+        main, rest = components[0], [county for component in components[1:] for county in component]
+        _, a, b = min((haversine_km(*centroids[a], *centroids[b]), a, b)
+                      for a in main for b in rest if a in centroids and b in centroids)
+        graph[a].add(b)
+        graph[b].add(a)
+
+
+def connected_components(graph: Dict[str, Set[str]], nodes: Iterable[str]) -> List[Set[str]]:
+    """Connected components of the subgraph induced by nodes."""
+    nodes = set(nodes)
+    components = []
+    while nodes:
+        start = nodes.pop()
+        component = {start}
+        stack = [start]
+        while stack:
+            for neighbour in graph[stack.pop()]:
+                if neighbour in nodes:
+                    nodes.discard(neighbour)
+                    component.add(neighbour)
+                    stack.append(neighbour)
+        components.append(component)
+    return components
+
+
+def spread_seeds(centroids: Dict[str, Tuple[float, float]], k: int, first: str) -> List[str]:
+    """Farthest-point sampling of k seed counties, starting from first."""
+    seeds = [first]
+    distance = {county: haversine_km(*centroids[first], *centroids[county]) for county in centroids}
+    while len(seeds) < k:
+        seed = max(distance, key=distance.get)
+        seeds.append(seed)
+        for county in centroids:
+            distance[county] = min(distance[county], haversine_km(*centroids[seed], *centroids[county]))
+    return seeds
+
+
+def grow_regions(graph, weights, centroids, seeds) -> Dict[str, int]:
+    """
+    Grow one region per seed, always extending the lightest region with its
+    nearest unassigned neighbouring county.
+    """
+    assignment = {seed: index for index, seed in enumerate(seeds)}
+    totals = [weights.get(seed, 0) for seed in seeds]
+    active = set(range(len(seeds)))
+    members = [[seed] for seed in seeds]
+
+    while active and len(assignment) < len(graph):
+        region = min(active, key=lambda r: totals[r])
+        seed_point = centroids[seeds[region]]
+        frontier = {n for county in members[region] for n in graph[county] if n not in assignment}
+        if not frontier:
+            active.discard(region)
+            continue
+        county = min(frontier, key=lambda c: haversine_km(*seed_point, *centroids[c]))
+        assignment[county] = region
+        members[region].append(county)
+        totals[region] += weights.get(county, 0)
+
+    return assignment
+
+
+def imbalance(totals: List[float], target: float) -> float:
+    return sum((total - target) ** 2 for total in totals)
+
+
+def refine_regions(graph, weights, assignment, k, target, max_passes=50) -> Dict[str, int]:
+    """
+    Move border counties to neighbouring regions while it improves balance
+    and keeps both regions contiguous and non-empty.
+    """
+    totals = [0.0] * k
+    members = [set() for _ in range(k)]
+    for county, region in assignment.items():
+        totals[region] += weights.get(county, 0)
+        members[region].add(county)
+
+    for _ in range(max_passes):
+        improved = False
+        for county in sorted(assignment, key=lambda c: -weights.get(c, 0)):
+            source = assignment[county]
+            if len(members[source]) == 1:
+                continue
+            weight = weights.get(county, 0)
+            best = None
+            for target_region in {assignment[n] for n in graph[county]} - {source}:
+                before = (totals[source] - target) ** 2 + (totals[target_region] - target) ** 2
+                after = (totals[source] - weight - target) ** 2 + (totals[target_region] + weight - target) ** 2
+                if after < before - 1e-9 and (best is None or after - before < best[0]):
+                    best = (after - before, target_region)
+            if best is None:
+                continue
+            if len(connected_components(graph, members[source] - {county})) != 1:
+                continue
+            target_region = best[1]
+            members[source].discard(county)
+            members[target_region].add(county)
+            totals[source] -= weight
+            totals[target_region] += weight
+            assignment[county] = target_region
+            improved = True
+        if not improved:
+            break
+
+    return assignment
+
+
+def partition_counties(venue_counts: Dict[str, int], k: int,
+                       graph: Optional[Dict[str, Set[str]]] = None,
+                       centroids: Optional[Dict[str, Tuple[float, float]]] = None,
+                       restarts: int = 5) -> List[List[str]]:
+    """
+    Split counties into k contiguous regions with venue totals as close to
+    equal as the graph allows. Returns a list of county lists, heaviest first.
+    """
+    if centroids is None:
+        raise ValueError("County centroids are required to place seeds")
+    if graph is None:
+        graph = adjacency_from_centroids(centroids)
+
+    graph = {county: set(neighbours) & set(centroids) for county, neighbours in graph.items() if county in centroids}
+    for county in centroids:
+        graph.setdefault(county, set())
+    connect_components(graph, centroids)
+
+    k = min(k, len(graph))
+    target = sum(venue_counts.get(county, 0) for county in graph) / k
+    best = None
+
+    # Try a few seed layouts, starting from the heaviest counties
+    starts = sorted(graph, key=lambda c: -venue_counts.get(c, 0))[:restarts]
+    for first in starts:
+        seeds = spread_seeds(centroids, k, first)
+        assignment = grow_regions(graph, venue_counts, centroids, seeds)
+        assignment = refine_regions(graph, venue_counts, assignment, k, target)
+
+        totals = [0.0] * k
+        for county, region in assignment.items():
+            totals[region] += venue_counts.get(county, 0)
+        score = imbalance(totals, target)
+        if best is None or score < best[0]:
+            best = (score, dict(assignment))
+
+    regions = [[] for _ in range(k)]
+    for county, region in best[1].items():
+        regions[region].append(county)
+    for region in regions:
+        region.sort(key=lambda c: (-venue_counts.get(c, 0), c))
+    regions.sort(key=lambda region: -sum(venue_counts.get(c, 0) for c in region))
+    return regions
+
+
+def county_centroids_from_venues(venues: Iterable[dict]) -> Dict[str, Tuple[float, float]]:
+    """Mean venue coordinates per county (venues without coordinates are ignored)."""
+    sums = {}
+    for venue in venues:
+        lat, lng = venue.get('latitude'), venue.get('longitude')
+        if lat is None or lng is None:
+            continue
+        total = sums.setdefault(venue.get('county', 'Unknown'), [0.0, 0.0, 0])
+        total[0] += float(lat)
+        total[1] += float(lng)
+        total[2] += 1
+    return {county: (lat / n, lng / n) for county, (lat, lng, n) in sums.items()}
@@ -1,3 +1,41 @@
+// Optional venue API (venue_server.py): set window.VENUE_API_URL before this script
+// or open the map with ?api=http://localhost:8765 to query venues instead of using VENUE_DATA
+const VENUE_API_URL = (new URLSearchParams(window.location.search).get('api') || window.VENUE_API_URL || '').replace(/\/$/, '');
+const VENUE_API_PAGE_SIZE = 1000;
+
+// Fields matched by the search box (must match SEARCH_FIELDS in build_search_index.py)
+const SEARCH_FIELDS = ['name', 'fullAddress', 'town', 'county', 'postCode', 'accountManager'];
+
+// Queries at least this long also match venues sharing most (not all) of their trigrams
+const FUZZY_MIN_LENGTH = 5;
+const FUZZY_MIN_OVERLAP = 0.75;
+// ...and, if nothing matched at all, venues sharing at least this fraction (swapped letters)
+const FUZZY_FALLBACK_OVERLAP = 0.5;
+
+function loadScript(src) {
+    // Script files work without a server, unlike fetching JSON from file:// pages
+    return new Promise((resolve, reject) => {
+        const script = document.createElement('script');
+        script.src = src;
+        script.onload = () => resolve();
+        script.onerror = () => reject(new Error(`Failed to load ${src}`));
+        document.head.appendChild(script);
+    });
+}
+
+function normalizeSearchText(text) {
+    return (text || '').toLowerCase().replace(/[^a-z0-9]+/g, ' ').trim();
+}
+
+function searchTrigrams(text) {
+    // Query trigrams are unpadded so any substring of a venue's text still matches
+    const grams = new Set();
+    for (let i = 0; i < text.length - 2; i++) {
+        grams.add(text.slice(i, i + 3));
+    }
+    return [...grams];
+}
+
 class VenueMapApp {
     constructor() {
         this.map = null;
@@ -7,6 +45,18 @@ class VenueMapApp {
         this.selectedVenue = null;
         this.countyBoundaries = null;
         this.boundariesVisible = false;
+        this.boundaryLevel = null;
+        
+        // Venue API state (only used when VENUE_API_URL is set)
+        this.apiFacets = null;
+        this.apiCache = new Map();
+        this.apiRequestId = 0;
+        this.apiMatched = 0;
+        this.apiMoveTimer = null;
+        
+        // Trigram search index (search-index.js) and normalised venue text
+        this.searchIndex = null;
+        this.searchTexts = [];
         
         // Color palette for counties (will be generated after venues are loaded)
         this.countyColors = {};
@@ -44,7 +94,9 @@ class VenueMapApp {
         ];
         
         const countyColorMap = {};
-        const counties = [...new Set(this.venues.map(v => v.county))].sort();
+        const counties = this.apiFacets
+            ? Object.keys(this.apiFacets.counties).sort()
+            : [...new Set(this.venues.map(v => v.county))].sort();
         
         counties.forEach((county, index) => {
             countyColorMap[county] = colors[index % colors.length];
@@ -53,7 +105,61 @@ class VenueMapApp {
         return countyColorMap;
     }
 
+    boundaryLevelForZoom(zoom) {
+        // Pick the most detailed precomputed level at or below the current zoom
+        let chosen = COUNTY_BOUNDARY_LEVELS[0];
+        COUNTY_BOUNDARY_LEVELS.forEach(level => {
+            if (zoom >= level) chosen = level;
+        });
+        return chosen;
+    }
+
+    async loadBoundaryLevelScript(level) {
+        // Finer levels live in separate script files, loaded on first use
+        if (!COUNTY_BOUNDARIES[level]) {
+            await loadScript(`${COUNTY_BOUNDARY_DIR}/county-boundaries-z${level}.js`);
+        }
+        return COUNTY_BOUNDARIES[level];
+    }
+
+    async updateBoundaryLevel() {
+        if (typeof COUNTY_BOUNDARIES === 'undefined') return;
+
+        const level = this.boundaryLevelForZoom(this.map.getZoom());
+        if (level === this.boundaryLevel) return;
+
+        try {
+            const geoJsonData = await this.loadBoundaryLevelScript(level);
+            // Another zoom may have finished first
+            if (level !== this.boundaryLevelForZoom(this.map.getZoom())) return;
+
+            const layerShown = this.countyBoundariesLayer && this.map.hasLayer(this.countyBoundariesLayer);
+            if (layerShown) {
+                this.map.removeLayer(this.countyBoundariesLayer);
+            }
+            this.countyBoundaries = geoJsonData;
+            this.boundaryLevel = level;
+            if (layerShown || !this.countyBoundariesLayer) {
+                this.addCountyBoundariesToMap();
+            }
+        } catch (error) {
+            console.warn('Failed to load simplified county boundaries:', error);
+        }
+    }
+
     async loadCountyBoundaries() {
+        // Prefer the simplified boundaries generated by simplify_boundaries.py (index.html loads them once linked)
+        if (typeof COUNTY_BOUNDARIES !== 'undefined') {
+            if (!this.map) {
+                // Venues load before the map is created
+                setTimeout(() => this.loadCountyBoundaries(), 0);
+                return;
+            }
+            console.log('Using precomputed county boundaries');
+            await this.updateBoundaryLevel();
+            return;
+        }
+
         try {
             console.log('Loading official UK county boundaries from map service...');
             
@@ -348,6 +454,10 @@ class VenueMapApp {
     }
 
     init() {
+        if (VENUE_API_URL) {
+            this.initFromApi();
+            return;
+        }
         try {
             this.loadVenues();
         this.initializeMap();
@@ -360,6 +470,81 @@ class VenueMapApp {
         }
     }
 
+    async initFromApi() {
+        try {
+            console.log(`Loading venues from ${VENUE_API_URL}...`);
+            this.apiFacets = await this.fetchApi('/api/facets');
+            if (Object.keys(this.apiFacets.regions).length > 0) {
+                this.countyGroups = this.apiFacets.regions;
+            }
+            this.countyColors = this.generateCountyColorMap();
+            
+            this.initializeMap();
+            this.setupEventListeners();
+            this.populateFilters();
+            this.loadCountyBoundaries();
+
+            // Reload the venues in view after the map is panned or zoomed
+            this.map.on('moveend', () => {
+                clearTimeout(this.apiMoveTimer);
+                this.apiMoveTimer = setTimeout(() => this.applyApiFilters(), 250);
+            });
+            await this.applyApiFilters();
+        } catch (error) {
+            console.error('Error loading venues from the API:', error);
+            this.showError(`Failed to load venues from ${VENUE_API_URL}: ${error.message}`);
+        }
+    }
+
+    async fetchApi(path, params = new URLSearchParams()) {
+        // Revalidate with the last ETag so unchanged results come back as 304s
+        const url = `${VENUE_API_URL}${path}?${params.toString()}`;
+        const cached = this.apiCache.get(url);
+        const response = await fetch(url, {
+            headers: cached ? { 'If-None-Match': cached.etag } : {}
+        });
+        if (response.status === 304 && cached) {
+            return cached.data;
+        }
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+        const data = await response.json();
+        const etag = response.headers.get('ETag');
+        if (etag) {
+            this.apiCache.set(url, { etag, data });
+        }
+        return data;
+    }
+
+    async fetchApiVenues(params) {
+        // Only the venues in and around the current view, at most one page of them
+        const bounds = this.map.getBounds().pad(0.25);
+        params.set('bbox', [bounds.getWest(), bounds.getSouth(), bounds.getEast(), bounds.getNorth()]
+            .map(value => value.toFixed(4)).join(','));
+        params.set('limit', VENUE_API_PAGE_SIZE);
+        const page = await this.fetchApi('/api/venues', params);
+        return { venues: page.venues.map(venue => this.prepareVenue(venue)), total: page.total };
+    }
+
+    prepareVenue(venue) {
+        let coordinates = null;
+        
+        // Check if venue already has coordinates
+        if (venue.latitude && venue.longitude) {
+            const lat = parseFloat(venue.latitude);
+            const lng = parseFloat(venue.longitude);
+            if (!isNaN(lat) && !isNaN(lng)) {
+                coordinates = [lat, lng];
+            }
+        }
+        
+        return {
+            ...venue,
+            coordinates: coordinates
+        };
+    }
+
     loadVenues() {
         try {
             console.log('Loading embedded venue data...');
@@ -370,26 +555,25 @@ class VenueMapApp {
             }
             
             // Process the embedded data
-            this.venues = VENUE_DATA.map(venue => {
-                let coordinates = null;
-                
-                // Check if venue already has coordinates
-                if (venue.latitude && venue.longitude) {
-                    const lat = parseFloat(venue.latitude);
-                    const lng = parseFloat(venue.longitude);
-                    if (!isNaN(lat) && !isNaN(lng)) {
-                        coordinates = [lat, lng];
-                    }
+            this.venues = VENUE_DATA.map(venue => this.prepareVenue(venue));
+
+            this.filteredVenues = [...this.venues];
+
+            // Use the regions written by create_regional_groups.py when present
+            const regionGroups = {};
+            this.venues.forEach(venue => {
+                if (!venue.region || venue.region === 'Other') return;
+                regionGroups[venue.region] = regionGroups[venue.region] || [];
+                if (!regionGroups[venue.region].includes(venue.county)) {
+                    regionGroups[venue.region].push(venue.county);
                 }
-                
-                return {
-                    ...venue,
-                    coordinates: coordinates
-                };
             });
+            if (Object.keys(regionGroups).length > 0) {
+                this.countyGroups = regionGroups;
+            }
+
+            this.buildSearch();
 
-            this.filteredVenues = [...this.venues];
-            
             // Generate county color map after venues are loaded
             this.countyColors = this.generateCountyColorMap();
             
@@ -405,6 +589,78 @@ class VenueMapApp {
         }
     }
 
+    buildSearch() {
+        this.searchTexts = this.venues.map(venue =>
+            normalizeSearchText(SEARCH_FIELDS.map(field => venue[field] || '').join(' '))
+        );
+        
+        // Only trust the prebuilt index if it was built from this venue list
+        if (typeof VENUE_SEARCH_INDEX !== 'undefined' && VENUE_SEARCH_INDEX.count === this.venues.length) {
+            this.searchIndex = { grams: VENUE_SEARCH_INDEX.grams, postings: new Map() };
+        } else {
+            this.searchIndex = null;
+            console.log('Search index missing or out of date - run build_search_index.py; scanning instead');
+        }
+    }
+
+    searchPostings(gram) {
+        // Decode a delta/base-36 posting list on first use
+        const index = this.searchIndex;
+        if (!index.postings.has(gram)) {
+            const encoded = index.grams[gram];
+            const positions = [];
+            if (encoded) {
+                let position = 0;
+                encoded.split(',').forEach(gap => {
+                    position += parseInt(gap, 36);
+                    positions.push(position);
+                });
+            }
+            index.postings.set(gram, positions);
+        }
+        return index.postings.get(gram);
+    }
+
+    searchVenues(query) {
+        // Ranked matches: exact substring matches first, then near misses (typos) by shared trigrams
+        const normalized = normalizeSearchText(query);
+        if (!normalized) return [...this.venues];
+        
+        if (!this.searchIndex || normalized.length < 3) {
+            return this.venues.filter((venue, i) => this.searchTexts[i].includes(normalized));
+        }
+        
+        const grams = searchTrigrams(normalized);
+        const counts = new Map();
+        grams.forEach(gram => {
+            this.searchPostings(gram).forEach(position => {
+                counts.set(position, (counts.get(position) || 0) + 1);
+            });
+        });
+        
+        const fuzzy = normalized.length >= FUZZY_MIN_LENGTH;
+        const rank = overlap => {
+            const minShared = fuzzy ? Math.ceil(grams.length * overlap) : grams.length;
+            const ranked = [];
+            counts.forEach((shared, position) => {
+                if (shared < minShared) return;
+                const exact = shared === grams.length && this.searchTexts[position].includes(normalized);
+                if (exact || fuzzy) {
+                    ranked.push({ position, score: (exact ? grams.length + 1 : 0) + shared });
+                }
+            });
+            return ranked;
+        };
+        
+        let ranked = rank(FUZZY_MIN_OVERLAP);
+        if (ranked.length === 0 && fuzzy) {
+            ranked = rank(FUZZY_FALLBACK_OVERLAP);
+        }
+        
+        ranked.sort((a, b) => b.score - a.score || a.position - b.position);
+        return ranked.map(match => this.venues[match.position]);
+    }
+
     buildFullAddress(row) {
         const parts = [
             row.Address1,
@@ -640,6 +896,11 @@ class VenueMapApp {
             const currentZoom = this.map.getZoom();
             const sliderValue = this.zoomLevelToSlider(currentZoom);
             zoomSlider.value = sliderValue;
+
+            // Swap in more or less detailed county outlines
+            if (this.countyBoundaries) {
+                this.updateBoundaryLevel();
+            }
         });
     }
 
@@ -648,12 +909,14 @@ class VenueMapApp {
         const countyGroupFilter = document.getElementById('countyGroupFilter');
         
         // Populate county filter with venue counts
-        const countyCounts = {};
-        this.venues.forEach(venue => {
-            countyCounts[venue.county] = (countyCounts[venue.county] || 0) + 1;
-        });
+        const countyCounts = this.apiFacets ? { ...this.apiFacets.counties } : {};
+        if (!this.apiFacets) {
+            this.venues.forEach(venue => {
+                countyCounts[venue.county] = (countyCounts[venue.county] || 0) + 1;
+            });
+        }
         
-        const counties = [...new Set(this.venues.map(v => v.county))].sort();
+        const counties = Object.keys(countyCounts).sort();
         counties.forEach(county => {
             const option = document.createElement('option');
             option.value = county;
@@ -665,9 +928,7 @@ class VenueMapApp {
         // Populate county group filter with venue counts
         Object.keys(this.countyGroups).forEach(groupName => {
             const countiesInGroup = this.countyGroups[groupName];
-            const groupCount = this.venues.filter(venue => 
-                countiesInGroup.includes(venue.county)
-            ).length;
+            const groupCount = countiesInGroup.reduce((sum, county) => sum + (countyCounts[county] || 0), 0);
             
             if (groupCount > 0) {
                 const option = document.createElement('option');
@@ -679,35 +940,23 @@ class VenueMapApp {
     }
 
     filterVenues(query) {
-        this.filteredVenues = this.venues.filter(venue => 
-            venue.name.toLowerCase().includes(query) ||
-            venue.fullAddress.toLowerCase().includes(query) ||
-            venue.town.toLowerCase().includes(query) ||
-            venue.county.toLowerCase().includes(query) ||
-            venue.accountManager.toLowerCase().includes(query)
-        );
-        
+        // applyFilters reads the search box itself and uses the search index
         this.applyFilters();
     }
 
     applyFilters() {
+        if (VENUE_API_URL) {
+            this.applyApiFilters();
+            return;
+        }
+        
         const typeFilter = document.getElementById('typeFilter').value;
         const countyFilter = document.getElementById('countyFilter').value;
         const countyGroupFilter = document.getElementById('countyGroupFilter').value;
         
-        let filtered = [...this.venues];
-        
-        // Apply search filter
-        const searchQuery = document.getElementById('searchInput').value.toLowerCase().trim();
-        if (searchQuery) {
-            filtered = filtered.filter(venue => 
-                venue.name.toLowerCase().includes(searchQuery) ||
-                venue.fullAddress.toLowerCase().includes(searchQuery) ||
-                venue.town.toLowerCase().includes(searchQuery) ||
-                venue.county.toLowerCase().includes(searchQuery) ||
-                venue.accountManager.toLowerCase().includes(searchQuery)
-            );
-        }
+        // Apply search filter (ranked, best matches first)
+        const searchQuery = document.getElementById('searchInput').value.trim();
+        let filtered = searchQuery ? this.searchVenues(searchQuery) : [...this.venues];
         
         // Apply type filter
         if (typeFilter) {
@@ -732,7 +981,37 @@ class VenueMapApp {
         this.updateVenueCount();
     }
 
-    updateMap() {
+    async applyApiFilters() {
+        // Same filters as applyFilters, evaluated by the server
+        const params = new URLSearchParams();
+        const typeFilter = document.getElementById('typeFilter').value;
+        const countyFilter = document.getElementById('countyFilter').value;
+        const countyGroupFilter = document.getElementById('countyGroupFilter').value;
+        const searchQuery = document.getElementById('searchInput').value.trim();
+        
+        if (typeFilter) params.append('type', typeFilter);
+        if (countyFilter) params.append('county', countyFilter);
+        if (searchQuery) params.append('q', searchQuery);
+        if (countyGroupFilter && this.countyGroups[countyGroupFilter] && !countyFilter) {
+            this.countyGroups[countyGroupFilter].forEach(county => params.append('county', county));
+        }
+        
+        const requestId = ++this.apiRequestId;
+        try {
+            const { venues, total } = await this.fetchApiVenues(params);
+            if (requestId !== this.apiRequestId) return; // A newer filter change is in flight
+            this.venues = venues;
+            this.filteredVenues = venues;
+            this.apiMatched = total;
+            // The view decides what is loaded, so don't move it to fit the results
+            this.updateMap(false);
+            this.updateVenueCount();
+        } catch (error) {
+            this.showError(`Failed to load venues from ${VENUE_API_URL}: ${error.message}`);
+        }
+    }
+
+    updateMap(fitToMarkers = true) {
         // Clear existing markers
         this.markers.forEach(markerData => {
             this.map.removeLayer(markerData.marker);
@@ -747,7 +1026,7 @@ class VenueMapApp {
         });
 
         // Fit map to show all markers
-        if (this.markers.length > 0) {
+        if (fitToMarkers && this.markers.length > 0) {
             const group = new L.featureGroup(this.markers.map(m => m.marker));
             this.map.fitBounds(group.getBounds().pad(0.1));
             // Update slider after zoom
@@ -757,7 +1036,12 @@ class VenueMapApp {
 
     updateVenueCount() {
         const count = this.filteredVenues.length;
-        const total = this.venues.length;
+        if (VENUE_API_URL) {
+            document.getElementById('venueCount').textContent = count < this.apiMatched
+                ? `${count} of ${this.apiMatched} venues in view` : `${count} venues in view`;
+            return;
+        }
+        const total = this.apiFacets ? this.apiFacets.total : this.venues.length;
         document.getElementById('venueCount').textContent = 
             count === total ? `${total} venues` : `${count} of ${total} venues`;
     }
@@ -0,0 +1,2 @@
+// Trigram search index generated by build_search_index.py
+const VENUE_SEARCH_INDEX = {"count":1325,"fields":["name","fullAddress","town","county","postCode","accountManager"],"grams":{" 0 ":"ck"," 0a":"1a,5d,4i,b5,53,1o,7d"," 0b":"fw,65,7n,6f"," 0e":"3,22,5l,4n,13,22,6,bi,b"," 0f":"pc"," 0h":"k3,d1"," 0j":"a3,9l,4,2j,e1"," 0l":"e9,5,4z,1t"," 0n":"9e,5x,1,jh"," 0p":"wp,1"," 0q":"u,90,9b,26,fc"," 0r":"g,k,89,d,3z,1v,42,7"," 0t":"62,3j,5h"," 0u":"ik"," 0y":"1b"," 1 ":"a,c,q,10,6,k,14,7,4,9,c,i,6,x,16,2,h,20,5,12,o,1d,i,3,d,1j,5,t,h,7,9,2k,10,17,1f,f,l,7,8,28,6,10,m,6,f,10,5,j,6,6,1,8,1b,12"," 10":"v,n,14,u,c,2,o,2f,1,q,2,1o,b,8,35,q,s,19,7,18,5,s,2i,3,2,6,5,3,f,1,z,48,1,q,1t,c,q,p,34,1h"," 11":"y,1z,10,m,9,g,4,r,3,f,k,1c,21,2w,1j,a,8,12,b,i,5,f,7,1g,s,2,9,7,39,1n,q,o,5,1,i,a,2,d,3,27,6,2,8,g,1l,v,k,1g,1"," 12":"2v,k,1j,2s,7,2,e,3,8,2,j,3,1,4,h,49,o,9,1r,u,e,37,1r,2l,d,t,1c,d,2j,5,1,g,j,f,4,1o,f,z,e"," 13":"3,i,h,1e,h,1,c,1e,4,1,u,24,t,v,8,m,g,m,v,j,19,2,x,1,1a,d,h,h,p,a,1i,9,2,40,1t,19,3,7,3,b,3h,1g,v"," 14":"2d,36,a,e,19,1f,45,p,1k,1d,4,3t,3w,t,i,y,d,1,p,b,7,41,a,4,41"," 15":"g,2,1,1,i,d,1a,h,4g,6,1n,3,4,1,3,2d,b,3,6,k,q,1k,r,6,20,d,p,p,2,u,29,39,k,1,j,5,d,7,7,1h,39,x,25"," 16":"k,p,4,n,g,e,2p,i,6,2c,m,4v,d,w,5,p,18,38,5k,m,g,9,m,5,3q,10,b"," 17":"e,9,2m,4,z,1s,9,1f,t,3t,2x,1,d,2u,2,1p,j,3w,1,1,14,1l,5,b,8,1,7,7,x,17,3j,m"," 18":"38,w,a,2n,k,d,b,e,5l,12,21,1c,2d,26,12,b,v,j,1b,l,1,1h,13,9,c,1b,25,d"," 19":"9,6,11,c,2a,s,d,x,b,4z,1d,1u,14,9f,h,9,2e,14,3v,1a"," 1a":"5,7e,d,1t,2e,j,ad,5,4j,2,1,5,9,66,n,7,p,9,d"," 1b":"y,1s,r,1d,1d,u,1h,2l,q,8,3,10,41,3d,g,1,1,1e,1,1i,i,19,1f,1a,2,a,1v,w,13,1"," 1d":"t,2j,4,l,1h,o,c,p,16,g,2r,3,30,2l,1e,24,1,1r,29,1b,4,4,18,j,28,1i,v"," 1e":"1,2q,25,4,28,3c,m,1h,1a,17,9,9,u,1h,3h,f,a,n,8g,26,6,1,v,b,a"," 1f":"7d,n,cg,3e,9t,1,24"," 1g":"1w,sg"," 1h":"1s,1m,49,4u,x,u,3,4d,1h,4,34,j,2d,c,5,a,g,e,5,7,x,7,18,1y,p,13,s"," 1j":"2t,1p,6,7,4,2f,4s,1s,9,2n,h,d,a,1,1,1x,5,2i,2f,v,18,y,c,n,2k,1i,j,21,g"," 1l":"1l,2s,g,8,y,5,4,1z,q,2r,1t,o,d,2m,2,j,f,18,39,q,p,j,r,14,d,8,8,1x,14,f,d,1z,1w,k,11"," 1n":"35,u,c7,2n,3g,z,4,4m,5,h,1,1,3z"," 1p":"0,8q,18,v,5,n,5,56,4w,2l,t,t,1g,c,2u,1j,2q"," 1q":"42,f,2y,7,1m,17,g,1e,2w,27,1,2,2,e,1c,9,62,22,22"," 1r":"f,1g,22,1a,2l,9a,1,33,9j,14,b,q,4n"," 1s":"33,j,t,j,4,2r,3g,13,5k,7,2c,1,l,3j,1s,y,3v,q,w,b,2o,9,r"," 1t":"8,1l,o,1r,9b,i,1g,8h,3o,21,54,19"," 1u":"8p,ff,1u,9,1,4h,1c,x"," 1x":"3u,29,2t,f7,i,2j,14"," 2 ":"22,9,4,1j,b,1g,6,18,17,n,1p,t,14,m,2i,q,11,2u,5,8,3,20,1,3,1c,a,2,z,3,2l,n,p,1m,6,3g,8,r,c,j,7"," 20":"11,15,2t,1p,8,1j,43,3,1q,s,2x,a,3a,x,r,2c,m,1,1,z,14,4z"," 21":"1x,1z,3,4u,f,k,16,2i,3,cj,4,1,1,8,s,6,1,10,3,19,1f,d,1k,12,9,17,e,1"," 22":"21,d,6,6,1,n,1j,1k,d,1k,5a,g,12,3i,2u,12,e,j,22,1j,g,10,1u,29,t,6,27"," 23":"3r,10,16,2z,1h,l,23,51,a,2p,2d,2f,5d,1u,4,a"," 24":"1h,3,2,2e,u,3o,1n,7h,6a,1s,1,1k,2j,3s"," 25":"1t,s,f,15,z,1,2g,1j,o,2z,s,1h,s,x,11,29,2,d,h,j,1i,a,48,2g,j,c,4l"," 26":"2a,3m,3,3,1c,6f,1k,3x,38,4x,j,c,22,d,3a"," 27":"h,i,36,1a,16,5h,3w,m,66,47,2,1i,42,12,2x"," 28":"40,2l,27,72,2z,78,11,w,4l,9"," 29":"11,2,58,8,3l,1t,1o,2x,4m,5v,n,2n,3a,s"," 2a":"2,12,1j,2,y,m,5j,1c,f,33,1i,27,14,s,6f,1n,n,2,2,1s,1k,q,z,c,1b,a,7,1"," 2b":"2w,4,16,25,7v,q,4,8a,4v,c,f,23,30,d,k,18"," 2d":"m,5e,c,3k,1v,13,5,6,2o,v,ao,2e,1c,14"," 2e":"j,1,d,6f,n,2e,c,1z,3f,2c,48,2m,14,s,5p"," 2f":"74,c"," 2g":"8c,g,as,5x,k"," 2h":"h,4,47,2b,1l,26,3x,13,27,18,5r,3u,x,e,t,j,1j,x,8"," 2j":"n,1x,1n,i,4b,54,25,q,6h,37,3k,3t,k"," 2l":"2j,3u,4,1n,12,e,2g,23,6p,44,2i,35,3f,b,v"," 2n":"3p,59,x,17,4t,12,bd,4s,3j"," 2p":"p,z,1a,2r,4i,2c,2f,g,z,o,53,o,9m,1"," 2q":"8g,1v,6p,6z,1n,6e"," 2r":"69,1f,c2,16,1,5,1,44,56,e,j,2x"," 2s":"f3,n,bt,35,6,2d"," 2t":"5g,qx"," 2u":"1p,h8,54"," 2x":"ac,8y,7a,6m"," 2y":"76,27"," 3 ":"r,l,31,8,19,4i,2m,6,3v,7,p,4,12,h,g,i,3n,i,1z,1,2,u,7,1b,o,2f,1,k,2,2r"," 30":"4m,a4,4,x,5k,5i,k,21,4z"," 31":"5,2o,6,5,1i,1p,3g,58,3z,7w,39,6,2,5,1l,y,1v"," 32":"31,1m,4t,3v,1q,9y,1z,f,2g,d,x,9,2k"," 33":"29,n,1o,2x,m,35,2n,4,x,1y,a,5g,i,1s,5,27,3n"," 34":"4n,11,17,40,o,6x,33,3h,6,8s"," 35":"23,t,96,2k,2,8,28,id"," 36":"1,bf,62,5u,5r,3b"," 37":"p,1z,do,bn,1r,e"," 38":"3c,r,bd,36,6k,4k,d,5b"," 39":"6e,1b,d5,20,ay,2h"," 3a":"15,2v,5,11,2,1c,1,c,1,4e,12,1,1,5e,3r,1,4,w,f,56,2q,3e,1j,p"," 3b":"7i,r,1h,y,24,3u,6h,2b,x,q,5m"," 3d":"5w,1o,2h,2q,3e,70,3n,72,1,7"," 3e":"16,1,ig,z,ah,1p,14"," 3f":"8j,5w,bo"," 3g":"8v,f0"," 3h":"1h,4t,2a,1,9v,25,5a,9,37,37"," 3j":"54,1q,1g,27,2,s,2z,78,3x,57,1c"," 3l":"q,9,2g,42,5r,55,4,1x,1,1a,1d,6r"," 3n":"11,4q,6u,f,2s,i,1y,8l,3n,28,5,3i,e"," 3p":"1u,8c,b3,4,39,45,1j,x,3b,1"," 3q":"2f,8h,b,s,1o,9k,3c,2c,4r"," 3r":"ec,v,37,cv,w"," 3s":"cy,8q,bn"," 3t":"fp,jy"," 3u":"2g,bk"," 3x":"nn"," 4 ":"4,q,34,1b,2e,12,1g,79,f,b,4k,1p,1l,1s,a,2m,17,4,5,1,2v,7"," 40":"1e,a,2d,2q,32,5t,4g,13,8w,2s"," 41":"fl,bp,p,5t"," 42":"1u,4b,h,56,4r,3n,f,2m,3l,j,8i"," 43":"7c,1q,5,75,4,b5,4o,4d"," 44":"5y,7,1v,8t,71,g,27,1e,1q,1c,4n"," 45":"92,4p"," 46":"kc,65,m,q,1s,50"," 47":"14,h,5x,42,1p,3s,62,19,4h,2l"," 48":"3b,5g,1x,u,8,2t,39,88"," 49":"4w,30,7z,2i,6y,2r,r,72"," 4a":"r,4c,ci,6,20,4,8x,1,4y,1,16"," 4b":"39,2w,12,1,19,3l,3i,2y,1,38,3w,az"," 4d":"22,s,7k,4,3a,30,ag,8n"," 4e":"9,2d,7n,2k,2m,l,1j,1c,2l,29,m,t,p,3m,4,g,23,1,8"," 4f":"lu"," 4g":"l7"," 4h":"6,3k,w,8p,3w,41,5o,26,j"," 4j":"6m,o,3b,1,1o,9n,2h,5i"," 4l":"d,2x,2d,1y,1q,1q,7,10,4d,2,2g,43,1c,3f"," 4n":"1g,22,c5,14,2f,62,65"," 4p":"a0,4j,34,29,30,1x,74"," 4q":"3o,7b,1y,at,1,1,4y"," 4r":"1y,7j,ah,4i"," 4s":"fr,g5,d,3n,1"," 4t":"28,n,8r,2a,z,cg,17"," 4u":"eu,ey"," 4w":"je"," 4x":"td,2x"," 4z":"79"," 5 ":"2,20,2f,r,57,1u,5l,f,6,2r,2,53,c,2c,1,6,s,1u,1,22"," 50":"1p,37,26,13,7l,p,o,74,33,46,10"," 51":"6s,t7,r"," 52":"8r,6s,29,p,7j,v,40,1g,2z"," 53":"b2,40,13,a5,3m"," 54":"50,6p,41,27"," 55":"50,9a,cm,6s"," 56":"8u,5k,80,3r"," 57":"7,6b,b3,9v"," 58":"xu,1z"," 59":"17,1l,6j,6r,ie"," 5a":"3y,1v,1y,18,2w,1h,dm,q,19,b,5v,1f"," 5b":"55,31,z,s,d,2z,1,4a,6,3k,19,11,2v,28,1,1c,3f"," 5d":"3v,fg,31,3e,6h,4l"," 5e":"26,12,1c,q,2l,1t,6n,2c,b8,7,d,19,3q"," 5f":"81,4p,bx,1"," 5g":"kk,4h"," 5h":"jl,e5"," 5j":"1d,m,13,4,2o,cd,k,1m,4,48,1,6p"," 5l":"6w,17,z,a6,2c,3a,38,1w,1e,4v"," 5n":"ci,7t,8,1,4,1,17,7i,47"," 5p":"85,8q,65,25,2g,1k,51,1b"," 5q":"8m,49,1m,8,6b,2h,7,28,7e"," 5r":"3d,3s,16,aa,f,6g"," 5s":"1e,6,1d,77,4t,41,1a,f,d2"," 5t":"2i,bk,hl,1m"," 5x":"is"," 5y":"7"," 6 ":"1w,1r,1,l,s,6n,18,4s,g,4r,l,1h,4,1n,2,1d,1s,3,1t,1,4a,4"," 60":"5a,b1,bl"," 61":"6t,11,dn,7n"," 62":"5b,hm,3i,7v,x"," 63":"qr,6,1g,r,38,q,17"," 64":"68,gp,41,3s"," 65":"5d,2t,4m,l,6g,2q,59,2d,3,24"," 66":"ti"," 67":"86,6z,d8"," 68":"2f,1t,24,3y,3d,lq"," 69":"2h,m,ay,3x,2j,2j,3z,4i,21"," 6a":"4,2x,3r,3v,4e,k,t,5m,2v,74,33,4,d"," 6b":"18,1r,x,8,5f,5g,1r,1j,9n,2i,41,x,1"," 6d":"s,67,1,2,1l,n,y,15,27,1p,5g,2,1,v,8,2c,1q,1w,q,5x,v"," 6e":"3b,53,1,s,2q,4w,5v,2v,1,w,2t,18"," 6h":"4e,91,3a,64,2z,4c,1a"," 6j":"19,2i,53,7,5r,7z,2y,g"," 6l":"as,x,3,1f,5i,25,18,2v,1x,41,3r,13"," 6n":"c,1b,9v,3b,15,88,s,6a"," 6p":"12,4t,3h,b,6l"," 6q":"4n,r,1,41,74,32,79,38,25,9"," 6r":"i,d,8n,8a,y,4w"," 6s":"xe,3"," 6t":"d1,5b"," 6u":"b,6k,2w,4p,4,3q,39,aa"," 6x":"fz,35"," 7 ":"1r,w,13,1d,5b,4d,1d,n,9,7,k,2y,5x,1b,19,1s,1s,11,4,u,1g,a"," 70":"gw,1b,al,5,1m,4t"," 71":"69,87,h1,4q"," 72":"b6,4t,2c,8y,a,4,1a,1,6w,m"," 73":"3h,c,2g,aw,4,2u,1,a4"," 74":"1v,e1,48,78,1m"," 75":"c8,a8,b,1v,1s,m"," 76":"3p,6v,2o,1f,2a,4a,6a"," 77":"qe"," 78":"1v,1a,2m,1d,96,4s,6g"," 79":"1z,1n,j0,20,2j"," 7a":"1m,i,1h,4n,v,12,2r,1s,1j,1z,1t,1g,y,c,2d,b,1b,9,1h,s,3x,10,1f"," 7b":"2a,5f,1q,22,2c,53,15,27,m,1y"," 7d":"e,1p,3j,80,58,co,44"," 7e":"1i,1a,r,58,7b,w,92,6w"," 7f":"82"," 7g":"2l,gh"," 7h":"37,25,64,v,46,io"," 7j":"3t,44,3z,5d,31,3s"," 7l":"2o,w,77,1y,t,13,p,20,5z,7s"," 7n":"5o,9,am,6w,3a,k,12"," 7p":"5d,80,6z"," 7r":"3s,6a"," 7s":"tk"," 7t":"7y,d6,2p"," 7w":"81,gn"," 7y":"4g"," 8 ":"1r,s,2k,3x,16,3x,2k,12,2,54,i,1g,3n,7h"," 80":"d8,11"," 81":"4g,i6,7o"," 82":"nz,c9"," 83":"8x,py"," 84":"ld"," 85":"c1,3,6g,94,6f"," 86":"bm,3w,6,9,c0"," 88":"dq,ie,2i"," 89":"o,5,4o,ts"," 8a":"1f,4z,f,11,2m,9o,p,o,p,5m,3s,1b,d,1d,3,4,o,u"," 8b":"4x,e,q,di,2m,s,1,1j,14,88,o"," 8d":"4r,cv,g,d9,3z"," 8e":"1c,45,ay,dr,1m,3f"," 8h":"5y,5g,3u,ge,55"," 8j":"1x,77,r4,5"," 8l":"20,1,3k,8s,4m,9h,2a,10,2e,j"," 8n":"29,3a,5h,26,p,8c,9,ca,b"," 8p":"1j,47,if,8s"," 8q":"2b,24,7f,5o,4g,2e"," 8r":"5k,up"," 8s":"34,17,1,7v,w,39,2p,4d"," 8t":"5s,pt,53"," 8u":"by,1t,lh,1"," 8x":"ni"," 8y":"a"," 9 ":"2j,10,7,2a,1v,15,2y,25,1c,19,a,9,u,2o,1w,2d,26,6j,4,1h"," 90":"10,e8,2c,cx,2g"," 91":"t,93,hy,40,3c"," 92":"4p,72,kw,o,20"," 93":"1y,6o,18,4v,b7,1n,31"," 94":"47,c2,30,16,45"," 95":"iq,10,81,3,2o"," 96":"47,c2,8e,4x"," 97":"1n,k,5v,5s,4v,92,c,4a,4,42"," 98":"k5,cc"," 99":"6p,44,6j,5,3v,6m,5a"," 9a":"9t,2c,2l,t,7c,6h,4,1g,4v"," 9b":"4j,6e,8w,4h,t,1f,92,10"," 9d":"1r,2c,7c,2k,2j,dc,7"," 9e":"2c,dp,88"," 9f":"i5"," 9h":"nl,n,13,47,3y"," 9j":"13,bz,4c,53"," 9l":"9z"," 9n":"4l,1y,db,19,1,97"," 9p":"o,ei,2a,21,6a,5y"," 9q":"aq,ir"," 9r":"ba,4n,43,3j,2y,6w"," 9s":"w,5j,1,ef,1"," 9t":"59,ck,46"," 9u":"4a,g,2l"," 9y":"tx"," a ":"eu,8g,5o"," ab":"3u,1,1,1,j,c9,1,1,2,1,q,18,r,47,4,j,39,1m,17,13,7"," ac":"9c,er,8x"," ad":"63,1,2,3,1,1,af,3c,1,1,1,1,1,1,3,9,1,1,1,1,3,1q,1"," af":"zq"," ag":"1y,1,1,1,1,1"," ai":"sr,3"," al":"e,1,b,s,m,c,5,3x,r,1,g,n,m,21,e,j,l,c,b,6,p,a,7,1,p,f,l,24,1m,2u,n,24,3,4,10,1o,1,s,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,8,2,s,2,5,27,u,1,1,1,1,1,1,1,1,1,1,1,q,1,11,1"," am":"9,vb,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1"," an":"3,2,9,6,9,6,1,5,6,b,2,8,v,4,1,1,c,c,1,1,1,6,1,1,1,9,4,a,1,5,h,5,e,7,b,k,d,11,1n,9,e,b,q,7,b,b,j,g,1,6,4,l,1,2,3,k,1,1,9,9,3,z,6,1,1,1,1,1,1,1,1,1,3,k,10,12,6,a,5,8,4,1r,2a,c,3m,o,k,v,n,d,1,1,1,1,1,2,2,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,1,2,b,a,17,n,3,1,1,1,1,1,1,1,1,1,1,8,a,d,4"," ao":"7j,fl"," ap":"2s,46,x,14,5,6y,5k,dh,d"," aq":"bt"," ar":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,1,3,h,1,3,4,8,1b,1,r,j,b,6,1r,6,i,l,4,9,2,1a,g,3,k,b,2,1i,a,4,2,6,a,4,1a,g,u,j,j,a,33,e,d,p,7,3,c,7,6,8,d,q,6,1,q,l,a,2,2,w,1k,p,1n,1e,h,20,8,3,k,9"," as":"1w,18,17,24,14,1,1w,4,7,8,2o,u,10,1v,6s,1,x,3r,1m,1u,b,1,1"," at":"gz,23,1z,2o,a"," au":"6g,17,d9,2b,4w"," av":"1w,44,23,1d,29,3,3g,3t,5,h,1e,3t,bs"," ay":"5j,2f,3f,hr,j"," b1":"g,j,4,a,1,7v,5,8,7,1,1,22"," b2":"h,h,8e,f,1,b,1,4c,4"," b3":"14,89,3,5,3,8,a,21"," b4":"96,e,6,97"," b5":"92,8,28,4,g,gg"," b6":"11,e,1,6,1,7l,h,g,1a,2,t,3,6s"," b7":"f,3,i,2,4,c,1,7k,4,8,3,5,b,27,6t"," b8":"bg"," b9":"1a,7u,1,6,6,2,e,2,1,1,1,1s,c,2"," ba":"e,8,c,6,1,7,4,o,4,7,i,j,i,1,6,1,n,7,4,5,3,d,g,2,7,6,1,7,1,1,1,1,1,1,1,1,4,4,3,f,7,1,1,3,1,5,8,1,e,e,b,1,3,l,1,3,4,7,k,1,2,8,2,1,7,8,3,8,2,1,6,e,s,5,b,1,5,h,3,a,3,7,3,b,3,1,8,3,m,5,5,2,6,5,4,c,a,o,b,q,1,1,1,1,7,1,2,1,1,1,1,1,1,1,4,2,1,2,2,3,9,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,4,7,1,1,9,9,6,j,3,4,d,3,3,3,5,8,9,1,5,e,1,1,b,c,5,a,4,7,m,1,9,3,3,1,1,c,5,4,3,b,5,2,2,1,9,15,4,2,a,b,c,6,1,9,2,1,10,3,3,9,1,b,2,d,5,3,1,6,9,1,6,1,a,3,8"," bb":"6t,1,en,1,b,u,4s,1,1"," bd":"hb,1i,5j,3,4f,1"," be":"t,d,j,10,5,w,1h,s,2j,11,r,2,7,1,d,3,1h,5,s,j,8,4,1,2,f,d,m,d,r,d,1n,1,s,9,4q,w,6,14,7,13,14,5,3,d,o,m,d,9,1,s,1,i,u,y,2,6,2,5,h,l,1,1,8"," bh":"8z,mk,2j,3,1,1,1,1,2,2,q,1,2,2,1,2,1,1,1,1,1"," bi":"7,a,o,j,k,1y,1,u,8,5,b,u,2j,1,3,5,3,6,a,1,5,1x,5,6,1o,d,5,12,b,i,m,19,t,1,26,29,15,2y,10,1,1,1,b,1o,21,v,1r,e,1"," bk":"sh"," bl":"4,6,13,c,g,o,19,2p,1,b,1,1,1t,2,j,6,l,1h,19,1b,1j,1h,1l,1d,1,5,r,s,1,1,1,2,1,1,1,1,1,6,3,2,1x,r,14,3,1,1,1,1,3,8,4,1,4,1,6,4,m,1,7,7,6,1,1,1,1,1,9,1,1,1,a,b,z,2q,j,1,1,1,1,1,1,1,v,1,1,1,1,1,1,3,e,d"," bn":"um,3,4,a,7,2,1,4"," bo":"1p,19,i,k,c,7,1,1,v,1,1,1p,10,s,p,8,29,k,21,8,c,j,1f,31,1,b,1i,7,4,1b,1l,1t,h,3,c,1,e,k,5,3,3,2,o,m,1,j,9,5,6,16,9,11,1,5,2,e,2,a,3,3,1,1,1,1,2,1a"," br":"4,8,6,9,e,3,9,1,4,1,5,3,m,b,2,l,d,l,j,4,1,3,d,2,c,e,1f,4,y,d,4,a,1,j,4,6,8,z,g,o,m,4,l,4,n,h,8,p,3,7,1l,7,2,n,2,4,1,1b,o,4,t,j,7,4,l,6,4,3,3,1,k,3,g,2,6,3,1,s,w,13,1q,3,w,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1f,1,3,1,1,1,1,1,1,1,1,1,1,1,8,4,1,3,4,4,d,b,r,1,1,3,7,3,g,7"," bs":"f5,3u,1,dy,1,3,2,1,1,1,1,1,1,1,1,9,4,1,3"," bu":"1,17,x,3,i,2h,d,t,4,c,13,1,1b,1l,1,r,v,1g,6x,d,8,3,c,6,p,17,l,n,4,1e,s,3,a,3j,d,1c,1,1,1,1,n,1,e,9,d,1,a,y,r,1"," by":"3d,12,8i,5o"," c2":"dl"," ca":"r,10,5,7,1,1,1,4,d,1,1,1,1,1,1,1,b,d,i,2,9,g,6,c,4,h,7,1d,1,5,1,1,1,1,1,1,1,1,1,1,8,p,l,2,2,d,f,f,8,2,7,x,3,3,6,6,1,i,k,7,4,1,1,d,3,b,3,1,h,1,8,i,1,1,1,1,1,1,1u,c,3,9,f,17,1,3,7,5,z,6,r,1,1,1,1,1,1,1,1,1,1,1,6,1,8,3,1,5,c,3,5,m,6,6,m,9,t,r,1j,8,d,s,5,6,8,3,5,j,1,1,7,c,8,1,g,1,9,8,1,3,1,1,2,1,1,2,o,1,2,g,q,1,2,a,1,1,i,1,2,1"," cb":"cu,n0"," ce":"60,l,2,s,b,d,20,w,6,29,3a,1i,w,3q,z,a,1,s,1c,1,1,2f,1,35,e,2,1a,5,2z"," cf":"ec,3,il,1,h,1,3,2,3,1"," ch":"8,r,1,8,p,4,l,z,10,1u,1,2,e,5,1,5,1,1,2,4,7,1,1,1,1,1,q,f,o,a,e,4,2,6,3,b,7,1,1,c,d,10,5,6,2,3,1,e,f,3,5,4,z,3,5,b,6,q,6,1z,2,m,g,3,1,f,8,1,1,1,1,1,1,2,g,a,8,a,2,1,4,6,1,1,1,1,1,1,e,a,10,14,o,a,2,3,2,9,g,2,5,1,1,2,2,1,1,2,1,2,1,2,2,1,2,1,3,2,h,1,f,7,1,1,9,3,19,5,4,4,h,4,p,7,a,l,1,c,k,e,1,1,1,1,1,1,1,1,1,1,3,1,8"," ci":"2c,t,x,1y,k,23,w,6i,n,99,9,1,1,2,79,5"," cl":"0,12,10,k,g,h,4,17,1e,5,7,j,11,6,k,7,8,4,7,3,1,3,1,4,6,4,8,3,f,3,4,1,4,2,1,s,u,3,5,2,4,8,1m,v,y,8,9,2g,y,e,n,4,1,e,a,k,c,7,2,6,6,5,9,3,b,5,2,4,8,c,1,d,1,1,1,u,k,1,s,k,15,1g,1,2,7,4,7,9,5,1,2,8,8,4,l,u,t,p,e,2,1,1,5"," cm":"zj,1,2,x"," co":"9,7,j,2,2,c,1,a,l,3,7,5,1,8,i,1,9,8,f,2,8,b,f,c,6,17,5,c,j,6,1,1,1,2,1,b,4,3,9,g,4,d,d,o,1,c,4,7,8,u,b,4,1,e,2,z,2,3,5,a,9,11,c,a,9,e,6,1,1,w,6,9,g,h,5,b,l,1,1v,1c,5,8,3,h,1,1,1,2,1,1,4,1,1,8,6,2,1,16,1,2,9,q,5,r,j,e,1,1,1,1,1,1,1,1,1,1,o,9,9,5,1,1,1,1,3,7,w,5,l,1,1,1,4,u,4,1,q,8,7,3,3,6,1,2"," cr":"0,v,1,j,8,q,6,1,a,7,8,5,2e,8,1p,1i,d,1a,j,4,t,3,j,2,r,e,1,x,5,d,4,g,5,g,1,1u,5,2j,y,n,1,1,4,10,13,2,2j,2,1o,7,1,2,y,e,i,4,1,8,1l,3,t,g,b,15,g"," ct":"uq,1,8,f,1"," cu":"3o,1m,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,24,2,24,30,34,1,1,1,1,1,1,1,1,1,1,1,1,ay,37,z,1,1,7,2o"," cv":"85,4,1,1,1,2,1,1,e,2v,3,8,72,66,3,3,1,1,1,2,1,1,1,3,1,1,e"," cw":"7b,e,en,g,1,1,1,4t,2,c,2"," cy":"sx"," da":"3v,1a,1j,q,r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,18,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,k,4t,14,2,8,3,48,1t,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,v,f,2n,p,1,9,d,1,1,1y,3,p,n"," dd":"gn,5,3,1,n,w"," de":"1,28,1c,n,1q,16,k,i,s,2,1,t,d,22,3,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,1u,45,4t,f,7,19,1e,34,8,6,c,19,2,x,1,1,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,3,5"," dh":"3i,r,rl,1,1,1,1,a"," di":"4p,1n,1,4,11,b,1h,3u,h,6m,m,4,1w,a,56,p,2,9,3h"," dn":"88,ay,41,1,4,1,j,1h"," do":"b,9,b,r,5l,11,r,5,a,36,t,3g,2d,41,1,4,1,f,4,n,u,5a,w,s,n,r,d,1,2,1,1,1,1,2,2,q,1,2,1,1,1,1,1,1,1,1,1,1,b"," dr":"s,51,2v,7,t,26,h,4p,g,2,12,2p,3w,7,2d,8,20,2,1v,2h"," dt":"y3,14,3"," du":"o,9,o,7,k,u,5,1,6,2,g,2e,11,6,1,60,2f,m,4,1,3,1,e,9,r,2,3,7,5,e,w,t,d,1z,49,2,2j,1f,b,4,1,1,1,1,7,3,v,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1"," dy":"3,2,2,1,1,1,4,6,2,1,1,1,3,1,3,1,f,9,4,9y,4,7"," e1":"fr,ek,5"," e4":"j1"," e8":"fs,3"," ea":"1d,21,21,4,4,2,2m,3,1,2e,2m,2c,m,7,24,63,p,3,1,1y,1q,17,7,3,4,a,7,1,1,1,4,7,2n,t,d,8"," ec":"22,e,b2,h,1,7b,16"," ed":"1a,1,1,1,1,1,1,1,1,1,1,1,1,1,1l,1,1,4,1,1,1,2,6,1,1,1,1,5,1,1,1,1,1,1,1,1,1,2,4,1,3,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,s,18,5w,28,1,1,b,j,7,h,1,1,1,1,4,1,1,1,1,3,1,1,1,1,1,1,4,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,1,4,1,1a,1,30,9v,9,2w,3,o"," eg":"v3"," eh":"38,1,1,4,1,1,1,2,6,1,1,1,1,5,1,1,1,1,1,1,1,1,1,2,4,1,3,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,s,9c,1,1,u,7,h,1,1,1,1,4,1,1,1,4,1,1,1,1,1,5,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,1,4,1,1a,1"," ei":"z5"," el":"1w,y,q,1j,1c,2,58,7,55,9,h,14,d,56,3e,2v,d,l,a,1r,g"," em":"0,2l,67,6a,k,7b,34,2r,x,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5m"," en":"3,3m,41,n,2o,3q,k,1m,1y,4u,h,23,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,h,1,9,1l"," ep":"ar,pa"," er":"9r,c,2u,10,j,4,3p,b5"," es":"17,g,3w,1e,1,1s,5f,j,3,4d,l,1w,1,4d,2j,4v,q,c,v,7,1,1,1,1,1,1,1,1,1,r,1,1,1,1,1,1"," et":"v,2b,4e,9x,1a,4e"," eu":"6z,1,en,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1"," ev":"6x,b8,1c,24,2k"," ex":"2f,16,3i,5r,lo,1,7,1,2,1,7,1"," ey":"7o,2l,df,6z"," fa":"1d,g,1k,a,2d,7,2s,u,1h,3d,21,g,k,1,w,1y,9,3,j,20,2c,1g,3,1k,n,1,1,16,a,24,t,1,6,1,1,1,1,1,1,1,1,1,1,1,m,4,1"," fc":"l9"," fe":"f3,8h,27,36"," fi":"p,2v,q,b,5,2,s,k,12,5f,1r,f,12,1,18,1,1,6,r,e,1,c,15,4,2,1,2,1,7m,11,1v,18,1j"," fk":"60,ao,10,1"," fl":"28,27,f,3s,19,2w,15,7e,1b,22,19,y,1l,4n,1c,2c"," fo":"g,1d,7,j,a,18,4s,b,i,8,r,5,b,1,d,25,j,e,19,4f,s,11,2b,m,q,h,d,j,o,8,z,1e,h,r,h,p,11,6,f,3,n,11"," fr":"1v,h,k,m,6,3k,i,x,4h,1s,8,9,o,f,4i,4z,g,s,4,1a,1i,1n,8,n,1,11,20,6,1,1,1,1,1,1,1,1,1,1,1,j"," fu":"1h,6i,6k,2,33,5v,c,35,20"," fy":"k6,68,1,1,1,1,2,1,8,1,2,1,1,4,1,14,d,1,1,1,1,1,9,1,1,1,4"," g ":"eu"," g1":"33,1,1,6,2,v,3,1,3,3,1,r,h,4,1,2,1,ab,1,1,3,1v,2,2,7"," g2":"5b,i,al,17,s,3,1,8"," g3":"3c,2g,5,cp,4"," g4":"5f,n,ai,1r,9,p,r"," g6":"36,2a,9,1,4,aj,2e"," g7":"5c,1,4,3,3,au,1,3,1n"," g8":"5m,do"," ga":"y,d,2n,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,z,7,5,g,1i,1l,4,b,10,1q,a,4,1m,1j,1t,b,23,i,32,d,1,q,24,x,5,32,x,p,1,1,1,1,n,1"," ge":"2,26,f,z,1a,4,50,y,2y,1h,1,q,1t,3v,u,q,18,2k,l,8,1x,5z"," gh":"49,3m,gu"," gi":"5f,ab,2m,n,c,4p,1u,q,7s"," gl":"l,2i,1,1,1,5,1,1,v,3,1,3,3,1,a,h,1,1,1,2,1,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,3,u,n,b,2d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,n,2,1,35,12,1,1,1,1,1,2,1,1,1,1,1,z,l,1,1,1,1,1,1,1,1,2,1,3,1,1,3,1,1,i,1,q,1k,1d,1,6,85,k,1a,5,6,1,1,1,1,l,1v"," go":"p,8,3p,2t,7,6,8,4,4t,9,k,i,3,33,1e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,21,1,1r,1,1,2,v,1,6,u,5h,1n,o"," gr":"e,3,n,1,4,i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,9,2,3,1,c,2,3,r,e,1,5,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,4,2,3,1,2,1,1,2,1,1,1,1,1,5,1,1,1,1,5,5,8,h,d,6,7,2,j,16,r,3,o,6,4,h,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,8,8,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,6,i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,i,6,n,1,6,6,1,2,1,1,1,5,6,5,1,3,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,8,1,1,1,1,1,1,1,1,1,1,1,2,1,1,r,6,2,6,1,f,1,1,3,2,e,l,a,d,1,1,8,7,1,1,1,1,1,1,1,1,b,4,4,2,1,6,2,1,1,1,3,3,n,5,4,d,5,4,2,2,1,1,1,5,2,3,7,b,2,y,3,5,j,1,31,1,1,1,1,1,1,1,1,1,1,1,p"," gu":"4v,42,4,e,52,6,9i,24,31,5,1,1,1,3,s,4c,1,1,1,1,1,1,1s"," gw":"xd,7,3"," h1":"h9"," ha":"7,9,1,7,4,6,9,3,5,q,2,c,g,1,g,4,d,x,i,v,5,1,1,1,1,1,1,1,i,1,1,1,1,1,1,1,1,1,1,l,a,7,q,j,f,1a,6,7,m,3,4,7,1,o,2,6,9,9,k,5,7,1,m,6,d,1,v,7,2,23,7,2,2,4,5,5,b,6,a,1,1,1,1,1,1,1,1,1,1,1,1,5,e,18,3,c,b,h,5,9,1,a,1h,14,q,a,f,9,g,8,1,1,1,3,6,2,1,1,1,4,3,3,3,2,1,1,1,2,2,2,2,1,3,2,3,1,1,1,1,2,2,5,1w,1,2,4,v,g,b,1,16,5,4"," hd":"ng"," he":"e,l,1,8,7,8,12,2,x,2z,e,h,o,4,3,5,n,c,2,n,1b,8,1,7,z,1a,g,6,1,v,3,1,1,1,1,1,1,1,1,20,1d,1t,15,t,s,2,4,9,a,v,3,6,1j,j,8,s,m,b,1,1,2,1,1,1,3,2,1,2,6,7,i,2f,2a,o,a"," hg":"oh,1"," hi":"3,9,d,1,8,1,1,1,1,l,2,3,1,1,4,1,1,7,3,9,8,2,2,1,15,3,8,i,4,4,n,20,5,1b,4,5,9,2,1,7,b,2,1,9,2,1,g,3,7,1,1,1,l,3,e,1,i,e,1,2,1,2,8,1,3,1,5,3,1,1,1,2,2,9,9,1,c,3,1,5,1,6,8,1,2,e,q,1,7,l,7,1i,4,e,e,l,1k,2,6,3,4,15,6,g,7,2q,2,4,9,y,i,a,a,5,b,7,4,a,b,k,n,5,s,3,6,9,4,3,1,q,4,a,6,2,4,j,d"," ho":"3,1,1,1,3,5,3,3,9,l,1,k,c,f,1,5,3,8,w,7,4,2,6,8,1,h,2,1,1,1,1,1,1,1,1,1,14,3,6,h,c,3,p,1,1,1,1,1,9,5,f,6,1,7,1,3,2,d,3,d,1,1,6,8,f,1,2,4,n,1,2,5,8,8,1,2,1,x,3,5,e,3,g,1,2,5,9,2,8,k,1,1y,1l,8,8,s,d,2,7,c,5,h,d,6,1,g,e,n,p,1,1,1,1,1,1,1,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,1,2,n,8,6,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,k,3,1,e,p,7,9,f,2,f,a,q,9,u,b,g,5,f,4,c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,2"," hp":"e6,g,f1"," hu":"1w,17,84,f,g,28,j,32,2w,25,k,1c,4e,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4o"," hx":"o3,5"," hy":"p1,2d,3v,36,7"," ib":"70,ev"," ic":"20,cd"," id":"oc"," il":"cx,i,kp"," im":"ee,6l"," in":"7,2,2,1,b,2,7,8,4,f,g,p,9,6,c,7,e,6,3,s,t,7,q,1q,g,4,1,o,d,1,3,4,6,1,4,1,3,8,a,3,9,v,7,c,e,2,y,l,11,4,g,9,c,j,12,2l,6,j,5,7,m,o,9,h,d,7,2,v,t,c,22,23,1,4,1,o,1,13,a,2,p,6,g,1i,1,5"," ip":"es,l4,2,1,1,d,2,b"," ir":"6n,1g,2t,2i,64,5c,3e,7,3u"," is":"fy,dr,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,67"," it":"19,cy,at"," iv":"4w,4,48,65,2k"," ja":"u,19,33,12,e,1,1,1,1,1,l,1,1,1,1,6,1,1,1,1,1,1,1,1,2f,z,11,3i,1,1,1,1,1,1,1,1,2r,19,18,1,1,1,1,1,1,1,1,y,b,1,1,1,1,1,1,1,1,1,1,1,2s,4w,1,1,3,1,1,2,1,3,2,1,2,1,1,1,1,1,1,1,1,5,1,39,15"," je":"53,bk,1,13,a1,2p,2q"," jj":"yx,1"," jo":"7,13,1,1,1,1,1,1,1,1,1,1,1,1,1,f,e,1,1,1,1,1,h,5,1b,13,n,e,1,1,1,1,1,l,1,1,2,1,1,1,1,1,k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,g,47,h,1,1,1,1,1d,3,4e,19,1,1,1,1,1,1,1,1,z,1,1,k,1,1,1,1,1,1,1x,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,4h,c,13,y,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,2j,c,1,1,1,1"," js":"td"," ju":"6,f,4m,80,1j,23,1w,c6,3b"," jw":"2f"," ka":"5j,m,2,d,1,7,1,1,1,1,1,1,db,1,2,1,1,1,1,1,1,1,1,5,1,2,e,a,1,1,1,1,1,1,x,1,1,1,1"," ke":"29,3w,4p,24,x,1p,3a,d,44,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,14,4,b,w,1,1,1,1,u,1f,b,z,k,5,1,2,2,4,2,3,a,1,3o"," ki":"8,l,e,4,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,o,1,1,1,n,q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,10,2t,t,z,3,1,6,8,m,t,4,1,1,1,1,1,1,1,1,6,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,f,m,n,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,18,b,17,35,u,8,6,7,q,b,27,24,b,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,l,15,x,1,1,1,1,4,1"," kl":"o0,1,1,1,1,1,1,1"," kn":"72,2x,2r,w,8w"," ko":"ml"," kt":"26,dz,3p,2,ad"," ku":"a5,mh"," ky":"3k,q,b,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,bt,1,1,6,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1w"," l ":"a1"," l1":"qq,1g,6,4,c"," l2":"jh,84"," l3":"jg,73,27,3"," la":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,5,1,r,h,7,b,w,8,v,5,5,8,x,1,h,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,4,1,1,1,1,1,2,2,10,4,q,d,3,4,7,m,6,b,7,3,3,6,8,c,9,r,6,b,d,1,x,3,z,1b,f,1,3,1,i,8,4,n,a,7,3,1,b,e,g,2,q,3,8,h,o,7,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,4,1,1,2,1,1,1,1,1,2,1,1,2,3,1,1,1,1,1,1,1,2,1,1,1,1,1,a,1,1,1,1,o,1,2,1,2,1,1,4,1,1,1,1,1,1,2,2,5,1,1,1,1,1,1,1,7,d,6,q,e,a,b,4,a,a,a,1,1,b,g,j,1,1,1,1,1,1,1,7,o,1,1,1,1,1,1,3,c,1,1,1,1,1,1,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2"," ld":"fr"," le":"1c,1w,j,w,g,3,2,m,19,n,5,1,1,1,1,6,l,1b,1b,1z,1s,b,1y,g,2,t,h,a,1,l,a,13,11,4,s,8,f,2,2,4,1,1,2,1,1,2,1,2,3,1,1,1,m,r,1v,3,h,z,a,4,8,h,a,5,3,1,2,3,d,2q,1a,4,6,t"," li":"f,c,g,8,15,3k,n,8,l,z,6,1h,d,4,5,13,r,6,3,v,e,g,1,y,5,18,1e,16,1,1u,c,r,5,m,4,1,1g,18,5,9,b,3,1b,3,2,6,4,a,2,1,m,h,23,f,t,5,6,c,f,9,1,f,2,r,e,1"," ll":"q6,1,1,1e,1"," ln":"1i,t,61,9,4,7n,h,48,3a,16,e,2,1,r,37,4r,20"," lo":"x,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,1,1,1,1,1,1,1,1,1,1,e,28,m,b,9,1d,9,q,8,s,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,t,a,12,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,8,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,5,d,f,a,s,o,6,7,3,1,1,b,5,4,2,z,l,6,h,q,1v,m,a,17,i,1u,8,c,5,6,2,1,1,1,5,5,i,u,14,20,1,u,c,4,1,3,1,1,1"," ls":"73,cc,4m,4,1,1,2,1,1,2,1,2"," lt":"79,2g,a,1h,bu"," lu":"pc,5n,5q"," ly":"2o,2x,8w,5p,6a,1b,2,1c,69,1d,1"," m1":"66,1,3,9,5,c,c,1,1,2,1,3,co,3,3,1,3,1,1,1,1,1,1,1,1,1,1,2,9,1,3,1,5,1,h,1,m,2,i,3"," m2":"65,7,1,1,3,5,3,6,b,d6,8,8,1,3,1,c,3,7,5p,3"," m3":"69,i,8,5,f,2,cu,1,v,5,7,a,k,2,l,2,40"," m4":"68,3,5,a,2,5,1,df,3,1,e,1,e,5,6,1,8,6n"," m5":"6k,1"," m8":"6n,cv"," ma":"1a,o,1,9,h,7,i,g,1,1,1,d,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,5,6,1,1,e,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,4,2,3,1,2,1,1,2,1,1,1,1,1,1,4,1,1,1,1,1,2,b,b,1,6,5,2,1,3,1,i,c,8,6,6,a,m,c,2,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,4,j,4,6,7,w,3,4,7,5,6,2,2,1,1,1,1,v,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,j,u,k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,8,1,1,1,1,1,1,1,1,1,1,2,1,3,4,6,s,7,c,6,1,1,1,1,5,1,m,4,1,3,5,1,1,1,1,1,1,5,1,1,a,7,1,1,1,1,1,1,1,1,2,3,6,4,4,1,1,1,2,6,1,1,1,3,3,d,1,1,3,o,p,f,1,3,9,9,1,1,1,1,6,6,6,2,o,1,7,4,2,1,1,b,8,6,1,a,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,i,6,8,5,5,6,9,1,7,1,2,1"," mc":"3y,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1e,53,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3w,32,3w,6w,6,1,1,1,1,1,1,1,1,1"," me":"1u,1b,2q,p,1,x,c,2,3,m,9,8,u,1c,1h,2v,1g,i,1y,1,i,34,1i,1a,a,1,1,1,b,7,v,l,6,4,a,2,1,4,17,h,a,9,c"," mh":"5z"," mi":"0,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,2,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,2,1,1,2,1,1,2p,e,6,1,f,3,a,1,3,11,g,k,1,1,1,1,1,1,1,1,1,5,6,n,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,19,1,1,1,1,1,2,8,1,1,1,5,3,1,1,1,2,3,m,1g,1,4,7,b,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,k,h,2,k,q,t,1,1,7,6,1,1,b,4,o,13,1c,1i,2,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,4,3,6,1o,i,s,2s,w,d,1,15,2,2"," mk":"p3,4"," ml":"5e,a,av,3"," mn":"te"," mo":"13,h,10,j,1,1,1,1,1,1,1,1,1,1,1,11,1z,1i,b,12,k,j,e,j,10,t,12,1a,7,21,k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,x,f,5,7,5,z,o,9,11,i,1,b,7,i,13,t,4u,r,25,c,3,18"," mp":"vs"," mu":"44,3,7,93,2s,r,6f,j,76,1c,26"," n ":"e,gv"," n1":"2y,c0,k,1,2,3,1,1,6,1,2"," n2":"24,e3"," n4":"fm,7,1"," n7":"fg,i"," na":"8l,k,5d,8t,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1w,27,5w,2s"," ne":"2,m,a,6,7,a,6,11,9,k,1,1,1,t,r,1,19,d,a,f,x,g,1v,6,5,9,23,1,b,h,3,5,l,5,f,h,q,o,3,a,1,e,r,m,q,4,5,5,u,6,p,r,1o,7,n,2,22,9,6,r,4,16,i,v,1,1,1,1,1,4,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,9,1,1,1,n,3,18,4,1,12"," ng":"80,1,1,1,1,2,1,c,1,1,1,1,4,1,1,2,5u,9y,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,2,j,1,1,3,1,1,1,1,2f"," ni":"27,1,1,1,1,1,1,1,8,1h,q,2l,4v,1f,1,1,1,1,1,1,1,1,24,1,10,47,3d,4,11,l,48,1,k,10,u,32,q"," nn":"8h,7,av,5l,1,1,h,5,1,1,4k"," no":"0,8,1z,1,1,1,1,1,1,1,8,l,e,2,3,2,1,4,7,y,c,a,l,d,r,n,1,1,1,1,2,1,a,2,1,1,1,1,1,3,1,1,2,7,1c,4,2i,o,1,1,1,1,1,1,1,1,e,9,6,1,1a,1,i,3,a,b,p,13,h,3,1,6,11,27,2,h,c,o,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,4,1,1,b,5,1,1,1,1,1,3,1,1,1,1,a,d,e,j,c,j,1,1,1,i,12,8,1q,2,a,1,o,1c,j,t,2,2,4,1,1,1,3,1,1,1,1,1,2,2"," np":"xd,7,3"," nr":"jk,g9,2,2,4,1,1,4,1,1,1,1,1,2,2"," nu":"3u,ga,1,1,13,59"," nw":"21,2,4,2,1,1,1,2,8,9,2,3,ao,2,1,1,1,1,1,10,2,3,8,3,1,o,1"," o ":"6a,1t,m,6k,15,1,1,7,1,1,4,3t,48,14,f,6l,1g"," oa":"j,10,4k,2b,3g,o,8q,39,12,1s,3z,26,r,1h"," oc":"3,cv,ga,34,1,i,3r"," of":"21,7,c,i,c,11,20,2,60,10,5,a,8,1k,4,1p,17,1j,2b,4z,u,i,2,d,5u,o,q"," ol":"j,5,s,5,2,8,1b,1z,8,21,8,4,w,1d,b,c,d,16,8,1m,d,5,1,c,s,24,4c,i,1,f,c,a,p,1a,b,g,g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,o,y,2,1p,1l,x,2m,3"," om":"yk"," on":"2p,1o,k,1l,28,1j,h,18,7r,n,2,1d,48,22,t,t,m,e,4u,4,4,s"," op":"73,h,fl"," or":"4f,2m,d3,w,1p,3u,27,1l"," os":"3f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,31,6n,3g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2g,1,1,1,1h,au,1"," ot":"o1,4"," ou":"3f,hn,f9"," ov":"yb"," ow":"1c"," ox":"2a,d,3w,5k,1q,2b,1a,3q,84,1,2,2,6,1,2,2,9,1,h,2,1,2e"," oz":"td"," pa":"v,c,7,8,5,d,13,4,1,1,13,12,3,a,r,g,7,1g,j,q,n,e,2,s,1,r,i,1f,k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,d,b,a,7,17,1,2,d,b,7,c,5,5,2v,3d,r,3,29,8,4,j,2,5,5,2,g,1l,n,1,18,8,1,4,2,x,l,1,7,5"," pe":"d,h,q,7,o,n,8,8,l,h,1n,36,2,5,2s,17,1,1,1,1,5,y,2e,1e,f,17,f,n,2c,2c,1p,k,v,21,1t,q,2,27,1,c,1,1,b,7,1,2,1"," ph":"24,a,26,1o,7g,2j,9m,91"," pi":"3n,5c,87,p,43,j,3c,2r,1,1,1,1,1,36,d,2v,10"," pj":"l3"," pl":"2j,6,7,19,4,1,g,17,1p,4,2,3,f,m,2,2,1,1d,2,2,8,r,i,o,6,9,11,g,d,2s,14,15,19,22,4,4,6,b,10,8,a,1s,7,3o,l,11,1a,2,h,3,1,1,1,1,1,3,4,1,1,7,o,c,1"," pm":"9b"," po":"e,2h,1,1,1,1,1,1,2,s,6,29,a,j,1,1,7,17,2c,k,c,7,t,1l,j,1,1,1,1,1,1,15,16,z,y,d,6,u,1,5,1j,19,g,17,w,j,16,1e,n,h,3,6,4,1,6,6,5,1,1,1,2,1,1,1x,4,2,r,w,1e"," pr":"1i,3,g,11,j,48,14,37,c,n,24,1,1m,m,9,31,3i,1,1,1,1,1,1,1,1,1,1,13,o,1,1,2,4,3,2,1,5,3,6,4,d,1,s,2,2,2,3,1,1,1,1,1,2,4,26,g,15,13,a,w,1l"," pu":"1f,3,p,g,5q,5h,2a,84,10,h,16,43,9,1x"," q ":"zc"," qu":"g,o,2k,2,4,1,1e,x,f,2f,h,5,t,1a,1v,1l,2,1k,g,g,6,j,1p,q,8,3b,1,26,5,b,3v,25,f,7,6,8,3,w,4,1f,d"," ra":"3j,1q,23,16,8g,v,3g,r,6,2d,15,1n,2,z,2e,1e,1w,1h,6,2"," rb":"x,yi"," rd":"1d,1,1,1,1,3,3,u,d,1l,2e,p,o,7,6,1,2,7,1,1,3,22,15,1w,o,14,1,1,1,1,1,f,2,3,2,b,e,2v,2,1b,1j,3,o,1,2,3,1,3,1,3,7,1,2,3,m,3,e,4,2,1,1,3,6,1,1,1,f,7,4,5,w,1v,1,4,5,2,1,1,1,1,3,2,4,2,3a,n,1,9,4,1"," re":"f,m,w,1a,6,x,15,3,3,14,8,1,1,i,w,c,m,5,1,l,l,5,12,y,b,2,u,d,8,k,c,14,1b,b,1,1,1,c,u,8,1p,9,1,1,1f,f,3,1,n,y,2,q,8,1,1,1,1,1,1,1,1,1,1,1,1,l,14,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,n,2,1,1q,z,i,f,18,r,x,8,1"," rf":"az"," rg":"2p,cf,4j,9j,8"," rh":"9y,hp,2x,d,j,1x"," ri":"26,1,f,5,9,5l,1,1,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3o,16,3,s,5,25,5o,1z,1,1,1,1,1,1,1,r,16,3z,q,a,17,5"," rm":"j4,hi,1"," ro":"2,1,5,1,4,3,2,1,2,2,1,1,4,2,1,7,1,1,1,1,2,d,2,6,2,5,2,2,1,3,3,1,1,1,3,1,1,2,7,5,1,1,1,1,4,3,1,1,2,6,1,2,3,4,c,9,2,1,a,7,5,6,4,1,1,1,2,1,1,1,4,1,1,3,3,1,1,1,1,1,1,9,1,1,1,1,1,1,1,3,3,4,1,2,5,1,1,1,1,1,1,1,1,1,1,9,7,6,1,1,5,4,6,b,a,1,6,2,3,1,1,2,2,1,1,1,1,1,5,1,1,2,1,3,1,1,1,1,1,1,c,4,1,2,8,3,5,1,5,1,3,3,3,1,3,4,4,1,9,2,2,1,3,1,3,7,8,5,8,1,b,1,1,1,1,2,3,7,1,1,5,1,2,1,2,1,1,1,2,1,7,1,5,1,1,1,1,1,2,b,2,5,1,1,4,2,5,1,2,2,3,2,d,4,6,1,8,4,2,1,1,1,2,a,2,a,4,1,2,1,1,6,1,2,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,i,b,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,4,1,2,k,c,1,4,6,5,3,6,4,2,6,2,1,b,4,1,m,1,4,2,2,1,4,1,1,6,1,2,2,6,f,b,2,3,1,1,a,6,1,1,8,2,3,5,5,7,1,2,v,1,3,3,1,2,1,3,2,4,1,2,1,1,1,1,1,1,7,1,8,1,b,5,5,1,2,1,1,4,4,5,3,2,2,1,1,1,2,4,3,5,7,8,6,1,g,1,1,1,1,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,7,2,3,8,3,j,6,1,3,2,1,1,1,3,4,2,1,3,4,7,1,8,3,2,2,5,2"," ru":"x,18,e,k,1,1,1,1,1,1,1,1,1,1,1,v,a,3x,e,2,4,27,2w,16,2x,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,x,2r,1u,b,12,j,1q,1n,l,1i,h,1,1,e"," ry":"cc,29,fy,1z,i"," s ":"22,t,1,1,1p,h,9,f,22,2e,19,w,17,1c,1,1,k,u,3,1,1,q,7,4,a,2b,4,j,c,17,d,p,3,s,1,2b,2i,12,s,4,22,2,p,3,14,1,11,g,b,2"," s0":"uc"," s1":"ni,1,6,1,1,1,1,2,3"," s2":"jq"," s3":"ne,1,6,1,1,1,9"," s4":"8w,ed"," s6":"na,1"," s7":"nu"," sa":"f,13,29,2,24,o,w,3a,8,b,1q,49,c,e,e,3,1,1p,k,c,16,a,8,c,5,1,1,1,s,2h,1,1,1,1,1,1,1,1,5,18,m,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,12,q,s,4,y,n,1,1,1,b,k,1t,1,6,c"," sc":"1u,1n,8,3,d5,8,2e,6,ep,1,1,1,1,1,1,1,1,1,1,1z"," se":"c,a,17,3,l,1,3,8,8,1,1e,4a,12,m,s,s,a,v,y,1,z,9,k,e,27,t,h,1j,4r,60,k,1,e,17,1c,4,4,d,f"," sg":"8i,h6"," sh":"c,e,u,v,b,k,g,e,j,2n,1,4,u,d,2,i,15,e,11,3,3,4,o,t,6,1s,z,1,1,r,5,8,m,c,u,e,r,1v,v,3,1,3,1,3,1,2,1,1,1,1,1,1,1,1,1,1,3,a,1,1,1,1,1,1,1,1,1,1,4,s,i,l,3,1t,4,e,7,14,2,u,5,4,7,1,a,a,c,1,1,4,1g,m,21"," si":"m,1l,1o,2,r,47,k,k,3t,2,20,2b,54,3,1,h,2,8,1p,33,38"," sk":"2i,4r,1,8,8,1,1,1,1,17,51,39,4d,d,n,8,1,1,1,4,1f,2u,2,b,57,1s,21"," sl":"2b,f,2l,p,5l,5r,1,2,2,cf,3j"," sm":"6x,2b,al,1s"," sn":"9d,3h,h,41,3,4f,2z,z"," so":"m,i,6,1,3,2,1,2,j,2b,4,k,8,1b,8,1g,f,6,3,w,4,5,1,b,c,m,5,6,b,o,a,g,2x,u,r,b,w,6,3,8,8,1,2,j,22,a,6,e,1,1,1,1,1,1,1,1,3,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1f,e,6,5,e,12,3,14,2,y,h,1,3,2,6,5,1,4,2,2,4,2,4,3,4,5,5,6,4,g,8,o,i,1,1,5,6,a,10,8,3,l,9,1,1,1,1"," sp":"6,7,p,4,6,1m,1k,1e,29,4,15,7,2,5,a,k,d,k,i,3,2u,10,3a,5,h,4,1,1,1,w,2l,1,1g,9,6,d,f,1,1,2h,2,f,7,u,23,b,1p,2,10,2,h,p"," sq":"22,24,f,1l,17,2,7,l,5,30,j,g,1v,3p,e,2i,4j,7,11,1e,4,v,a,i,2f,1,1b,2,1,n,21,1"," sr":"jr,cw,1,1,1,1,1,1"," ss":"8q,5f,j,51,6a,9i,1,3,2,1,1,v,1"," st":"0,1,3,1,2,2,1,8,8,1,3,3,4,1,3,2,2,3,5,4,2,3,1,1,1,1,1,1,1,1,1,1,2,5,1,2,6,5,2,1,2,1,1,1,2,8,4,2,1,2,3,1,1,4,1,2,2,1,5,1,1,2,1,1,1,1,2,4,2,6,2,1,5,3,1,1,3,1,3,2,1,1,1,1,4,5,6,1,2,1,1,1,2,4,1,3,2,1,1,1,1,1,2,4,2,6,2,1,1,3,5,1,1,1,2,2,1,2,2,1,1,2,1,2,2,2,1,1,2,1,1,1,2,1,4,1,3,4,2,2,1,1,1,1,1,7,2,1,4,6,1,1,1,2,1,1,4,1,4,5,2,1,1,6,4,7,1,1,1,2,2,3,1,1,3,2,1,2,1,2,2,1,4,1,1,2,2,1,4,1,2,2,1,2,1,1,2,2,1,1,2,3,2,1,1,1,1,4,1,2,1,6,1,3,5,3,1,1,1,2,2,4,1,2,1,3,1,1,2,2,1,1,1,5,3,1,2,1,1,1,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,9,2,3,2,1,2,1,2,3,3,3,1,1,1,6,3,2,2,4,4,2,1,2,2,1,2,1,1,4,2,4,1,1,1,1,1,2,1,3,5,2,4,1,1,1,1,2,2,2,4,3,a,1,2,1,1,1,3,3,1,h,o,6,2,2,1,1,1,3,1,1,1,1,2,1,1,1,1,1,1,1,1,1,2,4,3,1,2,1,2,2,1,1,4,2,1,3,b,1,i,1,1,3,1,1,2,1,1,2,3,1,1,2,1,1,2,1,2,2,4,2,1,1,2,4,5,7,7,1,4,1,1,4,1,4,1,1,3,1,1,2,6,4,4,2,1,5,2,2,1,1,2,1,1,2,4,4,2,1,9,2,7,2,1,2,1,1,2,1,1,1,6,1,1,1,5,1,1,1,1,2,2,1,1,3,1,1,1,1,1,2,1,1,2,1,3,1,1,1,1,1,1,5,1,2,1,2,8,2,2,2,3,2,2,2,3,2,8,1,1,1,1,3,1,2,1,5,2,2,7,5,1,2,2,1,7,2,2,1,3,5,1,9,2,1,1,4,2,2,7,2,5,3,3,1,3,1,1,1,4,1,1,5,1,5,1,4,1,1,4,2,3,3,1,1,1,1,1,1,1,3,2,1,1,1,1,1,3,6,2,1,2,2,4,1,8,1,5,1,4,2,2,1,1,1,1,1,1,1,1,1,1,4,2,2,1,1,3,1,3,1,1,1,1,1,2,1,1,1,1,1,3,1,6,1,2,4"," su":"26,u,6a,2u,2c,1,6,5,8,15,1t,1t,2,1,2,3d,v,2k,2m,5,1,1,1,3,o,b,2,3,4,4,6,2,1,4,2,1,3,1,j,n,1,1,1,1,1,1,1i,1l,2,1,1,d,2,b"," sw":"o,13,3,1,2,80,1q,10,2,d,b,3,3,2,10,3,e,1,e,4q,7,4,1l,5l,1y,g,u,2f,y,v,e"," sy":"7x,2,3r,4d"," ta":"8,w,6,4,2,1,3,u,f,5,d,g,v,c,5,3,g,f,h,j,a,5,k,5,1a,1a,21,y,q,k,q,8,7,1o,c,u,6,j,1e,o,2,1h,1,1,1,1h,4,1j,b,8,11,e,t,c,f,4g,9,3,4,1,o,8"," td":"2l"," te":"3p,4,1,2q,44,c,4t,14,2,a,2m,3d,2a,15,3,1y,2x,1e,2,1g"," th":"4,5,1,1,7,1,3,1,1,7,3,6,1,2,1,5,2,2,6,b,1,1,1,1,1,2,1,2,1,1,1,2,1,2,5,1,1,1,1,3,2,1,1,1,1,1,1,1,7,3,3,d,1,1,3,1,5,1,1,1,8,6,1,1,1,1,1,2,7,3,6,7,f,4,7,2,6,5,2,3,6,2,1,1,1,3,4,7,1,4,2,1,4,6,4,5,3,1,6,1,1,3,2,1,1,2,6,4,b,b,8,1,3,1,2,1,4,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,3,5,1,3,1,1,7,1,1,1,2,1,2,c,1,g,7,2,1,1,2,3,2,1,1,3,2,1,3,1,m,1,1,3,1,3,1,1,1,1,1,1,7,2,5,5,1,1,4,4,6,2,1,1,1,1,d,1,1,5,2,2,3,w,1,1,6,1,1,5,1,1,3,a,4,17,1,1,1,7,6,4,6,8,9,1,7,4,1,1,1,3,4,c,4,3,2,4,8,1,5,1,2,5,1,8,1,d,a,1,4,2,2,3,1,1,2,1,1,7,3,2,3,4,1,7,3,1,4,1,1,3,1,2,1,5,2,5,2,1,2,1,1,a,1,5,1,4,1,2,1,1,1,1,3,2,1,1,1,2,2,2,1,1,1,1,3,2,1,2,2,2,1,1,4,3,1,5,2,5,1,5,7,1,1,2,5,1,f,1,1,c,1,5,4,2,1,1,1,1,1,2,1,1,1,5,1,1,4,1,2,1,1,2,6,1,2,4,2,b,1,1,3,2,8,1,1,1,7,1,2,1,1,8,5,g,1,4,e,1,1,3,2,1,4,1,2,9,c,6,4,1,b,3,4,5,8,2,3,1,1,2,1,1,1,5,4,1,3"," ti":"3,19,e,1,1,1,1,1,1,1,29,22,t,g,1,1,1,1,d,4g,4,1n,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2b,3x,1,1d,1,1,k,1,1,1,1,1,1,34,5s,1,2f,1e,1"," to":"3,x,19,26,18,e,m,5r,l,m,a,s,o,7,3,c,o,24,t,c,1u,24,17,38,1l,m,e,1,v,2b,1t,c,d"," tq":"xz,g,1,1"," tr":"k,8,v,17,2g,j,14,1,b,1c,c,a,e,2e,2a,22,5a,1,1z,2a,10,1,15,19,g,44,1,1,1,4,1,6,n,4,1"," ts":"jv,co,1,2"," tt":"wo"," tu":"7v,1,1,1,1,1,1,1,1,1,6i,6,9r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3r,s,9"," tw":"2f,49,4i,2g,1,5o,4f,56"," ty":"1b,2a,1,1,1,3h,73,3,5a,6,49,1,1,1,1,1,1,1,7d,1,1,1,1,1,4,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,1"," ub":"20,by,9,6,4z,1"," ud":"5c,1"," uk":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,31,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,r,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1"," ul":"qo"," un":"1c,e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,u,1,1x,r,9,3,1,1z,1,13,4,9,26,11,3,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,11,9,w,k,1m,h,4,8,5,3,1,2g,13,11,1,1,f,14,2,o,q,6,b,v,1j,1,v,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,12,1o,1,1,1,1,1"," uo":"p5"," up":"15,11,b,3j,15,4h,3,3,29,12,12,j,3j,2e,3n,21,1t"," ur":"6g,eg"," ux":"20,by,9"," va":"62,7,37,5,b,31,1k,87,7,q,4g,1x,p,1,2v"," ve":"8y,3m,gn,1z"," vi":"i,1m,1,1,h,1,1,1,1,1,1,1,1e,4,e,1f,t,l,1z,u,3,15,3,6,24,1,1,u,1,18,1,1,1,1,1,1,3g,1y,q,g,c,p,6,11,1l,8,1l,1t,2,1,1,1,1,3,1,7,20,1b,q,1i,c,1,1,1,1"," vo":"34,1,3,70,8f,2b,3x"," w ":"1h,fz,2q,9x"," w1":"1y,1,p,aw,1a,f"," w2":"f7"," w9":"2w,c0"," wa":"3,2,8,2,4,6,4,a,9,5,k,b,l,b,2g,g,b,3,e,5,1,5,1,7,7,1,1,3,e,4,1,1,1,2,1,1,e,8,a,2,5,g,7,1,17,1,a,3,8,e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,n,d,f,c,a,4,e,5,8,29,b,4,1,b,4,e,6,9,3,6,5,8,1,1,1,1,1,1,1,1,6,5,4,v,a,1,1,k,o,1,2,1,1,h,k,3,3,3,1,1,1,2,1,1,1,3,1,1,e,1,1,1,4,n,6,6,a,a,1,2,2,b,5,d,8,8,3,o,8,1,2,2,1,3,2,1,o,h,2,2,3,t,1,5,1,4,1t,1g,7,5,3,1,1,1,1"," wc":"28,5,bc,7,x,d"," wd":"2r,r8,1,8"," we":"0,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,2,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,2,1,1,2,1,1,5,16,m,1,1,1,f,1v,f,q,2,1s,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,w,d,1,1,1,2,2,8,2,1,5,3,1,1,1,2,3,12,t,3,5,4,f,b,15,w,1i,3,1,1,7,5,5,6,4,2,6,w,1n,10,1,3,5,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,9,8,h,1p,b,p,c,1,n,d,9,1,q,1,8,8,8,1,1,1,1,1,4,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,1,h,1,1,1,2,k,b,e,3,8,4,1,2,5,n,f"," wf":"nh,3,f,1,2,2"," wh":"r,1f,e,2h,1s,n,2h,14,1m,1,1,e,v,6,a,9,1,1k,1w,3d,1e,1s,o,2h,2a,16,i,1,j,n,9,1,3,2,h,1n,x,2,6"," wi":"2,h,2,1v,1,1,1,1,1,3,2,c,2m,e,1,1,7,1,y,1a,2p,7,3,2,18,17,1,1,1,1,k,58,6,1,1,3,6,i,a,1a,1,6,5,8,2,j,5,25,a,l,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,6,f,1,f,m,9,g,1,h,6,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1,5,2,g,o,2,2,1,4,y,3"," wm":"nb"," wn":"63,1,dy,1,1,3,1i,1,1,1,h,1,1,2,3,6,f,3o,a,y,b,1,1,1"," wo":"0,1,4,2,1,2,3,7,2,3,1,2,1,1,1,1,7,h,1,1,2,1,17,8,1,3l,1w,1a,7,2,g,7,j,3,6,3,1,3,5,2,1,7,12,1h,3,4,f,d,3i,h,1s,1a,37,2f,2s,20,2k,9,h,a"," wr":"4m,66,w,b,fn"," ws":"15,2,a,9x,f,8,3"," wv":"0,1,1,2,2,5,1,1,6,2,5,1,3,1,d,1,b,4,9w,c,70"," wy":"1p,5h,70,g,ly"," xo":"hp"," y ":"eu"," ya":"13,1d,5v,m,j,28,i,1u,a6,1a,9f"," ye":"55,3w,8p"," yo":"73,15,o,4a,14,9,10,1s,1i,d,9,b,p,2s,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,v,1x,1k,1,1h,1"," zo":"ut","0 0":"10,e2,4n,1m","0 1":"8,q,2w,3,34,p,16,1o,m,3,e,j,1r,q,27,2m,h,11,1,1,2y,t,22,e,i,9,1p,x,w,10,13,1,3,1","0 2":"h,k,1z,3c,1,4,2w,j,g,1f,39,13,4p,4,1,59,1,1,3x,2p,6","0 3":"4m,1y,1,c,1,7c,7b,1,29,3i,55,41","0 4":"2v,t,y,2n,35,4,41,c,s,4b","0 5":"36,74,5g,31,i1","0 6":"i,k,7,7s,6,b,5,73","0 7":"1i,7l,2d,g,h1,6p","0 8":"1j,h,3j,5h,3d,9s,7,6z","0 9":"59,9h,33,4o,e,2g","0 a":"f,bi,bx","0 b":"1o,4t,a,17,5a,2j,5c,8q,2n","0 c":"2m,bn,1r,4n,6e","0 d":"3c,3c,by,8t","0 e":"8f,b2,63,3u,11","0 f":"ky","0 g":"4w,ac,17,1s,13","0 h":"10,8p,1,7,2l,1p,4,2s,7,bi,2o","0 j":"4i","0 k":"72","0 l":"38,ff,1d","0 m":"ck,3z,1m,31,22,9p","0 n":"3s,ay,26,da,2z","0 o":"eu,cc,27","0 p":"41,ea","0 q":"3u","0 r":"26,13,3o,1,bl,32,1,6a","0 s":"19,94,5g,1r,t,48,75,1w,17","0 t":"5a,2v,86","0 u":"ck,hz","0 w":"j,16,d0,5d,13,6r,2l,n,34","0 y":"ra","00 ":"1o,24,5x,8,4e,24,4o","00b":"f3","01 ":"1i,fv,3d","010":"11","015":"uc","02 ":"v,8y,ii","03 ":"lb,d2","04 ":"v,2l,5y,37,4n,59,53,25,c,5b","05 ":"ek,12,1r,3y,5i,1,7j","06 ":"ia,47","07 ":"1e,3l,1x,b4,3k,bq","08 ":"7o,64,hc,48,d","09 ":"d2,7q","0a ":"o7","0ad":"ma","0ae":"6n","0ag":"10e","0ah":"1a","0aj":"b5","0ax":"t1","0ay":"rd","0b ":"f3","0bl":"m1","0bp":"fw,ds","0bs":"103","0ea":"dg","0eb":"rh","0ef":"25","0en":"7q,jg","0ep":"cd","0et":"3","0ey":"fi,6","0fs":"pc","0hb":"x4","0hd":"k3","0je":"jo","0js":"10c","0jt":"a3,c8","0jz":"js","0ld":"l6","0lh":"e9","0lp":"jd","0lr":"ee","0ne":"fb,1","0nf":"yt","0nh":"9e","0ph":"wq","0pl":"wp","0qa":"10n","0qh":"9u","0qn":"lb","0qq":"u","0qx":"j5","0rj":"dl","0rp":"g,96","0rt":"10,ip","0ry":"99,67,42","0td":"9l","0th":"dq","0tr":"62","0tz":"f2","0ut":"ik","0yj":"1b","1 0":"1b,c5,1v,1,a0","1 1":"0,f,16,7,15,6,2,7,5,5,d,3,6,5,5,6,4,1,1,1,1,2,1,1,1,1,5,s,4,1,2,1,10,1,5,1,1,7,1,5,1,7,7,c,6,4,20,x,b,3,5,3,5,n,a,5,1e,7,9,4,1f,6,1,1,1,1,6,1,2,2,8,6,1,1,1,1,1,3,1,i,l,v,3,4,2,7,8,1,a,s,a,6,9,2,6,i,4,1,j,7,1,f,1,m,4,8,c,4,4,1,6,1,2,2,7,5,1,3,5,3,2,4,2,6,4,2,8,5,1,3,1,2,2,4,5,3,1,1,d,4,1,6,f,w,4,g,e,8,3,1,6,3,u,e,10,2,d,o,b,2,8,g","1 2":"l,22,b,19,2,g,3,o,1n,9,4,8,o,4,8,a,2,s,3,c,6,c,5,4,4,h,h,u,p,n,g,c,16,5,q,1,11,a,4,u,1,a,n,q,5,1,11,o,o,j,1a,8,5,r,7,l,9,v,1,8,g,2,q,n,e,8,7,1,3,7,j,e,1,n,v,1,1,1,1,b,8","1 3":"16,6,5,y,10,q,8,r,2,2,j,5,e,17,3,p,1,9,c,16,5,6,c,8,n,g,s,9,8,f,2i,5,p,v,k,20,1,1,5,1,12,1e,3,29,1,o,8,h,1,8,5,t,8,1g,6,n,6,h,4,r,7,i,1,4,1,11,1,1,f,1j","1 4":"3i,4z,1s,d,m,5f,5,r,1k,24,1,2h,t,m,j,6,1s,17,t,7,24,1,5,1,6,1,1","1 5":"3d,i,m,3,q,1v,q,6,5,5,4y,1,31,19,11,1n,3,8,1,3,1,1,l,m,14,1n,1,1,1,f,b,a,p,j,c,1d,1,q,2t,1e,4,1,29","1 6":"s,2j,l,8,1r,15,1n,4k,3i,4,1h,2,2d,2,1,13,2b,1,q,1,z,j,23,l,5","1 7":"1m,h,7,b,10,1r,1,w,1t,p,1e,3o,v,m,17,7c,27,36,6c","1 8":"21,8,38,x,7h,1d,5l,1c,1,1,1b,4y,2a,61","1 9":"6g,1f,57,2h,5c,1,2n,4b,40","1 a":"34","1 b":"6s,15,2k,2x","1 c":"1x,x,8,3j,5m,ca,i,30,g,2n","1 d":"p2,7,6h","1 e":"e5,jh,18","1 f":"2c,38,80,2h,fv","1 g":"8c,9p,7g,6k","1 h":"52,2s,1b,4b,1z,2h,9t,6,1m,s","1 i":"6n","1 k":"t,1k,5,b7,d,8l","1 l":"58,cm,52,6v,1t","1 m":"a,9m,cq,4l,1o,48","1 n":"3x,4k,21,40,62,53","1 o":"k4,a7","1 p":"7t,bg,7,1a,9k,17","1 q":"hn,gd","1 r":"4j,ja,7,18","1 s":"m,w,2o,a,a,10,g,2n,5n,11,p,2a,5m,20,6x,t,27,1,q","1 t":"3,q3,1,1,p,7r,1j","1 u":"u2","1 v":"uo","1 w":"5,g,41,1p,b5,1i,2i,9g,3i","1 y":"9g,2q","10 ":"8,t,8,r,m,9,5,u,3,l,4,2b,1,3,8,h,3x,4,5,2e,3,6,4,3,5,5,2,r,7,q,4,g,v,1c,h,p,b,1,1,6,f,1,z,a,10,3,e,f,k,1w,8,a,9,1f,12,5,k,c,1k,5,e,5,k","100":"3s,5x,8,b6","101":"1i,fv,3d","102":"v","104":"v,2l,5y,7u,ac,25","105":"ek,2t,9g,1","108":"7o,64,hc,4l","109":"d2,7q","10t":"dq","11 ":"s,j,1m,1,d,2,i,1,1,m,9,g,n,8,3,f,z,x,21,4,1f,3,y,c,2,3,n,g,2,9,1,h,2,18,4,6,d,1,2,2,3,a,7,9,2,9,1o,2,9,n,m,17,5,d,1,a,7,1n,1j,1,9,6,d,5,d,s,1,16,8,2,6,7,h,2b,1,4,1i,i","110":"ha,27,88,3f,21","111":"63,lw","112":"f7,ku","113":"y,55,ap,9l","114":"5c,b5,ak,1d,7n","115":"uu","117":"75,aa","119":"s1","11a":"yk","11e":"6o","11h":"2e,ba","11s":"kr","12 ":"6,e,2,7,w,8,17,g,9,6,c,1,2,1,4,v,k,v,x,n,3,8,l,5,f,1,1z,w,o,14,q,p,1,f,3,u,1,f,13,19,1g,2u,1b,12,4,y,r,y,u,5,r,1,z,f,4,f,2h,c,5,3","120":"e7,hf","121":"7x,qf","122":"la","123":"9d,l,oe","124":"gv,66","125":"8q,r,gi","126":"7z,75,7x","127":"4y,3s,j,5v,2z,7w,25","128":"99,lr,3r,z","129":"2v,6h,5j","12a":"3f","13 ":"2,8,9,f,4,1,1d,h,2,x,w,1,1a,g,18,3,2,o,v,8,1a,11,r,h,u,s,5,2,m,n,k,a,c,u,21,2,s,1,1t,1,1,1m,1j,9,13,7,e,4x,1y,1,1g","130":"k0","131":"3,i","132":"hj","133":"2y,c,bo,3k,8v,6g","134":"ap,dm","135":"5n,6j,1s,2n","136":"a9,hh,3s","138":"bb","139":"4o","14 ":"w,1m,j,2b,7,a,e,b,y,12,d,1o,k,l,9,25,g,j,8,18,2f,1n,b,6,4o,10,c,1,d,o,7,5,u,17,1,c,c,a,4,s,a,4,1t,h,10,3,k","140":"r1","141":"2d,bc,bj","144":"gm,k3","145":"gq,ac","147":"of,1b","149":"rr","14a":"d0","15 ":"4,g,i,1n,d,z,f,1z,17,6,1n,8,y,g,c,q,b,3,6,2g,15,6,d,1n,1e,d,2,u,29,14,e,1o,3,t,b,i,7,7,1k,9,i,8,h,g,1a,x,10,f,q,6,5","150":"j,97,47","151":"fh,3z","152":"i,90","153":"1f,po,2x","154":"dx","155":"d7","156":"g,96,i6","157":"r4","159":"36,fl","16 ":"b,1,8,7,h,5,h,6,g,1u,b,5,t,o,v,3e,3k,d,w,5,d,8,4,18,38,22,44,1g,p,13,1,z,y,10","160":"19","161":"2u,5p,m,gy","163":"8j,hk,1b","165":"r5","166":"s0","167":"61","168":"x6","17 ":"g,1g,1h,z,1s,11,n,t,11,2s,17,1x,3,3,1,1q,16,43,12,1,1,x,1,d,s,1l,o,8,7,1p,3,3u,1,m,t,z","170":"39,fa,9d","171":"rl","172":"tg","173":"6d,eg","174":"n,eo,1","175":"ka,7v","177":"or,5w","178":"e","18 ":"1d,1,30,2n,k,o,e,l,1q,4c,g,1l,5v,1a,y,j,1b,f,18,g,1o,1b,c,1t,d,o","180":"38,ff","182":"e8","184":"44","185":"oj,5v,9","186":"rt","188":"7y,ga","189":"ru","18a":"l0","19 ":"z,u,2,y,17,2,22,5r,w,2y,h,57,1,47,9,27,7,2n,b,9,2u,8,b,c","190":"f","192":"57,jx","193":"1g,4z,qs","196":"9,1j,9m","197":"el","198":"tc","199":"4u","19g":"6p,en","1a ":"vu,2q,k","1aa":"9p,da","1ab":"c3,fn,83","1ae":"yx,15","1af":"7w","1ah":"s4","1ar":"7j,fl","1as":"rn,8s","1at":"5","1au":"rv","1ax":"cm,f3,6l","1ba":"8i,ff,1r,4w","1bb":"sp","1be":"67,eb,1w","1bg":"2q","1bh":"sf","1bj":"71,50,3,8v,1,3f","1bq":"ky,1","1bs":"b3,ha,46,1","1bt":"bt,jn","1bu":"3h,9n,41","1bw":"r3","1bx":"y,3w","1by":"mf","1d ":"2o,c6,f","1da":"41","1db":"66,ek,1,7a,4l","1de":"bn","1df":"bk","1dg":"t,tg","1dh":"en,a4","1dj":"8d,hx,18","1dl":"8t,h9","1dn":"3c,fa,7k,5l","1dr":"3g,3r,a1","1ds":"6i","1dw":"mi","1dz":"5i","1e7":"28,bo","1ea":"dx","1eb":"xc","1ef":"xi,17","1eg":"ak,m,bk","1eh":"xj","1ej":"4w,4,cx","1el":"m3","1en":"fd,61","1ep":"f4,1c,5d,cl","1er":"2r","1es":"v6,3t","1eu":"cn,2z","1ex":"78","1ey":"1","1ez":"6o","1fb":"7d","1fe":"xo","1ff":"80","1fp":"zs","1fq":"nu,9t","1fs":"kg","1ge":"uc","1gq":"1w","1ha":"ch","1hb":"2e,ba,6h","1hd":"e8,3","1he":"1s,q2,76","1hf":"wg,p","1hg":"3e,49,b1,8s","1hh":"t3","1hj":"ql","1hq":"nd,j","1hr":"ui","1ht":"de,cv,31","1hu":"k9,6h,19,7","1hx":"y8","1hy":"r0","1ja":"pu,9r","1jb":"2t","1jd":"sz,4l,2h","1je":"oz","1jg":"4v,hp","1jh":"jx","1jl":"x1","1jn":"7e","1jp":"r2","1jq":"4i,h,d1","1js":"4o,c6","1jt":"e7,dt","1ju":"c6,5i,2e","1jw":"hy,ae","1jx":"dy","1jy":"hz","1jz":"hb,e8","1la":"87,gc,r,1x","1lb":"8x,ee,bk","1ld":"64,kv","1lg":"4t,16","1lh":"bo","1lj":"o0,68","1ll":"4d,o,c3,10,18,72","1lr":"ml,8f","1ls":"e5","1lt":"zf,11","1lu":"1l,g4,92,2d,1j","1lw":"68,79,11","1lx":"wz","1ly":"h6","1m ":"22","1na":"wl","1nd":"m9,z","1ne":"nc,4r,h,1,1","1np":"35,d1","1nq":"3z","1nr":"it","1nw":"ry","1pa":"p6","1pd":"ul","1pg":"8q,h9","1pj":"bl","1pp":"0,bq","1pr":"w4","1ps":"gw,av","1pt":"yu","1pu":"9y,10","1px":"od,32","1py":"at","1pz":"ls","1qb":"7f,7","1qe":"j7","1qg":"af,j7","1qh":"av","1ql":"f5,ad","1qp":"rk","1qq":"jg","1qr":"42,f","1qs":"98","1qt":"c9","1qw":"hv","1qy":"hc,1,2,2","1ra":"h3","1rf":"k6,an","1rg":"vu","1rh":"f,up,5d","1rj":"3x","1rl":"tp","1rn":"h2","1rq":"1v","1rw":"57","1rx":"7s","1sa":"qc","1sb":"ok","1sd":"zz,r","1sg":"4y,d5,2y","1sh":"33","1sj":"vv","1sl":"7t","1sn":"cc,ey","1sp":"zq","1sq":"3m","1sr":"52,cu,d9","1st":"4f,5c,b0,cb","1su":"wr","1sw":"kf,1","1sy":"b9","1ta":"rm,21","1td":"ny,at","1tf":"2h,bk","1th":"100","1tn":"8","1tq":"1t,do","1tt":"dj","1tx":"48","1u ":"1y,1","1ue":"wy","1uf":"8p,h9","1ug":"up","1ul":"q7,1","1uq":"w1","1uy":"o4","1v ":"dz","1w ":"dk","1x9":"2d,bc","1xa":"ol","1xl":"3u,29,2t","1xq":"r4","1xr":"s8","1xx":"o3","2 0":"1a,7z,5,g,1b,18,1w,5,1i,h8","2 1":"1,s,2,2l,45,2d,1m,9,4n,s,1l,2z,1e,r,3q,3,2j,k,1r,4,3d","2 2":"k,2,i,k,1,2h,4m,s,3l,g,1t,1n,1w,t,5h,u,11,3a,20,1,11,6,1q","2 3":"4n,3y,4d,29,36,3,1,38,1,w,f,m,28,ag","2 4":"6,33,1,o,27,h,8t,1z,7,2,v,1,n,2l,x,1n,i,f,1k,2n,1y,4j,1","2 5":"22,4,r,2w,2a,2,u,5i,g,1y,1x,1s,1s,1c,16,2r,1c,2q,1,1r,r,x,q,e","2 6":"49,5,10,au,6,2b,44,4,1y,x,2b,2b,3,2x,3,28","2 7":"24,o,s,9,1v,21,8,1,2t,1y,o,9,2g,5,c,q,1,2r,b,s,1l,5,f,t,2m,2a,45","2 8":"1f,i,17,17,1,3,w,f,8,ae,3,82,5p,3n,b,2k","2 9":"o,3v,5a,1h,4n,l,3i,6h,93","2 a":"5b,o4","2 b":"2f,4e,1n,3b,8u,w,45,5f,2","2 c":"21,1y,s,2c,1o,91,a,26,g,5c,s,5d,6,1l,1h,l","2 d":"8o,9o","2 e":"8e,h5,1z,10","2 f":"la,55,j,2i","2 g":"4p","2 h":"2r,2y,2l,2c,k,1d,1p,1a,6,p,40,52,1y,2s,q,a,1i,1n,1c","2 k":"it,6p","2 l":"db,ao,bs","2 m":"3e,4c,23,7t,12,5q,2v,a,8y","2 n":"f6,2d,5f,5z","2 o":"mk,5","2 p":"2e,3h,5k,29,41,ir","2 q":"f7","2 r":"i,90,2a","2 s":"2b,f,5n,4s,2i,c,47,31,x,2r,1v,4l,1c,k,x,k","2 t":"og,41,2p,1,4n,e","2 v":"ms","2 w":"6c,2l,g7,27,10,6k","2 y":"fj","20 ":"h,h,18,46,1,4,7,1r,m,19,q,1i,1p,2c,1s,2h,4,1,2b,x,1f,m,1,1,z,2g,6,d,15,b,1y,3,2w","200":"eb,s","201":"11","202":"sb","204":"cl,9w","206":"ia,47","207":"4z,1x,b4,3k,bq","21 ":"1x,27,2a,1j,j,d,n,c,16,29,2,1,9,7a,4j,a,g,4,1,1,10,6,11,3,o,l,v,j,1,1x,19,2,11,k,1","210":"rf","211":"dg","212":"3z","213":"3w","215":"qg,53,42","217":"y5,1g","218":"98","219":"6p,en","22 ":"21,3,a,c,1,n,38,1s,4r,j,1i,11,2h,2m,1a,e,2l,1j,g,3,x,1u,1b,1,1q,6,k,1n","220":"6h","223":"2k,2d,97,9d","226":"6u,eo","22a":"wl","23 ":"2k,9,8,q,16,10,19,k,16,v,7,6,u,23,13,c,4,h,2a,3q,2d,3,7p,n,17,4,a,u,4,e,b,d,o","230":"ad","232":"4r,db,a","237":"pt","239":"9d","24 ":"1m,2e,u,1s,9,1n,1l,2,2y,3s,2m,22,1i,v,1s,1,1j,1,2r,w,g,28,2,5,1,a,5","242":"hm","245":"1k","246":"1h,sb","25 ":"1t,s,f,15,z,1,2g,15,e,d,b,2z,s,1h,1p,11,29,2,d,2s,17,1m,1f,2z,c,1u,1,d,3s","251":"mw","253":"tu,5g","254":"le","255":"fs","256":"kv","26 ":"1u,42,3,n,8,k,2e,5c,9,5w,9,10,j,4a,4,j,2e,d,3a,1c","263":"sa","265":"2a,bj,5h","267":"62","269":"7z","27 ":"z,36,t,h,3b,j,3,2q,32,1g,1j,4n,1j,1,1p,10,15,d,42,12,2x","271":"qx","274":"fy","279":"h","27a":"6l","28 ":"40,2l,2o,98,8l,w,32,1j,28,k,f","282":"8s,a1,78","284":"8s,72,a7","287":"ws","29 ":"2v,3g,7a,1a,3a,6u,20,n,2n,28,12,s","290":"bx","293":"9c","294":"a4","296":"11,5i,9z,4m","298":"13","2a ":"3f,t6","2aa":"2p,nx,7r","2ad":"49,e2,1w,82","2ae":"sw","2ag":"em,ig,33,1","2ah":"3n","2an":"wc","2ap":"bj,of","2aq":"2,b2,mx","2ar":"us","2at":"2n,dh","2aw":"jf,9j","2ax":"9s,j8,6o","2ay":"14","2b ":"sw","2bd":"46,tt","2be":"104","2bj":"2w,3f,8l","2bl":"na","2bn":"e6","2bq":"s5,2u,3d","2bs":"sh","2bu":"yw","2by":"30,c0","2de":"tq","2df":"ft","2dg":"60,ao","2dn":"6c,3k","2dr":"cz","2ds":"cu,jc","2dx":"m,qq","2dz":"br,1e,hx","2eb":"j,c5","2ed":"p9,1w","2ee":"qd","2ef":"g3","2eg":"6r,bo","2eh":"k,d","2en":"7z,eo","2eq":"7c","2er":"wu","2ex":"ap","2ez":"ad","2ff":"7g","2fw":"74","2gb":"jk","2gr":"8s,h9","2gy":"8c,h5","2h ":"f6","2ha":"h,is,aw,t","2hd":"73","2he":"p0,80,x","2hg":"8o,mt","2hi":"57","2hl":"y5","2hp":"su","2hq":"au","2hr":"l","2hu":"tr","2hy":"4s,9z,13,27","2jd":"2k,bk","2jl":"yk","2jr":"47,i,bk","2jt":"qn","2jx":"gz","2jy":"n,mt","2jz":"90,l7,3t","2la":"9k","2lb":"96","2le":"2j,bk,jv","2lg":"84,gs","2ln":"6d,ef,9r,4l","2lw":"6h,5j","2lx":"re","2ly":"y9","2n ":"et","2nd":"kl,ch","2nf":"3p,d8","2nn":"10l","2np":"fv","2nt":"sa","2nu":"9v","2nw":"b2","2ny":"8y","2pd":"1o","2pf":"fe","2pj":"h1","2pn":"5p,ao","2pp":"2y,9l,2f,76","2pq":"we","2pu":"ms","2pw":"wf","2px":"a7","2pz":"p","2qd":"h0","2qe":"8g,h6","2qf":"nz","2qn":"ab","2qt":"w0","2rb":"va","2rh":"69","2ru":"7o,c2,16,1,5,1,44","2rw":"kx","2ry":"ud,e","2rz":"y7","2sb":"x7","2se":"rj","2sh":"f3","2sp":"uo","2sq":"uu","2ss":"fq","2tj":"wd","2tq":"5g","2ub":"ix","2ue":"1p,mc","2xe":"ac","2xq":"qk","2xt":"ja","2xz":"x6","2yp":"76","2yt":"9d","3 0":"7q,1v,jg,n,6f,9,2,9","3 1":"12,1e,b,2,4q,d,1j,8,4a,3,8,3,1x,13,21,13,1,1y,l,5,1h,2u,1,7,e,4k,g,4,13,p,w,6,2,1,o","3 2":"2,h,6,8,2q,2m,v,2,y,gs,21,h,35,1n,2q","3 3":"2w,8b,35,3,h,28,47,62,70","3 4":"2u,4r,1h,38,6l,w,5,1k,h,19,3x,4z,1,3s","3 5":"3y,2y,1q,1i,4l,4w,1z,z,3d,r,2c,w,7,1a,42","3 6":"9r,3a,1f,4,8,3y,w,2g,1k,4r,1r,1p,j,37","3 7":"5m,b,fi,20,3i,m","3 8":"a,5i,22,1a,2u,18,4g,5b,1,g,86,1,1,4,2,2y,b,17,5","3 9":"13,5g,3g,y,6h,2f,1a,1,2h,2x,3j","3 a":"6f,9x,n,42,2d","3 b":"2y,3b,4,6c,29,1w,3z,2o","3 c":"1f,22,a,u,c,36,1r,14,64,3,u,2a,7,4e,1r,w,7,5c,e","3 d":"3b","3 e":"za","3 f":"d4,d9,7","3 g":"4s,86,jb,23","3 h":"y,21,a2,1y,16,1q,28,ah,3p,2d","3 i":"ji","3 j":"jy","3 k":"29,2b,9b","3 l":"2k,6n,4x,1h","3 m":"1y,3w,2p,1,1s,8p,72,1,3j,32","3 n":"31,1s,a8,1r,1g,23,6g,2d,3u","3 o":"mk,ak","3 p":"7c,2m","3 r":"3a,dw,1c","3 s":"3t,k,1k,6,1e,a,15,8d,5t,1j,30,2b,4,t,d,1h,16,1n","3 t":"1g,ou,3k,e","3 u":"1c,2k,51,o5,1t","3 w":"r,26,6f,1q,3v,96,47,4x","30 ":"3o,y,n,a,3u,j,h,4c,1,4,x,22,1n,k,1b,16,4c,d,7,21,32,e,3y","303":"lb,d2","305":"lb,d2","31 ":"3,2,g,2j,8,1a,1p,3v,8g,c,5z,1,1,1v,3f,2,1q,y,1s,3,1x","313":"2z,c0","314":"ug","315":"u3","319":"2t","31s":"9r","32 ":"14,3j,4,3e,56,48,j,a,5b,1,9,1b,1q,f,3q,2t,2b,4","320":"tt,d","321":"9g","323":"31,c0","324":"vc","329":"oz","32e":"6r","33 ":"29,n,2,c,1a,2x,m,1i,4a,11,2,1w,a,1e,42,i,j,1,18,2j,36,a,1s,18,26,4,5,4,2,c","330":"r6","331":"oz","335":"b8","336":"dz","33b":"f2","34 ":"4n,28,4,1n,23,6,o,7g,2k,4,2o,p,6,q,82,2b,1","341":"ig","344":"5o","34r":"27,bn","35 ":"23,t,2r,3t,1s,u,1w,o,2,8,1p,j,a2,4j","351":"c6","357":"zh","36 ":"1,a8,17,2j,3j,5u,4e,1d,2f,w","37 ":"2o,70,21,3,4k,9h,26,u","375":"p","376":"u4","378":"tq","37a":"6q","38 ":"43,78,w,cz,7p,1,2v","380":"3c,fa,b4","384":"u3","385":"fg","387":"ze","39 ":"3q,y,31,1o,7u,2x,2q,3p,27,t,49,2h","398":"6e,eg","3aa":"45,o2","3ab":"15,a7","3ae":"mm","3ag":"6x,1,en,1,cp,28","3ah":"6l","3al":"ux","3an":"lq","3as":"40","3at":"56,2,77,1,5e","3au":"ce","3ax":"6k,ta","3ay":"n1","3b ":"f2,1e","3ba":"89,h5","3bg":"9q","3bh":"ao","3bj":"gm","3bs":"7i,fl","3bt":"cs","3bu":"r1","3bx":"qb","3by":"wn","3dh":"a1,gr","3dl":"7k,fl,ap","3dp":"xv","3dq":"5w","3ds":"g5","3dy":"y2","3dz":"cr","3ed":"v3","3eq":"xw","3es":"ws","3eu":"jn","3ey":"17","3ez":"16,jg","3fe":"ef","3fr":"8j,hk","3gd":"nv","3gx":"8v","3ha":"tb","3hj":"wi","3hl":"1h","3hq":"8k,hk","3hs":"8l,ha","3hu":"6a,eb","3hw":"ig","3jb":"6u,eo","3jj":"ah","3jp":"ea","3js":"aj,s","3ju":"54,qu","3jx":"um","3jz":"8a,h5","3la":"q,ci","3le":"z","3lh":"tt","3lq":"lp","3lw":"id,4","3ly":"3f,gz,1","3lz":"7h,fl","3na":"5r,aj,kf","3ne":"qt,5v,3n","3nf":"d0","3nl":"11","3nr":"cl,k8","3ns":"fs","3nt":"i8","3nw":"ug","3pe":"l9","3ph":"a6,eg,45","3pp":"ua","3pu":"v7","3pw":"ld","3px":"1u,wo,1","3qa":"aw","3qb":"sv","3qg":"qj","3qh":"b7","3qn":"bz","3qr":"xm","3qs":"2f,b8","3qt":"n7","3rb":"ie","3re":"w5","3rf":"v9","3rr":"f7","3rz":"ec","3se":"cy","3sl":"lo","3sp":"xb","3ta":"zn","3tx":"fp","3ue":"2g,bk","3xh":"nn","4 0":"3,22,3x,41,8h,t,b","4 1":"2h,9,2t,o,1,a,20,2l,i,3,f,1y,h,r,d,4u,3,2i,1y,p,1c,1,2,s,6,o,x,w,m,16,18,2x","4 2":"2k,15,b,1p,m,68,g,15,1p,1,j,k,2i,32,2j,1m,s,13,2b,3f,1h,a,n","4 3":"7i,12,1z,s,13,1,1,5,7,ab,23,y,u,6o,g,g,1","4 4":"d,29,31,z,4d,1u,2r,g,l,59,4n,r,25,8,b,3v,1,16","4 5":"1k,y,2i,5,7l,1c,3o,1a,1d,4,j,2h,5r,s,f,1e,4p","4 6":"v,s,1e,3r,3,4,2k,2e,34,33,2q,p,4,8g,1b,u,27,1,6,g","4 7":"e,1h,1o,7y,5h,1y,8d,2b,1y,2l,19","4 8":"1c,5h,6a,5w,2,i,1y,d0,4,2,1,j,3,z,1","4 9":"w,v,2g,c2,38,4r,6o,2h","4 a":"8s,fl,1c,c","4 b":"4,a1,aa,z,66,i,2k,4j","4 c":"av,4g,1,1j,dl","4 d":"v,4y,1p,fl,5v,60","4 e":"bp","4 f":"4u,aw","4 g":"80,24,7t","4 h":"3g,ah,21,1a,5g,9,7t,4u","4 j":"u,fz","4 k":"65,l7,2p","4 l":"6v,eo,6v,8b","4 m":"5c,c,37,2o,4y,5,a2,12,8b","4 n":"44,15,ck,a7","4 o":"he,6x","4 p":"8p,h9,5e","4 q":"oa","4 r":"8i,g2,14","4 s":"3y,p,30,32,1w,39,82,5t,28,1n,e","4 t":"n,5l,18,nh,15,1,h","4 u":"s9","4 v":"p0,7o","4 w":"1m,70,s,r,fr,47","40 ":"41,2q,6,1,1y,b6,13,g,1,28,37,5h,b","400":"1o","402":"9t","404":"u1","405":"fm","407":"1e","41 ":"2d,43,79,4m,5,t,v,r,1,e,3y,22,p,3b,2i","413":"fl","42 ":"65,3f,28,2h,5,38,1b,13,6,31,2,3j,j,42,4g","420":"gj","424":"6m","426":"1u,4s","42n":"kl","43 ":"7c,1q,5,75,53,66,4o,4d","437":"6q","43b":"gg","44 ":"5o,h,1v,8m,7,7h,27,1e,1p,1,1c,4n,15","440":"nu","445":"5y","45 ":"1k,4e,34,7o,4n,5a,f,47","458":"dr","46 ":"1h,3y,3r,k,6u,3s,65,m,q,1s,7,4t","47 ":"1l,9z,1p,3s,7b,3,1b,33,3,2i","474":"7i,fl","47w":"14","48 ":"8r,1x,u,8,2t,39,88","483":"3b","49 ":"4w,30,7z,1,9f,2g,b,r","490":"id","496":"zv","4a ":"d0","4aa":"53,co,h7","4ab":"r,gu,g7","4af":"jv","4ag":"jr,91","4ap":"xr","4aq":"st","4b ":"77,1","4ba":"39,f9,1","4bb":"10m","4bd":"c2","4bj":"fk","4bq":"65","4bt":"8h,h6","4bw":"lr","4da":"ds","4de":"22","4df":"2u,oe","4dh":"gs","4dw":"ae,4","4dy":"zv","4ea":"2m,de","4eb":"p4,4v","4ed":"hj","4ee":"lg","4eh":"pt","4ej":"iv","4el":"ff","4en":"a9","4ep":"w2,1","4eq":"9","4et":"ct","4eu":"ob","4ew":"np","4ex":"tj,2s","4ez":"tf","4fy":"lu","4gu":"l7","4hb":"6,d5","4hd":"tl","4he":"t2","4hf":"qw","4hj":"3q,dh","4hl":"l8","4hr":"4m","4je":"7a","4jf":"al","4jg":"tw","4jp":"ca","4jq":"am,ds","4jr":"lx","4jt":"6m","4la":"b1","4lb":"d,8y,2x","4lj":"b8","4ll":"oi","4ln":"5n,ay","4lp":"rx","4lr":"gn","4ls":"3a","4lt":"j3","4lz":"7l,fl","4nb":"1g,hq","4ng":"vd","4nl":"fn","4nq":"3i","4nr":"gr","4nx":"p8","4pa":"hn,76","4ph":"jw","4pl":"mw","4pn":"a0","4pp":"vx","4px":"ej","4qa":"nq","4qb":"3o","4qr":"cx,av,4y","4qw":"nr","4qx":"az","4r ":"2g,bk","4rb":"jy","4re":"1y","4rh":"og","4rl":"27,7a,4d","4sg":"w9","4sh":"fr","4sl":"vw","4sn":"zx","4sp":"zw","4td":"bm","4th":"28,bo","4tr":"2v,c0,dn","4tw":"rb","4un":"ts","4ur":"eu","4wj":"je","4xp":"td","4xq":"wa","4zg":"79","5 0":"j5,n,7e","5 1":"k,3h,17,2k,l,d,1p,1z,5g,3c,37,1m,1s,e,7,7,1t,b,d,1j,1,7,1f,j,1s","5 2":"n,3i,66,t,3z,5y,5m,f,a,2f,x,1,5,8,33,1g","5 3":"15,2,5n,3n,65,31,1v,66,2f,7,z,5g","5 4":"al,g,l,g,19,h,2z,2n,h,4j,2i,1m,84","5 5":"32,60,3,s,2l,u,eq","5 6":"4,82,8,1,f,g,6,s,f,q,5,e1,1,5,g,q,33,1u,7","5 7":"4g,3s,43,l,m,8v,29,6,l,11,r,21,12,3n","5 8":"5l,6g,3,80,5h,27,55","5 9":"6f,50,8f,5x,20,3y,1r","5 a":"2l,k6,83","5 b":"54,4d,1r,10,61,9e","5 c":"2a,5b,5m,6,g,2w,21,1f,2e,n,1d,1s,i,26,1j,2r,1x,15","5 d":"ik,8g,20","5 e":"un","5 f":"ru","5 g":"50,y,4h,57,er","5 h":"p,d,1y,6n,2e,1,2,1u,c,c,e,g,1a,e","5 j":"23,hw","5 k":"cr","5 l":"9f,av,11,1z,36,e","5 m":"2p,2g,i,3f,3l,5,30,t,15,9o","5 n":"2,4f,f9,1i","5 o":"5d,29,nx,t","5 p":"1k","5 q":"k1","5 s":"22,72,o,2b,6,1a,11,1o,15,12,1z,z,ag,1v","5 t":"eo,9k,2b,d,77","5 u":"ie,1t,6g","5 w":"1t,13,9l,2f,1i,62,5c,2m,3z","50 ":"j,16,37,1o,1,h,13,1l,m,2,4,2,m,3,2o,1t,1d,27,80,46,10","500":"gf","50a":"o7","51 ":"6s,5e,3b,3z,3g,d3,r","52 ":"i,89,r,61,29,88,v,3a,q,1g,2z","528":"ih","53 ":"1f,9n,53,a5,t,2r,2,4,5a","533":"f2","54 ":"50,6p,28,1t,27,3h","55 ":"50,58,f,1v,p,4,z,1i,b4,6s","56 ":"g,8e,s,14,1w,2,1q,5f,12,1j,3r,1n","57 ":"7,6b,b3,8l,1,1,w,c,81","58 ":"dr,k3,1z","59 ":"17,1l,e,65,6r,2p,fp","5aa":"5t,36,q4,1f","5ad":"qy,1z","5af":"7r","5aj":"t8","5al":"3y,7x","5as":"dc","5ax":"ro","5ba":"86,z","5bb":"sn,1,1c","5bg":"la","5bh":"nk","5bj":"aa","5bn":"xf","5bq":"d9,1","5bw":"qf","5by":"9x","5bz":"55,cf,6,4t","5db":"jb","5dg":"w7","5dq":"3v","5dt":"mc,eg","5dy":"pq","5ea":"38,ff,bf,d","5eb":"26","5eg":"ze","5eh":"7v","5en":"4k,r4","5ep":"5a,b1","5es":"tv","5ex":"9o","5fb":"on","5fn":"cq","5fw":"81,gn","5gd":"p1","5gu":"kk","5hp":"jl","5hu":"xq","5ja":"32","5jb":"i7","5jd":"5u","5jq":"36,fl","5jt":"op,1","5ju":"1d,u2","5jz":"1z,ie,4","5lf":"vc","5ll":"6w,eo,6i","5lp":"107","5lq":"83,gr","5ls":"92","5lu":"j8","5lw":"ty","5na":"te,47","5np":"kb,8,1,4,1,17","5ny":"ci","5pa":"t5","5pe":"rl","5pg":"gv","5ph":"p5","5pn":"n0","5ps":"zh","5pw":"85,q1","5qa":"eh,90","5qd":"no","5qe":"l0","5qq":"cv","5qs":"8m,63,b7","5qx":"xa","5rd":"3d,f8","5rg":"j0","5ru":"8b,h5","5rz":"75","5sa":"iy","5sb":"a4","5sf":"1k","5sh":"k8,f","5sj":"2x,c0","5sr":"1e","5sy":"xp","5tn":"vn","5tw":"2i,bk","5tz":"x9","5xa":"is","5ys":"7","6 0":"u,j9,27,1,ae,1","6 1":"98,h,2x,1,u,1n,27,5a,q,14,29,7m","6 2":"96,m,2w,23,8j,r,3e,j,7,p,1d","6 3":"11,t,7w,bj,68,3g","6 4":"r,f0,bk,f,3,7,1z","6 5":"38,2m,ct,bb,3b,1","6 6":"b,1,w,2j,w,s,1n,3q,57,l,18,a0,1","6 7":"37,be,49,8,18,1y,5p,e,3,2n","6 8":"5k,4w,2s,98,f","6 9":"4a,b,5,2l,3f,1f,hs,5e","6 a":"1w,k,bk,cp,4t,4o","6 b":"5z,4a,gu,5s","6 c":"9,cn,7g,v,17,2n,42,i,r","6 d":"1,j,gy,s,6d","6 f":"1d,2a,1,2j,ec","6 g":"47,1c,9u,1,v,9,a8,1f","6 h":"11,r,8,8k,w,6,2r,1k,dn,8,c","6 l":"jt,2p,9a,m","6 m":"8u,8u,4t,k,b,4,1h,18","6 n":"up","6 o":"6j,v,6l,75","6 p":"6m,lh,1v","6 q":"g,96,gv","6 r":"49,b0","6 s":"1u,37,v,a7,21,hr,7","6 t":"3p,ay,2a,ey,2q","6 u":"6u,eo","6 v":"xz","6 w":"1h,9x,30,6h,6y,1p,d,1w","6 y":"bo","60 ":"19,1x,24,b1,2g,95","61 ":"1m,18,2m,2e,p,m,10,fy,31,2w","612":"6t,eo","62 ":"1f,3w,f,6n,35,6,79,3i,2i,4h,1,2,t,x","63 ":"8j,3r,dt,o,6,h,w,3,r,2g,1,1,q,q,17","64 ":"1n,42,j,59,4w,6k,41,3s,2s","65 ":"2a,33,2t,39,1d,k,1,g,5c,3e,4m,n,2g,24,14","650":"ja","652":"u5","656":"jt","66 ":"11,4t,3e,h,68,c3,1i","67 ":"61,1,24,6z,9h,3r","68 ":"2f,1t,62,3d,jj","682":"6c,t1","68x":"2f","69 ":"1g,11,m,4w,62,3x,2j,2j,3z,4i,21","6ab":"vz,33","6af":"4","6ag":"fl","6aj":"6s,i3","6ap":"zj","6as":"31,7m,4e,6z","6ax":"z6","6ay":"ge","6ba":"18,1r,x,b3,cx","6bd":"yf","6bh":"44","6bn":"gq","6bp":"9j","6bs":"i9","6bt":"zd","6bx":"ue","6by":"zc","6da":"9a,j9","6db":"6z,eo","6dd":"f9,5g","6de":"bd","6dl":"dk,lr","6dn":"s,jz,1","6dp":"70,6k,8b","6dq":"8n,ha,1w","6ds":"yg","6dt":"72,h5","6dy":"a8","6ea":"97","6eb":"uh","6eg":"8f,h5","6ej":"3b,53,h5","6en":"bx","6ep":"gt","6et":"qg","6eu":"mo","6ey":"t9","6ha":"gp","6he":"u4","6hl":"mt","6hn":"4e","6ht":"ps","6hw":"df","6hy":"ve","6ja":"3r","6jd":"91","6jg":"es","6jl":"8u,hb","6js":"mr","6jt":"19","6ju":"pp","6lb":"ku,60","6lg":"ym","6lh":"zp","6lj":"d7,bq","6ll":"ip","6ln":"bp","6lp":"bs","6lu":"uv","6lw":"m2","6lx":"as","6ne":"fy","6ng":"et,gf","6nj":"o6","6nt":"1n","6nu":"c,b6,dg","6pl":"5v","6pp":"12,8l","6pu":"9c","6pw":"g8","6qa":"jm","6qe":"5e,1,b5","6qh":"wh","6qn":"4n","6qp":"9g","6qq":"w8","6qr":"qv","6qx":"u3","6rb":"v","6rd":"i,90","6rh":"nm","6rs":"hs","6ru":"iq","6sl":"xe","6sp":"xh","6tb":"d1","6tu":"ic","6ua":"b","6ub":"9r","6ug":"ek","6un":"ia","6uq":"6v,eo","6ut":"eg,hd","6xs":"fz","6xw":"j4","7 0":"g,96,3z,1v,2,6,j5","7 1":"1w,48,2t,c,1m,3a,1k,6q,1f,2c,1,1,18,f,9,9,2,1t,f,45,3,4,1","7 2":"7z,eo,4c,k,k,t,3n","7 3":"q,am,q,ck,b1","7 4":"53,48,6,2r,p,3f,1f,55,u,1,1,45,2,u,6c","7 5":"9o,37,5c,r,d,49,1h","7 6":"9c,2d,3,1n,26,d,6q,46,4e,3y,5,1,1","7 8":"1r,3c,co,fh","7 9":"3q,dh,3i,3k,1,t,21,37,26,1a,2t","7 a":"105","7 b":"3d,4f,y,3o,67,7e,5f,3b,1t","7 c":"z,40,12,21,57,4r,12,9b,4x,l","7 d":"86","7 e":"5f,b5","7 f":"f4,am,2t,52","7 g":"2n,1,1h,1x,a2,8l,1","7 h":"27,2r,8w,37,12,m,5n,3f,d,4o","7 j":"7","7 k":"rx","7 l":"el,el,68,7","7 m":"8l,66,29,8v,1l,5a","7 n":"1l,5k,39,fc","7 o":"wd","7 p":"1e,p8,4c,38","7 q":"f5,1m","7 r":"sc,75","7 s":"1n,4v,ax,6,55,1p,7y,1s","7 t":"or,1n,a5","7 v":"4c,78","7 w":"6w,eo,49,2o,7y","70 ":"i,i,2,g,1,1q,5u,4,b,5,79,1b,c,9d,w,5,1m","704":"zc","708":"zc","71 ":"f,r,46,1,4,s,87,21,ag,o,3w,4q","72 ":"9y,18,1s,31,j,ar,a,4,1a,1,i,6e,m","720":"ib","73 ":"3h,c,2g,4,6o,44,4,2u,q,9f","739":"k4","74 ":"n,18,3s,1v,51,2s,1,m,n,6i,49,1m","741":"k4","749":"fw","75 ":"p,bj,o,m,6s,26,b,1v,1s,m,15","76 ":"3p,1v,50,1l,13,1f,2a,4a,6a,2n","77 ":"or,1n,49","78 ":"e,1h,1a,2m,1d,96,1y,2u,6g,28","79 ":"h,1i,1n,5t,d7,20,2j","7a ":"6l","7aa":"6q,bg,1t,1g,y","7ab":"93,dm,6h","7ad":"eo,ku","7ae":"1m,8j,my","7af":"se","7ah":"cw","7an":"p2","7at":"3l,ui","7ax":"88,h5","7ay":"24,e3,ah","7az":"qx","7ba":"9f,am","7bl":"7p,b7,3y","7bs":"os","7bt":"bh","7bu":"2a,bj","7by":"m8","7da":"iu","7db":"23","7de":"5m,u0","7ds":"e","7dt":"dm","7du":"vi","7ea":"2s,da","7eg":"1i,21,df","7eh":"8r,h9","7ej":"ww","7fe":"82","7gp":"j2","7gr":"2l","7hf":"37","7hj":"bg","7hl":"cb","7hp":"z5","7hz":"28,34,8k,2l","7jb":"3t,dg","7jd":"ka","7je":"o2","7jl":"7x","7jr":"bw","7le":"di,hj","7lg":"cp","7lh":"n9","7ln":"ar","7lu":"2o","7lw":"el","7lx":"3k,dq","7ly":"fa","7nf":"sb","7ng":"5o,9,am","7nn":"qp","7ny":"r9","7nz":"nf","7pb":"kc","7pf":"5d","7px":"dd","7rs":"a2","7ru":"3s","7ss":"tk","7tr":"7y","7ts":"nt","7tu":"l4","7wo":"14,6x,gn","7yx":"4g","8 0":"6n,cv,7z","8 1":"5,at,30,9,y,2j,1,2h,3u,3i,5,2,3f,1i,d,1v","8 2":"2j,3h,1l,6i,1n,5,t,6i,4c,3g,28,1","8 3":"fs,2g,aj,4,g,f","8 4":"9,o7","8 5":"7,16,1,6d,10,91,88,35","8 6":"dn,4m,4i,55","8 7":"3s,6a,84,1t,6q,67","8 8":"4r,6,14,5t,d,5v,et,2d,1,7","8 9":"2j,1k,4x,53,3d,bw,i,5x","8 b":"1v,4j,1a,3n,7,9c,4c,2s,1d,36,2a","8 c":"1r,1e,19,9d,db,89,1","8 d":"40,34","8 e":"53,co,d9,3f,1a","8 f":"8n,ha","8 h":"e,9w,71,if","8 k":"ao","8 l":"2f,7r,3h,k7","8 m":"5r,3i,2h,22,r,1r,ay,7e","8 o":"71","8 q":"6l","8 r":"dq,2x,ja","8 s":"89,z,99,2l,2b,1g,l,5l,15,6,3j","8 t":"fa,d6,43","8 v":"48","8 w":"43,is,6h,3u,1m","8 y":"13","80 ":"38,4,4m,3i,1s,11,4d,1,b3","81 ":"4g,eu,3c,7o","82 ":"6c,2g,5g,4l,56,22,9c,v","83 ":"3b,2b,3b,5f,3,im,1u","84 ":"44,4o,72,a7,42","845":"ld","85 ":"c1,3,3c,34,5o,b,35,2q,9,3g","86 ":"bm,g7,4","862":"fi,6","866":"fx","87 ":"ws,2d,9","88 ":"dq,ie,2i","880":"7y","885":"o8","89 ":"o,5,4o,md,7f","8a ":"k5,v","8ab":"rs,3s","8ad":"6e,ef","8ae":"ag","8af":"1f","8aj":"6t,eo,be","8an":"ys","8ap":"m6","8aq":"10a","8at":"k4,d4","8au":"yo","8ax":"yl,v","8az":"7u","8bg":"5b","8bh":"mx","8bj":"4x","8bn":"61","8bp":"m5","8bs":"my,av","8bt":"jj","8bu":"oh,14","8bz":"yh","8dg":"za","8dq":"4r,db","8dt":"hm","8dz":"vb","8ee":"u6","8en":"gf","8eq":"z7","8eu":"5h","8ex":"1c,ug","8hb":"be","8hd":"10r","8he":"vm","8hh":"5y","8hx":"f8","8ja":"94","8jb":"1x","8jr":"108,5","8lg":"vq","8lh":"y4,j","8lj":"20,cd","8ll":"21","8ln":"uq","8lp":"iz","8ls":"5l","8lw":"sg","8ne":"5j,ti","8nf":"yq","8nl":"29,8r,2v","8nn":"m7","8nq":"d6,9a","8pg":"5q","8pl":"wx","8pr":"1j","8ps":"o5","8qh":"hi,6u","8qj":"bu","8ql":"2b","8qp":"ly","8qx":"4f","8rl":"109","8rx":"5k","8sa":"ne","8sj":"34,17,1,c0","8sn":"j1","8sp":"c7","8sq":"d3","8td":"5s","8tp":"vl","8ty":"10o","8ua":"dr","8ue":"z8","8uh":"z9","8uy":"by","8x ":"2f","8xq":"ni","8yp":"a","9 0":"l6,v,5c","9 1":"1t,2,1j,13,11,38,6p,r,1v,n,2q,17,3e,23,34,4f","9 2":"2b,e,7,9v,25,c3,z,6b,4,r,10,1,1","9 3":"z,31,2b,9e,5o,1u,1s,1k,3q,32","9 4":"1g,2a,3k,2q,77,bj,c,h,49","9 5":"4w,6z,7d,8g,3r,42","9 6":"2z,c0,45,2w,8v,1m","9 7":"9f,ap,4y,6f,3o","9 8":"2b,93,2d,87,o,c6","9 9":"t,1j,dp,24,3u,5s,3,1m,1,1","9 a":"fp,9w,21","9 b":"42,3u,1f,2n,co","9 c":"4o,da,a3,78","9 d":"36,fl","9 e":"at,ni","9 f":"r5","9 g":"h,qn,64,a","9 h":"o,27,8,1r,2v,76,11,4l,2d,at,2m","9 l":"17","9 m":"1z,3i,18,16,4,53,8a,cf,1h","9 n":"kp,2b,1y,9j","9 p":"9d,bf","9 q":"3q,5a,87","9 r":"2j,10,36,7e,1s,13,4e,d4","9 s":"2s,1,d9,1a,5,8d","9 t":"dl,f8","9 u":"2h,3j,81,2n","9 w":"3m,2i,j7,1o,19,5b","90 ":"f,l,ax,9,32,2c,t,c4,2g","91 ":"t,93,5,ht,40","915":"z6","91a":"vu","92 ":"1a,3f,2w,46,bf,1y,7j,o","926":"zb","928":"zb","92h":"57","93 ":"1g,i,4h,2p,8,i,5,hk,31,2n","930":"ep","934":"8m,ha","94 ":"47,5c,l,65,46,45","941":"j9","95 ":"95,s,8t,10,81,3,2o","96 ":"9,s,r,2f,2c,4v,4v,9,4m,3j,4x,6b","97 ":"1n,k,5v,19,6,2r,1m,r,44,92,c,4a,4,42","98 ":"13,5b,3o,1s,90,8i,35","98a":"k5","99 ":"4u,1v,44,6j,5,3v,6m,5a","9ab":"eq,t","9ad":"uw","9ae":"c5","9af":"tc","9ag":"mv","9at":"9t","9aw":"zr","9ax":"tg","9ba":"p3","9bg":"4j,6e","9bj":"2d,bc,mv","9bq":"zk","9br":"oa","9bw":"qi","9bz":"jt","9dd":"43,7c","9dg":"gi,dc","9dr":"dz","9dw":"1r,sa","9eh":"o9","9er":"2c,dp","9fs":"i5","9ga":"6p,en","9ha":"xg","9he":"ti","9hf":"o8","9hg":"nl","9hu":"pb","9je":"d2","9jl":"mh","9jt":"he","9jw":"13","9lw":"9z","9nl":"ub","9nn":"4l","9ns":"6j,ek,1","9nt":"ju","9pb":"vp","9pq":"jh","9ps":"f6,al","9px":"hg","9py":"o","9qh":"th","9qx":"aq","9ra":"k0","9rg":"ba","9rh":"fx","9rl":"nj,9u","9rw":"qh","9sb":"6g,ef,1","9sd":"w","9sq":"6f","9ta":"59,ck","9tj":"lz","9ue":"7b","9uy":"4a,g","9yj":"tx","a 1":"39,2k,2g,5o,am,v,5g,36","a 2":"5z,m,1x,h6,7x,e,6,i","a 3":"34,4l,aa,4v,2c","a 4":"41","a 5":"za","a 6":"86","a 7":"53,o,p7","a 8":"ot","a 9":"uh,4r","a a":"b,6,9,i,2o,ct,23,9m,x,3,9,2y,2w,1,1,1,1,1,1,1,1,1","a b":"2p,q,4s,7s,6n,2h,7,1b,2d,g,2b,19,1,1,1,1,j,4,1","a c":"2p,3,3s,1l,5s,25,6q,q,p,11,2c,2,a,2j,b,q,a,1,1,1,1,5,3k,y,8","a d":"86,1,2,9,h,5,1,2,3,5,5,5,2s,r,8,bu,4,a,72,1n,l,5","a e":"38,1,i,a,4,y,6,1o,1t,8x,4,2,p,1,4,12,a,1m,s,3m,1l,2i,3,5c,4,2,2,s,1,5","a f":"60,2z,84,2y,4,cg,1s,q","a g":"2m,6,7,3,z,4,1m,2,w,1,46,5,2q,1,5,b,r,11,2,8,2z,r,1c,3,y,m,3d,v,2y,t,4t,1,1,1,1,1,1,1,1,1,1,1","a h":"2w,5m,6e,v,1,1,1,1,1,1,1,1,3n,4f,12,l,3z,f,8,d,1,6,6,44,1e","a i":"af","a j":"32,3n,1,em,3,1k,24,3,bj","a k":"53,6,i,2,ah,1d,4,2,z,2,4,b,d,4e,1,1,1,1,1,1,1,27,1,1,1,1","a l":"a7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3r,1,c,92,2,21,1l,y,10,t,1l,1,2e,n,2","a m":"35,9c,r,8,1m,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,51,3s,2,8","a n":"2m,5k,1,5k,1,28,7e,3,9,7,w,d,4,k,2p,21,5i","a o":"3r,cw,1,f,2w,1,1,z,67,f,a,1f,14","a p":"24,v,c0,18,e3,d,1,6,6,7,2s","a q":"3v","a r":"25,13,1,5p,98,c,1,4,11,5c,u,i,1v,c,25,2s,5","a s":"7j,17,33,17,1h,1x,1,1,39,3f,6,4,c,7,22,n,2j,15,a,2h,2g,4,4,y","a t":"aw,5,jm,1,10,x,1z,23","a u":"e7,hj,1,1,7","a v":"7j,fl,76","a w":"b,6,9,i,1w,1,50,4,v,1,2,3,5,5,5,99,4j,1r,6,82","a y":"eu","a0 ":"jx,a8","a1 ":"77,1,7,7,1,1,bj,1q,4,1,1,1n,41,d,g,1j,1,m,21,2n","a10":"71,dx,1,1,6y","a12":"qo","a14":"6i,80,6i,60","a15":"6f,pk","a16":"72","a2 ":"l4,1l,7h","a22":"y4","a3 ":"6w,eo,8b,6,3,1m,2","a30":"5j","a4 ":"25,hj,af","a5 ":"5l","a6 ":"37,fn,c7","a62":"xe,1,2","a65":"xg","a7 ":"i7,48,5g","a8 ":"i6,3,4i,55","a9 ":"2z,2j,9h,e3","aa ":"2p,1g,y,q,x,29,q,82,f,1t,1g,y,m,3n,1l,66,l,5,1f","aac":"10f","ab ":"r,e,4r,37,29,r,2n,t,22,37,1x,51,2,1e,2e,2,d,1t,1a,r","ab1":"3u,1,1,1,j,c9,1,1,2,1,q,18","abb":"s,ir,47,4,3s","abe":"1t,1r,a,1,1,1,j,c9,1,1,2,1,g,a,18,5l","abi":"8z,4m,fn,17,1a,2d,1,1,1,1,1,1,1,1,1,1,1,q,1","abl":"kk,8j","abo":"6m,ow,2n","abr":"db,jn,1,1,1,1,n,1","abt":"l7","aby":"bl","ac ":"10f","aca":"69,h7,n","ace":"24,b,4,6,7,x,1,b,4,1,g,17,1p,4,2,3,2j,2,2,1h,o,6,q,1,1,1,1,g,t,1b,s,a,f,5k,4,a,1b,8,d,15,k,7,1a,2e,j,2,11,b,1i,1o,1","ach":"2r,1,53,o,g,5,m,22,1h,1,28,k,23,7y,21,3a,3f,6,2,2,d","aci":"6l","ack":"4,6,k,j,c,g,a,2r,12,e,1,1,1,1,1,l,1,1,2,1,2s,1,1h,1w,o,7,1a,2,1h,v,k,6,13,i,q,1,1,1,1,1,1,1,1,14,j,15,9,1y,1,1,1,1,3,8,4,1,4,1,14,d,1,1,1,1,1,9,1,1,1,9,1,b,3p,1h,r,d","acl":"3u,1,1,1","aco":"16,86,ng,2d","acq":"x0","acr":"a3","acs":"a4","act":"1d,20,f8,4z,g,92,3f","ad ":"2,1,5,5,3,3,2,2,1,1,4,2,3,5,1,1,1,1,1,1,2,b,2,6,7,2,2,1,3,4,1,1,3,1,1,2,7,5,1,1,1,5,5,2,6,1,2,2,1,4,g,3,2,2,1,s,4,1,1,1,2,1,1,1,4,1,4,4,e,1,1,1,1,1,1,1,3,3,5,2,a,4,a,4,3,7,1,5,4,s,5,1,2,3,1,1,4,2,1,1,1,5,1,1,3,3,2,1,1,2,c,2,2,1,2,8,3,2,3,1,5,1,3,3,3,4,1,1,6,1,9,2,2,4,1,a,8,5,8,1,b,1,1,1,3,3,7,1,1,5,1,2,1,1,1,1,1,1,2,1,3,4,1,5,1,1,1,1,1,2,b,2,5,1,1,6,5,3,2,3,j,6,1,c,2,1,2,2,c,6,8,1,2,1,1,9,6,2,1,1,3,1,1,5,2,2,1,3,1,3,3,2,2,2,2,1,2,5,7,m,1,1,1,8,1,5,1,1,1,5,2,q,6,1,a,5,3,6,4,2,6,2,c,4,n,1,4,2,2,1,4,1,1,9,2,w,5,1,1,g,1,1,8,a,5,5,2,1,g,h,1,6,1,2,1,3,2,4,1,2,1,1,1,1,1,1,7,9,1,b,4,7,2,1,5,2,2,5,5,2,1,1,1,2,4,3,5,f,6,1,5,b,1,2,1,2,3,4,1,1,1,1,2,e,a,2,3,8,m,6,1,3,2,1,1,1,3,1,3,1,1,1,3,4,7,1,8,5,2,7","ada":"63,1,2,1,2,1,1,af,3c,1,1,1,1,1,1,3,8,1,1,1,1,1,3,1q,1,t,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","adc":"l9,62","add":"2m,al,2g,d,s","ade":"1r,3k,8,3f,10,1e,19,a0,3w,6,1x,1,1,1,1,1,1j,i,k,i,1x,a,4,c,5,q,9,y","adf":"it,46,1d,3","adh":"cf,4z","adi":"1n,5a,1,e,29,5j,4j,1y,1,2f,e,4z,a,3i,1,36","adl":"1f,8,64,3q,18,b,2,b,3,e9","adm":"nx,95","ado":"8l,be,5w","ads":"nb,c5,i","adw":"15,i,8,1x,4y,5y,93,1,27,4y,4,4h","ady":"7b,no","ae ":"1m,51,3i,b,1p,ah,6a,47,1u,15","ael":"5x,1y,1,1,1,1,1,1,1,1,1,z,2s,co,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7h,1,19","aer":"ec,3,im","aes":"vh,n","af ":"4,1b,5z,d,5,bz,8j,y","afc":"wr","afe":"42,9,y,2t,cq,e9","aff":"15,2,2,8,9x,f,2,6,3,7,3c,c4,a,2,2,6g","afi":"4g","afo":"tw","aft":"8v,qv","ag ":"6x,1,7o,z,46,1u,1,19,5x,1t,1,2g,19,1u,1,8,5","aga":"4w,dj","agd":"101","age":"1g,4e,t,b,e,p,3j,36,3n,r,2a,8,27,4,r,1m,3x,2,1,1,1,1,3,a,5,3,1,2,3,d,2s,v,13","agg":"3,2,4k,l,b1,f6","agh":"2m,3w,9i,cc,2f,n,1,1","agi":"1y,1,1,1,1,1","agl":"1d,4c,6l,43,5t","agn":"u2","ago":"t,a,b8,fe,8,22","ags":"95","agu":"6z,1,3o,az,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3e","ah ":"1a,2d,1g,15,4,1,1,1,1,1,1,1,2,1,1,1,1,1,1,a,1,1,1,1,1,1,1,1,1,1,1,1,1,2,5g,4v,32,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,5h,18,2h,1,b","aha":"iu","aho":"ur,n,1,1,50","ai ":"q6,1,1","aid":"2w,c0,g8,1f,1,3n","aig":"60,ao,hr,1","ail":"3y,18,3,39,33,68,74,r,j,1,y,4a,49,n","aim":"7f,7,1,1,1,1,1,1,1,1,eu,1,1,1,1,1,1,1,1,1,1,1","ain":"f,4q,7,3,2,6,1,1,8,20,n,1a,g,p,3,24,6,17,8,1q,2,1,1,1,14,2g,r,3b,1,5,5,1l,3,29,b,a,4e,17,1j,1","air":"15,2x,1e,66,em,2m","ais":"1y,1,1,1,1,1,19,fa","ait":"4r,db,hf,1,1,1,1,1,1,1,1,1","aiu":"l9","aj ":"6s,1,4c,ac,3e,4d,3n","ak ":"j,10,4k,2b,44,2k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7s,21,1s,3z,26,28","akd":"y7","ake":"4i,39,2m,21,1,6q,9,x,9,5,3a,1,2,2,4s,6,r,62,h","akl":"y5","aks":"2l,in","aku":"y0","al ":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,1,d,1p,7,7,m,7,15,i,7,i,9,k,b,d,9,s,4,4,1,1,19,5,5,a,n,18,o,s,1d,1k,28,1,4,7,c,15,9,l,6,x,1,s,e,1,a,8,9,1b,k,s,1,8,1,5,e,b,d,8,i,3,h,9,k,6,10,3,b,1,1,1l,a,q,5,2","al1":"pi,47,3","al3":"u2","al5":"8d,le","ala":"24,18,3a,8g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,h,1y,h","alb":"q,e,e,13,z,9a,4g,1t,3o,2r,7,p,j,15,c,13,8,3,8,2,s,7","alc":"21,7s,24,3d","ald":"0,40,2u,f,3r,e,2e,p,2l,1,1,24,2a,57,2l,5,g,9","ale":"e,a,7,k,m,3,4,13,34,9,5,x,1q,5,b,2h,k,z,e,7,15,l,5a,14,15,4,8,24,1,1,16,6,r,2,e,f,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3k,2t,f","alf":"4u,1r,5x,t,2,1u,56,4f","alg":"tk","alh":"8r,h9","ali":"3q,59,20,38,30,64,s,5,9k,a,1,1,1,1,1,1,1,1,1,1,1,q,1","alk":"1c,1w,2s,47,6h,10,1,y,bq,1g,2,u,1","all":"2,d,4,2,a,c,a,z,2g,d,t,1,1,1,1,1,2,1,1,7,2,1,7,1,1,1,1,1,1,5,1u,6,y,o,m,3,f,v,9,8,1,9,1,k,1w,a,j,w,8,i,2,3,1,13,e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,b,a,1,1,1,1,1,1,2,t,1,1,1,1,1,1,b,n,1,l,l,t,o,4,2,j,1,1e,g,8,v,6,5,6,3,f,i,g,g,1l,1,1,1,4,d,1,1,1,1,1,1,1,1,1,1,7,4,1,15,1","alm":"2x,1j,ah,7l,w,6w,3l,1","alo":"hk,1,1,6,gl","alp":"jx","alr":"uw","als":"j,y,9x,6l,t,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","alt":"6i,s,78,ci,21,b,x,2,6,2,1","alv":"bo,bz,z","alw":"o0","aly":"rc,4z","am ":"h,o,p,4,1,1,1,1,1,c,2,d,8,g,2l,1,2,3,1,1,7,8,k,4,m,1,1,1,1,2,1,c,1,1,1,1,4,1,1,2,7,4,8,6,a,1,5,c,2,6,j,3,r,5,n,q,4,e,4,c,5,3,2,2,t,2,1,i,2r,1,2,1,6,4,u,1,1,1,1,1,1,3,9,1,1,1,1,3,o,t,9,1,2,n,1,1,1,5,9,z,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1,k,1,1,3,1,1,1,1,8,4,3,1,1,1,1,1,1,1,1,f,4,c,6,a,g,1,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,4,1,1,1n,p,1,1,1,1,a,11,1,16,1,1a,5,e,3,7,7","ama":"4z,d1,60,1,1,1,1,1,1,1","amb":"9,7w,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,4q,14,40,3h,31,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,q,4d,h,4,b,32,1,1,1,1,1,1,1,1,1,1,8,3,1,2,a,1,1,i,1,2,1","amd":"23,7,8d,36,1i,1","ame":"23,3,j,8j,11,3w,2s,3g,6g,1g,k,5x","amf":"6i,9h,71,4c,8s,1,1","ami":"85,7m,1,1,1,1,1,1,1,1,99","aml":"vt","amm":"3x","amo":"c0,2,1,lb,1,1,1,1i","amp":"0,1,c,d,4,1,9,6,a,4,5w,x,7,q,u,1c,c,3,8,3z,2b,12,3,6,3d,1z,1,1,h,5,1,1,2d,1h,j,3,2,1,1,5,4,1,4,2,2,4,2,3,1,1,1,1,2,7,3r","ams":"y,k,y,1,1,1,1,1,5,c,4y,1,1,1,1,2,1,c,1,1,1,1,4,1,1,2,2q,2f,1,1,1,1,l,21,7x,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,3,2,j,1,1,3,1,1,1,1,2f,1s,f,42","amu":"wy","amw":"3i,5x,fc,58,1x","amy":"vk,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1","an ":"o,g,u,1,1,1,1,1,d,1,1,1,1,1,h,f,3,3,b,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1c,1,1,3t,a,c,2,t,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,e,b,1d,1,1,1,1,k,1l,w,5,z,1p,4,1,1,3,7,4,18,d,3,a,6,f,21,14,1,1,1,1,1,1,1,1,1,1,1,1,7,a,l,n,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,x,8,8,l,1,1,2,1,1,1,2,1,3,2,1,2,1,1,1,1,1,1,1,1,1,4,1,8,l,o,b,3,1,1,1,h,e,2,e,6,k","ana":"4n,r,5,5,33,7s,3,3q,b,5d,83,6,6,p,4,2","anb":"9o,k9,1","anc":"5n,g,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,4,2,3,1,2,1,1,2,1,1,1,1,1,5,1,1,1,1,2x,x,15,n,j,6,11,1f,2x,k,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,3,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,8,1,1,1,1,1,1,1,1,1,1,33,1,1,1,1,1,1,1,1,1,2,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,4,4,2,1,7,1,1,1,1,2,1,1,2,3,1,1,1,1,1,2,7,1,1,1,1,1,1,1,1n,3e,1l,1,1,1,1,1,1,1,1,1,1,1,k","and":"0,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,2,1,1,8,8,9,e,e,4,c,1,1,1,3,f,3,1,a,1,5,h,j,7,6,5,2,9,m,11,f,1,1,1,1,1,6,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,14,5,1,1,1,2,2,8,2,1,5,3,1,1,1,2,3,g,6,a,1,9,1,5,j,3,5,4,m,c,f,a,15,17,d,1,1,7,g,2,4,4,8,b,4,4,6,c,2y,6,9,2,1,b,c,2,j,1,1,1,1,1,1,1,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,k,i,10,5,8,1,1,1,1,1,2,2,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,b,a,x,a,b,c,3,1,1,1,1,1,1,1,1,1,1,8,n,2,2","ane":"6,b,3,q,9,x,h,7,b,w,8,10,1s,1c,1d,4,q,d,3,x,6,b,a,9,8,c,9,r,6,o,1,1z,1b,f,1,3,1,i,c,n,a,7,1b,q,3,8,h,41,2,1,1,2,5,a,j,d,6,q,o,p,a,a,2,b,g,x,2c","anf":"10k","ang":"1o,17,1,1,o,1r,1r,3d,1j,v,21,1,1,i,12,6,8,4,f,28,1p,20,2v,1,1,5c,2a,1,2e","ani":"89,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1t,1,1,1,1,1,1,1,1,1,1,1,1,1,1,51,4,5t,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1f,5o","anj":"60,ok","ank":"1g,15,4i,1,1,1,1a,7,5,47,2e,21,2l,13,1o,1,i,1r,m,b,4,19,8,3,h,4d","anl":"s3","anm":"e9","ann":"3j,b,1,1,1,2,s,1l,1,1,1,1,1,1,1,i,1,1,1,1,1,1,1,1,1,1,4q,3,4j,1,1,1,1,1,1,1,1,1,2,l,2i,5,n,1,1,1,1,1,1,1,1,1,1,1,1,2v,1,1,1,1,1,1,1,4y,1b,5,1,4,5,2,1,1,2,3,d,18,3e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ano":"3g,1b,6,14,3j,1d,1z,45,7,u,aq,2l,g,1x","ans":"12,14,c,9,2,16,8,14,i,1b,q,f,a,5,7,s,c,8,2j,k,o,4,a,w,l,f,1,38,19,4m,2,4,l,3m,3,8,2,10,b,f,2m,19","ant":"1w,19,15,1p,n,v,w,4k,5,1,13,2u,62,f,1g,1,34,2p,8,15,28","anv":"m9","any":"pp","ao ":"7j,fl","aol":"s5","ap ":"53,1y,4i,an,bl,1s,f","ape":"2n,1n,3g,y,5,2q,b,4a,6f,h,32,2b","aph":"dj","apl":"6y,eo,3g,7r,1y","app":"2s,53,14,5,r,4u,1d,j1,d","apr":"hr,5q,i","aps":"9u","apu":"o3","aq ":"2,b2,hp,58,29","aqu":"bt","ar ":"a,4,8,c,6,1,6,1,s,4,p,i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,7,1,n,7,4,5,3,2,8,3,1g,b,3,7,7,1,1,3,1,e,6,m,c,p,e,l,a,2,1,1,e,3,8,s,n,5,b,1,3,2,h,3,7,r,3,1,8,3,l,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,b,1m,6,7,1,1,1,1,a,b,a,w,7,1,7,3,c,4,8,5,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,b,k,3,8,i,3,1,1,5,9,1,1,b,1o,1,9,2,1,4,1,c,5,4,3,b,7,q,7,k,4,2,2,1,1,1,1,1,3,1,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,6,1,p,k,b,3,d,5,3,1,6,9,1,4,2,1","ara":"1r,4g,3r,1m,11,25,19,2e,26,22,7n,i,3u,z,y","arb":"g,56,1m,o,15,1,k,2s,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d7,41,38,i,g,1i","arc":"m,2s,1x,8x,1h,2z,5d,7r","ard":"y,5,4,3,1,1,1,1,1,1,1,1,1,1,1,1,1,k,9,5v,m,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,u,q,g,b,i,v,6,c,3,1a,4b,8,g,14,17,17,2,1,1,1,1,1,1,1,1,1,1,m,5,7,1i,a,m,g,2n,8,2,5,1i,3,3,1,f,2,1,3,2,3,1,f,o,3,9","are":"22,1j,l,f,1l,17,2,4,3,3,i,35,j,1,f,1v,19,d,23,e,2i,23,a,26,18,1i,v,7,3,i,2,g,1x,1,g,1,u,2,1,n,1z,2,1,8,e","arf":"od","arg":"2p,2m,8,9,9a,37,6i,1m,s","ari":"7g,1a,t,2a,e6,o,62,1,2t,y,8","arj":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,1","ark":"v,c,7,1b,1i,i,3,2,k,7,3,12,j,d,4,5,u,3,9,1f,5,g,b,h,u,6,a,5,2l,1,1,e,9,1,3,d,12,w,7,c,5,5,1g,9,b,w,f,7,4,a,1b,11,3,n,j,2,4,1,5,f,w,1,1,5,8,4,a,9,7,1f,1,4,e,12,1,c,r,f,15,7,t","arl":"30,e,h,2j,1x,3,1,2p,3w,p,y,1,e,1m,8,f,1j,10,2p,g,h,3,1,16,u,m,3,z,1u,o,1,1,18,11,2i","arm":"1,p,1j,1,3,4,1j,1,r,44,b,1a,g,3,a,a,b,2,1i,a,4,2,6,a,4,1q,u,j,j,a,33,e,d,w,f,7,6,l,q,7,1b,a,4,w,1k,1i,1t,f,h,1m,e,8,3,5,f,6,1,1,1,1","arn":"88,33,3c,2s,7y,x,z,27,1,1,57,2,1j","aro":"10n","arp":"7b,12,le,3w","arr":"2z,2d,a,8,12,b,1,7,7,1,1,e,6,n,p,1,f,1h,3i,n,1f,18,o,15,w,4,3,f,15,1,y,t,1,k,b,f,18,2q,5,6,3,1,1,l,n,1,1,v,9,d,1w,k,1f","ars":"d,v,2,15,3k,4,1,2,3,1,1,g,h,w,8,2e,1i,1b,1,1,1,1,6f,1,1,1,1,1,1,3,9,1,1,1,1,3,7,1c,7,1,2e,l,a,11,r,2f,4g,1,1,1,1,1,1,1,1,1,1","art":"17,l,1e,5,2,5,l,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,m,b,20,23,z,c,t,c,1y,15,e,y,g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,2,f,g,1k,8,62,1,2,n,8,6,16,1x,1t,h,2a,4,s","arv":"5q,n9","arw":"85,4,1,1,1,2,1,1,e,i,2,l,1q,3,8,72,5c,h,d,3,3,1,1,1,2,1,1,1,3,1,1,e,1a,4c","ary":"1y,1,1z,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,d,n,6d,4g,c,3k,5,i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,34,2q,1p","as ":"2m,9,1,1,1,1,1,1,z,8,5j,l,b,2p,10,j,1,1,1,1,1,1,z,58,s,5n,t,3o,u,3,c,v,z,t,f","asa":"d2","asc":"fz,8f","asd":"o2","ase":"74,1d,v,ad,5y","asg":"33,1,1,1,5,1,1,v,3,1,3,3,1,r,1,1,1,2,1,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,3,a8,1,1,1,1,1,2,1,1,1,1,1,z,l,1,1,1,1,1,1,1,1,2,1,3,1,1,3,1,1,i,1,q","ash":"1w,18,17,k,4,1g,e,1,q,53,2,8,k,10,1v,1o,26,1b,1,b,u,i,34,1,1,2,1,1,1,1,1,2,1,1,2,3,1,1,1,1,1,1,1,2,1,1,1,1,1,a,1,1,1,1,a,e,6,2,5,1,1,1,1,1,2,7,1,1,1,1,1,1,1,a,1u,b,1,1,19,1","asi":"t6,1f,60","ask":"es","asm":"7j,fl","aso":"6p,7q,6x,5x,3e,1,1,3,1,1,2,1,3,2,1,2,1,1,1,1,1,1,1,1,5,1,1m","ass":"l,3m,i,3,4o,b,8,6a,1s,4p,93","ast":"r,k,l,1p,1,1,1q,2,4,4,1i,g,n,18,4,9,10,2,z,p,1,h,1,d,2,2a,t,2c,a,f,26,6,19,1,1,4,1,j,6,r,k,w,e,4,c,1,d,1,9,1c,1,1b,7,3,4,a,4,3,1,1,1,4,7,d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1f,h,7,1,l,d,8","asu":"u","asy":"4i","at ":"5,1b,17,1,x,1l,2,q,9,23,1j,2c,a,1,3o,b,1f,1g,u,f,2v,b,a,14,c,12,9,1g,9,29,1b,2,5,12,2,t,2m","at7":"j2","ata":"kq","atc":"2j,58,54,18,1h,5q,cb","ate":"y,9,4,c,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,1,1,1,1,1,1,1,1,1,g,4,d,p,3,6,2,b,r,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,4,1,1,3,1,1,1,1,1,2,1,1,1,1,1,5,1,1,1,1,6,19,6,1,9,o,c,4,9,m,12,a,4,b,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,8,8,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,3,3,e,k,1,2,2,2,f,1,1,6,9,1,4,b,6,7,3,1,1,5,6,5,4,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,5,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,8,1,1,1,1,1,1,1,1,1,1,u,3,e,1,n,17,1,c,a,6,1,1,1,1,1,1,1,1,1,6,1,4,4,1,3,2,1,5,3,1,1,1,3,3,6,f,o,5,6,2,1,1,1,5,5,a,8,8,2,o,d,t,b,6,v,15,m","atf":"bp,3,i0,8,8","ath":"e,11,8,7,a,1,1,a,1,1,1,1,1,2,1,1,1,1,1,1,1,8,i,1k,r,3o,n,b,10,g,o,1c,1,1,1,1,1,1,1,p,1,q,i,1,1,1,1,1,1,r,b,d,r,g,i,14,34,d,70,4,t,2k,f","ati":"1n,15,2y,f,2,5,4,4,1,7,1,1,1,1,1,1,l,8,u,j,c,b,8,15,h,2x,2,1i,47,1,2,1,1,1,1,1,1,1,6,1,2,4,a,a,1,1,1,1,1,1,x,1,1,1,1,c,5,14,9,1e,10,y,11,b,5,9,7,1w,l,39,m,o","atl":"cf,1,5,5,2,1,ag,18,5x","ato":"7i,j,f2,1l,3,3u,3y,1","atr":"1m,1k,z,2x,lk","ats":"3o,34,c6,1g,12,8h","att":"68,2p,4,1,3c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1z,5k,4r,44,4t,1,1,1,1,1,1","au ":"ce,fh,6t","auc":"hl,s,3,1,4q,4w","aug":"3t,dg,d0,1,1,1,1,1,1,1,1,1","aul":"6g,s,20,1j,4b,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,56,1s,7,l,4l,1x,p,1,2a,1,k,2l","aun":"o8,1,1,1,1,1,1,1,1,1,1,2b","aur":"4a,43,l,2,43,ae,8n,1q,1,1,1,1,1,1,1,v,1,1,1,1,1,1,3,c,1,1,1,1,1,1,1,1,1","aus":"7n,ru,1,1,1,1,1,1,1,1,1","ava":"60,ox,4b","ave":"8,12,4,3,3,7,5,b,7,f,5,d,g,v,c,q,d,h,j,z,3,e,z,o,1d,27,6,k,f,5,a,g,f,20,y,5,h,q,n,o,2,a,1l,19,1,6,m,12,19,e,t,c,3x,1,2,v,h,o,8,x","avi":"55,b,a,2f,g,5x,38,3b,1b,3j,3e,45,3,14,3,4","avo":"bp,3","avy":"xy","aw ":"5o,dr,1u,3u,1,1,1,1,1l,26,3l,1,37","awb":"l7","awd":"3n","awe":"76","awk":"g5","awl":"u6,e,w,3d","awn":"d1","aws":"ib,y","ax ":"6k,1o,1k,2u,ap,s,5,15,2b,1,1b,1,f,4u,b,l,a,8,6","axw":"ho","axy":"f9","ay ":"f,p,1,q,9,8,1g,3,z,1d,n,k,i,m,8,7,3,16,19,9,1f,a,s,j,j,9,3,3,3,9,3,6,7,i,h,l,15,f,e,n,z,1j,f,b,1,8,l,l,i,b,p,h,1,7,n,g,7,e,8,y,l,5,4,o,18,3,c,d,8,2,1,v,1,3,1,i,2,5,5,l,6,7","ayb":"6r","aye":"g5,38,h5","ayf":"4e,py,2m","ayh":"zt","ayi":"is,15","ayl":"7y,3f,bu,1,1,1,6d,5u,2,4","aym":"rd","ayn":"rd","ayp":"vu","ayr":"5j,nl","ays":"p,48,d,1b,4o,6,3s","ayt":"32,i5","ayw":"ux","ayz":"7f,7,1,1,1,1,1,1,1,1,eu,1,1,1,1,1,1,1,1,1,1,1","az ":"7u,j3","aze":"6w,eo,1c","azy":"be","azz":"68","b 1":"12,5b,30,a,3k,48,3c,2,3w,f,60,g,2,1l","b 2":"9s,ec","b 3":"9r,kd","b 4":"h1,hk","b 5":"8u,3f,3a,am,6,af","b 6":"68","b 7":"2n,16,6l,5q,hn","b 8":"a6","b 9":"27,7p,3y,aq","b a":"6,7,6,8,4,a,y,43,6o,h,6u,91,2e,5,a,n","b b":"77,1,2c,4,ca,1,1t,20,3e,3y,3,5,39","b c":"26,n,4m,7,1b,27,3m,5f,n,1x,u,26,1,1,1z,2,2p,q,s,n,i,m,2,13,1o","b d":"93,3,5,g,d,1a,p,5,g,c,1,a,js,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,19","b e":"3t,36,cz,1p,8c,1,1a,b,51","b f":"gg,7t,bk","b g":"1x,6,b,f,1j,1k,a,a,j,e,r,34,2,1,1,2c,1v,22,t,x,11,e,4,1,s,39,72","b h":"6g,1u,2m,9y,1,4k,4k,1,6k","b i":"cx,9a","b j":"1g,5x,2,7,f3,2f,66","b k":"6u,88,2j,1c,9,5,9,s,e,s,bc","b l":"6u,eo,32,2a,n,16,1,1,6d","b m":"8x,3r,d,a,8j,24,m,1,2,g,4,3p,2e,d,38","b n":"2e,8p,2l,5w,3r,1c,h,ap","b o":"3o,5,76,14,56,2p,6w,n,9,2,9,2g","b p":"fj","b r":"8d,4k,5a,7,5u,4f,1,1,4f,3,5,g","b s":"15,s,9,42,8,4,4u,3c,4g,1q,2f,17,3j,u,7r","b t":"3o,6e,1a,ce,7u,5","b u":"f3,26","b w":"0,6,7,6,8,4,l,2,7l,3,5,g,d,24,6p,3g,6i,49","b1 ":"9v,pz","b10":"20,1u,3,ag,2d,4","b11":"3v,1,ct,4,r,49,5n","b12":"99,5,f,1,8y","b13":"13","b14":"bx","b15":"4g,cb","b17":"g,96","b18":"1d,1","b19":"z","b20":"h,h","b23":"9r,d,4c,4","b24":"a3","b26":"9s","b27":"9c","b3 ":"jc,83","b30":"9d,j","b31":"a6","b32":"14","b33":"9l","b35":"9g","b37":"9o","b38":"c7","b4 ":"6t,ck,24","b42":"9k,9d","b46":"96,k","b5 ":"6u,28,8,28,4,g,9g,70","b61":"1m,8j","b62":"1f,ay","b63":"ca","b64":"1n,9u","b65":"bf,7q","b66":"11,87,h","b69":"1g","b7 ":"iy,3p","b70":"i,i,2,g,1,7k,4,b,5","b71":"f,r","b72":"9y","b76":"c5","b79":"9f","b8 ":"dy,9,da","b80":"bg","b9 ":"a0","b90":"c6","b91":"a1","b92":"1a","b93":"94,v","b94":"9j","b95":"95,s","b97":"9b,6,2r","b98":"a2,1s","ba ":"18,1r,a,n,4a,3,9,n,a,5k,3j,1,1i,3w,16,b,a,28,2o,43","ba1":"ye","ba2":"y4","bac":"o7,3x","bad":"10d","bag":"6z,1,en,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","bai":"3y","bak":"ad,21,1,he","bal":"65,2,d,1,7,1,1,1,1,1,1,l,4a,3h,3y,q,1,1,1,8,1,2,1,1,1,1,1,1,1,6,1,2,e,a,1,1,1,1,1,1,x,1,1,1,1,b,6,4a,2t","bam":"n0,3v","ban":"1g,15,1e,1k,1n,1a,7,5,w,3b,4f,2l,f,2d,i,1r,i,4,3,8,4,5,1,1,12,8,3,h,1n,3,5,1,2,2,p,1o","bar":"e,8,c,6,1,7,s,4,7,i,9,5,5,i,7,1,n,7,4,5,3,d,p,u,i,7,1,1,3,1,5,9,e,e,b,1,o,1,e,k,1,2,8,2,1,f,3,8,1f,5,b,1,5,h,3,5,t,3,1,8,3,m,5,5,2,b,4,1,b,a,1,2,f,6,11,1,1,1,1,a,b,7,3,w,7,1,7,3,c,4,8,j,6,m,4,d,3,3,8,8,a,5,e,1,1,2,9,h,17,1,9,3,4,1,c,5,4,3,b,7,1h,4,2,a,b,i,1,9,13,3,c,c,2,d,5,3,1,6,9,1,6,1,a","bas":"74,m2,7f","bat":"7b,36,24,2w,3,iu","bau":"78","bay":"6u,4f,3y,6b,75,4a,1","bb ":"sn,1,1,1b,5r,1,1,1,1,1,1,1,1,1,1,1,k","bb1":"lt,5n","bb3":"rf","bb4":"6t,eo","bb5":"6u,eo","bb7":"mn","bb8":"rh","bbe":"s,ir,47,4","bbi":"t3,7k","bbl":"1b,j","bbo":"rm","bd ":"46,7w,lx,g","bd1":"oc,4i,1","bd2":"hb,1i","bd6":"of","be ":"4c,h,1e,44,3v,g,5w,1w,b4,1n,z","bea":"16,2e,6q,70,9i,1a,3c,2f,y,2,6,2","bec":"28,m,86,2e,i,1,4y,he,1","bed":"ec,1r,fk,1,t","bee":"57,55,3x,1,b8,3t","bel":"41,1y,2j,11,10,23,25,z,14,7s,12,4r,21,j,27,12","ben":"ak,3l,fm,5w","ber":"s,q,b,k,8,4,w,5,4,1,1,1,j,1h,1,1,1,1,1,a,1,1,1,1,1,1,1,i,1,1,1,1,1,1,1,1,1,1,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,j,1i,1x,v,3,1c,1l,1,1,2,1,c,1,d,18,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,n,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1k,p,x,v,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,d,d,4,1f,s,8,1b,5,7,13,2d,p,1,1,1,1,1,1,1,1,1,1,12","bes":"ch,c4","bet":"3k,22,3o,80","bev":"jw","bew":"t,w","bex":"iu,c7","bey":"jj,47,4","bg ":"2q,1t,s,4f,17,ad","bh ":"2c,1s,6k,5d,6w,n,4v","bh1":"vj,2q,2,t,c","bh2":"8z,p3,4,1,1,v,b,1","bh5":"y5","bh7":"z6,5,1,1","bh8":"z8,1","bh9":"yd","bic":"xy","bid":"47,bk,i","bie":"kd,83,1,1,1,7l","big":"5e,15,8x,5o,6c,32","bil":"6,1i,7f,44,1j,8n,15,81,2m,f","bin":"9,4s,d3,aq,9,5,17,1a,4y","bio":"8z,ki,4l,1,1,1,1,1,1,1,1,1,1,1,q,1","bir":"7,a,o,13,6u,4,5,3,6,a,1,5,1x,5,6,1o,d,5,2h,22,1,9k","bis":"46,13,g,1b,ev,1i,a1,25","bit":"dl","bj ":"2d,j,21,1e,q,39,1r,3,1l,17,o,12,4d,1,3f,c5","bk ":"sh","bl ":"x,6s,b7,35,t,g,c5","bl1":"k9,1u,1,1,1,1,5s,1","bl3":"me","bl4":"r9","bl6":"ka,1y,66","bl9":"l6,s,1,1,1,5c","bla":"4,6,13,c,g,1x,2p,c,1,1,35,1h,2k,1j,1h,1l,3n,1x,1y,1,1,1,1,3,8,4,1,4,1,14,d,1,1,1,1,1,9,1,1,1,a,b,3p,28,d","ble":"9,12,j,15,c0,4x,1,n,4n,3w,a,s,13","bli":"1f,60,7,ev,3u,5u","blo":"6s,dn,85","blu":"8y,2,j,6,3b,hl,39,1,1,1,1,1,1,1,v,1,1,1,1,1,1,3","bly":"2t","bn ":"61,85,2k,gp","bn1":"up,e,e","bn2":"um,7","bn3":"vc","bn4":"va,3","bo ":"zb","boa":"c5,a5,47,44,1,1d,2u,1w","bob":"t3","boc":"5g","bod":"o5,t,2p","bog":"v5","boh":"ve","bol":"77,10,c2,1,1t,b,2w,1f,1a,1,e,28,13","bon":"1y,1,21,n3,5s","boo":"4c,1p,99,5b,8d","bor":"g,7g,q,10,53,2r,7o,p,3,3k,j,4e,12,d,w","bos":"3g,68,31,4j,i2","bot":"14,3f,1,1,w,dm,4m,2p,j,n,2","bou":"2y,3o,28,5,x,2r,u,19,8,b7,34,2,7,14,4,t,t,1,1s,1,5,2,3,b,5,7,3,3,2,1,1,11","bov":"vi","bow":"5i,ab,4h,49,8l","box":"t6","boy":"1p","bp ":"9j,6d,69,7j","bq ":"65,74,1,7o,1,76,2u,3d,18","br ":"oa","br1":"1s","br2":"2s,da","br3":"2u,b3,4y","bra":"7h,f,aa,n,3x,c,p,1,k,3,6,5,2g","bre":"gc,7c,6z,1,1,3,1,1,2,1,3,2,1,2,1,1,1,1,1,1,1,1,5,1,1u","bri":"4,1,2,2,3,e,1,h,s,1n,b,f,j,4,1,8,8,2,4,2,6,e,1f,4,29,a,o,z,o,m,e,c,9,j,2,d,8,s,1o,4,7,2,k,9,1,1b,s,t,j,w,6,1e,8,3,1p,h,8,e,1t,g,i,4,a,7,3,4,9,1,1,7,z,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,4,1,3,4,4,9,4,1a,3,1,2,1,1,8,1,1,7,5,6,1,2,1","bro":"i,n,c,1,4,1,8,m,y,d,1c,1n,1t,6,b,2,4,a,1,j,4,e,z,1g,d,1,p,n,4c,4,o,17,1n,z,1c,a,5,n,5,3k,12,5,2,1,1,2,3,d,1l,n,1r,1,1,3,q","bru":"xp,10","bs ":"1f,63,3l,76,4p,5,1p,3l,4,42,1,19,25,5","bs1":"wy,4,a,9,4,1","bs2":"x4,p","bs3":"iz,e6","bs4":"j0","bs6":"x9,1","bs7":"x8","bs8":"f5,hu,7,1","bs9":"xb","bsb":"xq","bsh":"ci","bsi":"9a","bt ":"8h,30,c,z,6r,64,5t,3x","btr":"l7","bu ":"2a,17,9n,p,3c,7c,14,1g,7v","buc":"i,28,6s,23,q,cs,4,21,4h,4","bud":"yq,b","buf":"vm,2r","bui":"1,27,a8,1g,cp","bul":"18,x,4o,41,an,2e,l,3a,6e,n","bur":"q,q,v,1,w,1,1,4,1,1,1,2,6,1,1,1,1,5,1,1,1,1,1,1,1,1,1,2,4,1,3,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,s,b,1,4,c,3,m,e,1,15,e,8,19,3,d,d,f,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1m,1,1,e,1,7,8,7,a,7,1,1,1,1,4,1,1,1,1,3,1,1,1,1,1,1,4,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,1,4,1,1a,1,u,4,4,5,8,3,3,9,6,14,e,3w,3,27,a,1,l,8,8,1j,g,1,1,1,1,n,1,2,k,1n,3,o,1","bus":"5k,3o,44","but":"at,kg","bux":"mo","bw ":"lr,4o,3,l","bwa":"hy","bx ":"y,3w,lh,43","by ":"30,2k,2m,a,e,13,2m,8,6,1,2,1,3,1,4,1,2,2,1m,3p,3j,7,1u,e,f,7,d,j,1n,4,x,2s,j,j,2p","byr":"3d,12,76,70","bys":"c9,3,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,br","bz ":"55,cf,6,23,2q,by","c 1":"wo","c a":"gz,j","c b":"x5","c h":"1f,9s","c k":"4q","c m":"wr","c n":"l9","c p":"az","c r":"9b","c s":"101,e","c t":"nb","c w":"2o","c1e":"28,bo","c1m":"22","c1v":"dz","c1x":"2d,bc","c2 ":"dl","c2h":"f6","c2n":"et","c4r":"2g,bk","ca ":"6x,7b,2f,1,4x,a4,4,3y,1,1,1,1,1,1,1,1,1,1,1","ca1":"rk,47,8","ca3":"vq,2","cab":"t3","cad":"5b,iq,7r","cae":"ec,3,im","caf":"42,9,y,25,o,cq,dt,g","cak":"j5","cal":"40,d2,1,1,6j,k,3d,4r","cam":"23,7,5a,1u,u,f,1k,1f,7,x,l,1,35,9,4f,20,4j,63,1,2,a,1,1,i,1,2,1","can":"35,1m,6,14,8,2i,26,14,3,5y,2a,b,5d,4g,b,8,2r,8","cap":"4a,j7,i,4","car":"3f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,21,28,32,g,3,q,1z,3,1k,y,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2g,1,1,1,3h,1h,s,1t,1r,1r,o,1,1,r,1,g,1,h,1,3,1,1,3,1","cas":"r,k,l,1p,1,1,l,15,1g,1,b,g,n,14,4,d,12,1o,1,i,64,f,l,1b,1,9,2,4,q,j,1,1,4,1,j,6,r,k,w,1,1,2,1,1,1,1,1,2,1,1,2,3,1,1,1,1,1,1,1,2,1,1,1,1,1,a,1,1,1,1,8,g,6,2,5,1,1,1,1,1,2,7,1,1,1,1,1,1,1,1g,m,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1f,o,1","cat":"24,1,1,h,1,1,1,1,1,1,1,b3,1,1,u,1,18,1,1,1,1,1,1,26,22,2y,9w","cau":"fk,7w,3d,3g,1,1,1,1,1,1,1,1,1","cav":"1r,im","cay":"7f,7,1,1,1,1,1,1,1,1,eu,1,1,1,1,1,1,1,1,1,1,1,cl","cb ":"cu","cb1":"zu","cca":"u9,1,1,1,1,1,1,1,1,1","ccl":"b7,a4,16,ds,1","cco":"k7,82","cde":"be,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ce ":"1i,m,b,4,6,7,6,r,1,b,4,1,g,x,a,10,1,o,4,2,1,2,28,b,2,2,1h,o,6,q,1,1,1,1,c,4,t,b,h,j,e,8,6,a,f,3x,1,1m,4,a,19,2,8,d,15,6,e,7,x,d,2d,1,j,2,z,2,b,1i,1,18,f,1,a","cel":"7q","cen":"3e,2e,8,l,2,s,o,20,w,6,29,3a,1i,i,e,3q,z,a,1,s,1c,1,1,2f,1,35,e,2,1a,5,2z","ces":"5,3,2,a,2,6,1,3,p,1,3,c,5u,1,1,1,1,26,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,1,3,6,1,1,h,2s,2h,1h,8,1c,3t,1,1,1,z,4t,2p,5,v,1o,1,1,1,1,1,1,1,1,1,1,1","cf1":"x0,j,5","cf2":"xm,5,1","cf6":"xi","cf8":"ec,3,im","cfa":"jb","cgo":"4w,p7","ch ":"i,z,1,11,3,5,1,r,12,3a,q,1,1,1,1,1,9,4,1,3,4,6,1,2,6,c,w,7,n,2,2,z,1,d,1,2,1,e,c,3,3,19,6,c,2,p,5,2,2m,q,10,s,c,h,2x,1,1,1,1,1,1,1,c,a,7,9,g,7,d,1,2,3a,5,h,14,r,1,c,l,6,2,2,3,5,1,1,3,d,2,2,3,1,e,1","ch1":"j3,12,7p","ch4":"e9,5,c9,29","ch6":"rs,15","cha":"21,6,y,g,21,w,l,7,g,5,1,1,1,1,1,1,1,1,1,d,m,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1d,c,z,d,n,o,k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1a,2,g,27,25,p,1p,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,l,13,1g,1,2,4,17,d,27,f,1,9,10,z,e,1,1,1,1,1,1,1,1,1,1,c","chc":"4a","chd":"b7,be","che":"8,e,m,p,o,i,2o,c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,p,d,y,i,2,6,m,1v,18,4,1,4,9,t,m,4,2t,f,k,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,23,r,9,b,2,6,4,7,1,1,1,1,1,1,1,1,2,4,4,1,1,2,1,1,1,1,1,1,1,1,2,2,4,1,1,1,3,3,f,1,f,9,9,3,o,l,5,4,1v,b,j,1f,1,6,s","chf":"9b,2x,29,l7","chg":"k9,7q","chi":"z,1,5g,t,2z,f,4u,p,1f,k,8,3,1,k,1v,1p,6y,1n,5","chl":"9d,1z,dv","chm":"26,18,4d,7c,3l,98","cho":"2m,85,x,15,n,p,11,u,1j,20,6,1j,2b,40,u,2,22,2,1,1b,9,u,1q,1c,m,1","chr":"vj,2p,y,5,1,1","chu":"2m,1z,2o,2b,1e,7,2,p,10,d,3,1,e,f,3,18,j,w,3d,1t,c,e,3j,a,7,9,g,i,2,3i,h,10,v,1,c,y,5,1,1","chw":"fp,hb","cia":"22,1p,31,2o,b,1,4,3,3,19,5,53,3s,22,3e,4l,1b,q,1e,1,1,1l,15,2","cid":"9j","cie":"h2,dg","cin":"us,3e","cir":"2c,dp","cit":"35,x,1y,k,1,22,81,99,9,1,1,2,79,5","civ":"n7","ck ":"4,6,8,e,h,c,e,2,2,1,1,1,1,1,1,1,1,r,5,2,d,1p,4,c,2a,13,4,2,4,h,b,p,12,3,7,4,1,1,4,5,2,1,u,1,1,1,1,1,1,1,1,1,1y,7,f,c,8,7,10,k,5,1l,o,2,1c,c,e,g,p,2,l,1x,a,7,1t,3,b,1d,e,e,3,y,a,9,e,j,d,3,4,14","cka":"4x","ckb":"3h,h,90,47","cke":"3,w,1,10,f,f,14,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4h,d,3u,j,g,5,1r,1x,p,z,59,q,2g,2w,f,1,51","ckf":"6r,49,3o,ku","ckh":"2h,l,az,3a,30,1l,37","cki":"2q,8v,di,4,7j","ckl":"1e,13,6u,8,4i,24,72,db","ckm":"2r,7b,pt","ckn":"fs,90","ckp":"7s,1,dk,51,1,1,1,1,3,8,4,1,4,1,14,d,1,1,1,1,1,9,1,1,1","ckr":"o7","cks":"u,3v,h,12,e,1,1,1,1,1,b,a,1,1,2,p,4,1,1,1,2,1,1,e,5,d,x,1g,3,8,2b,1j,2w,c,x,18,1,1,1,1,1,1,1,1,3t,3,3,1,1,1,2,1,1,1,3,1,1,e,k,29,2,a,2n,o","ckt":"bl,8a,52,1a,1,58,16,7","ckv":"7h,fl","ckw":"br,fo,5p,2f","cl ":"h6","cla":"2m,g,2e,83,2h,57,an,49,e","cle":"22,a,17,b,1,1,1,54,8,1y,w,3y,x,2x,1g,16,5y,44,1,2,3n,1","cli":"di,1n,4k,1k,1e,4f,9,1m,2,47,15,13","clo":"3n,17,29,3e,t,1v,a2,1u,74,x","clu":"0,12,3a,1w,5,7,1k,6,k,j,7,3,1,3,1,4,6,4,8,i,3,4,1,4,2,1,y,o,3,7,4,3q,e,3e,11,4,1,e,16,7,2,6,6,5,9,3,4,7,7,4,8,b,1,1,d,6,3t,10,g,1,2,b,g,g,x,u,1y,1,1,5","clw":"q6,1,1,1e,1","cm0":"zm","cm1":"zk","cm2":"10j","cm3":"zj","co ":"5q,1u,fl,y,6x,7,1x,31","co1":"zq,r","co4":"10i","co6":"er","coa":"2r,x,34,2y,22,1h,1,28,4w,48","cob":"uj","coc":"2e,13,5v,29,23,3h,7s,1a,1,17,41,h,v","coe":"di","cog":"oe","col":"9,3u,4g,6,h,k,q,3a,11,s,48,1i,4p,5,1e,2f,1t,41,i,a","com":"3r,l,5z,u,31,g,8,1p,v,b2,1w,4t,t,d","con":"z,7,6x,1q,a,11,45,1,2i,2f,4n,2w,j,c,1o,1,1,1,1,1,1,1,1,1,1u,1,i","coo":"1f","cop":"g,96,53,6l","cor":"1q,l,a,5,9,e,11,10,1p,1u,2k,1d,25,3m,q,12,22,22,3e,5z,1,1,1,4,u,4,1,1k","cos":"tv,26,v","cot":"9,17,l,1g,8,3,7f,1i,d,9,2,3,3h,8,2a,7z,1v,40,15,1,1,1,1,1,1,1,1,1,1","cou":"3i,y,1g,1c,1i,85,21,1c,g,5b,5v,1,1,1,1,a,4c","cov":"13,76,1,1,1,2,1,f,36,72,6c,1,1,1,2,1,1,4,1,1,e","cow":"11,2y,p,b,86,4t,1,1,bc,16","coy":"s8","cqu":"x0","cr ":"6b","cr0":"fn,g","cr2":"g8","cr4":"2k,bk","cr8":"2j,bk,gv","cra":"1f,8,28,25,5h,57,4j,3u,5j,w,d","cre":"3e,2e,1x,2e,8l,44,1,1,1e,7c,50","cri":"1u,7d,d,fj,6h,1","cro":"0,v,1,r,q,h,7,8,7l,j,x,3,j,2,r,1c,5,d,4,l,h,1u,3m,1t,3o,2,1o,7,1,2,3s,3,t,g,b,15,g","cry":"my","cs ":"a4","ct ":"8x,en,g,av","ct1":"uq,1,8,f,1","cti":"l,7e,1e,iq","cto":"1d,s,18,46,2w,1e,6s,13,34,c,1w,1t,1l,23,7,2e,x,2i","cub":"ur,3w","cue":"a6","cui":"nd","cul":"3o","cum":"5a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,ae,1,1,1,1,1,1,1,1,1,1,1,1,ay,46,1,1,7","cup":"d6","cur":"80,2","cv1":"89,1,1,1,3o,db,3,1,1,1,9","cv2":"8g,h6","cv3":"85,3k,3,dg","cv5":"8e,1,f,gp,1,1,4,2,e","cv6":"j2","cw1":"ms,3,4v,e","cw2":"7p,en,h,1","cw5":"s2","cw6":"7b","cw9":"ro","cy ":"69,lu","cyc":"sx","d 1":"2g,79,2p,1m,19,3,4v,33,1z,2h,4,32","d 2":"dj,5a,1f,g,7,7v,4u","d 3":"bg,38,4d,c2","d 4":"ej,b,9i,am","d 5":"af,3z","d 6":"3o,bl,9s,57","d 7":"2o,oo,1l,7a","d 8":"e9","d 9":"hh,29","d a":"e,4,e,s,m,3,1n,g,1o,e,r,x,q,g,1o,e,1f,w,4,o,1,o,g,15,s,2k,4,1l,33,2y,y,j,5,6,21,1m,3e","d b":"16,7,1,2,6,18,y,k,v,7,6,5,2t,q,3,6,4,7,1,1,2,5,1,9,16,o,1,2,2,p,1d,4h,1,1,3,1,1,40,1c,3,19,q,1,1,1,1,3,8,2,2,1,2,2,1,7,3,3,5,e,1,7,7,4,2,1,1,1,1,1,5,4,1,1,1,5,i,b,g,a,u,1g,3,5,1,2,2,e,b,1,3,2,6,e,f,3,2,1,1,a,m,1","d c":"0,z,1,1,e,8,9,1d,2h,6,k,m,i,6,1,b,9,j,25,5,16,3,p,3,14,5,1,f,b,29,15,16,2,15,29,2,2,1d,u,5,4,2,e,1c,2,1,5,1,4,j,2,i,e,1,7,1o,c,8,1f,m,1r,l,1,1,c,5,4","d d":"n,2,4,2r,2s,5,1r,t,d,4,3,1u,7,g,c,1,v,3l,f,9,1m,5e,q,4,22,38,l,2r,3,5,8,c,2,5,t","d e":"v,2o,6,e,3,3,5,3,12,25,23,c,4d,4,4,29,1,2,c,1,2,2,i,19,23,y,1,42,1a,1,5,21,1,s,h,8,3j,n,1,1,5,z","d f":"1v,y,k,59,17,s,g,3g,4,18,1,2r,2a,30,21,y,c,3,k,11,m,1,1,p,18,9,1e,1x,10,2","d g":"p,g,1f,t,q,3,3,6,10,1,c,2,3,1,6,a,7,b,3l,4,1,2,8,5,3,7,2t,15,k,k,2,3,2,1n,1,2,1,1,9,6,8,8,2,1,q,3,4,3,f,4,d,e,e,b,1,p,1,c,t,8,q,1w,8,12,1c,3z","d h":"3,2,b,d,5,p,14,1n,14,w,1,o,f,o,7,5,l,2,e,3,1v,14,o,1,z,j,o,2,6,b,4u,14,j,g,3,4,d,6,b,4,5,2,a,j,n,l,y,7,p,1m,1,1,2,6,1,1,3,4,d,b,1m,1k,10,c,8","d i":"7,2,z,d5,9z","d j":"2k,31,4o,3v,gs,7,5n,1","d k":"1b,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1e,18,2,45,26,1j,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2z,13,f,h,7w,1j,2d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2q,1,1,1,1","d l":"f,1f,7,2,6,4,1,3,1,1,1,2,e,2u,15,z,2p,5,d,1n,u,1,1,1,3,3,6,1,1,1,g,8,1,7,2,1,k,1,1,6,1,1,1,2,3,3b,3,1g,g,a,12,1h,5,f,1,1f,1,1,f,3,1,3,4,6,1,h,1,a,9,6,4,c,1,6,4,1,1,a,g,l,3j,a,r,h,1,3,6,c,2,1,1,4,9","d m":"13,4a,d,o,5,2,4,v,2,1f,1f,29,a,1q,16,3i,b,u,c,1,2,d,2,15,o,1w,6,21,19,1n,30,1n,s,15","d n":"8,g,n,1n,3,l,7,2p,4,1i,2,d,1,2,7,2,2,5m,f,3,a,5,9,1k,1q,l,25,1s,7,7,3,p,6,2,1,4,1,1,2,7,1,g,1,3,6,1,1,1k,3,b,h,e,39,6,1,2i,4,w,6,f,a","d o":"3,g,24,j,3o,59,3l,g,w,3e,14,1i,3c,7,f,1,6,2,3,1g,n,7,2,2,u,4k,n,m","d p":"d,u,e,1,1a,6,9,2,w,19,f,b,22,o,2,k,11,3r,6,e,d,4d,i,2d,2y,u,1,1,2,7,2,6,9,4,3t,9,3,2q,f,1,1,8,9,7,z,1,1","d q":"dk","d r":"3,10,4,2,w,1,n,k,c,r,12,2,z,a,1q,c,g,6,1j,b,3,s,2,12,17,c,a,k,1a,f,1,2,2,u,a,a,i,n,14,d,p,a,1f,h,1,y,a,i,18,c,8,e,15,e,4,7,8,11,28,33","d s":"7,h,g,13,1e,1o,11,x,1,2,p,j,e,a,7,m,3,c,5,3,d,b,9,6,1,6,1,10,e,j,5,9,3,3,a,1k,1l,1q,7,1,1,1,i,9,1,1,3,3,27,9,1,1,1,3,1,3,1,2,1,1,1,1,1,1,1,1,1,1,3,a,c,i,m,2,14,9,9,6,e,2,3,3,1,a,2,a,4,2,2,2,k,7,e,4,2,c,6,2,h,14,6,1,1,1,1,1,1,5,b,7,z,z,4,6,a,1,d,b,2,1","d t":"8,c,1v,j,56,64,3,n,k,l,3o,3,1,51,m,1e,2p,7,4,2n,1,2,1,1,1,1,1,1,1,1,5","d u":"5d,h,m,3p,1k,3,83,11,5s,5v,1,2,42","d v":"ov,5l","d w":"2,g,1,2,b,7,2,4,2,6,3,4,1b,m,1,1,1,2p,p,1,2,1,2c,3,e,1g,5,2,2,e,26,3,o,8,3m,5,n,6,f,n,b,1,15,6,b,p,j,1,2,2,8,3,g,1b,1,1,h,a,m,1,a,c,1,1,1,l,1,c,q,1,5,3,3,s,5,4,8,1,1,1,1,1,4,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,1,d,6,4,2i,l","d y":"ea,9","d1 ":"gn,5,4,n,w,51","d10":"oc","d16":"su","d17":"u8","d18":"sv","d2 ":"gv,1y","d23":"hb","d24":"u0","d3 ":"2r","d6 ":"of,5k","da ":"2w,15,59,4i,14,3y,9p,5h","da1":"j7","da6":"iu,c7","dac":"a3","dag":"2m,de,34,ay","dal":"v,5t,5,64,8k,14,15,4,8,2y,1r,b,6z","dam":"63,1,2,3,1,1,af,3c,1,1,1,1,1,1,3,9,1,1,1,1,3,1q,1,x","dan":"93,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,18,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7l,au,3e","dar":"3v,4a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,2o,1f,5x,b,t,3b,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,19,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1a,1u,1i,n,1,1","das":"40","dav":"55,3c,99,7x,7r,3","daw":"yt","day":"67,17,d5,8i,16,5n","db ":"23,43,t,cc,1f,1,w,6e,4l","dba":"s4","dbo":"8m,63,b7","dbr":"es,l4,h","dbu":"1g","dcl":"l9,62","dco":"jf,9u","dd ":"43,7c,3u,5g","dd1":"gn,5,4,n,w","dd2":"gv","dda":"2m,de","dde":"8,l,au,4,1g,2k,7p","ddi":"5c,1,3y,6,l,1s,kr","ddl":"4s,23,b6,1a,1,1,b,1v,1c,4d","ddo":"fn,15","ddr":"4t","ddy":"47,c2","de ":"c,a,15,b,23,10,6,8,3,1,y,2p,k,4,c,12,1,a,y,i,2b,2c,17,j,1,e,3,14,1j,2k,1c,2,1,3,3,o,7,l,6,4,4,1,1,1,1,1,1,2,1,2,2,t,i,b,7,k,i,4,8,5,1g,a,4,c,5,2,4,b,9,7,2,3,v,9","de1":"c9,3,5,8,2,3,6,2,2,2,2,5,1,2,bt","de2":"d3,2,2,2,1","de4":"ce,1,1,5,5,2,1,6","de5":"ci,4,2,n","de6":"cn,p,5","de7":"cj,c,1,1,1,3,e,3","dea":"74,k,2j,c,kv,3k,1","dec":"ju,b6,5k","dee":"3u,1,1,1,j,1i,ap,2,1,1,1,1,1,1,1,n,1,v,d","deg":"x1","dei":"8y","del":"48","den":"y,15,7,q,l,31,t,7,r,p,3,b,s,f,d,26,1,j,2,1,17,b,1,r,6x,24,24,12,1h,1g,1,4,1l,2,j,p,8,v","der":"1,7,l,34,3,39,x,1d,b,16,e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,z,v,f,1,1,1,1,1,1,1,1,h,3b,3p,17,f,7,1g,12,2,3,1e,5,38,1,1,1,1,1,1,a","des":"d7,2i","dev":"29,6p,2,1,4u,cn,58,28,1,1,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,3,1,3","dey":"z7","df ":"2u,8q,49,bf","dfi":"2w,c0,83,1c","dfo":"g3,2q,5j,3,38,1y,2w","dg ":"t,57,ai,6,d6,f,1y,33","dge":"4,1,2,2,1d,e,1y,f,j,4,1,8,8,8,6,e,10,f,4,g,w,o,17,a,5,k,8,g,m,e,c,9,j,2,l,10,1g,4,7,2,k,19,14,1c,3,t,6,1p,7,1i,h,m,29,2w,y,9,1e,3,1,2,2,8,1,1,7,b,1,2,1","dgf":"ov","dgn":"4,8,f,h","dh ":"a1,4m,25,7z,21","dh1":"3i,sc,1,1,1,1","dh4":"w8","dha":"7e,51,a5,3s,u,4,33,43","dho":"3l,dt,ax","dhu":"49,16,5v,5a","dia":"14,5g,1,hg","dic":"4p,fi,82,p,2,3l,5","did":"6c,1,4,11,db,4,26,66","die":"3m,tk,1","dif":"ec,3,il,1,h,1,3,2,3,1","dig":"9a,45","din":"1n,l,10,1,1,4,1,1,1,2,6,1,1,1,1,5,1,1,1,1,1,1,1,1,1,2,4,1,3,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,o,w,1,2n,6,c,2d,1g,k,4,k,9,1,1,u,7,h,1,1,1,1,4,1,1,1,1,3,1,1,1,1,1,1,4,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,1,4,1,z,b,1,1m,1,2f,2k,2t,a,j,43,1s,b","dio":"7c,sp","dir":"dl","dis":"1r,4c,71,6z,2q","dit":"9b,6,l,1s","diu":"of","div":"7t","dj ":"8d,hx,18","dka":"34,1","dl ":"7k,19,4r,9l,2x,7s,1h","dla":"0,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,2,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,2,1,1,2,1,1,7e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,19,1,1,1,2,2,8,2,1,5,3,1,1,1,2,3,v,18,4,4c,1,1,7,i,8v,41,1","dle":"o,5,4,6,c,6,2,2,1g,1n,23,w,1,3p,p,u,2v,26,14,6,1,1,b,1v,13,9,6,1b,2w,h,5e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1","dli":"cp,d,b,3,i7,1","dma":"5f,56,5z,j3","dme":"x2","dmi":"2o,l9,5f","dmo":"fq","dmu":"d5,mu,r","dn ":"s,2k,30,3k,5v,2v,25,1,5e,5l","dn1":"n8,4,1,j","dn2":"j6","dn5":"88,h5","dn9":"n7","dne":"mr,55","doc":"gs,gx","dog":"k,12,7s,l9,1o","doh":"77","dol":"bq","dom":"1q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,am,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,gq,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2q,1,1,1,1","don":"1k,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,1,1,1,1,1,1,1,1,1,l,4h,4,6,1,j,2,24,1g,t,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,8,8,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,l,j,1j,6,5,2,3,1,1,b,5,3,1,2z,b,1,4,1,j,10,h,6,1,20,1m,2,i,5,6,2,1,1,1,5,4,1,i,a,h,19,w,1,1,1,1,1,1,1,v,1,1,1,1,1,1,3,m,u,1","doo":"ky","dor":"8z,5,eo,7r,2j,1,2,1,1,1,1,2,2,q,1,2,1,1,1,1,1,1,1,1,1,1,v","dov":"v,no","dow":"b,8a,2m,41,4r,5w,1l,8b","dp ":"70,6k,8b,c0","dpa":"wq","dpi":"vw","dpo":"3r","dq ":"2l,1a,w,15,2r,9f,7v,1w","dr ":"3g,3r,5s,10,39","dra":"24,6k,7,3g,3w,49,79,8,22","dre":"46,4,b,5,v9,r","dri":"s,8w,1q,g,9f,3w,7,4l,4e,16,1,1,1,1,1,1,1,1,1","dro":"h0,g","dru":"5t,bp,ec","dry":"4t,dr,f8","ds ":"0,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,2,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1a,3a,a,1,k,1z,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,19,1,1,1,2,2,8,2,1,5,3,1,1,1,2,3,h,b,m,p,4,e,d,m,8,2n,4,1,1,7,a,8,a,17,1v,q,a,2,4,1,1,2,1,1,2,1,2,1,q,36,5,17,18,19,a,1,4,9,k,3,q,9,1j,r","dsa":"gw","dsb":"6c,1,4,11,db,4,26","dse":"zj","dsh":"15,2,a,16,4,5m,5,2w,f,2,6,2,1,7,1v,g,z,j,9e,6,23,a,2,2,13,1,2,1,1,6,1,2,1,1,1,2,1,1,1,3,1,1,1,2,6,7,2,1","dsl":"7,n4","dsm":"op,1","dso":"2q,2f,6g,65","dst":"v4,4c,i","dsw":"h,h","dt ":"72,6k,40,4q,1v,cl","dt4":"y3,14,3","dtw":"6u,eo","du ":"vi","dub":"2c,53,7,8f,g4","duc":"l7,68,4f","dud":"o,9,o,hk,dy,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1","duf":"6e,eg","dug":"vf","duk":"1s,1k,49,61,50,4k,4b,49","dul":"vr","dum":"36,5,ez,2,f","dun":"3k,g,cn,5,3,1,e,9,w,1m,9z","dur":"3i,sc,1,1,1,1,a","dus":"vg,1x","dut":"gr","dw ":"1r,8n,4,c0,7j","dwa":"15,5,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1x,4y,5m,c,8b,s,1,27,4y,4,1t,2o","dwe":"xe,1,2,2g","dwi":"ch,eh,47","dwy":"1n","dx ":"m,qq","dy ":"47,1y,16,2x,61,t,1,1,71,t,s,4h,s,33,d,1g","dy1":"8,2,a,2,6,1,3,p,4,9y,4,7","dy2":"o","dy3":"p,8","dy4":"3,b,y","dy5":"n","dy8":"5,2,2","dyf":"5x,kz","dz ":"5i,69,10,e,hx,9","e 1":"9,14,2,d,12,l,d,e,o,p,n,h,i,n,o,f,13,28,h,2,d,c,k,9,14,1a,5,1o,61,17,1s,1x,c,23,c,1,7,1,r,39,e","e 2":"z,n,z,2u,1f,9,32,3b,2x,5,w,w,1r,1h,10,q,5o,w,h,3,2r,2i,6","e 3":"5,2r,3,14,aj,4,6,3,4z,3e,1n,1,4e,12,w,1n","e 4":"6r,20,92,k,7n,2t,30","e 5":"7,i2,45,ba","e 6":"1w,j,ay,9k,5g,1s,1m,3g","e 7":"1v,4,cs,2e,bn,6,1l","e 8":"fo,2w,5f,6b","e 9":"1n,b,64,gl,5x,2o","e a":"m,d,c,7,7,9,4,7,g,k,c,1,1,1,6,1,1,1,e,5,1a,q,p,4,m,i,1g,y,12,h,j,c,a,1,f,d,3,7,p,8,1a,1,1,2,1,q,z,9,a,j,6,r,e,1y,d,v,c,14,1g,15,o,3,o,5,2,2,1,a,z,j,1,1,1,1,1,3,1,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,1,2u,7,b,i","e b":"4,6,4,2,i,7,3,2,3,6,3,j,3,1q,l,1,1,8,8,8,w,2,d,1,7,1,1,1,1,1,1,s,c,e,o,5,6,1,3,3,2,a,1,1,4,6,9,b,3,c,l,a,1,2,1p,d,4,b,3,j,k,9,2,16,t,p,15,1,1,1,8,1,2,1,1,1,1,1,1,1,6,1,2,e,a,1,1,1,1,1,1,7,h,9,1,1,1,1,c,s,l,3,c,9,5,d,4,k,1,1,9,1,h,g,1,1,6,3,9,1,e,6,1,1,1,1,1,5,1,8,3,1c,3,1,4,3,2,2,1,1,2,3,1,5,2,5,1,5,1b,d,3,b,4,4,4,8,2,t,2,8,1,1,2,3,8,f,h","e c":"v,s,o,3,7,1,d,13,17,4,1,e,n,5,3,g,8,4,7,1,1,1,1,1,1,1,1,b,4,1,1,1,2,1,1,e,c,1,9,a,d,3,6,5,n,1,2,3,9,6,3,8,7,d,g,7,c,5,i,3,5,1,b,1,8,11,j,1j,10,1,8,k,a,3,5,b,c,7,15,c,1,1,1,1,1,1,1,1,1,1,1,13,z,4,2,1,3,3,1,1,1,2,1,1,1,3,1,1,e,5,d,r,1,5,4,2,2,2,8,2,5,n,1,f,7,1,d,f,e,g,9,b,1,1,f,1,s,j,5,6,3,b,a,1,2,f,1,5,1,1,1,1,1,1,1,1,1,1,e,a,7,9","e d":"8,1,1,1,9,2,6,1,3,p,4,k,1c,o,g,2q,7,m,8,u,k,b,1f,3,4,7,7,4,3,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,9,1u,y,5,3,1,n,w,r,41,1,4,1,j,1d,4,9,w,z,8,7,1,33,f,b,6,2,7,3,1q,b,6,b,1,5,1,4,3,4,6,1,1","e e":"1w,y,k,1,2,c,5,1,3,3,1,3,4,b,3,3,1,1,1,2,1,1,i,i,1j,t,f,1h,1n,1j,k,s,m,1,1,7,1d,a,m,2,1,2,4,5,i,17,1,2y,8,11,1v,8,1,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,a,1,1,1,1,2,3,2,1,1,2,1,1,2,3,1,1,1,1,1,1,5,1,2,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,e,3,1,a,2,a,6,1,p,c,2f,n,1,a,1,k,y","e f":"1h,j,1k,2k,1m,24,1,4w,c,27,r,20,5,13,p,2p,y,t,1,1,1,1,3,8,1,2,1,1,4,1,14,d,1,1,1,1,1,4,5,1,1,1,4,1j,1,18,m,1,w,r,q,15,o","e g":"1s,6,4,6,8,3,4,h,s,f,8,3,1,d,a,1,4,7,1,2,1,4,3,5,5,b,5,9,a,3,1,c,5,9,1p,i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1p,4,k,6,4,3,4,a,9,l,1,e,8,6,7,9,11,l,3,4,7,14,u,r,7,4,u,7,1,a,e,1,f,a,g,h,2e,1,2,b,4,1x,e,2,7,3,t,x,s,2,3,f,39","e h":"4,2,6,5,18,9,1,q,4,3,11,6,7,17,2,4,s,v,1,7,e,m,1g,d,n,1f,b,1,o,t,4,c,1,9,c,y,1t,1m,4,l,q,23,8,5,6,h,5,4,5,1,16,1j,7,z,1a,8,o,o,1,1,3,f,h,10,u,4,1k,e,7,2,1,6","e i":"4w,4,5,10,6e,7,s,1a,l,t,1k,7,6u,3h,u,29,y,1v,1s,h","e j":"1m,u,3,44,7d,3,1h,e,5b,15,8k,5e","e k":"17,2d,a,1,1,1,d,b,5,o,1,4,3,l,5k,6,t,w,5,2t,3,1,1,1,1,1,1,1,1,1,6,1,1,6,9,1o,h,d,h,n,b,16,48,6,7,1k,b,1d,b,b,3,b,2h","e l":"h,a,o,c,5,1,3,2,2,8,4,4,4,1z,w,6,7,v,2,1,9,s,1,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,2,1,1,1,1,1,28,a,s,i,1c,4,14,t,6,6,1x,r,a,3,1,1,1,p,4,x,7,3,1,p,7,9,1a,4,4,1,1,2,1,1,2,1,2,3,1,1,1,m,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,2,1,1,1,1,1,8,6,4,1,2,1,2,2,5,3,1,8,5,2,2,9,a,2,5,1,2,2,4,1,1,4,2,1,9,1,1,1,8,j,k,l,17,13,1,l,1,k,f,3,1,l,m,5,1","e m":"1y,1,x,1h,e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,2,8,i,5,a,6,6,1,6,2,7,p,w,2b,3,19,d,4,g,1e,i,15,3,7,r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,16,1,14,4,8,h,4,1,7,1,a,1j,y,m,1,3,1,1,1,1,4,1,u,1,1,f,j,5,a,w,1v,s,d,b,e,a,33,o,9","e n":"y,6,7,10,2,f,5,o,1,1,1r,1h,a,v,1,1,1,1,2,1,a,2,1,1,1,1,1,3,1,1,2,2h,1o,f,a,10,8,b,b,2,h,1s,1p,2,16,s,1t,15,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,4,2,b,2,3,1,1,1,1,1,3,1,1,1,1,11,v,j,1v,1n,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1j,24,2,7","e o":"j,5,s,u,d,f,23,3h,3,1x,1h,a,l,j,5,7,1t,i,1m,3c,1j,r,15,1f,2,v,h,7,2,2,8,1,7,2,8,j,1,d,1,2,2,6,1,2,2,9,1,h,2,1,5,n,1m,3k,7,3","e p":"1f,p,3,8,s,b,3,i,2,1d,3,2y,1f,20,15,g,1,1,1,1,7,w,i,3,1,u,1,l,2,5,w,b,1,2,j,5,7,i,3y,g,8,x,y,6,1,1,2,7,2,1,5,3,6,4,d,1,9,j,2,2,2,5,5,4,i,v,2,3,6,4,1,6,6,5,1,1,1,3,1d,4,l,17,2,a,1,m,8,1,c,1,1,b,7,1,2,1","e q":"6l,hq,2m,60,1z","e r":"9,m,1o,6,b,7,4,b,j,5,4,d,m,3,5,i,j,d,d,5,h,w,2,h,3,1,b,4,7,14,d,a,g,1,1o,4,i,f,4,1g,19,a,5,x,i,v,o,h,y,h,f,d,4,4,16,k,d,8,7,6,i,n,p,1,1,8,c,7,1,3,1,y,5,5,4,h,2,i,h,1,5,4,a,7,l,h,4,4,2,a,g,a,9,1,g,1,5,c","e s":"4,2,g,5,11,2,m,7,3,5,1,1,1,b,1,2,a,5,1,c,6,2,9,3,2,5,x,3,5,9,f,h,4,1,1,4,2,4,3,3,1,1,8,b,6,e,w,5,e,2,c,4,2,4,3,2,2,4,8,1,2,2,3,2,3,3,a,3,b,1,1,6,e,5,4,9,a,f,2,6,1,4,3,1,1,1,g,1,b,2,c,7,d,9,5,9,1,5,7,u,1,3,3,1,10,1,1,3,6,4,1,5,a,i,10,9,3,h,6,4,3,1,1,1,2,1,3,1,2,1,1,1,1,1,1,1,1,1,1,2,1,5,1,k,i,b,1,6,u,1,5,1,1,3,b,6,2,2,a,1,2,2,1,4,3,2,2,1,l,3,1,1,6,1,f,7,d,4,1,3,2,b,5,4,4,2,5,2,9,8,9,f,1,9,q,3,1,1,2,9,7,3,6,1,1,2,4,1,e,5,6,a,e,6,3,1,1,1,5,6,1,4,4","e t":"v,g,20,a,1,1,6,v,a,8,g,1b,1,5,2,6,u,1t,e,4,x,39,6,t,10,1i,1i,a,1q,1,26,9,1,t,3y,1,12,1q,f,1,1,1,1,1,1,2,1,1,1,1,1,1,9,1b,i,c,o,n","e u":"8,2,a,2,6,1,3,9,2,a,4,4,y,2,1,1,g,d,a,1,1,1,d,6,5,5,o,4,1,2,3,r,3,b,1,2,2,3,1,1,2,2,1,3,4,7,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,15,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,2,2,1,1,1,1,1,1,2,3,1,1,1,2,1,5,2,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,o,1,2,1,4,4,1,3,3,1,e,10,2,d,3,1,2,1,1,1,1,1,1,1,6,1,1,6,1,8,1,m,1,2,6,d,1,9,1,3,8,1,1,1,2,3,1,3,2,9,4,1,r,1,1,1,1,1,2,9,4,1,2,2,7,j,3,8,2,1,1,1,1,1,1,c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1m,1f,1,1,1,2,1,1,1,5,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,5,1,2,2,1,1,1,2,1,1,4,1,4,2,2,4,2,3,1,1,1,1,2,7,1l,17,2,1f,1,2,a,1,1,i,1,2,1","e v":"i,1m,1,1,h,1,1,1,1,1,1,1,e,1i,1f,t,2i,2,4f,1,1,u,1,18,1,1,1,1,1,1,2f,2z,q,c,7,q,e,2u,35,d,6,6,1,i,51","e w":"2,4,c,7,a,6,2,a,5,3,11,1,3c,1,b,3,b,3,5,1,5,1,7,7,1,1,s,4,y,1,d,1,6,2,n,m,9,1,5,6,2,3,1,k,4,1p,1o,2q,16,c,j,1,1,1,1,1,2,d,3,v,1,9,1,1,k,6,3,5,a,1,1,1,2,11,h,8,a,v,j,a,3,1,2,a,2,1,l,1,12,1,2,5,1,1,2,8,1,3,1,13,5,t,1,5,18,7,10,13,4,4","e y":"8b,5z,9,ax,4x","e z":"ut","e1 ":"2l,10,1,3j,q,4e,3,5,a,3,6,4,4,6,1w,99,1,p,5c,1g,3,1,2,2,1,4,1,3d","e10":"eq","e11":"1b,br,e,h0","e12":"cp,o","e13":"7w,5a,bf","e14":"2i,j,b1,z,g3","e15":"32","e16":"fr","e17":"1w,sf","e19":"1t,t2","e2 ":"7x,1,oe,1,4b","e21":"d7,2,1","e22":"d5,ii,1","e23":"2t,t0","e24":"d3","e25":"wx,3s","e29":"wh","e3 ":"3n,al,3,5a,cl","e30":"3o,ss,e,3y","e31":"10r","e33":"wl","e35":"vp","e38":"wv,1,2v","e4 ":"2h,9x,1,1,5,5,2,1,6,12,1j,3h","e40":"wi","e5 ":"je","e55":"ci,t","e56":"cm,2","e6 ":"cn,u","e61":"w0","e63":"vk,1,1","e65":"dc","e67":"om","e7 ":"7z,4w,2,i","e72":"cy","e73":"d1","e74":"cj","e75":"cw,m","e7h":"28,bo","e8 ":"fs,3","e9 ":"j8,gw,1,1","ea ":"2m,6,g,5i,h,10,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,23,h,1k,j,2,c,1,1,27,12,3t,2h,43,8,5,8,1,6,6,7,4a,2,2,4,d,f","eab":"6m,6p,ku","eac":"16,u8,1e,21,6,2","ead":"y,a,3,1i,v,o,3c,3,u,k,c,1k,o,1,2j,5,e,c,k,2b,1o,c,16,15,1l,2,4,1u,1u,1,1o,a,r,t,1a,k,a,1n,n","eaf":"4g,pg","eag":"1d,4c,4z,5p,22","eak":"2l,1x,j0","eal":"f6,ep,9,1a","eam":"85,h3,2u,1g,3g","ean":"74,33,c,2d,3r,e3,5,3,1,2,3,d,3h","eap":"9u","ear":"17,4,14,z,7,1,1,1,f,32,11,5,3,1,m,8,11,39,1,1,1,1,l,3,1h,2w,x,6,5p,3,1,18,r,1j,6,2c,1,1,1,1,1,4,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,1,w,y,7","eas":"4i,x,4,4,12,44,1w,d,d,2c,t,4s,66,2x,7,3,4,a,7,1,1,1,4,7,2n,t,d,8","eat":"e,11,8,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,1,1,1,1,1,1,1,1,1,i,l,1q,3,5,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,4,2,3,1,2,1,1,2,1,1,1,1,1,5,1,1,1,1,g,19,n,1b,g,1m,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,8,8,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,7,v,1k,1,6,7,2,1,1,1,5,6,5,4,5,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,8,1,1,1,1,1,1,1,1,1,1,e,d,b,j,c,c,x,d,1,9,7,1,1,1,1,1,1,1,1,b,4,4,2,1,6,2,1,1,1,3,3,5,14,5,6,2,1,1,1,5,5,h,1,3,15,d,1","eav":"bh,3c","eb ":"j,1n,ai,cg,2d,2i,i,2v","eba":"qa","ebe":"xi","ebo":"1y,1,fh,ej","ebu":"i,6e,2m,2t,99,5o","ec1":"22,bx","ec4":"2g,bk","ecc":"lb,16,ds,1","ece":"yi","ech":"bc,66","eck":"28,m,8,7y,2e,i,1,4y,z","ecl":"di","eco":"9,34,7u,7e,cf","ecr":"o8,cc","ect":"8x,g,pi","ed ":"f,m,2,n,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3x,13,1c,v,5,9,5,20,d,j,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1b,44,3m,1w,27,3,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,g,1v,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,g,r,15,1,d,1,1,1,1,1","eda":"v,j5","edc":"jf","edd":"9b,6,l,1s","ede":"aj,5x","edf":"g3,ge","edg":"79,2j,cq,al","edh":"5f,b5","edi":"38,1,1,4,1,1,1,2,6,1,1,1,1,5,1,1,1,1,1,1,1,1,1,2,4,1,3,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,s,j,1,8s,1,1,u,7,h,1,1,1,1,4,1,1,1,1,3,1,1,1,1,1,1,4,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,1,4,1,1a,1,g3","edl":"vn,1","edm":"d5,2l,k9,r","edo":"jw,7o,3o","edr":"kg","eds":"68,v,6o,5o,4k,2,4,1,1,2,1,1,2,1,2","edu":"vg","edw":"1a,1,1,1,1,1,1,1,1,1,1,1,1,1,cp,8n,9v,33","edy":"65","ee ":"6,p,1z,2,17,l,1w,p,5w,2,1f,4,6,1r,5,3,1,n,w,d,1i,x,9,4x,5,1w,f,1d,20,2,1u","eeb":"hg","eed":"73,cc,4k,2,4,1,1,2,1,1,2,1,2","eee":"vx","eeh":"7u,2i,3x,b9,3t,6a","eek":"sy,26","eel":"27,9,6z,3o,p,2,6,76,1p,af","eem":"r9,2q","een":"2b,n,q,6,1,1,1,8,b,t,a,l,e,2u,5,2,2,u,1a,c,3,o,6,m,7,17,7,2,f,7,w,1,1,2,1,q,3,6,e,l,f,u,2,1,2,1,3,3s,8,1,5,l,1g,5,5,6,27,5,q,1z,1l,1m,1m","eep":"5y","eer":"3p,1i,10,26,1v,6p,3m,29,l,4q,d","ees":"ea,5l,d6","eet":"0,1,3,1,2,2,1,8,8,1,3,3,4,1,q,6,1,1,a,d,1,2,1,4,8,4,2,1,2,3,1,1,4,3,2,1,5,1,1,2,1,1,1,1,4,4,6,2,9,1,1,3,4,2,1,1,1,1,4,5,6,1,3,1,1,2,4,6,2,1,1,1,e,2,1,4,6,1,1,2,2,1,4,2,2,7,1,1,3,1,1,2,1,4,1,n,d,3,2,2,5,4,5,2,1,7,b,1,1,3,2,4,1,3,5,1,2,2,1,4,1,3,2,1,4,3,2,1,4,2,2,1,6,2,9,a,3,5,3,1,1,5,5,2,1,3,1,1,2,2,2,1,8,4,1,1,6,2,1,3,3,5,4,3,4,1,9,2,3,2,1,2,1,5,6,e,2,j,1,4,2,4,2,1,8,5,2,4,1,2,1,2,2,2,7,a,1,2,1,1,1,3,3,1,h,u,7,4,1,1,1,2,1,1,1,1,1,1,1,1,1,2,7,1,2,1,2,3,7,4,v,1,3,1,1,4,2,3,1,1,2,1,3,9,2,2,2,4,5,7,7,1,5,a,1,4,1,1,2,6,10,c,2,g,1,1,7,1,1,1,5,1,1,1,1,2,2,1,1,3,1,1,1,1,1,3,1,2,1,3,1,1,1,2,1,5,1,2,3,a,2,2,3,4,5,c,1,1,g,7,5,1,2,2,1,7,2,2,1,3,5,1,9,2,1,1,6,2,7,2,b,1,3,2,1,4,1,1,5,6,5,1,1,d,1,2,1,1,1,6,1,1,2,3,8,1,2,7,e,1,9,1,c,2,1,2,1,3,1,3,2,1,1,3,3,1,1,3,1,9,4","ef ":"1a,1,1,1,1,1,1,1,1,1,1,1,1,1,i,dy,hf,17","eff":"jq,3k,1,3,1,3,1,2,1,1,1,1,1,1,1,1,1,1,3","efi":"kb,9,5,18,22,1,2,2,c8","efo":"3p,6r,6w,1,2,2,7l,9","efr":"nk,g","eg ":"1i,1s,9,38,1o,25,m,5s,1h,3,48,2u,9u","ega":"u,jb,61,1,1,1,1,1,1,1,1,1,1,1,1,1c,d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ege":"1c,l,bt,61,5h,7e","egi":"a1,jq,1e","egn":"10p","egr":"v3,1y","eh ":"k,d,6y,w,fi,1k,7,7j","eh1":"3f,2,c,6,1,1,1,3,2,2,4,1,8,2,1,3,1,1,1,1,2,1,1,1,1,2,2,1,1,a5,w,q,1,5,1,6,1,1,1,2,d,1,1,1,1,1,1,1,2,1,1u","eh2":"39,1,6,o,2,b8,1,11,l,7,f,i,d,1","eh3":"3q,8,1b,by,f,7","eh4":"3j,6,1g,bs,1,s","eh6":"38,j,w,d5,v","eh7":"53,co","eh8":"3s,b,o,6,14,bf,m,1x","eh9":"3e,13,e7","eha":"2i,5c,68,3j,s,3,1,bi","ehi":"ac,3x,b9,3t","eho":"ny,bn,17","eic":"7v,1,1,1,1,bf,55,1,1,1,ay","eif":"y1","eig":"6k,26,h9,1y,1h,j,4k,o,c,4,2","eil":"8p,9j,7q,6i,1,4","ein":"fd,9g,9s","eir":"8y","eis":"hc,1s,46,10,53","eit":"38,j,w,g,3,2,ck,2,t","ej ":"3b,1l,4,3e,9j,y,6o,7d","ek ":"sy,26","el ":"4,d,17,3,p,1y,2,w,3,2,1,1,1,1,1,1,a,13,h,9,5,1,1,1,1,1,1,1,1,1,8,j,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,3,e,1,e,7,g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1,2,d,r,8,1f,8,n,2,f,a,3h,o,l,4,2,6,1,c,3,d,6,k,2,v,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,2w,1a,19,7,s,1f,7,8,4,i,b,3,x,g,4,3","ela":"26,bs,2a,3n,8h,3,44,1,2,k,1","elb":"44,4q,hb","eld":"1k,1c,2,u,m,2,12,2,c,2n,c,1,f,q,2,25,12,14,i,2,3u,l,6,7,7,e,9,5,6,12,j,j,a,1,1,3,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,3,1,1,2,2,7,1,o,c,6,l,3p,1,6j","ele":"e,p,t,b,4u,28,k,14,2x,ab,2u,z,s,1p,67","elf":"aj,1z,4f","eli":"3k,3d,1,71,3b,4b,1,8y","elk":"6f,2","ell":"22,h,z,j,1g,a,8,1r,s,b,q,l,8,6,r,i,n,1,m,l,h,o,j,g,1y,4s,15,5,1e,k,5,9,c,1,1,1,1,10,a,1,d,a,1,1,1,16,8,i,15,1,b,e,6,i,1,1,1,1,n,1,x,j,r,5,6","elm":"18,1m,1e,v,6t,4y,x,14,5j,69,d,2m,g,1h","elo":"e6,1e,7b","elp":"cm","els":"5c,3r,1p,13,3k,t,5h,2v,3g","elt":"7w,3,2d,2,6,m,82,5d,8p","elv":"91,fl,4a","elw":"d3","ely":"bp,9r","ema":"r9,2l","emb":"2l,e,4i,1b,67,3,4v,7,2y,2z,44","eme":"0,74,2o,19,12","emi":"53,71,5n,by,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,16,1h","emo":"8z,a6,az,z,g,1b,1b,1,5,2,q,3,3,2,1,1,q","emp":"fm,7b,b,5k,21,51","en ":"o,a,1,1,c,3,b,1,1,1,1,1,1,1,6,7,1,n,2,u,1,1,1,1,i,3,1,1k,e,4,d,1,f,7,4,9,e,l,2,2,3,7,7,2,n,1,6,8,1a,4,3,4,5,f,6,5,3,1,d,6,1,1,1,c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,2,b,1,1,9,7,1,l,a,1,1,2,1,q,m,m,f,u,2,1,2,1,3,y,1,5,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,d,12,8,1,5,l,t,1c,9,1p,n,8,18,2,3,c,6,4,z,2,2,h,2,5,5,1,1,1,1,1,1,1,s,3,1,1,1,1,1,1,3,5,r,4,m","en1":"tt","en8":"tc,i,5b","ena":"7j,6,i,2,el,a,26,4,s,1,1,9,6,1x,1,1,1,1,1,1g,x,2g,7","enb":"l1","enc":"2f,7o","end":"3,19,f,52,1k,1h,r,g,4a,g,1,1,1,1,1,1,1,1,2w,u,1s,28,h,4w,p,c,1l,2r,1a,x","ene":"b0,e4,93","enf":"37,2b,3,8k,41,1,2,bk,5u","eng":"3p,4o,6e,26,9c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,p","enh":"2,h,2,1f,f,f,7i,2,6,m,2r,c,4,1,14,3,i,2s,9,cv,1b,30","eni":"24,a,ba,2j,ck,4y,15","enl":"2p,6g","enm":"v8","enn":"d,17,4l,az,cn,w,1,1,3,1,1,2,1,3,2,1,2,1,1,1,1,1,1,1,1,5,1","eno":"4b,18,2g,a8,b6","enp":"ft","ens":"z,1,2o,6,1,1,1,8,b,t,x,v,5,7,1j,l,f,19,3,h,3g,2,6,1c,1,1,2,1,q,3,6,z,1z,m,n,4h,5,5,6,b,q,b,1,g,1p,34","ent":"1x,c,3,9,t,7,27,8,l,2,1,9,7,b,o,6,1,1,1,2,1,2,4,7,2,m,n,h,e,1,6,1,u,3,1b,h,1p,h,n,1h,1,i,6,8,5,2e,17,y,1,a,1,s,e,1,5,1,1,1,2,1,1,2,2,1,1,4,6,4,1,1,1,1t,f,7,1,16,7,k,5,1,4,4,2,3,a,1,5,9,e,2,d,r,6,1,3,1,2z","enu":"83,v,i,34,2o,3t,5,h,57,4d","env":"qc","enw":"22,pa,1x","enz":"5u","eod":"3u,1,1,1","eon":"qv,7c","eop":"ru","eor":"2,26,f,z,1a,4,50,y,2y,1h,1,q,1t,4p,q,18,2k,l,8,7w","ep ":"5a,o,6f,2r,17,5,d,50,a9,1,2b","eph":"1w,22,3j,1,1,1,1,1b,di,1,1,k,1,1,1,1,1,1,57","epi":"9l,9r,f6,1j","epl":"p6","epn":"ar,lo","epo":"p3","epp":"10h","eq ":"9,73,qk,1b","equ":"zk","er ":"3,2,3,8,d,4,p,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,e,7,2,5,1,2,23,3,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,4,2,3,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,4,6,3,d,8,6,2,4,3,9,a,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,4,1,2,3,2,5,8,3,7,5,3,1,5,b,6,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,2,4,3,5,4,2,2,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,g,9,4,7,4,3,g,b,6,3,1,f,6,2,3,2,3,1,1,1,4,4,2,5,4,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,4,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,a,9,8,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,1,1,e,4,7,6,3,6,5,2,2,4,4,5,2,1,1,1,1,1,1,1,1,2,1,8,2,2,1,3,2,1,3,5,1,1,1,3,2,1,1,1,1,1,1,1,1,1,3,5,6,1,m,3,2,6,1,1,1,1,1,5,1,2,2,3,1,1,d,8,5,h,1,c,4,c,9,1,8,5,1,u,1,e,1,b,8,1,6,a,2,1,4,d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","era":"0","erb":"86,43,3,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,b5,f,7,2n,2t,2,8,4t,w","erc":"35,j,3,9k,38,h,b3,29,3z","erd":"3u,1,1,1,j,5b,c,4d,4,25,1,1,2,1,q,18,9l,87","ere":"13,r,39,1h,38,b,2u,1c,3i,2m,7f","erf":"8w,h,5g,8g,14,n,8e,1,2","erg":"gs,r,6h,3k,8y","erh":"0,1,c,d,4,1,9,g,4,4i,5e,c,c7","eri":"24,1,1,9,8,1,1,1,1,1,1,1,b,3i,2f,s,43,1,1,f,f,1,18,1,1,1,1,1,1,8,1t,2q,4u,4o,u,4,45","erk":"1r,b,n,88,47,4j,7c,1h,1,1,1,n,8","erl":"s,1l,18,23,9,1,1,1,1,1,17,6g,10,1p,2e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,14,5b,19,1t,1u,1f,1,1,1,1,1,1,1o","erm":"8,l,2q,1,f,7f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1z,2m,c,2r,6o","ern":"8,4,a,o,4,3,3,u,f,5,d,g,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,10,3,h,4,f,z,3o,a,1q,q,k,q,f,6,6,1o,17,13,e,9,o,2,35,2a,t,2,c,t,c,m,49,h,o,8,w","ero":"87,q,4,dm,2n,9f,1,1,1,1,1,1","erp":"ec,3,51,1,1u,5c,3,1g,6,4,c,1,48","err":"1,3s,1,1f,3o,4,j,7f,a,e,6,14,2a,l,3q,15,1n,e,9,2o,1e,1q,1,1,1,1,1,1,1k","ers":"1,7,2,a,2,6,1,3,p,4,i,1,1t,n,4,c,3,n,o,10,4,5,4,1,1,1,1,i,9,h,6,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,1,3,7,1,e,m,v,2,l,10,3,7,1,1,1,1,1,1,1,1,6,1i,8,6,6,o,j,2,1,d,1k,r,6,i,a,d,4,1,c,g,6,1,1,1,i,1,6,c,c,k,5,2,n,8,l,6,4,1,9,2,1,4,d,5,9,6,2,e,o,1,x,8,z,4,g,h,a,s,1,1,1,1,1,1,1,1,1,1,4,8,3,m,1","ert":"o,u,13,6,1t,1s,1,1,1,1,1,1,1,i,1,1,1,1,1,1,1,1,1,1,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,5,e,1l,1u,y,e,g,6,h,1x,2r,7,p,1,1,1,1,1,1,1,1,1,1,1,1,1,1l,2h,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,29,2,v,1,9,2,2,2,1,1,1,5,1,2,6,h,5,7","erv":"ae,q,hh","erw":"3q,a,bc,1v,60,22,4o,1y,2s","ery":"8o,4g,b1,7k,1o","erz":"om","es ":"3,2,8,9,7,18,5,h,2,2,m,t,9,7,f,t,8,y,b,d,15,j,d,p,a,k,9,7,l,7,t,1,1,27,4,i,1,c,c,r,1,1,3,3,c,h,s,t,7,3,v,j,1,i,4,8,2,9,y,l,1,1,i,4,e,9,8,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,v,a,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,j,5,2,e,k,d,b,k,1,1,1,4,4,8,3,2,1,2,9,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,16,h,d,3,d,1,6","es9":"7l,fl","esb":"9g,1k,84,aj","esc":"3e,2e,cw,h3,1,1,1,1,1,1,1,1,1,1,1","esd":"30,a7,1t","ese":"jb,1,1,b,3m,8a","esf":"uw","esh":"1b,3j,1l,3,e,5,1,5,1,3,4,7,1,1,1,1h,k,26,2d,5,4,8,4d,12,s,1,1,1,1,1,2,g,s,3,a,1,1,1,1,1,1,3s,11,2,2,2,1,1,2,4,2,s,1,f,i,2e,3j,1,2,2,8,1,1,i,1,2,1","esi":"9g,9h,dc","esl":"8x,45,cj,9a","esm":"rs","eso":"o,r,1o,9a,eq","esp":"5j,a6,dd,51,c,v","ess":"21,5r,y,3r,1o,j,3,1w,1,2g,l,6,v,59,r,a,s,q,6z,1,1,1,1,1,1,1,1,1,4,n,1,1,1,1,1,1,2","est":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,4,4,6,q,t,f,2,7,1o,5,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,3,1,2,3,1,2,1,1,2,1,1,1,1,1,5,1,1,1,1,1,1,1,1,1,e,j,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,2,1,1,3,3,2,1,1,1,3,3,1,1,1,2,3,k,6,2,a,x,4,4,7,h,y,9,w,5,f,d,l,3,1,1,5,2,1,4,4,1,3,7,d,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,8,1,1,1,1,1,1,1,1,1,1,3,7,1,3,1,4,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,9,h,x,1,1,1,1,7,2,3,3,7,2,4,1,1,1,1,1,1,1,1,1,2,9,4,1,3,2,1,8,1,1,1,3,3,1,c,1,2,1a,7,7,a,1,a,5,1,5,n,7,c,5,b,5,5,1,1,1,1,2,k,1,3,7,e,b,c,b,d,4,1,3,1,2,3,1,2","esw":"1b,cz","et ":"0,1,2,1,1,2,2,1,8,2,6,1,3,3,4,1,q,6,1,1,8,2,d,1,1,1,1,4,8,4,2,1,2,3,1,1,4,3,2,1,5,1,1,2,1,1,1,1,3,1,4,6,2,5,3,1,1,1,3,4,2,1,1,1,1,4,5,5,1,1,3,1,1,2,4,6,2,1,1,1,e,2,1,4,6,1,1,2,2,1,4,2,2,6,1,1,1,1,2,1,1,1,1,1,4,1,n,a,3,3,2,2,5,4,2,3,2,1,7,b,1,1,3,2,1,3,1,3,5,1,2,2,1,4,1,3,2,1,3,1,3,2,1,4,2,2,1,6,2,9,a,3,1,4,2,1,1,1,5,5,2,1,3,1,1,2,2,2,1,8,3,1,1,1,6,2,1,3,1,2,4,1,4,3,4,1,9,2,3,2,1,2,1,5,6,5,9,2,3,g,1,4,2,4,2,1,8,5,2,4,1,2,1,2,2,2,5,2,a,1,2,1,1,1,3,3,1,h,u,7,4,1,1,1,2,1,1,1,1,1,1,1,1,1,2,7,1,2,1,2,1,2,7,4,7,o,1,3,1,1,2,2,2,3,1,1,2,1,3,7,2,2,2,2,4,2,3,7,7,1,5,5,5,1,4,1,1,2,5,1,5,v,c,2,4,8,4,1,1,7,1,1,1,3,2,1,1,1,1,1,1,2,1,1,3,1,1,1,1,1,3,1,2,1,3,1,1,1,2,1,5,1,2,3,a,2,1,1,3,4,5,c,1,1,1,f,7,5,1,2,2,1,7,2,2,1,3,5,1,9,2,1,1,1,1,1,2,1,2,7,2,2,9,1,3,2,1,4,1,1,5,6,5,1,1,b,2,1,2,1,1,1,6,1,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,5,e,1,5,1,2,1,1,1,1,1,1,1,1,1,1,4,2,1,2,1,1,2,1,3,1,1,1,1,3,3,1,1,3,1,9,4,1","etc":"p7","ete":"97,35,in,3j,1,b,8,q,w","eth":"o,2u,2,5o,2,7i,i,9,7h,70","eti":"7k,9f,66","eto":"6v,3v,15,n,t,46,42,5p,i","ets":"7h,1,cq,2u,1,6o,4z,b","ett":"v,2b,6f,15,81,k,4d","etu":"nk","etw":"qu","ety":"h2,dg","eu ":"5h,76,2z,41,31,1n","eug":"6z,1,en,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","euk":"5u","eva":"3b,g6","eve":"c,a,14,1,1,1,1,1,1,1,1i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2d,r,g,3s,1,s,a,v,12,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,12,13,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,n,1q,1,2,1,1,1,q,h,1,4,8,9,k,4,1n,4a,18,2w,1,2,2k,1,1,1,1,1,1,1,1,1,1","evi":"ba,ez","evo":"29,6p,2,1,4u,cn,58,28,1,1,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,3,1,3","ew ":"2,w,6,2,f,17,9,15,2c,d,p,x,2v,34,l,k,h,2x,1c,4,5,5,u,v,r,k,2,12,u,2,k,2o,1a,i,1u,1,25,1a,r","ewa":"a1,2w,59,9,1","ewc":"1b,2a,1,1,3i,cg,86,4a,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ewd":"t,w,bq","ewe":"7p,39,1g,1,ad,1,1,aj","ewg":"75","ewh":"59,87,4d","ewi":"4h,ie","ewk":"b0","ewn":"b3","ewp":"xk,3","ewq":"8x,py,4,1","ews":"q,2h,13,b,5,i,a,3,65,64,c,1,2","ewt":"t1","ex ":"1c,5w,1i,y,11,3g,j,3,4d,7,1,1,b,1,6a,2h,2,o,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,y,3,4,a,2,1,4,2,1,4,b,j,36,1,1,1,1,1,1,1,1,1,r,1,1,1,1,1,1,3","ex2":"yq,b","ex3":"yr","ex4":"yi,1,j","ex7":"yt","ex8":"yu","exa":"24,e3","exc":"3l,3i,5r","exe":"yi,1,b,8","exh":"rm","exl":"iu,c7","exm":"yu","exp":"2f","ext":"102","ey ":"1,6,5,2,a,1,3,1,4,6,3,1,7,1,6,2,2,h,1,1,1,1,1,1,1,1,3,2,3,3,a,9,2g,9,1,1,1,1,1,d,e,o,1,1,1,1,n,p,8,4,3,1,6,a,b,n,6,k,p,4,g,7,5,7,b,4,1,1,1,1,1,1,1,1,5,2,e,6,2,a,j,6,4,3,5,1,4,2i,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,b,j,1,f,c,l,1,1,6,4,a,1,1,1,1,1,1,1,3,1,8,2,7,9,4,4,1,x,6,8,1e,h,3,k,a,2,f,1,e,1,5,1,1,1,3,k,4,1,1,1,1,1,1,1,1,1,2,d,1,i,z,i,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,8,l,9,8,1j,3","eya":"no","eyb":"ti","eyd":"nq,4","eye":"7o,2l,ke","eyf":"84,8,b7,5d,l,1","eyh":"iu,4h,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,72","eym":"y3,14,1,2","eyn":"p3,4","eys":"6a,4a,a,24,3p,1,1,2r,1,15,25,3m,6,7,v,l,6,4,a,2,1,4,2l,1,3o","eyt":"tr,p","eyw":"84,gs,2b","ez ":"16,5i,3p,4q,5j,8t","f 1":"fe,hr","f 2":"7e,54","f 3":"ut,2z","f 4":"nu","f 6":"5d,s5","f 7":"3p","f a":"4,k2,92,4,34,k","f b":"4f,sq","f c":"25,p,a3,p,q,3,1o,3s,23,1,1r,1,1,92,6,1,h,1,3,2,3,1","f d":"6h,53,1g,lb,e,1,3","f e":"1a,1,1,1,1,1,1,1,1,1,1,1,1,1,22,bp,1j,dw,j","f f":"st","f g":"25,c,d,2j,23,b,2u,3g,1s,a,b5,13,3","f h":"6f,62,3b,dk,1x,32","f j":"1f,5,x,4z,b,6a,1s,f0,g,3","f k":"5d,ei,2n","f l":"28,5o,t,57,6a,5s,y,l","f m":"2k,u,4i,4,50,h,n,4k,1p,4f,9x,1,3","f n":"80,fz","f o":"3p,d8,2s,77,c,6t","f p":"32,cc,jo","f r":"37,5i,h9,2d,3,4r,d","f s":"7g,a1,2q,41,4n,6j","f t":"4m,5z,lv","f u":"ec,3,il,1,h,1,3,2,3,1","f w":"4,1b,5,h,9j,cf,9,43,85","f1 ":"nz,5","f10":"x0,j,5","f2 ":"o2","f24":"xm,5,1","f4 ":"nh","f64":"xi","f7 ":"nk","f8 ":"o0","f83":"ec,3,im","fab":"1t,76,bt,da,1,1,1,1,1,1,1,1,1,1,1,q,1","fac":"1d,20,f8,eh","fai":"r6","fal":"60,3t,6v,10,1,36,d0,1,h","fam":"st,66","far":"67,53,3d,2h,27,18,v,4c,1j,27,1,1,1g,5g","fat":"ne,7a","faw":"3n","fax":"nb,s,5","fb ":"7d,ha","fc ":"az,8,a2,bi","fe ":"3k,i,8,1,a,5,j,2t,6d,2n,1,1,6,2r,r,h,62,6d,1d,d","fea":"nk","feb":"vz","fec":"9d","fei":"yl","fen":"pr","fer":"3k,1p,4u,77,d,6,28,8w","fez":"f3","ff ":"7g,k,6c,3,5a,db,1,h,1,3,2,3,1,j,r,c","ffa":"yd","ffe":"l9,62,7a,t","ffi":"96,6i,42,3k,1,3,1,3,1,2,1,1,1,1,1,1,1,1,1,1,3,bs","ffn":"5f","ffo":"15,2,2,8,9x,f,2,6,3,7,2h,v,3c,8s,a,2,2,7r,2,1,1,d,2,b","ffs":"vm","ffy":"6e,eg,22","fic":"fo,k2","fid":"4s,d9","fie":"2w,2,u,m,2,12,2,c,2n,c,1,f,q,2,25,12,14,i,2,3u,l,6,7,7,e,9,5,6,12,j,j,a,1,1,3,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,3,1,1,2,2,7,1,o,c,6,l,3p,1,6j","fif":"3k,q,b,5,1e,ay,1,1,6,2r,2,1,2,1","fig":"vx","fin":"96,6n,1","fir":"76,b9,1,9d,y,3","fis":"cl,1r,j4","fit":"up,32","fiv":"p,e2","fk1":"hp","fk8":"60,ao,10","fla":"9v,ik,5z","fle":"4u,9b,cp,8t,13","fli":"la","flo":"28,27,47,45,15,8p,3b,4g,2q","flu":"on","fn ":"cq","fno":"5f","fol":"al,2z,18,4s,6,28,10,v,7m,4e,2,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,a","foo":"vw","for":"15,2,2,8,t,d,4,2,w,c,1w,l,1,2,h,18,3,5,m,1c,k,1,d,5,6,3,1,2,6,2,1,7,1i,d,2,3,6,2,3,2,5,u,3,9,4,1,t,f,1,2,2,1c,6,2,6,e,k,s,7,1l,b,1c,1,2,1,f,7,9,4,3,6,2,16,g,b,4,3,7,2,2,o,f,1,2,1,1,6,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,2,5,1,3,4,2,1,e,1l,h,g,1,2,q,3,n,l,1,5,a,6,1,1,3,b,3","fos":"aq","fou":"9u,18,d,cu,1c,81,6","fow":"wl","fox":"g,1d,7,j,6a,t,4h,as,17,d,j,o,32","fp ":"zs","fq ":"nu,9t","fr ":"8j,hk","fra":"3i,bv,87,g,7w,3v,1,1,1,1,1,1,1,1,1,1,1","fre":"2w,b,2b,3,6x,t,1l,b,19,1q,1,2,90,8c","fri":"1v,4w,h,i,e,8,b,4h,20,5u,3y,l,g,g,s,1e","fro":"3o,qd,1n,v,1,11","fry":"2c,87,5i,kk","fs ":"i5,2b,4w,6a","ft ":"cg,nn,4,1,3,1,2","fte":"64,6r,78,1,2,1,1y,dl","fth":"8v","fto":"f5,bx,1x,47","fub":"ho","ful":"1h,b,cr,2,8y,c","fun":"7z,l1","fur":"r0","fw ":"74,x,gn","fwa":"4u,8j","fy ":"lu","fy1":"qe,1,1,5,8,5,4,15,d,1,1,1,1,a,1,1","fy2":"qh","fy3":"qi,f,24","fy4":"r3,1m","fy5":"qw","fy7":"qu","fy8":"k6,8z","fyl":"qk","fys":"6e,eg,22","g 1":"2m,1x,17,9e,p,7,2i,fo","g 2":"8f,e2,b,2s,55","g 3":"5o,bg,9h","g 4":"bi,43","g 5":"uv","g 6":"5b","g 9":"3j,2h,ao,21,hu","g a":"t,e,f,29,9p,q,k,1u,7,cr,24,4,d,2","g b":"28,i,6d,b,4i,18,3w,n,9e,d,1p,1z","g c":"2q,4p,8,2l,f,46,3d,2v,1p,5,2d,51,12,f,3,1,3,1,47,1","g d":"8f,1b,2q,9,46,1k,75,8r,b,o,4","g e":"1n,1n,4,5,h,t,2,3,1z,1,1s,88,15,l,2x,1,35,18,3v,2,t,e,a,4,1d,3p","g f":"60,ao,10,14,15,ee","g g":"4j,c,g,f,7,2,s,6,1,b,36,5,d,9,4,3j,s,x,3s,10,b,1,y,p,9t","g h":"6j,q,6c,11,7,68,3,8q,1e,4x,1,8","g j":"1i,59,w,dn,1g,5,7u,6,d,5,2t","g k":"4t,2,3,d,d,2,7,2,1,x,1,9k,1,1k,2,v,r,1u,1,y,8b","g l":"6,e,qw,2g,1l","g m":"84,1s,2t,c7,1n,29,20,3,i","g n":"5o,2g,k,7v,72,1b,8o,2u","g o":"3j,df,ai,26","g p":"bt,3s,a8,1,6h,29","g r":"3e,5a,2,6e,c,2z,9,z,6c,32,d,l","g s":"30,3v,7,5p,1t,2,6,8,6j,14,y,2y,1e,a,l,q,r,5,4,5,3z,2,m,4,15","g t":"af,5,d,9,4,8h,cg,2","g v":"9l","g w":"t,p,6x,1b,g,4e,53,5x,1w,8,37,3m","g1 ":"33,2,13,a,s,h,5,3,21,1,1,4,1,c,4,4,2,2,69,16,1,23,64,5,1,1,1,k,n,3,2,1,2g,v","g10":"or","g11":"3b,2,2i,cf,2,9","g12":"34,17,1,3,4,1f,ae,3","g14":"8i,h6","g15":"os","g2 ":"5b,i,2a,i,7,7m,17,s,3,1,8,5s,c,1,1,10,6","g21":"pc,3u","g3 ":"5s,5,27,i,63,41,66,10","g31":"3c,fa,6b,1","g4 ":"62,2i,a0,6f,1,14","g41":"ib,y","g42":"k0","g46":"5f,b5","g5 ":"jn","g60":"36,fl","g61":"5g","g62":"5q","g64":"5p,ao","g66":"5u","g7 ":"p1","g71":"5c,1,4,b0","g72":"gi","g74":"5n,ay","g76":"5k","g78":"i8","g81":"ja","g83":"5m","g9 ":"2p,md","ga ":"6p,en","gab":"wy,1,1,1,1,n,1","gae":"5x","gai":"4r,a0,3b,fd","gal":"4w,16,g,hi,89","gan":"47,1w,1,25,80,15,2o,1,1,3,29,6,f,2d,s,1,1,1,1,1,1,1,1,1,1,1,1,7,a,18,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2d,q,1m,1,1,1,v","gao":"s5","gar":"y,30,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,o,c,3v,f,10,3q,1j,20,4,60,r,1x,1,2,4,j,8,6,5,32","gas":"u,nk","gat":"y,d,27,4,d,p,3,6,2,b,r,1,1,1,10,1,v,l,o,6,a,o,c,4,9,1o,a,4,b,13,1t,h,r,f,1,1,f,5,1i,3,4,7,i,32,h,1,1d,i,m,6,f,a,5,6,x,1o,g,q,d,t,h,v","gav":"5g,a","gay":"fm","gb ":"jk","gbe":"9a","gbo":"p4,p","gbr":"u7,43","gby":"8g,e,ff,1d,j,5g","gd ":"nv,16","gda":"101","gdo":"1q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,am,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d0,17,1a,19,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2q,1,1,1,1","ge ":"2,2,1,2,2,17,6,e,8,f,u,4,d,f,j,4,1,8,8,8,6,e,2,c,b,5,6,3,c,4,9,7,9,n,w,y,1,7,3,5,6,e,8,g,8,e,e,4,6,2,9,j,2,l,1,5,l,9,d,f,o,4,7,9,d,11,8,z,5,b,8,t,3,t,1,5,c,4,r,3,f,7,a,n,l,9,8,d,8,1,1g,r,2,2,1,1,1,1,3,a,5,3,1,2,3,d,1f,7,y,8,1,u,k,4,2,2,b,6","gea":"6m","gel":"1o,3o,54,1j,3g,ku","gem":"9s","gen":"1c,l,52,1,c4,2j,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2v,4m,2s","geo":"2,26,f,z,1a,4,50,y,2y,1h,1,q,1t,4p,q,18,2k,l,8,7w","ger":"57,2r,6v,6z","ges":"5u,8w,9u,b7,1,1,1,a,1,1,i,1,2,1","gew":"i6","gfi":"2y,2y,92,4f","gfo":"j1,5u,be","gg ":"40,e5","gga":"5e","ggi":"4p,l,b1,f6","ggl":"qk","ggo":"3,2","ggs":"35,2k","gh ":"q,b,1,q,2,4,1,1,a,1,b,5,4,d,1,1,4,1,1,1,2,6,1,1,1,1,5,1,1,1,1,1,1,1,1,1,2,4,1,3,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,s,1o,5,s,4,f,i,2,1,7,b,2,a,3,3,d,3,7,3,1,k,3,e,1,i,e,1,2,3,8,4,1,8,1,1,3,2,6,3,3,6,g,1,1,1,1,3,6,8,1,3,9,7,h,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,4,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,1,4,1,x,4,9,1,4,e,27,6,3,o,c,v,c,p,3,3,1q,2,4,2,7,8,12,2,4,k,5,b,7,4,a,9,1,1,k,n,5,v,m,1,u,a,1,2,3,1,1,1,3,2,a,7,d,2","gha":"h,o,t,1,1,1,1,1,n,5a,1,1,1,1,2,1,c,1,1,1,1,4,1,1,2,7,4,8,6,a,1,5,1l,c,5,2l,2,48,1,5p,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,3,1,1,j,1,1,3,1,1,1,1,2e,1,7u,7","ghc":"ze","ghe":"6i,7r,g0,1,1,1,1,1,1,1,1,1","ghf":"oc,c2","ghg":"99,jt","ghi":"d,3w","ghl":"c","gho":"7v,gu,bt","ghs":"sc","ght":"q,p,20,e,t,i,2a,1e,1e,23,u,9,3p,8,7c,4,11,b,a,3m,s,4,a,1,6,3,4,g,25,13,1l","ghu":"gt","gia":"mm","gie":"2v,1,1,1s,l,9l,1,1,1e,3b,1p,a6","gif":"5f,dk","gig":"qk,7s","gil":"fq,2m,z,6j","gin":"3p,j,45,8k,6w,3v,16","gio":"a1,jq","gir":"o0,50","gis":"3i,rn","git":"1y,1,1,1,1,1","gl1":"a7,2,4,3,3,2,1,2,1,4,1,2,1,1,3,1,1,5,5,lq","gl2":"aa,h,9,5,5","gl3":"b7","gl4":"az,c","gl5":"a8,3,1,2,1,2,1,2,3,3,e,2,3","gl7":"av,h","gla":"l,2i,1,1,1,5,1,1,v,3,1,3,3,1,r,1,1,1,2,1,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,3,u,54,2,1,47,1,1,1,1,1,2,1,1,1,1,1,z,l,1,1,1,1,1,1,1,1,2,1,3,1,1,3,1,1,i,1,q,1k,m,43,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2o,1l,1,1,1,2h","gle":"1d,4c,5g,15,43,4,6,c,72,2j,16,14,2f,29","gli":"tu","glo":"4t,2q,b,2d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3v,7p,1,6,p,9a,5,v","gly":"3a,f8","gmo":"xl","gn ":"6k","gna":"u2","gne":"oe,cb","gnm":"yh","gno":"4,8,f,h,tx","gnt":"yf,1","go ":"f2","goa":"is,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","god":"7s","gol":"4m,2t,7,5b,9,k,88,1,1r,1,1,2,v,1,6h,1n,o","gon":"3,2,o,a,3t,7f,fe,8,22","goo":"80,9e,dt","gor":"p,8,77,b0,5s,1a,1,1","gos":"e8,3,5a,65,84,1","gou":"vf","gov":"u3","gow":"33,1,1,1,5,1,1,v,3,1,3,3,1,r,1,1,1,2,1,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,3,a8,1,1,1,1,1,2,1,1,1,1,1,z,l,1,1,1,1,1,1,1,1,2,1,3,1,1,3,1,1,i,1,q","gp ":"j2","gq ":"1w","gr ":"2l,67,h9","gra":"2f,8,1k,g,2,3,15,2w,1b,3f,1,1,1,1,2h,5,14,o,t,46,b,1m,1,14,6n,1","gre":"1r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,1,1,1,1,1,1,1,1,1,13,1e,f,5,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,4,2,3,1,2,1,1,2,1,1,1,1,1,5,1,1,1,1,a,8,10,7,2,1p,7,k,3,o,6,4,h,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,8,8,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,7,1s,o,6,6,1,2,1,1,1,5,6,5,4,5,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,8,1,1,1,1,1,1,1,1,1,1,w,e,g,5,2,e,v,d,1,1,8,7,1,1,1,1,1,1,1,1,b,4,4,2,1,6,2,1,1,1,3,3,n,5,4,d,5,4,2,2,1,1,1,5,2,3,i,5,v,8,v,3q","gri":"e,q,1,4,26,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,e,4w,6s,z,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2g,1,1,1,49","gro":"h,15,b,2e,20,1o,1i,o,1d,61,1p,m,13,1z,b,2,1,y,9,40,13,13,d,11","gru":"zr,1,1,1,1,1,1,1,1,1,1,1","gs ":"2d,s,2e,6,b,35,e,27,7,1s,1d,h,15,q,1f,2c,5p,6,7,2t,f,4,2n,q,1q,15,1","gsb":"2b,1,9t,1m,2a","gsh":"v,9t","gsi":"jy","gst":"26,36,1,4i,6a,9n,3e","gto":"4h,2f,b,1,7,7,1,1,e,3,1m,c,2h,1w,4,1e,50,4,3,f,s,d,1,2i,2a,b,1v,1w,1,1,1,1,5,12,1,2i,1a,1,1,1,1","gu ":"kk,n","gu1":"eh,6,en,5,6","gu9":"tg,1,1","gua":"pr,7p","gub":"10n","gue":"8x,4,1n,o1,1,1,1,1,1,1,1l","gui":"o5,24,3c,s","gun":"9f","gus":"gv","gut":"4v,24,1,en,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","gwe":"vk,1t,7,3","gwo":"y2,5","gx ":"8v","gy ":"8c,h5","gyl":"2p,2m,h","h 1":"f,3,10,u,1s,3r,1k,2,1,4q,1t,1m,1t,1,1t,3h,9t","h 2":"2r,bk,3b,e,8g,73","h 3":"r","h 4":"4,93,8l","h 5":"9b","h 6":"33","h 7":"69,b0,2u,4j,1s","h 8":"2j,bk,3f,a6","h 9":"f6,43","h a":"f,5,d,z,v,1t,1p,58,3,1p,1,28,1a,3g,f,69,2l,30,9","h b":"h,h,p,23,n,o,32,w,b,9,n,1r,1f,3k,b,x,w,1a,4k,2f,z,2d,1,x,1l,5,w,1,2,3,2,1,n,2,3,2,1,2,1,1,3","h c":"18,9o,l,4,1t,v,1z,6n,4t,e,2,1t,23,9,19,1,c,1,15,d,e,w","h d":"8,6,8,2w,59,7,1,1,4,a,a,6,7,5,1i,x,8,3,g,3g,22,10,66,3x,14,i,b,24,2,3,2,1,2,3,2,4,3,1,1,1,1,1,4,1,9,2,1,1,1,1,1,1,1,1","h e":"38,1,1,4,1,1,1,2,6,1,1,1,1,5,1,1,1,1,1,1,1,1,1,2,4,1,3,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,s,9c,1,1,u,7,h,1,1,1,1,4,1,1,1,4,1,1,1,1,1,5,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,1,4,1,1a,1,3q,64,50,1,v,s","h f":"28,bo,n,jl,1w","h g":"1b,1s,11,1u,b,c,15,2y,7,c,u,3,1m,1d,o,6,2x,r,c,b,f,2a,49,3,o,1x,1d,1n","h h":"1f,1c,1d,r,1s,g,1i,1,1,1,1,1,10,22,5h,2b,2,3z,27,1,1,1,1,1,1,1,3u,d,7,u,4v,f","h i":"m2,1v,c3,f","h j":"1a,4y,e,1,1,1,1,1,l,1,1,2,8b,6,5a,1,1,1,1,1,1,1,1,1i,28","h k":"5y,n,5c,6x,10,2,1,b4,3","h l":"1a,11,h,2m,a,27,26,2u,k,c,2b,h,3,a,7h,3,6,26,1n,c,c,o,1d,5,4g","h m":"33,1,1,1,1,1,1,1,1,1,1,1,4h,2v,26,3v,1f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5v,5,2f,3l,n,1,1,k","h n":"8r,4z,i,3,4o,l,40,2,1,14,e,o,7,60,u,2z,2,2,4,f","h o":"3n,53,8s,8h,t,1c,7d,4,11","h p":"1r,2t,4e,2,1e,4,1c,r,2i,4i,1,8y,1,1,3,1o,u,2r,2,k,1,1,1,1,1,g,n,w","h q":"14,45,ck,h7","h r":"1h,d,s,h,g,1,2s,1,1,1,1,1,1,1,i,1,1,1,1,1,1,1,1,1,1,1b,y,i,f,o,r,t,1k,4,c,t,6,8,1,3,y,c,3j,1,1,1,1,1,1,1,1,1,1,1,1,3m,d,p,3,f,g,5,p,u,c,d,a,1,1,o,t,m,l,2,1d,1a,6,7,5,1,1,4,4,2","h s":"c,e,b,1,q,6,1,1,a,h,4,c,q,4,3,h,9,4,4,1,3,1,1,2h,1,4,19,2,3,f,2,1,7,5,6,2,a,3,3,8,5,3,7,3,12,1,c,1,5,8,4,3,2,3,8,4,1,8,1,1,1,2,b,1,3,5,g,1,1r,1,7,g,3,2,7,1m,5,2,7,e,1x,a,5,1,3,c,d,1,m,3,4,9,1,2,6,1n,7,9,e,2,8,2,4,6,3,8,f,c,e,3,p,b,4,3,4,2,8,9,2,h,j,1,4,2,4,1,d,i,8,1,2,6,5,1,4,9,h,5,b,2,4,a,9,6,7","h t":"29,1e,2e,m,u,1,1,1,1,33,7,c,2o,d,3,1d,3u,4,2s,1,1,k,1,1,1,1,1,1,8u,h,9,4,11,1,l","h u":"38,1,1,4,1,1,1,2,6,1,1,1,1,5,1,1,1,1,1,1,1,1,1,2,4,1,3,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,s,9c,1,1,u,7,h,1,1,1,1,4,1,1,1,1,3,1,1,1,1,1,1,4,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,1,4,1,1a,1,56","h v":"cx,1k","h w":"0,f,5,d,b,2,1h,h,66,g,7,5,1i,2i,g,41,1g,3h,p,3,4,3h,6w,m,19,1,1,1,1","h y":"88,o,5e,9,4n,k,3h,1,1,1,1,1,1,1,1,3,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,j,1,v,4z","h1 ":"3f,2,1,h,3,3,2,2,4,7,4,1,3,1,1,1,1,2,1,1,1,1,2,2,1,1,a5,w,r,5,1,o,1,1,1,1,1,1,1,2,1,z,12,7p,3p,b,1,1,1,1,2d","h10":"4m,fc,am,w","h11":"gz,d,1,2,2","h12":"3t,l,cv","h13":"he","h15":"41","h16":"ux","h18":"zg","h19":"40,u9,v","h2 ":"39,1,6,q,4t,6f,1,11,l,7,f,v,1,fn,x","h21":"44,vb","h23":"y8,16","h24":"y2,5","h29":"i5","h3 ":"3y,do","h30":"59,ck","h39":"3q,dh","h4 ":"3j,6,1g,bs,1,s,ei","h42":"e9,5","h45":"qn","h47":"sw","h5 ":"y5","h6 ":"38,j,w,d5,v","h62":"sx","h65":"rs","h7 ":"53,co,hf,5,1,1","h8 ":"3s,b,o,6,14,bf,m,1x,f9,1","h9 ":"3e,13,e7,fp","ha ":"h,c0,48,2k,a2,u,t,2i","ha0":"jx,a8","ha1":"tq","ha2":"u6","ha3":"tv,6,3","ha4":"25,hj,af","ha9":"2z,c0","hab":"s,ct","hac":"2f,b8,25,4p","had":"7b,9,5n,9s,6","hae":"7v,1,1,1,1,1,1,1,1,1,z,2s,co,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7h,1,19","hag":"ca","hak":"t2","hal":"2,h,2,3,7,c,8,m,f,14,1a,f,u,1,2,3,1,1,4,o,20,y,1a,12,b,p,2,1,k,12,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1k,b,8,k,3,1,13,i,1,1,1,1,1,1,3,2,7,1,1,1,1,3,x,t,1,t,b,h,5,k,1h,6,j,1f,o,g,3,c,h,3,x,31,1,1,1,1,1,1,1,1,1,1","ham":"0,1,c,4,9,4,1,3,6,1,5,a,4,6,4,1,1,1,1,1,3,9,2,8,1,4,8,g,f,2l,s,4,m,1,1,1,1,2,1,a,2,1,1,1,1,1,3,1,1,2,7,4,8,6,a,1,5,c,2,6,j,3,e,1,b,1,5,n,u,e,4,c,5,3,2,2,t,2,1,i,2,1,2o,1,2,1,6,4,b,3,6,e,2e,23,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,b,5,1,1,1,1,1,3,1,1,1,1,8,4,6,k,4,c,l,b,1,m,7,4,1,1,h,8,2,1,1,1,1,1,5,4,1,4,2,2,4,2,3,1,1,1,1,2,7,c,1,1,1,1,6,4,11,1,16,c,e,1,1,1,1,1,1,1,1,1,1,b,5,e,3,7,7","han":"7,a,h,y,2,1,1,1,1,1,d,1,1,1,1,1,h,3,b,4,1,2r,1,1,1,1,1,1,1,i,1,1,1,1,1,1,1,1,1,1,j,c,4o,16,1,1,1,1,2w,1,7,2,2,6,3b,1,1,1,1,1,1,1,1,1,1,1,1,26,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,44,p,1t,1","hap":"7q,3t,b0,5u,4g","har":"g,1r,s,1,l,1r,a,d,1x,h,q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1b,f,l,8,15,t,c,1,f,7,3,1d,30,1s,2e,1,1,1,1,1,1,1,1,1,1,1,27,1g,3,1g,1,1,4,6,3,1,1,k,f,2,1,a,1,2x,g,b,2,j,m,5,4","has":"8h,6b,4x,5y","hat":"2j,3o,68,1o,1h,4z,r,8i,5,3o","hau":"o8,1,1,1,1,1,1,1,1,1,1","hav":"27,bn,8i,b2,1,2,1r","haw":"5o,1i,8z,26,y,20,8x","hay":"bo,7p,80,3k","haz":"mw","hb ":"6,28,90,1x,d,6h,cz","hba":"8n,ha","hbo":"cn,u","hca":"4a","hcl":"ze","hd ":"73,75,3,5s,9i,76","hd1":"ng","hda":"ml","hdo":"b7","he ":"4,5,1,1,7,1,3,2,7,3,6,1,2,1,5,2,2,6,5,6,2,5,3,1,1,1,2,1,2,5,1,1,1,1,3,1,1,4,1,1,8,3,3,d,1,1,3,1,5,1,1,9,6,1,1,1,1,1,2,7,3,6,7,f,4,7,2,6,5,2,3,6,2,1,1,1,3,4,7,1,4,2,1,4,a,5,4,6,1,1,3,2,1,1,2,6,4,b,b,8,4,1,2,1,d,6,2,3,5,6,7,8,2,5,1,3,5,1,3,1,1,7,1,1,1,2,1,2,c,1,g,7,2,1,1,2,3,2,1,1,3,2,1,3,1,n,1,3,1,6,1,1,8,2,5,5,1,1,4,4,6,2,1,1,1,1,d,1,1,5,2,2,3,w,1,1,6,1,1,5,1,1,3,a,4,17,1,1,1,7,6,4,6,8,9,1,7,4,1,1,1,3,g,4,3,2,4,8,1,5,1,2,5,1,8,1,d,a,1,4,2,2,3,1,1,2,1,1,7,3,2,7,1,7,3,1,4,1,1,3,1,2,1,5,2,5,2,1,2,1,1,b,5,1,4,1,3,1,1,1,3,2,1,1,1,2,2,2,1,1,1,1,3,2,1,2,2,2,1,1,4,3,1,5,2,6,d,1,2,5,1,f,1,1,c,1,5,2,2,2,1,1,1,1,1,2,1,1,1,5,1,1,4,1,2,1,1,2,6,1,2,4,2,7,5,1,3,2,8,2,8,1,2,1,1,8,5,3,e,4,e,1,1,3,2,1,5,2,9,c,4,2,4,c,3,4,d,2,3,1,1,2,1,1,1,5,4,1,3","hea":"e,u,3,4,8,21,h,7,36,9,f,4,v,c,2,b,c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,8,1,7,z,1d,5,e,1,v,4,m,1,1,1j,v,i,1t,15,t,s,2,4,1e,2a,1,w,12,r,i,4,1h,u,2a","heb":"qa","hed":"kg,g8","hee":"2q,ad,9p,3,af","hef":"jq,3k,1,3,1,3,1,2,1,1,1,1,1,1,1,1,1,1,3","hei":"oa,5n,2j,1,4,1g","hel":"18,c,m,3l,1a,3b,2,6,m,1c,j,x,1m,o,2,8a,3e,s,1p,2v,29","hem":"ve","hen":"z,1,1p,19,38,13,n,9,58,1e,1,1,1,1,1,1,1,1,3q,5p,5o,4n,l","heo":"qv","hep":"jc,91","heq":"zk","her":"o,1g,1,1,h,1,1,1,1,1,1,1,2a,1e,4,1,k,13,3,5,1,39,25,1,1,7,3,3,a,7,1,18,1,1,1,1,1,1,k,r,4,32,2,1w,6,e,d,d,13,c,3,3,6,f,12,f,g,a,3,z,9,2,2,2,1,1,1,3,2,1,2,6,h,q,d,2v,1s,5","hes":"8,e,1b,16,30,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,12,5d,5,4,9,1f,2x,f,k,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,33,b,2,a,7,1,1,1,1,1,1,1,1,2,8,1,1,2,1,1,1,1,1,1,1,1,2,2,4,1,1,1,3,3,f,1,f,i,r,l,5,2t,1m,s","het":"7h,1,cq,2u,1,ai","hey":"27,1,1,1,1,1,1,1,8,b2,1,1,1,1,1,1,1,1,24,1,b6,32,1,1,1,1,1,1,1,1,1","hf ":"37,l1,2o,5k,p","hfa":"10e","hfi":"3s,5j,2x,c4","hfo":"eh,l7","hg ":"3e,49,11,a0,4x,3v,41","hg1":"oi","hg2":"oh","hga":"63,36,14,c,9k,7q,13,24,29","hgu":"xg","hh ":"5y,n5","hi ":"i5,4g","hic":"z,1,f6,f0,5","hid":"l2","hie":"ah,74,s,3,1","hig":"c,e,b,1,q,2,4,1,1,a,h,4,16,3,q,4,4,5,2i,5,1b,4,e,2,1,7,b,2,a,3,g,3,7,3,l,3,e,1,i,e,1,2,3,8,4,1,8,1,1,1,2,2,9,9,g,1,6,6,8,1,16,1,7,l,7,1i,4,e,e,27,6,3,1f,g,2x,2,4,9,y,i,k,5,b,7,4,a,b,k,n,5,v,f,7,1,u,a,6,2,4,j,d","hil":"3,a,l,1,1,n,2,4,e,c,a,3,1d,3,12,b,1k,1x,8,c,9,c,b,n,5,1,h,1n,b,9,9,3,h,c,9,i,e,i,25,2r,38,4,4r,37,j,9,d,u","him":"p,5r,eg","hin":"4e,cq,1x,3l,f,6i,1k,h,1,1,4,15,1","hip":"c,3e,e,36,1e,1k,3,c,2,4w,1m,d,89,r,2b,2c,18","hir":"8,2,a,2,6,1,3,9,2,a,4,4,k,e,2,1,1,g,n,1,1,1,j,y,4,1,2,3,r,3,b,1,2,5,1,1,4,1,3,4,7,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1b,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,2,2,1,1,1,1,1,1,2,3,1,1,1,2,1,5,2,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,b,3,1,4,4,1,3,3,1,e,10,2,d,3,3,1,1,2,1,h,9,m,1,2,j,1,9,1,3,8,1,4,3,1,3,2,d,1,r,1,1,1,1,1,2,d,1,2,9,j,3,8,2,1,1,1,1,1,1,c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,4,1,1,2,1,1,1,1,1,2,1,1,1,1,3,1,1,1,1,1,1,1,2,1,1,1,1,1,5,5,1,1,1,1,5,2,1,1,2,1,1,2,3,1,1,1,1,2,6,2,4,1,1,1,1,1,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,5,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,5,1,2,2,1,1,1,2,1,1,4,1,4,2,2,4,2,3,1,1,1,1,2,7,8,1d,17,2,1f,1,2,a,1,1,i,1,2,1","his":"51,2f,c,ac,6j","hit":"r,1t,49,34,14,1m,1,1,1f,a,9,1,6t,3u,2h,2a,16,i,1,j,n,9,1,5,h,1n,x,8","hiv":"ac,3x,b9,3t","hj ":"3q,7q,5r,9e,5x","hl ":"1h,au,8x,1l,bc","hla":"bc","hle":"c,63,2y,7m,88","hma":"4u,2x,o2","hmh":"gm","hmi":"zm","hmo":"26,18,bp,3l,98","hn ":"7,1v,2c,4,91,1y","hns":"37,2e,2s","ho ":"1a,1,3,2,1,2,5u,8j,el","hoc":"1e,85","hod":"9y,pw","hoe":"24,a,17,a3,2j,g1,2m","hog":"r1,1,2,n,8,6","hol":"2m,57,s,1,1,1,1,1,1d,l,2o,24,i,2,6,k,40,i,4k,1,1,1,1,1,1,1,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,11,1,c,1,1k,e,g,1q,1c,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","hom":"1z,w,1,1,1,1,1,1,5o,12,4m,i,1,1,1,1,1,1,ax,2i,4x,v,z","hon":"7x,mu,n,1,1,50","hoo":"9,31,2l,cn,11,6,2w,21,3v,86","hop":"5p,1q,17,37,10,2m,2r,j,4w,1,2a,3x,20,1l,1t,1d","hor":"3,1,1,9,6,3,6,1y,1w,27,1a,19,1e,5,s,c,t,g,1,3,3,p,11,c,14,p,2z,18,21,x,g,7,p,14,n,u,2,2w,x,45,1,8","hos":"7v,9o,76,76,4w","hot":"4,d,3x,2,w,3,2,1,1,1,1,1,1,1d,h,f,13,5,l,1,7,j,3,e,1,e,19,1,2,d,1g,16,14,3r,1d,2,7,c,m,k,5o,5,t,o,7,2e,u,b,10,g,4","hou":"6,19,w,f,6,3,8,8,o,7,c,8,1,j,2,q,l,20,4,o,f,3,13,n,1,2,4,1f,4,t,8,e,3,2f,10,1x,1l,1j,j,4,1,1x,2b,2,1c,3,1z,2,6,9,10,1l,9,5,e,5,3,q,5,1,3","hov":"vc","how":"5i,kz,5m","hoy":"sw","hp ":"jl,99,6b","hp1":"e6,g","hp2":"tn","hpo":"4h,84,ex,19","hq ":"8k,2a,cj,j,28","hr ":"l,41,pw","hre":"q,5,3t,1k,5i,2w,bw,2b,3d,2","hri":"4v,qo,2p,y,5,1,1","hro":"a2,1o,7m,43","hs ":"8l,5q,bk,16,1,2,n,8,6,7","hse":"ua,d,1,6,6","ht ":"4m,2s,1e,4b,b,b7,17,9,8,31,7g","htc":"c9,4s,7o,11,l,4t","hte":"z5","hth":"1f","hti":"vx","htn":"a6","hto":"q,2e,b,e,i,t,2g,5s,30,x,5w,4o,2w,4,a,7,3,4,2l","hts":"tx","hu ":"49,21,dz,c,4q,1f,19,7,1l,3z","huc":"b7,dl","hud":"ng","hue":"1w,ex","huf":"mw","hug":"ms","hul":"a1,49,6h,m","hum":"2d,18,2,a2,fh,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4t","hun":"et,32,bh,i,4i","hur":"17,r,1,1,1,1,1,j,1z,u,6,1o,2b,1e,7,2,3,c,a,6,u,d,3,1,e,f,3,18,j,k,c,3d,1t,c,3x,a,7,9,g,i,2,3i,h,10,v,1,c,y,5,1,1","hus":"96","hut":"33","hve":"4j","hw ":"df,51","hwa":"fp","hwe":"5h,3c,h9","hwi":"98,ig,3p,1n","hwo":"10a","hx ":"f8,j0","hx1":"o3","hx4":"o8","hy ":"4j,1,1,7,1j,8g,13,1m,l,8z,c,15,2x,12","hyd":"re,71,7","hyl":"rn","hym":"xd","hys":"h0,81","hyt":"v9","hz ":"28,34,8k,2l","i a":"nz","i c":"q6,1,1","i k":"ml","i l":"ok","i r":"i5,5c","i s":"bg","i u":"ml","i w":"qs,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ia ":"25,4f,z,2w,1e,2e,5h,2y,6,c,x,z,2k,u,23,7,12,1,1,7,20","iac":"6l","iag":"5u","iah":"53,co","ial":"22,1p,31,30,4,6,19,5,2y,25,3s,o,1e,3e,4d,8,1b,q,10,e,1,1,1l,15,2","iam":"2g,1,1,1,1,1,h,ay,1,1,1,1,do,3d,3c","ian":"14,2j,3a,1,31,40,7m,1,5y,3u,d,2n","iar":"6r,h,w,8,b,g,41,20,5u,3,3v,l,g,g,s,1e","iat":"9g,b,8","ib ":"68","ibb":"1b,j","ibi":"70,ev","ibr":"oq","ibs":"ci","ic ":"1f,19,22,c9,j,f6,h,2w","ica":"48,7c,3,50,1,ha,1m","icc":"k7,82","ice":"7v,1,1,1,1,2f,5a,15,2l,55,1,1,1,b4","ich":"i,z,1,o,1,e,1,59,1,1,1,1,1,1,1,1,1,h,1,1,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1p,1z,18,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,6,3e,q,y,1n,1o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,q,1,1,1,1,1,1,1,1p,8,6,2f,2,1,m,5,t,f,1,e,v,20,2,2,3,1,e,1","ick":"z,1,10,7,1,1,1,1,1,1,1,1,2,a,f,5,2,d,z,16,17,13,4,1,1,1,2,1,1,e,d,1,4,2,6,f,10,q,3,8,h,17,1,1,1,1,1,1,1,1,5,c,b,1d,4,b,k,7,1k,b,19,u,r,1t,p,p,5,3,3,1,1,1,2,1,1,1,3,1,1,2,c,t,1b,p,2,25,8,7,1,6,u,5,e,14,1a,d,n","ico":"43,9","ict":"25,5e,2w,1e,7v,34,c,1w,1t,1l,23,7,3b","id ":"oq,1m,2e,7h","ida":"2w,c0,e5,16","idc":"t9","idd":"8,l,3e,l,1,22,4s,4,40,i,1s,1a,1,1,b,1v,1c,4d,5d","ide":"c,a,3j,1i,y,2h,8,6,3,b,39,5u,j,1,e,3,14,43,1e,7,v,l,6,4,a,2,1,2,2,2z,8,5,38","idg":"4,1,2,2,3,f,h,e,e,1y,f,j,4,1,8,8,e,e,1f,4,1c,1v,f,k,o,m,e,c,9,j,2,l,2g,4,7,2,k,2d,1c,w,6,1e,b,1p,h,m,29,3u,9,1e,3,1,2,2,8,1,1,7,b,1,2,1","idl":"0,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,2,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,2,1,1,2,1,1,7e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,19,1,1,1,2,2,8,2,1,5,3,1,1,1,2,3,23,4,1b,31,1,1,7,57,46,41,1","idn":"mr,55","ids":"55,17,1,4,11,a8,33,4,26,81,2a,3","ie ":"2v,1,1,p,6,2,1,1,1,1,b,g,6,f,6,a,4,b,2,d,1,7,1,1,1,1,1,1,1r,5w,a,1,1,1e,c,1,1,1,1,1,1,1,1,1,n,2q,1,2,1,1,1,1,1,1,1,6,1,2,e,a,1,1,1,1,1,1,x,1,1,1,1,2k,r,5j,18,3f","iec":"yi","ieh":"hl,s,3,1","iel":"2w,2,u,m,2,12,2,c,2n,c,1,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1t,1,1,1,1,1,1,1,1,1,1,1,1,1,1,x,14,i,2,3u,l,6,7,7,e,9,5,6,l,h,j,j,a,1,1,3,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,3,1,1,2,2,7,1,o,c,6,l,3p,1,35,1,1,1,1,n,1,2m","ien":"2f","ier":"8z,1d,5,s,v,7i,r,83,1,1,1,1,1,1,1,1,1,30,3e,10","ies":"51,d3,37,6v,4h,2,1,g,1","iet":"h2,dg","iev":"3f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2g,1,1,1","iew":"16,ml,2i,8g","if ":"y1","ifa":"nb,s,5","ife":"3k,q,b,5,cc,1,1,6,2r,by","iff":"5f,21,1q,56,3,4k,q,1k,62,5p,1,h,1,3,2,3,1,j,13","ift":"64,6r,2a,4y,1,2,1,6v,1x,47","ig ":"6j,8x,5o,1d,3d,1m,32,32","iga":"47,1w,1,25,c,4u,13,1r,3t,1,1,3,29,6,f,2d,h,u,a,19,1,1,1,2r,3a","igb":"9a","ige":"7y","igg":"35,v,1e,b,cg,8f","igh":"c,e,b,1,d,d,2,4,1,1,a,h,4,16,3,i,8,4,4,5,27,b,5,w,2,d,4,e,2,1,7,9,2,2,a,3,g,3,7,3,l,3,5,9,1,i,2,c,1,2,3,8,4,1,8,1,1,1,2,2,9,9,g,1,6,6,8,1,14,2,1,7,l,7,1i,4,e,e,27,6,3,1f,9,4,3,y,9,2,a,1e,2,4,2,7,y,c,6,d,7,5,b,5,2,2,2,8,1,1,5,3,3,1,g,3,n,5,v,f,7,1,u,1,9,3,3,1,1,1,3,j,d,4","ign":"6k,rv,1,1","igs":"60,ao","iha":"7k,fl","ihu":"a1","ija":"zh,1,1,1,1,1,1,1,1,1","ike":"ly","il ":"bl,ao,2o,1a,1,58,2d","ilb":"59,e,c6","ilc":"s8,5w","ild":"1,27,a8,1g,cd,c,30,s,23,1,4,40","ile":"6,40,7,e,6,1,89,1j,3d,7r,p,7,4k,w,3q","ilf":"bj","ilg":"h6","ilh":"9z","ili":"3y","ilk":"cx,i","ill":"2,1,a,1,5,2,d,1,1,4,1,4,e,2,4,e,9,1,1,1,1,1,3,5,3,6,u,d,1,2,11,1,g,14,b,2,6,y,5,5,e,3,8,c,6,3,c,1,a,n,1,4,1,1,e,2,18,f,b,6,1,1,1,1,8,3,6,6,5,c,9,a,1,1,1,1,1,1,1,1,j,9,2,2,i,z,o,b,h,1u,5,1b,b,g,4,d,5,7,d,4,h,e,6,1m,2,1h,3,i,d,2,1,1,1,1,3,p,3,c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,i,5,4,d,b,j,5,f,n,1","ilm":"6c,y,dl","iln":"5g,a","ilo":"56,v6","ilp":"36,ck","ils":"1o,gk,47,15,38,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ilt":"5p,5u,4u,85,l,4,50,43,2","ilv":"3v,2,jc,3,1,j,8","ilw":"8i,h6,33,6y","ily":"tp,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2z","im ":"h6","imb":"5x,1,1,1,1,1,cq,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,eg,12","ime":"2k,4v,7,1,1,1,1,1,1,1,1,2d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2r,43,4h,1,1,1,1,1,1,1,1,1,1,1,93,1,b,24","imi":"fo","iml":"p","imp":"1q,1,1,1,1,1,1,1,4j,7p,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,64,3,2","imr":"f8","ims":"ab,ak","imz":"nu","in ":"7,2,23,2f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,5,6,1,1,8,20,n,l,1,o,g,g,c,24,6,17,1a,8,5,b,2,2,1,y,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2s,3c,5,1q,3,t,1z,4,2n,1b,e,c,v,22","ina":"f2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","inb":"38,1,1,4,1,1,1,2,6,1,1,1,1,5,1,1,1,1,1,1,1,1,1,2,4,1,3,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,s,9c,1,1,u,7,h,1,1,1,1,4,1,1,1,1,3,1,1,1,1,1,1,4,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,1,4,1,1a,1,4k,bj","inc":"1i,j,11,18,28,s,j,q,6,3r,9,d,b,3,12,p,c,26,31,4v,d,5,28,1l,15,u,r,3u","ind":"14,1k,2,8v,5b,5l,5,f,4f,1w,41","ine":"i,1m,1,1,h,1,1,1,1,1,1,1,q,5,p,1r,h,c,h,7,r,d,s,1r,1q,y,1,1,s,2,1,18,1,1,1,1,1,1,p,d,2r,c,19,q,n,10,e,y,o,o,27,14,p,1,1h,j,1,1,1v,y,y,8","ing":"6,7,4,e,a,2,g,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,t,m,v,1,j,4,w,1,1,4,5,1,7,7,1,1,c,1,1,1,1,1,1,1,c,1,1,1,1,4,1,1,2,7,1,3,8,5,1,1,6,3,1,1,4,3,3,2,f,1,u,3,5,3,4,5,3,b,4,7,t,1,3,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,g,g,k,i,m,1,4,1,3,c,a,a,1,c,o,4,3,f,1,1,q,b,2,1,j,k,8,m,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,2,1,1,g,1,2,1,1,3,1,1,1,1,h,9,6,7,b,6,5,4,a,b,1,b,7,5,2,6,4,6,b,1,7,7,1,d,3,8,8,9,1,1,1,1,1,4,4,1,w,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,3,6,4,1,3,7,7,q,8,r,6,1,1,1,1,1,1,1,1,1","ini":"48,4,4v,e2,5s,p","ink":"51,11,c2,6g","inl":"k7,41","inm":"sg","inn":"9,2,1,b,2,7,a,2,f,g,p,9,6,c,7,e,9,7,l,t,7,q,1q,g,5,o,d,1,3,4,6,1,5,3,8,a,3,9,v,7,c,e,2,y,l,11,k,9,c,j,3n,6,j,5,7,m,o,9,u,7,2,v,t,2e,h,1m,1,4,1,o,1,13,c,p,6,g,1i,1,5","ino":"ul","inr":"4k","ins":"8,l,4c,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1r,3c,o,4,26,1g,d,3,1,c,4,1,1,1,1,1,1,1,1,1,1,1,1,14,b1,42,2g,d,11","int":"f,1,o,5g,j,1,1,12,1f,1d,m,87,e,4n,h,37,7o,1","inv":"is","inw":"l5","io ":"7c,1n,82,h1,1,1,1,1,1,1,1,1,1,1,1,q,1","ion":"f,6,6,8,o,x,8,14,1u,m,4,e,5,k,8,8,m,j,9,3,b,8,2,m,5,7,m,11,6,y,e,e,2,1i,1c,e,m,2i,h,5,5,w,g,5,14,9,1e,s,8,y,a,1,q,b,4,1,5,2,2,7,1,s,13,l,t,2,a,6,r,r,9,7,m,3,1","ior":"1l,f9","ios":"101","iot":"10s","iou":"80","ip ":"c,1t,1l,e,36,31,5a,1m,2h,af,14,18","ip1":"es,l4,2,2,d","ip3":"zz,r","ip4":"10f","ipe":"3n,e8","ipl":"sv","ipm":"8o","ipp":"a8,f,f6,8f","ipr":"hk","ips":"71,3o,1p,14,3l,12,2v,5k,9d,3,f","ipt":"3,19,fz,77","iqu":"6r,hz,1m,1p,p,1u","ir ":"27,1v,1e,3z,4d,2,as,17","ira":"8y,jp","irb":"28,4y,6q","irc":"2c,6z,2,2v,3t","ird":"7","ire":"8,2,a,2,6,1,3,9,2,a,4,4,k,e,2,1,1,g,n,1,1,1,j,y,4,1,2,3,r,3,b,1,2,5,1,1,4,1,3,4,7,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1b,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,2,2,1,1,1,1,1,1,2,3,1,1,1,2,1,5,2,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,b,3,1,4,4,1,3,3,1,e,10,2,d,3,3,1,1,2,1,h,9,m,1,2,6,1,c,1,9,1,3,8,1,4,3,1,3,2,d,1,r,1,1,1,1,1,2,d,1,2,9,j,3,8,2,1,1,1,1,1,1,2,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,4,1,1,2,1,1,1,1,1,2,1,1,1,1,3,1,1,1,1,1,1,1,2,1,1,1,1,1,5,5,1,1,1,1,5,2,1,1,1,1,1,1,2,3,1,1,1,1,2,6,2,4,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,5,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,5,1,2,2,1,1,1,2,1,1,4,1,4,2,2,4,2,3,1,1,1,1,2,7,8,1d,17,2,1f,1,2,a,1,1,i,1,2,1","irg":"48","iri":"6n,1g,2t,2i,64,5c,3e,41","irk":"28,3s,11,5s,13,d,5,2a,7,7,1,1,k,1,g,1z,w,5j,3,24,7t,1,1,1,1","irl":"60,ao,10,6c,50","irm":"h,o,7x,4,8,6,a,1,5,1x,5,6v,1,9k","iro":"sf","irr":"8c,h5,3f,1","irs":"15,2p,1,1,1,7p,51,1,1,1,1,1,1,1,1,1,n,6n,22","irt":"dl","is ":"9,33,3o,s,au,39,9a,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1,r,2g","isa":"10f","isb":"5j,s9,k","isc":"nd","ise":"o5","isf":"xr","ish":"1r,i,1g,1z,1,e,k,1g,1y,v,1p,t,h,h,2a,b,2l,l,2q,21,3e,1j,3,2f,15,2,1d","isi":"1y,1,1,1,1,1,9,o,c0,11,gz","isk":"17,69,at,fi,17","isl":"25,dt,3q,7w,2j,1n,1,1","ism":"ia","iso":"33,1,1,1,1,1,1,1,1,1,1,1,6m,7m,k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a","iss":"bi","ist":"3i,1,n,2,g,d,8,1l,1b,4,4v,9,1s,p,14,16,1,u,1,c,26,2s,d,r,3j,s,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1b,1f,1,3,1,1,1,1,1,1,1,1,1,1,9,4,1,3,f,d,3,4,e,5,1,1,6,k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","isu":"hc,1s,46,63","it ":"19,3i,j,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,p,c,1,1z,18,3g,1p,10,1,1,1,1,1,1,1,1,1,1,1,1,1g,w,1m,h,k,1,1r,p,24,1,1,29,w,2j,6,1,1u,y,1t","ita":"6n,7k,iu","itb":"rs","itc":"5r,3k,6,l,1s,2j,1x,7y,1,1,1,1,1,1,1,1,1,1,36","ite":"r,z,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3r,a,2r,3,h,n,13,j,1,1,z,1,1,1,1,1,1,1,1,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,59,8l,16,i,1,j,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1o,1,1,1,1,1,1,1,1,1,n,6,1,1,1,1","itf":"ee,ed","ith":"1y,1,1,1,1,1,15,j,w,g,3,2,13,1f,6l,3h,2,t,40,22,1,1k,27,3r","iti":"a1,jq,39","itl":"wx","itm":"10l","ito":"x,kw,9m","itr":"kg","its":"9l,40,bf,8r","itt":"a,28,3m,4f,1c,27,2c,1,1,5y,2x,60,18,1b,o,1,x","itu":"z,gt,iy","ity":"1c,w,x,l,c,1y,k,1,22,k,4p,2s,j,7y,s,9,1,1,2,3e,2,3t,5","itz":"qb,4e","ium":"fm,5n,36,9a","ius":"bt","iv ":"4w,4,ad,2k","iva":"ql,7e","ive":"p,3,1g,59,1,1,1,1,8,1v,o,s,q,22,d,i,4p,1,1s,2,13,1,1,k,1,1,1,1,1,1,4,1v,7,6,15,3,1g,6,4,c,1,i,d,9,1y,10,1g,1g","ivi":"yo","ivo":"n7","ivy":"98","iwi":"xo","ix ":"24,a,6h,4t,2j,in","ixt":"la,7m","iza":"3k,dq","izz":"1v","j 1":"3x,f,41,cn","j 2":"4x,3h,h5","j 4":"3b,1l","j 7":"3q","j a":"20,1x,23,b,mx,2n,n,e","j b":"bl,3z","j c":"71,dy,aw","j d":"8d,1,32,5,9,7,3,13,cc","j e":"3q,16,1,3,c1,6,q,42,7y,b,6c","j f":"ov","j g":"20,d,j,1,7,7,10,1,1z,h,3i,7,o,3,2d,4,o,j,1,1f,2j,34","j h":"71,1c,cm,99","j j":"1b","j k":"4w,1,3,1s,1,8r,s,a,1b,y,j,23","j l":"6t,cl,23,4t,b,x","j m":"d7,bo,2","j n":"2d,bc,2x,89,2","j o":"3q,db,6,ab,1q,p","j p":"2w,1,bz,1,n","j r":"34,7,mz,63,i","j s":"c1,3,29,a2,26,8c,1,1m","j t":"1b,8z,7,o,3,cs,6,87,5,d,1","j u":"dl","j w":"8e,32,e,c6,6,9,14","ja ":"32,p,5d,gq,9r","jac":"u,4c,12,e,1,1,1,1,1,l,1,1,2,2t,8h,19,18,1,1,1,1,1,1,1,1,dd","jag":"pr","jai":"7f,7,1,1,1,1,1,1,1,1,eu,1,1,1,1,1,1,1,1,1,1,1","jam":"23,4n,4i,11,3i,1,1,1,1,1,1,1,1,5g,y,8g","jar":"7g,sh","jas":"un,1,1,3,1,1,2,1,3,2,1,2,1,1,1,1,1,1,1,1,5,1","jau":"zh,1,1,1,1,1,1,1,1,1","jaz":"68","jb ":"1x,w,10,31,af,y,3b","jd ":"2k,3a,37,53,66,8p,4l,2h","je ":"7a,5s,6m,4e,x","jec":"8x,py","jel":"uk","jer":"53,co,cq,2q","jes":"gn,1,b4","jf ":"al","jg ":"4v,9x,7s,7c","jh ":"jx","jit":"lt","jj ":"ah,og,1","jl ":"7x,x,dn,3o,6w,1j","jn ":"7e","joe":"85,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,g,fr,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,5w","joh":"7,1v,15,1b,13,2s,56,1y","jol":"fk,fe,5e","jon":"2g,1,1,1,1,1,h,36,e,1,1,1,1,1,l,1,1,2,6k,1,1,1,1,73,1,1,1,1,1,1,1,1,bo,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1","jor":"jy","jos":"1a,1,1,1,1,1,1,1,1,1,1,1,1,1,5u,1,1,1,1,et,1,1,k,1,1,1,1,1,1,9t,3p,1,1,1,1","joy":"um","jp ":"ca,20,cs","jq ":"36,1c,h,5n,7e,r,5n","jr ":"47,i,77,4d,5o,eb,5","js ":"4o,5v,s,5j,49,1o,6m,6z","jt ":"19,5d,3h,44,37,4x,2e,1,1x,1d","ju ":"1d,3r,72,5i,2e,5n,5q,j","jub":"6,d1,1j","jug":"ip,c6,3b","jun":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,1","jus":"57,bm","jw ":"13,1c,fj,ae","jx ":"dy,31,dn","jy ":"n,hc,5h","jz ":"1z,6b,q,8b,2h,l,4,4y,4s,1c,2h","k 1":"63,6e,4b,1z,8u","k 2":"1h,7r,6m,45,79,7,5d","k 3":"u3","k 4":"ra,1,r","k 5":"ea,fm","k 6":"2f,ad,v,6u,6h","k 7":"d8,7z","k 9":"vu","k a":"3u,1,1,1,j,16,w,r,9g,1,1,2,1,q,18,4x,4,4o,h,a,2,5,8,s,h,o,1,1","k b":"1p,g,3,1s,1e,3,3,5,6,34,1b,1b,h,d,6,1b,4x,1,1,2,2,1,19,1,w,18,a,c,1c,3,1,4q,3,2,m,1,1,q,4,8,4,5,3,4,2,4,1,1,20,g,1,5,2,1,c,1,a,2,3,3,2,1,1,3,4,3,c,a,1,g","k c":"w,2s,41,1,1,e,4,1,1,1,2,1,1,7,7,2,1r,1d,1,3,6s,6,1,12,s,2,1,1,1,2,18,b,5,1,1,f,1d,s,1,1,1,2,1,1,1,3,1,1,6,8,36,8,b,q,7,8,7,5,5,a,1,1,1,1v,k,k,r,7,4,n,1","k d":"3i,2,2s,5,1r,9,3s,2,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,35,5,3,1,e,9,w,p,1,1,v,36,1,4,1,j,1d,3,1,a,3m,25,g,1,1,1,1,2u,1,y","k e":"1d,1v,1,1,4,1,1,1,2,6,1,1,1,1,5,1,2,1,1,2,1,1,2,4,1,3,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,e,50,58,7,h,1,1,1,1,4,1,1,1,1,3,1,1,1,1,1,1,4,1,3,1,1,2,1,1,1,1,1,1,1,1,1,1,e,1,4,1,k,q,1,2i,7c,t,3w,1,b,8","k f":"60,16,9i,10,1,br,1,1,p,18,1n,t,1,e","k g":"33,1,1,1,5,1,1,v,3,1,3,3,1,r,1,4,1,a,1,1,1,2,1,1,1,1,3,u,3,1,u,2d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1f,3i,1,1,1,1,1,2,1,1,1,1,1,z,l,1,1,1,1,1,1,1,1,2,1,3,1,1,3,1,1,i,1,q,13,h,3,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,k,1,1z,1,4f,8","k h":"4,13,10,3b,x,c,1m,5,3v,1h,92,3,h,n,5,9,1,16,42,1,4,6,3,t,f,3a,s","k i":"23,6y,16,4l,9m,6w,2u,1s,2,1,1,d,2,b","k j":"37,2e,ow","k k":"72,a0,1,1,11,12,hk,1","k l":"1j,40,b,19,s,2,1,7,k,1,73,1,37,3,a,1,1,1,p,1n,q,1e,4,4,1,1,2,1,1,2,1,2,3,1,o,q,1,k,27,16,k,3s,o,1,1,j,4,i,4,1,3,1,2","k m":"44,21,1,1,1,1,1,1,3,5,1,2,1,1,1,1,1,1,3,2,1,6,8,1,1,2,1,1,1,1,1,b,4x,47,2b,1,1,5,6,k,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,b,1,1,1,1,1,1,1,1,1,3,2,1,w,1,1,b,7,1,1,1,1,3,1c,i,4,5,17,27,2e,v,1,1g","k n":"1b,w,1,1,1,1,1,1,1,17,1,1,3,3f,v,1,1,1,1,2,1,c,1,1,1,1,1,3,1,1,2,2,4r,1,1,1,1,1,1,1,1,e,1r,16,2c,1,1,u,32,16,1,1,1,1,1,1,1,1,1,3,1,1,1,2,1,1,4,1,h,1,1,1,1,1,3,1,1,1,1,5x,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2e,4,1,t,2,2,4,1,1,4,1,1,1,1,1,2,2","k o":"1c,7,1n,39,2,d,59,9f,51,2u,7,2,2,u","k p":"4k,4e,2,21,1f,76,4,2,3s,5p,14,l,9,2r,2,f,1,4,1,1,1,1,1,3,d,n,w","k r":"1e,2,43,2,9,z,d,1a,w,n,10,78,1g,3,e,1d,y,6,o,2d,3s,p,g,2,5,k,h,r,1k,5,1h","k s":"a,8,n,2,a,2t,b,5,j,r,l,g,r,1,6,6,b,9,p,4,1w,c,3,2,6,3,7,45,8,n,d,5,1x,1,1,1,3,13,1,5,1q,3,c,1,3,1,3,1,2,1,1,1,1,1,1,1,1,1,1,3,1k,4,c,1k,1q,e,3,3,a,4,4,2,b,1,4,2,6,2,2,5,9,b,q,1,1,1,1,1,1,1,1,1,1,i,w,2,3,s,i,2,1,9,6,1,1,j","k t":"2e,4x,3p,1i,8,9,p,3b,2v,1,aj,2g,10,3,2,2,g,b,14","k u":"28,34,1,n,g,64,1c,w,1w,10,1,1v,1l,82,6m,2,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,a","k w":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,3z,f,1,9,t,1,1,2,5,7,1,1,1e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,m,n,1,1,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,3,1,1,1,1,2,39,3d,2,r,8,5,1,1,3,r,1i,6,3,1,1,a,y,1,2,2,4x,b,o,5,3,1,2,k,8,5,1n,1,1,16,14,1,2,5,3,e,6,b","k y":"91,59","k1 ":"7s,1,9w,3z","k10":"79","k13":"7u,f3,1,1","k14":"re","k15":"rc","k17":"mo,2f","k2 ":"p7","k23":"7q","k4 ":"7i,fl","k7 ":"mw","k8 ":"60,1r,8x,10,a1","k9 ":"7a","ka ":"34,1,rl","ka3":"5j","kab":"kk","kai":"zh,1,1,1,1,1,1,1,1,1","kat":"65,2,d,1,7,1,1,1,1,1,1,db,1,2,1,1,1,1,1,1,1,6,1,2,e,a,1,1,1,1,1,1,x,1,1,1,1","kay":"4x","kbe":"28,bo","kbr":"3y,90","kbu":"3h,do","kca":"h2,1,1","kcl":"4c","kde":"y7","ke ":"1s,1k,5u,4g,50,3c,5j,k,v,a,1z,l,1l","kea":"17,3b,ug","kef":"kb,9,5,3a,1,2,2,c8","keg":"10p","keh":"2i,bk","kel":"ax,fh,1,1,1,1,h,1h,1,1,1","kem":"j5,bo","ken":"z,1,10,2,7,6,f,3b,4g,3a,2,c,4,1,z,7,2m,o,1,c,85,x,i,b,z,k,5,1,4,4,2,3,a,1,f,1v,2x","ker":"3,3v,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,31,1m,10,2h,h,1h,s,p,13,3,1z,g,20,3y,1,40,5s,a","kes":"7l,3f,1x,i,9r,s,54,m","ket":"2p,1i,i,3,2,1w,w,4,5,1c,d,w,w,1b,6,l,14,1d,e,1s,35,9,b,w,f,7,4,a,1b,6,1l,j,2,4,1,5,f,w,1,1,r,1x,1,2,e,12,1,c,2b,7,t","kew":"ce,1","key":"au,24,7k,k,1o,l,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,14,4,b,60,1,3k","kfo":"b0,3o,ku","kfr":"6r","kha":"2h,l,az,cl","khi":"gv,88","kho":"hb,30,1l","ki ":"ok","kib":"1b","kic":"h0","kid":"8,l,au,4","kie":"51,d3,3c,ba","kil":"36,2h,ml","kim":"5x,1,1,1,1,1,cq,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","kin":"17,j,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1i,2i,2t,1,s,x,5,7,8,m,t,4,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2l,2c,1i,2g,4,l,12,6,7,q,2i,2f,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,3,l,15,x,1,1,1,1,4,1","kip":"hb,77","kir":"3u,1,1,1,23,11,9m,1,1,1,1,1,1,1,1,1,6,1,1,f,5,1,g,1z,w,5j,3,24","kit":"2i,2s,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,86,b,1x,1,1,1,1,1,1,1,1,1,1,1,1,fx","kiv":"yo","kiw":"xo","kka":"uq","kla":"9b,6u,7v,1,1,1,1,1,1,1,10,8y,2d","kle":"1e,13,3l,3h,4i,96,bj,b","kli":"i5","kma":"2r,x4","kme":"2l,67,h9","kmo":"a2","kna":"os","kne":"dm,26","kno":"1q,78,11,2l,6,4j,9,3n,1d,6p","knu":"72","ko ":"33","kob":"zb","koo":"ml","kpo":"7s,1,dk,51,1,1,1,1,3,8,4,1,4,1,14,d,1,1,1,1,1,9,1,1,1","kro":"o7","ks ":"2l,45,c,1x,d,x,32,1h,1d,3u,19,7,5a,1s,t,2n,o","kse":"mr","ksh":"2p,2p,a,1f,12,3,1,1,1,1,2,1,1,e,2,2t,3,8,2a,9,l,1f,3,p,10,i,9,4,3,6,8,3,3h,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,q,3,2,1,1,1,1,2,1,1,1,3,1,1,e,15,1k,1,b,8,y,1","ksi":"zh","ksm":"eb","kso":"u,3v,h,12,e,1,1,1,1,1,l,1,1,2,ba,2h,1,1,1,1,1,1,1,1,7j,2","kst":"fu,fl","ksw":"ct","kt1":"g5,e4","kt2":"26","kt3":"jw","kt5":"ju","kta":"bl,dc,1a,1,58","kto":"jv,cr,7","ku ":"wm","kud":"y0","kum":"a5","kvi":"7h,91,6k","kwa":"x4,2f","kwe":"br,l0","kwo":"rf,31","kwr":"8s,h9","ky ":"1r,5p,el,7d,3i","ky1":"3k,q,b,5,cc,1,1,6,2r","kyl":"4r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3s,8j,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","kyn":"i9","l 1":"e,5,26,15,j,1a,43,7,1h,26,8,3l,2y,3p,6f,3e","l 2":"22,1u,1z,39,3h,3d,2e,22,42,12,7w,x,1b","l 3":"7h,8v,6q,74,58","l 4":"14,6s,8n,7r,3l,32","l 5":"2,6q,ee","l 6":"51,1s,8c,6c,el,4","l 7":"1r,f0,5p","l 8":"5h,3j,pm","l 9":"ff,1x,f1,2t","l a":"11,10,1t,m,v,m,6,17,9,k,ee,n,1q,3j,13,1e,2,10,t,8,1u","l b":"4,d,i,o,2i,1c,1,3o,8,c,b,a,8,w,4,2,11,2j,5,7,1k,1y,1,26,y,u,1z,1a,1,3j,1c,d,1i,1,3,2,1,1,1,1,1,1,1,1,9,4,1,3,d","l c":"6w,t,l,2,k,n,9,4,6,e,h,e,8,27,1x,j,5e,t,g,1,18,x,4,c,2,a,g,1,f,10,f,u,1,x,a,7,13,6,3,9,15,1,p,1,2,2p,2","l d":"3,u,s,3,71,1,1,1,l,2d,1,g,q,5,a,c2,k,3,6u,16,f,r","l e":"3,14,2r,f,1,n,2p,7p,1r,y,3k,d,2,7m,3o","l f":"h4,9a,1,1,1,1,3,8,4,1,4,1,14,d,1,1,1,1,1,9,1,1,1,54","l g":"2,1z,6,2,2,1n,f,12,2,3,2,9,8,1h,9,27,r,9,2u,1,1s,32,n,14,s,g,d,2,e,f,9,76,2q,2,a,3a","l h":"y,1l,2t,2,52,28,1f,2o,5d,1i,1w,3j,1,n,3,5,6c","l i":"19,fm,6t,ag,24,1","l j":"1h,63,5,4,c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,cc,1l,1,2,9,23,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,4s","l k":"51,i,c,11,b8,s,g,28,9u","l l":"1t,e,m,4i,m,1s,c,t,f,3,4,23,b,x,h,r,u,s,1v,1,49,h,22,5,1,1,1,1,3,5,3,4,1,4,1,k,j,1,5,4,4,1,1,1,1,1,3,1,5,1,1,1,1,a,d,7,2z,z,t","l m":"4r,7,22,x,42,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5q,1d,1,2e,2,1p,1h,14,j,1g,6,4,c,1,30","l n":"27,2,2,6i,25,2w,1,1v,39,h,3,40,z,a,1a,7b,7,1g,19","l o":"3e,2p,2b,44,4m,1k,33,2a,1i,1s,r,r,f,f,3t,28","l p":"v,1o,32,6e,24,12,a,8,21,7k,3f,1,18,1z,2q,3","l q":"kz,cq","l r":"j,2,c,1m,2q,4,1,3f,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,g,1s,1,1o,7,5,4a,b,k,1r,2m,25,5,1,6,1,j,3e,4,x,1n,d,1","l s":"f,12,l,m,13,t,17,8,14,18,7,9,5,15,o,m,a,5,1,4,g,2v,14,23,3,1,j,h,v,6,5,1w,r,9,e,l,r,7,8,c,1q,n,1p,v,1a,3,6,j,i,c,r,r,m,8,1","l t":"10,h,1c,4g,m,1,1,1,1,1,1,1,1,1,t,i,1l,1q,1o,7a,2v,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7n,8,g,h,1,1,1,4,u,4,1,1e","l u":"15,5g,2c,68,3u,1,78,6q,1,3,2,1,1,1,1,1,1,1,1,9,4,1,3,1,1,1,1,4,u,4,1","l v":"25,og,3s,4c","l w":"d,c,c,n,18,4e,1k,9,e,1x,i,s,28,40,t,22,i,3w,48,2n,e,21","l y":"2g,bk","l1 ":"8y,2,17,2,4,b,1,4,1,2,6,6,91,1u,1,1,1,1,3b,u,e,k,p,1,6,6,4,c,x,3,46,2,k","l10":"r7","l11":"am,ce,4m","l12":"5e,rp","l13":"ax,nz,1","l14":"aj,k,nv","l15":"al,g,c","l16":"ag,c5","l18":"ay,gp","l19":"ys","l2 ":"5o,53,e,5,59","l20":"91,19,q","l22":"rl","l24":"jh","l3 ":"b7,av,c,7o","l30":"jg","l37":"st","l39":"qj,27","l4 ":"2q,89,c,a,fo,7c,1,1,1","l5 ":"8d,1y,4,2,n,5i,d5,4y","l50":"ac,2,4,2,m,3","l55":"a8,f","l56":"aq","l57":"q6,1,1","l6 ":"ka,1y,5l,l","l7 ":"av,h","l9 ":"l6,s,1,1,1,5c,7s","la ":"q,7h,1d,1h,27,1w,1,m,1,1,1,1,1,1,1,1,4s,3s,r,1x,4h,v,1,e,1,1,1,1,n,1,f","la1":"qo,3,9,4,1z,1","la9":"t2","lab":"5w,5p","lac":"4,6,13,c,f,1,e,6,7,19,4,1,g,17,u,v,4,2,3,2f,4,2,2,19,8,o,6,1a,8,l,y,d,14,d,h,r,3n,p,4,a,u,h,8,19,1,1,1,1,3,8,4,1,4,1,4,7,t,d,1,1,1,1,1,9,1,1,1,a,b,1g,l,11,n,16,o,e,d,9,1,b","lad":"2m,8q,4o,ez,b,1w,1,2r","lag":"6i,g,eo,27,4j,1v,2,1,1,1,1,3,5r","lai":"3c,q,1e,d6,dx,1,22","lak":"f2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d6","lal":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,1","lam":"85,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,34,2,1,1c,8s,1t,1,1,1,1,1,1,1,11,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,79,1,1,1","lan":"0,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,3,1,2,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,2,1,1,2,1,1,i,7,3,h,7,b,6,o,2,8,v,5,5,c,a,c,7,1,9,1,1,6,1a,1,1,1,1,1,6,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,o,d,3,5,1,1,1,2,2,8,2,1,5,3,1,1,1,2,3,b,a,9,8,a,2,7,2,g,4,7,6,b,d,1,b,b,b,3,z,1b,1,1,7,6,1,3,1,7,4,4,3,8,4,c,6,5,a,7,3,1,b,d,h,2,q,3,8,h,1,9,3,n,l,1,1,1,1,1,1,1,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,d,6,q,o,3,8,e,a,a,1,1,2,1,1,1,1,1,1,1,2,g,s,5,6,1,2,l,8,9,k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2","lap":"9v,3o","lar":"5j,27,1b,47,bn,7,7i,24,1f","las":"l,21,h,1,1,1,5,1,1,v,3,1,3,3,1,r,1,1,1,2,1,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,3,4a,2p,2z,a,1,1,1,1,1,2,1,1,1,1,1,z,l,1,1,1,1,1,1,1,1,2,1,3,1,1,3,1,1,5,d,1,q,18,5v,4q,b,u,32","lat":"81,4u,4h,1,2,2,77,3r","lau":"8y,2,ou,1,1,1,1,1,1,1,v,1,1,1,1,1,1,3,c,1,1,1,1,1,1,1,1,1","law":"d1,ji,1","lay":"32,d3,2n,15,1a,29,1q,6o,3z,p","laz":"6w,4i,a6","lb ":"d,8k,9,5,2x,8m,2h,3j,81","lba":"pi,7,2d,1n,3,8,2","lbe":"1i,13,z,9a,4g,5h,5n,2g,7","lbi":"th","lbo":"14,4x,2t,a9,72,9,j","lbr":"q,r,3s,e,c6,1z","lbu":"44,79,5d,fs","lce":"bx","lch":"er,jd,1m,s","lco":"21,7s,5h,8t,45,4o","ld ":"0,j,5,x,2,8,11,2,8,m,m,2,x,5,2,c,8,c,r,1,e,4,t,3,9,1,f,o,n,d,16,3,5,x,p,d,2,3,1,c,2,2,e,a,3r,6,7,l,9,5,6,1,a,r,1,i,j,a,1,1,1,2,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,3,1,1,2,2,7,1,o,c,6,3,b,7,6,g,a,b,b,8,11,y,1,1,1,9,1f,1l,x,29,2,b,3","ldb":"1g","lde":"1,3z,15,24,6,7,2o,q,26,b,9,2,p,39,8u,5,2l,5,1s,2b,32","ldf":"ob,5a","ldh":"7e,f6,3s,u,4,33","ldi":"28,a8,1g,cp","ldn":"fr","ldo":"1k,ho,ch,4w","ldr":"be","lds":"a1,2,58,3h,15,4s,1,7q,1,4","ldt":"6u,eo","ldy":"h2,1,1","le ":"e,d,4,4,c,2,i,1,b,5,7,s,a,1,1,q,e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,c,3,c,b,9,5,1,b,c,4,5,1,1p,d,3,3,w,f,19,1,4,9,5,g,c,9,7,7,m,b,8,f,5,7,5,5,c,l,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1g,z,1,w,1,w,7,h,4,2,i,4,8,a,a,1,6,2l,6,5,2,m,e,c,a,4,12,1,h,6,1,2,g,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,t,m,4,8,c,1,8,1h,c","le1":"7v,1,gn,1,1","le2":"7x,1","le5":"je","le6":"om","le7":"7z","lea":"85,w,8,3t,9,a7,f,1b,4o,u,5,3,1,2,3,d","leb":"1y,1,vj","lec":"9,ay,5","led":"aj,9d,4,2i,52,3o","lee":"6,6x,64,y,l,4p,v,3p,2,4,1,1,2,1,1,2,1,2,2e,1k,1l,5o","lef":"ag,bh,35,9","leg":"1c,8p,3p,61,a0","leh":"ny","lei":"38,j,w,g,3,2,2n,1,1,1,1,r,8m,g,2,t,h,a,3w,19,1,1,1,1d,1y,1g,1,63,3,1,2","lem":"c3,hr","len":"2,h,2,59,17,kx,s,1p,u,2g,2c","leo":"3u,1,1,1,nx,6d","lep":"1w,7p","ler":"1u,8,13,e,5,14,12,2d,2b,b,27,4,i,3c,13,5k,1p,36,1,1,1,42,2z","les":"o,n,4,m,z,16,o,18,y,s,6,18,k,2n,s,1v,1h,2u,1,1,b,1n,j,1,m,22,12,9,c,1,1,b,1,18,h,2,1c,6,5n,g,d,1,6","let":"28,4n,50,21,33,2c,28,3o,21,i,70,b,q","lev":"b5,8q,1i,11,4,5x,18,2w,1,2","lew":"mv","lex":"24,e3,c9,q,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,72","ley":"7,5,2,a,1,3,1,4,6,b,1,6,2,2,s,2,6,a,9,2g,9,1,1,1,1,1,8,5,e,1f,p,8,4,4,6,a,r,d,k,p,4,g,7,5,7,b,h,2,m,a,w,s,1,1,1y,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,f,f,g,c,t,f,6,4,8,2,7,9,4,4,1,x,6,8,s,d,9,h,3,k,a,2,f,1,w,e,b,2,2,e,3,f,1h,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,8,l,9,1r,3","lf ":"4m,7w,f,7g,1l,1,1r,1,1,2,y,6k,1i","lfi":"mg","lfo":"6l,4y,30,2e","lfr":"aj,1z,t,1w","lfw":"4u,8j","lg ":"4t,16,25,4l,c7,6u,2w","lga":"3i,2m,dy,6x,16,3r","lgr":"h6,ce","lh ":"bo,2l,90,6k,4b,j,12","lha":"2g,bk,l","lhe":"4c","lhi":"9z","lho":"4a,4h,h9","li ":"8z,2h,fc,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5w,1,1,1,1,1,1,1,1,1,1,1,q,1","lia":"2g,1,1,1,1,1,h,3v,1,25,w,40,1,1,1,1,1,3,7e,1,66,3d,3c","lib":"oq","lic":"1f","lid":"t1,16","lie":"3y,b,63,x,3c,dl,3j","lif":"cv,2a,4k,1k,22,s,5,2u,9,1o,30,17,15,13","lig":"1f,2s,5z,63","lih":"a1","lil":"el,im","lim":"fo,gq","lin":"3k,b,25,y,h,7,x,6,40,d,b,3,1m,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,5,q,8,e,e,2d,9,1c,v,s,1v,p,5,5,1f,b,23,i,h,q,2,1,5,c,o","lio":"f,c,1t,4f,3o,5,7,1n,6,y,e,g,73,w,5l,15,6,3x,6,r,r,15,1","lip":"25,bd,66,af","liq":"6r,hz,1m,1p,p,1u","lis":"9,y,gy,5,1,99,1d,x,1q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1,v,k,h,5","lit":"3q,2e,4f,1c,5c,57,9,3o,7j,o,1","liv":"7k,bw,1,1u,1u,5,3d,3,1g,6,4,c,1,6y","lix":"la","liz":"3k,dq","lj ":"20,98,1z,16,9n,x,5b","lk ":"1c,1w,37,2,3q,4l,3v,x,6,38,v,6k,1g,2,u,1,33,2,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,a","lke":"cx,i,25","lki":"60,ao,10,1","lks":"vf","ll ":"2,1,a,1,1,4,2,a,3,1,1,4,1,2,2,8,6,2,4,8,1,3,2,c,5,5,3,10,h,7,h,8,2,2,1,3,a,8,4,1,1,1,1,2,1,1,9,1,7,1,1,1,1,1,1,5,6,2,17,b,4,6,3,8,5,7,b,a,b,3,5,f,2,3,1,c,3,2,i,1,9,2,g,a,3,b,9,7,5,c,5,c,2,7,9,8,1,7,l,2,2,9,9,8,3,g,8,1,3,1,8,b,c,8,i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,e,a,1,1,1,1,1,1,2,3,q,1,1,1,1,1,1,z,4,7,a,3,6,2,a,7,4,l,e,7,5,1,j,s,c,b,g,8,b,d,3,2,2,1,5,b,2,1,x,7,9,h,6,f,4,1,2,i,9,1,1,1,1,4,3,2,8,1,1,1,1,1,1,1,1,1,1,3,4,4,1,6,r,8,1,2","ll1":"rm,1","ll5":"q6,1,1","lla":"6i,g,s,b,k,1,1,1,1,1,1m,2p,e,2c,1,1,1,1,1,1,1,1,5n,27,v,14,1,1,1,1,1,1,1,48,2,1,1,1,1,3,2i,1,1,1,1,n,1,1f,12","llb":"1h,ib","lle":"2,h,2,2n,g,26,g,17,2f,m,s,1n,7,1,h,4,2s,7,1y,o,g,v,2g,j,11,z,s,1f,o,1,1,1,2p,2h,1v,o","llf":"mg","llg":"3i,2m,dy,6x,4x","llh":"2g,1u,2,9o","lli":"9,27,1,1,1,1,1,h,15,2,4u,w,d,x,7,2k,1,1,1,1,h,1o,22,6t,p,1p,a,1,d,13,1m,a,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1,1k","llo":"2g,1l,21,2i,5g,1g,i,2d,y,1h,5,59,65","llr":"bt,85,1,1,1,2x","lls":"18,3o,3j,6c,q,2c,62,k,15,26,2h,2c,f,34","lly":"8p,1e,1,h,2r,10,3,15,c,7h,2l,f,1,1,1,1,1,4g,23,32,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","lm ":"2u,3,1j,n,5l,49,2u,cw,d,2m,g","lma":"18,m6","lme":"iv,2i,31,1s,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,15","lmo":"48,cm,5o,bd,1","lms":"6c,y,4m,8z,cr,1x","ln ":"1i,t,3c,q,1z,9,4,22,y,3u,t,9,8,3z,9,3a,16,e,2,1,r,37,n,7,3x,h,1j","ln1":"8p,h9","ln4":"tw","lne":"er,cq","lng":"5g,a","lns":"8j,6,h9,5,3t","lo ":"41,b3,1,j8","loa":"5b","lob":"4t,2q,fl","loc":"23,ac,1,5,5,2,1,4m,5g,e,1s,81","lod":"5p,2j,31,x,47,3m,5e","lof":"cg","log":"3i","lok":"33,f8,y","lol":"f4,1","lon":"1r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,1,1,1,1,1,1,1,1,1,3t,49,1,2e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,8,8,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1c,1,1,6,13,6,7,3,1,1,b,5,4,1m,1d,1v,4f,k,5,6,2,1,1,1,5,5,i,4t","loo":"28,27,9h,2i,41,26,3r,19,z,2o,1u,d,1h,1","lop":"e6","lor":"56,51,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,47,1,2m,3i,h,11,1,1,1,3k,i,90","los":"3n,17,1y,12,3g,1v,d,9f,1,9,8y","lot":"73,3e,58,1d,9o,1g","lou":"2b,16,2u,b,1v,1q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,32,p,b,17,f,3t,2z,1q,3r,r,2r,7,5,v,24","low":"x,1j,3m,a,2,w,1a,2,l,8,t,f,24,19,s,o,i,4s,4,1,2y,23,8,48,1g,h,3u,4,1,3,1,1,1,5","lp ":"bs,77,e,8k,8a","lpa":"36","lpe":"cm,7b","lpi":"fq","lq ":"83,dm,35","lr ":"ee,29,5y,8f","lre":"uw","lro":"bt,85,1,1,1,2x","ls ":"18,22,1m,g,9,3h,1,5,2n,2a,m,o,2,2c,z,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3y,k,3b,1a,17,2c,f,34,2","ls1":"73,h3,1,4,3,2","ls2":"o5,4,1,3","ls4":"jf","ls6":"o1","lsa":"j,y,9x,6l","lsd":"8e,1,7t,9b,1","lsh":"l9","lsi":"ok","lso":"43,6p,ax,q,15,38,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","lst":"1o,cx,3n","lsw":"r6","lsy":"8f,h5","lt ":"j3,3l,5d,25,59,11,2","ltd":"79,2g,a,1h,bu","lte":"ac,2,6,m,jd,1,2q","lth":"j8,a4,z","lto":"5p,27,3,35,59,3w,1,1t,b,24,3,e,4,4,1f,e,z,1,e,1v,8,5,g,56,3","ltr":"6i,s,78","lts":"bj,bc,73,9,g,1,2v,r,2","ltz":"t1","lu ":"1l,13,f1,1j,7j,2d,1j,8","lub":"0,12,3a,1w,5,7,1k,6,k,j,7,3,1,3,1,4,6,4,8,i,3,4,1,4,2,1,y,o,3,7,4,3q,e,3e,11,4,1,e,16,7,2,6,6,5,9,3,4,7,7,4,8,b,1,1,d,6,3t,10,g,1,2,b,w,x,u,1y,1,1,5","luc":"uz","lue":"9j,6,3b,hl","lum":"ng,d9","lun":"8y,2,18,m6,1g,1,1,1,1,1,1,1,v,1,1,1,1,1,1,3","lur":"pc","lus":"vr","lut":"on","lve":"0,1,c,d,4,1,9,g,4,27,2,54,2j,4,8,at,k,3,1,a,9,8,2k,28","lvi":"om,bm","lvo":"om","lw ":"68,9,3i,21,1h,11,3,3s,4,3l,6e,1i","lwa":"8i,fi,1o,a1","lwi":"fo","lwo":"ju,3p,c,4w","lwr":"d3","lwy":"q6,1,1,1e,1","lx ":"3k,78,6i,a4,5l","ly ":"3a,5,3u,2,i,2b,h,14,2n,3,v,a,c,1a,1c,1w,1,2y,30,4,38,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,q,23,6,12,1u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","lyb":"dc,e0","lyf":"a3","lym":"8y,2,ir,67,2,k,1,1,1,1,1,g,9","lyn":"5l,8w,dc,8y,1","lyr":"2o","lys":"8p,cr,4i,g,1,1,2","lyt":"2t,hd,6a,2p,36","lz ":"7h,4,fh,4","m 1":"20,12,6c,y,41,5,3,c4,4h,3b","m 2":"h,bg,b1,y","m 4":"22,70","m 5":"hu,6d","m 6":"ti","m 7":"ak,m,3h,34","m 9":"9u,f4","m a":"2h,bk,g,1","m b":"2u,98,1v,8,9,c,f,21,1p,2,b,9a,2,4e,1,3,1,1,1,1,1,1,1,1,1,1,9,4,1,3,2h,b","m c":"3i,y,22,2o,e,1j,2,3a,3,9,t,m,53,42,2b,1q,2i,1,1,1,1,12,1,i,3,5,1","m d":"3i,97,q,if,1,1,1,1,a","m e":"53,5,98,4,t,1,1,3g,9","m f":"ej,2,2,it","m g":"2u,1,1,1,1,1,4k,2h,3j,e,b,3,2,8,2,8,1,1,1,1,3w,9,4,3w,38,y,26,1,1,15,d","m h":"1u,v,8e,33,3,d,8t,34,1,1,1,1,1,1,1,1,1z,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,20,29,1,2,32","m i":"ed","m j":"rs","m k":"26,7p,5p,l","m l":"1r,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,4,3,1,1,am,1,1,1,1,1,1,1,1,x,1,3,3,1,1,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,78,47,1j","m m":"63,1,2,3,1,1,99,4i,1,1,1,1,1,1,3,9,1,1,1,1,3,1q,1,1x,bc,10","m n":"80,1,1,1,1,2,1,c,1,1,1,1,4,1,1,2,5u,x,91,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,l,1,1,3,1,1,1,1,2f,51,3","m o":"2n,dh,a8,y,1k","m p":"ec,4l,7p,6n,4,5,7,2s","m r":"15,10,m,2c,27,3e,4g,z,1o,13,a,5b,21,q,4s,1b,1,16,27","m s":"6s,m,77,2,1l,1a,1q,q,1,1,1,5,9,1t,c,14,4e,13,b,1,1,44,2y,2","m t":"2u,kd,1,1,1,as","m u":"1q,1s,6w,3t,6,4l,cw,1,1,1,1,a","m v":"bt","m w":"2q,3s,8,5c,2g,6,4,45,2i,3w,11,26,7e,h","m y":"ea","m0 ":"zm","m1 ":"66,1,3,q,c,1,1,2,1,cr,3,3,1,3,1,1,1,1,1,1,1,1,1,1,g,n,1,m,2,i","m11":"6o,w,dn,1y","m12":"zk","m13":"6j,ek,1","m14":"ku","m15":"10m","m19":"ld,1","m2 ":"65,e7,8","m20":"6c,1,4,eb,4,1,fm","m21":"6e,b,e4,j","m22":"6m","m23":"76","m24":"6v,eo,5p","m26":"l9,62","m3 ":"69,v,f,2,c8,m,1,10,h,m,l,2,cd,14","m30":"lb,16","m32":"6r","m34":"6z,eo","m35":"r6","m4 ":"68,3,h,dl,3,1,1d,6n","m40":"6x,1,en,1","m41":"6g,ef,1,e","m43":"6q,ep","m50":"6k,1","m8 ":"6n,cv","m9 ":"j4","ma ":"ne,30,1,1,1,1","mac":"3u,1,1,1,67,dc","mad":"8y,3h","mae":"vh","mag":"4p,l,b1,ef,5,3,1,2,3,d,4k","mah":"ur,n,1,1,50","mai":"2w,29,7,3,2,6,1,1,28,n,1q,2w,6,17,d,1l,2,1,1,1,14,37,3h,1q,3,4x,53","mak":"7r,qe,1q","mal":"28,42,5e,24,4,2t,v,1,1,6,d,2h,5r,1p,2t,y","man":"12,1p,q,i,1u,a,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,4,2,3,1,2,1,1,2,1,1,1,1,1,5,1,1,1,1,p,5,7,p,3,y,2p,12,2t,2d,k,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,8,1,1,1,1,1,1,1,1,1,1,u,1,1,1,1,1,1,1,15,r,9,d,a,7,1,1,1,1,1,1,1,1,2,9,4,4,2,1,8,1,1,1,3,3,1d,y,l,g,21,1,h,1b","map":"ep","mar":"18,2,o,1,q,p,t,3,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,u,1,2,3,1,1,f,w,4,5,d,i,16,k,a,m,e,x,6,2z,3,b,3,e,1,w,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,j,1e,1,1,1,1,1,1,3,9,1,1,1,1,1,2,f,9,b,r,1,4,f,7,4,a,z,c,g,m,o,1,j,2,4,1,5,f,w,1,1,3,o,20,c,2,o,1,7,4,2,1,c,8,q,1,1,1,1,1,1,1,1,1,1,p,6,8,5,2,j,7,1,2,1","mas":"2v,1,1,1,1,1,1,1u,4,4s,3q,y,g,1,1,1,1,1,1,y,21,8n,m,17,4p,8,v,z","mat":"54,14,2p,4,1,3c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,45,5m,bg,1,1,1,1,1,1","maw":"p3,1,1,1,1","max":"ho","may":"5a,1h,nl,57","mb ":"m7","mba":"2l,l,5,5h,6a,38,2,f,7a","mbe":"2d,18,9,i,1l,1,1,1,1,1,23,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,1f,3e,h,g,46,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,3a,1s,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,d,d,59,2d,o,1,1,1,1,1,1,1,1,1,1,1","mbl":"9,2q,c0,4x,1,a8,13","mbo":"yd,12","mbr":"3n,3u,65,14,40,4c,4i,46,1,1,7,3p,3,1,2,a,1,1,i,1,2,1","mbs":"1f,yj","mbu":"vp,4","mby":"st","mc ":"9b,e0","mca":"6x,eo","mcc":"u9,1,1,1,1,1,1,1,1,1","mcd":"be,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","mcf":"jb","mcg":"4w,p7","mci":"n7","mck":"3y,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,bc","mcr":"6b","mde":"23,7,8d,36,1i,1","me ":"1z,5g,7,1,1,1,1,1,1,1,1,v,5o,70,1b,1,1,1,1,1,1,1,1,1,1,1,2z,1t,12,d,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2q,4c","me1":"ul,a,9","me4":"fk","mea":"5v,2q,2g,1o,7a,5w,5d,1u","mec":"hi","med":"6k,1,ov","mee":"7u","mel":"7w,3,v,fr,1k","mem":"u4","men":"2l,4j,1o,14,1c,v,dy,5,1,1,9,6,1t,4,1,1,1,1,1,50","mep":"yi","mer":"0,1u,q,l,m,6,3l,1k,q,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1y,t,5,7,23,h,17,o,l,1,1x,1p,3g,7,v,7,e,6,4,a,2,1,4,1d,2,m,36,a","mes":"23,3,j,8j,11,3w,2s,3g,3t,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,14,k,19,1","met":"98,f6","mfi":"a1","mfo":"6i,9h,71,4c,8s,1,1,h","mg ":"yk","mha":"5z","mhi":"j0","mho":"gm","mia":"53,co,dn","mic":"7v,1,1,1,1,1,1,1,1,1,z,2s,37,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8t,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7h,1,19","mid":"0,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,2,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,2,1,1,2,1,1,57,27,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,19,1,1,1,2,2,8,2,1,5,3,1,1,1,2,3,23,4,4c,1,1,7,6,1,1,b,1v,1c,4d,1a","mie":"c4","mil":"2o,1p,e,6,1,f,3,a,4,1h,14,34,b,2l,c,10,1,1,1,1,1,1,1,1,s,2,k,q,1p,45,i,o,4,d,26,1m,d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,12,w,p,u","min":"8,9,c,c,45,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,29,x,4,8,6,a,1,5,1n,4,6,5,x,3b,1,1,1,1,1,1,1,1,1,1,1,1,2b,1,5f,v,3,37,1h,5a,5,8,12,1,1,1,1","mis":"3j,4q,39,5g,8g,8d","mit":"a,5h,8k,1d,m,46,49,1","mk1":"p3","mk2":"p7","ml1":"5e","ml2":"5o,av","ml5":"gm","mle":"p,100","mli":"3k,dq,2r,bs","mm ":"b5","mma":"uq,5,3,1,2,3,d","mme":"3r,6,aj,23,dt","mmi":"5a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,ae,1,1,1,1,1,1,1,1,1,1,1,1","mmo":"10b","mne":"xd","mnk":"te","mod":"10b","moj":"lt","mok":"zb","mol":"qd","mon":"26,18,u,64,x,3u,b,c,14,1u,1u,1z,1,8,56,37,1o,3c","moo":"6e,1j,4c,3c,4s,h,2x,11,a4,1n","mor":"2k,j,1,1,1,1,1,1,1,1,1,1,1,11,5n,o,3e,3i,k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,4,t,4b,1,5u,1w,1e,1,1,1,4,30","mos":"13,86,k","mot":"87,37,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8c,4l","mou":"1k,7e,1,1,2k,g,2,1,z,6k,ar,u,c,18,3,11,1,2,2,3,2,1,5,2,4,3,1,1,1,1,1,5,5,4,2,1,1,1,1,1,1,1,1","mow":"7w,gp,2l","mp ":"6g,2y,2t,8p,5z,3y","mpa":"he","mpd":"a8","mpe":"k,du,6l,2","mph":"7x","mpi":"mx,5v,6h","mpl":"n8,58","mpo":"fm","mpr":"vs,42","mps":"1q,1,1,1,1,1,1,1,a2,26,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1e,3g,6,8f,23,3,6,4,1,4,2,2,4,2,3,1,1,1,1,2,7","mpt":"0,1,c,d,4,1,9,6,a,4,6t,7,2w,c,2y,4p,9,5c,1,1,h,5,1,1,4d,5,2,e,a,7,9","mpu":"7k,ax,4o,20,4j","mro":"f8","ms ":"1,p,s,r,1,3,3,1,1,1,1,1,h,y,1,r,l,2k,z,b,1a,g,3,k,b,1,1,1i,a,4,2,5,1,1,1,1,7,4,1q,l,9,j,j,a,33,e,d,w,f,7,6,l,q,7,1b,a,4,w,1k,15,2l,g,1,15,v,8,3,k,9","msc":"ab","msf":"zj","msg":"1m,7v,o,1d,j8","msh":"2q,5a,1,1,1,1,2,1,c,1,1,1,1,4,1,1,2,2q,34,9y,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,3,2,j,1,1,3,1,1,1,1,2f","msk":"71,d3,w,5j,27","msl":"6c,y,dl","mst":"y,5i,eg,9f","mu ":"a5,kz","mul":"47,c2,7p","mum":"v4","mun":"d5,mu,r","mur":"4e,cm,fg","mus":"44,jb,9j","mut":"dh,l5","mwe":"3i,se","mwi":"i,z,1,7l,4,b","mwo":"9f,fc,58","my ":"vk,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1","mz ":"nu","n 0":"ck","n 1":"3,i,2,8,h,1m,1g,k,13,3,2h,k,5f,e,15,s,f,1,s,g,1r,i,6,3d,r,s,1,1p,5,4,6,5,8,15,l,4a,1d","n 2":"1k,m,8,m,r,1e,s,4p,t,29,1c,d,a,23,2n,82,1c,3","n 3":"1,22,q,8,b,18,3,28,2l,3v,1q,6i,7k,6e,s","n 4":"u,u,5u,i,1t,1r,8,8e,z,1y,8b,58","n 5":"2s,8x,4d,at","n 6":"bo,35,50,2q,h,3o,42,3j,1","n 7":"eg,2r,2x,y,6g","n 8":"dq,3s,3v,6k,8b","n 9":"by,50,m,ae,1m,3r","n a":"3,2,3,c,8,1,6,1,1s,12,1,1,1,j,3x,r,1,2k,3,3,s,u,1p,w,n,1,1,2,1,q,r,h,9,i,i,q,8d,b,c,o,18,1,1,2,18,l,1w,16","n b":"c,3,c,7,5,1,4,7,3,a,10,2,m,29,1a,1,x,2,z,2,6,6,f,3,9,7,23,k,10,h,2,4,l,o,9,16,3,v,p,11,d,1,2,l,q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1a,2j,17,1,k,1,e,29,1,1,3,1,1,2,1,3,2,1,2,1,1,1,1,1,1,1,1,4,1,1,3,1k,o,1,1,1,1,1,1,1,s,3,1,1,1,1,1,1,3,5,i,j,g","n c":"0,23,g,1,11,2,3k,1,7,7,1,1,o,p,q,h,1o,5,3,9,t,x,1,1j,g,5,4q,w,i,3,a,1,1s,z,p,1k,5,1r,2,13,7,m,5,2,g,c,1,2,e,i,18,1f,3,j,1","n d":"o,1o,3m,33,v,4,7,1i,8,2,d,6,1,7,2,9,6,5,5,2k,dy,1v,17,o,q,1,c,1,b","n e":"22,e,t,a,7,e,a,8,1,1e,12,5r,15,1,k,t,e,1,3,1e,w,w,2p,h,a,17,q,5e,j,5,9,4,h,3,4,31,1,7,1,2,1,7,1,1j,1","n f":"p,3w,65,3v,2h,9u,4,84,t","n g":"e,k,6,n,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,7,1,1,9,1,12,6,1,2,p,1,a,2,e,1,8,1,3,f,j,c,2j,2,8,4,4,3,8,1v,m,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,p,1,6,1,1,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,4,1,2,6,1p,c,f,s,9,1,1,3,2,1,h,1,j,3,5,7,h,7,2,6,2,c,1,17,9,h,3,1o,a,7,2,2,p,1,8,1,1,1,3,v,1y,m,19","n h":"7,2,h,9,b,4,r,5,p,l,2s,1,20,1k,17,7,1,1,x,c,a,j,3,b,d,t,c,1,b,1m,2f,4,5,18,j,2e,e,j,17,1,1,1,1,1,1,1,1,1,1,1,1,1p,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,c,p,1,1,3,6,2,1,1,1,a,3,9,4,6,7,9,i,1f,2r,i","n i":"b,1c,1k,c,52,l,o,r,5,c,3b,4f,2l,4i,t,5c,2a","n j":"7e,c,dl,3,1m","n k":"8,23,3c,2,c,5m,4q,2,6,2g,1r,1v,2g,4,3v,1o","n l":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,1,9,1,2,1,1,8,t,d,u,8,37,9,q,1a,1,8,f,k,1r,9,c,1,1,1,1,3,1,6,1,1,1,1,1,1,1,17,8,3,4,1,1,3,h,t,7,1k,g,m,2p,1a,e,1n,b,1,1,2,7,2,2,4,4,5,4,a,t,2,1m,3,r,18,k,10","n m":"1a,y,27,1a,g,7,4,6,1,8,4,j,1,d,3,1l,16,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,s,2,14,5w,14,b,c,4,1g,1,1h,h,26,1m,5s,6","n n":"21,2,1,3,2,1,1,1,2,8,9,2,1,2,7,4d,11,3,24,2w,2,1,1,1,1,1,10,2,1,2,8,3,1,4,2,1,2,1,2,1,1,3,1,2,1,1,1,1,1,6,3c,3m,1m,1,3,4,2,1,2,1,1,m,1,1,1,2,4m,11,1,1,1,1,1,4,e,b,d,1,24,x","n o":"1n,x,1t,25,48,3e,2y,35,11,u,g,4o,4,1y,3,y,6,3z,23","n p":"3n,x,20,2c,2,2,1,1k,4s,4k,4b,1,1,1,1,1,1,1,1,1,1,1r,1,1,2,7,2,3,3,9,4,2y,z,9,24,j,2,k,1,1,1,1,1,3,4,1,1,7,1m,1","n q":"kr,a1,2k","n r":"g,8,8,8,g,3,1,f,6,6,5,a,4,2,2,4,5,1,h,o,18,1,8,f,3,1,d,2,v,8,5,g,5,u,3,5,4,6,1,u,8,1z,k,5,3,9,e,2,e,2,t,f,5,2,u,z,2,2,a,5,7,9,3,j,2,y,3,e,8,2,x,f,3,1,1i,b,3,5,q,7,6,2,p,5,t,15,2,6,4,1,8,7,1,a,6,3,c,h,5,7,6,1,q,h,4,4,e,n,1c,d,4,7,c,8,1","n s":"7,2,1,c,8,3,f,8,6,1,2,1,1,1,1,5,f,1,3,8,8,1,1,c,2,f,2,5,f,m,1,7,5,6,1,i,17,2,7,a,5,1,3,4,5,1,b,c,b,8,g,6,2,2,4,d,g,d,d,a,3,1,q,4,6,4,3,2,g,1,4,d,2,9,7,1,1,7,7,d,4,j,2,2,1,3,1,f,1,a,6,4,2,h,5,t,1,h,3,1,a,4,6,1,4,9,i,7,8,10,w,p,1,4,a,k,6,5,1,f,b,c,3,d,m,c,z,6,e,3,q,5,2,9,a,7,8,1,5,c,c,13,1,1,1,9,1,17,j,4,4,c,4,1,b,4","n t":"b,1c,3,1,1,1,1,1,1,1,1,1,1,1,1,1,3,9,a,1o,k,9,1c,j,4,2g,o,2,g,9,2m,1,i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,j,u,1,35,13,n,q,39,1n,1e,t,b,c,s,j,s,1,1,1,1,1,2,2,j,6,4,9,1,13,5,8,3,1,1,f,m","n u":"1q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,1,1,1,1,1,1,1,1,1,2a,14,2i,2,1,3j,14,1,1,1,1,1,1,1,1,2,9,6,8,8,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,11,9,1d,6,7,3,1,1,b,5,4,18,5j,15,1e,j,5,6,2,1,1,1,5,5,i,25,b,1,1,1,h,1,1,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,3,1,3","n v":"8y,1h,25,gn,12","n w":"8,3,2,d,2,p,3,e,1,9,5,3,1,1,1,1,1,3,8,6,30,1,1,e,p,1,7,7,1,1,28,4,1p,8,2,e,17,5,7,4,1,1,1,1,c,4,4,4,1,1,2,a,1,2,22,27,k,1,1,3,r,2,p,1,p,1,6,3,1,b,j,1l,1k,a,6,q,5,8,1,1,1,3e,1,1d,c,36","n1 ":"63,1,2k,1,6u,4j,5,22,z,4,1,j,18,1,1,n,1,4,11,19,1,1,1j,w,s","n11":"2y,5j,6h,ap,5g","n12":"fw,1,eh","n16":"fz","n17":"fi,3,3","n18":"fq","n19":"fp","n2 ":"j6,2j,1,1,1,u,f,2r,51","n21":"um","n22":"24,e3","n3 ":"vc","n4 ":"fm,7,1,3p,ad","n41":"va","n42":"vd","n5 ":"88,bw,29,30","n6 ":"k3,27,1,5,5v","n7 ":"fg,i,bz","n8 ":"qp,2n,i","n87":"z5","n9 ":"n7","na ":"5r,1s,6,i,6v,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,k,6k,a,w,1,1,1,1,1,1,1,13,44,r,2g,10,1n,1h","nad":"5j,hs,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2i,6,1x,1,1,1,1,1,50,e,c,v","nag":"4w,49,c9,cv,v","nah":"68,4,1,1,1,1,1,1,1,3,1,1,1,1,1,a,1,1,1,1,1,1,1,1,1,1,1,1,1,2,dd,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,5h,3p,1,b","nai":"q6,1,1","nal":"p,8,7u,bl,b,45,18,42","nam":"10q","nan":"3y,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3j,80,95,2o,2l,1,1,3,1,1,2,1,3,2,1,2,1,1,1,1,1,1,1,1,5,1","nar":"4n,r,a,av,3,cn,49,p","nat":"2g,1,1,1,1,1,h,ay,1,1,1,1,ad,c9","nav":"8l,5x,bd,83","nb ":"1g,hq","nbo":"oj,4x","nbu":"38,1,1,4,1,1,1,2,6,1,1,1,1,5,1,1,1,1,1,1,1,1,1,2,4,1,3,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,s,3n,19,4g,1,1,u,7,h,1,1,1,1,4,1,1,1,1,3,1,1,1,1,1,1,4,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,1,4,1,1a,1,12,8w,1,64","nca":"6t,1,1e,ay,10,1b,1,b,u,k,1,4,1,j,1h,w,1,1,2,1,1,1,1,1,2,1,1,2,3,1,1,1,1,1,1,1,2,1,1,1,1,1,a,1,1,1,1,o,6,2,5,1,1,1,1,1,2,7,1,1,1,1,1,1,1","nce":"1i,j,e,n,2l,1a,1,v,2a,2d,1j,18,1e,14,31,v,1,3z,18,1i,2q,1l,35,1,1,1,1,1,1,1,1,1,1,1,e","nch":"4a,1t,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,4,2,3,1,2,1,1,2,1,1,1,1,1,5,1,1,1,1,2x,x,15,n,p,c,1,o,4c,k,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,8,1,1,1,1,1,1,1,1,1,1,36,d,6,4,7,1,1,1,1,1,1,1,1,2,9,4,4,2,1,8,1,1,1,3,3,3e,19,3i","nci":"us,3e","ncl":"yb","nco":"6s,1r,6,40,d,b,3,23,4v,21,3j,5,1s,21","nct":"l,7e","ncy":"69","nd ":"3,2,2,7,6,9,6,1,5,6,b,a,a,7,e,i,c,1,1,1,l,b,n,j,7,b,2,v,11,f,1,1,1,1,1,6,x,1,8,j,g,g,t,b,8,g,1,9,1,5,j,3,s,3,5,7,31,c,d,d,4,2,3,1,j,4,3,1,6,5,1c,8,r,y,2,b,1,b,8,p,1,1,1,1,1,1,1,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,k,e,14,5,8,1,1,1,1,1,4,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,3,8,a,x,a,b,c,5,6,2,g,f,2","nda":"40,2t,66,8i,2l,17,3t,7","ndb":"s4","nde":"3x,2p,1r,6z,2,d,1,1,1,1,1,1,1,1,o,5,3,1,n,w,1c,80,2,1y,2w,1,1,1,1,1,1,a","ndh":"ba,n6","ndi":"14,n,4c,e0","ndl":"35,jh,f","ndm":"2o,qo","ndo":"1r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,1,1,1,1,1,1,1,1,1,82,2f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,8,8,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,14,1j,6,7,3,1,1,b,5,4,2z,4k,1q,k,5,6,2,1,1,1,5,5,i,4t,v","ndp":"3r,sz","ndr":"24,22,4,b,5,bh,hl,1p,1,1,1,1,1,1,1,1,1,9,r","nds":"0,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,2,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,2,1,1,2,1,1,12,8,3l,2j,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,19,1,1,1,2,1,1,8,2,1,5,3,1,1,1,2,3,s,1b,4,e,z,z,20,1,1,7,i,1h,2l,s,q,3b,17,5u,g,r","ndu":"vr,1m","ndy":"5x,kz,3b,48","ne ":"6,a,1,1,2,q,1,8,f,1,5,1,1,a,7,1,1,1,1,1,1,1,3,7,3,8,5,1,1,1,1,n,3,5,10,2,k,h,c,7,6,n,p,7,o,4,e,4,5,l,d,2,1,x,6,a,1,a,9,8,2,a,6,1,1,1,8,3,f,1,2,1,3,b,3,1,9,d,4,1,1,1,1,1,1,12,b,o,n,f,1,3,1,5,6,7,3,5,4,3,k,a,7,8,q,d,a,d,3,3,2,6,9,8,7,1r,i,6,o,c,a,5,2,1,3,5,1,1,1,7,1,i,1,5,5,2,6,3,i,5,1,1,1,2,3,2,3,1,2,3,5,6,2,3,1,1,1,1,1,4,5,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,1,e,u,2,1,5,8,4,c,e,1,3,f,d,6,3,5","ne1":"1b,2a,1,3j,ow,3,1,2,2,1,4,1","ne2":"vn,1,5,j,1,4,g","ne3":"3n,1,ak,3,5a,c4,h,a,5,9,1,1","ne4":"wi","ne6":"vk,1,1,e","nea":"f6","ned":"65,7m","nee":"3p,4o,8k,j,an","nei":"i8,6l","nel":"1r,91,2u,83,6b,6,6,4m,4,n,10","nem":"8z,mk,1b,1,1a,1,5,2,q,3,3,2,1,1","ner":"1q,l,f,9,10,3g,7,9,1,1,1,1,1,1,1,1,1,m,2a,1z,20,4c,52,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,7,o,o,q,2h,2b","nes":"d,f9,1y,1,1,6,2e,2l,2c,4,1t,w,19,34,3,8,j,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,2w","net":"o,g4,r,7h,4r","neu":"5u","new":"2,w,6,7,a,17,9,k,1,1,u,r,1,19,d,a,f,x,g,21,5,9,23,1,10,l,k,h,1r,1,15,m,q,4,5,5,u,v,r,1o,u,2,22,16,4,16,i,1c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,15,3,18,4,1","nex":"102","ney":"16,6y,2n,51,94,7j,y","nf ":"3p,9b,3x,be,6f,3","nfe":"3k,6j,77,2r","nfi":"tt","nfl":"e5,li","nfo":"10k","nfr":"37,2b,3,cl,1,2","ng ":"6,11,g,l,e,e,v,1t,9,3,v,2,1,4,d,1o,i,b,a,2,f,v,b,n,b,t,1,b,e,j,7,4,p,7,j,5,g,k,i,m,v,a,d,19,2,1,11,m,1i,12,s,13,9,a,u,d,4,h,f,e,3,8,5,3,2,g,4,1,w,1c,b,7","ng1":"80,1,1,4,1,c,4,4,2,2,fs,1,1,1,1,1,i,n,3,2,1,2g","ng2":"83,i,7,g1,1,1,h,j,6","ng3":"84,i,63,a7,1,1,y","ng4":"8k,gf,1,14","ng7":"p1","ng9":"p2","nga":"4r,6,d,6,a,b,3e,5c,v,p,1r","ngb":"p4,p,4e,43","ngd":"1q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,am,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d0,17,1a,19,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2q,1,1,1,1","nge":"1o,1t,4,1r,z,b,h,1e,1z,q,t,v,1z,m,4,17,f,3t,2d,2c,3r,r,2r,3d","ngf":"2y,2y,92,43,c,gw","ngh":"d,4,o,t,1,1,1,1,1,n,5a,1,1,1,1,2,1,c,1,1,1,1,4,1,1,2,7,4,8,6,a,1,5,1l,c,5,2l,2,48,1,5p,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,3,1,1,j,1,1,3,1,1,1,1,2e,1,7u,7","ngi":"2v,1,1,s,4o,6i,1,1,20,2p,1p,2i,3v,16","ngl":"b5,5c,6,c,6u,8,28,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,p","ngo":"q6,1,1,7m,1","ngr":"bh","ngs":"v,1b,5,1,1,2z,1,46,c,t,12,7,8,1k,2,1b,h,i,4,19,1f,15,17,4n,12,6,7,1z,u,f,2r,q,1q,15,1","ngt":"4h,2f,b,1,7,7,1,1,e,3,1m,c,2h,1w,4,1e,50,4,3,f,s,d,1,2i,2a,b,1v,1w,1,1,1,1,5,12,1,2i,1a,1,1,1,1","ngu":"gv","ngw":"vk,2i,5","nh ":"9e","nha":"2,h,2,1f,f,f,7i,2,6,j,3,2r,g,a,v,3,i,2s,9,ac,1,1,3s,2h,j,h","nhe":"e9,5,i4","nhi":"5e","nho":"vz","nhu":"5l","ni ":"nb,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","nia":"rk","nic":"27,1,1,1,1,1,1,1,7,1,1h,5,4,9c,1,1,1,1,1,1,1,1,24,1,1h,3q,9b,1,1k,k,a,7,2v","nid":"4t","nie":"3u,1,1,1,56,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1t,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4a,1,1,1,1,1,1,1,1,1,n,f6","nig":"7e,v,40,4s,7k,4,p,c,l,4r,2,5m","nil":"sr","nin":"a6,2e,7e,3b,5s,h,i","nio":"3w,2y,37,7d,10,2z,5,55,3w,2j","nis":"48,95,39,jh,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","nit":"1c,e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2s,r,c,1,1z,a,y,9,37,3,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2q,1m,h,k,1,2g,24,1,1,29,w,d,2c,1,v,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,12,1o,1,1,1,1,1","niu":"xp","niv":"28,bo,b9,4j","nix":"24,a,ba,2j,in","nj ":"60,i6","nje":"uk","nk ":"1g,5n,1,1,1,1a,7,4c,4f,2l,3a,1r,m,b,1d,8,3,h,4d","nke":"fd,55,k,1o,94","nki":"51,d3,6g","nkl":"62","nkm":"2l,67,h9","nkn":"1q,78,3m,4p,9,3n,82","nks":"mr","nkw":"wr","nky":"te","nl ":"11,18,8r,2v,1s,eo","nla":"o8","nle":"2p,44,2c,b2,1a,c,5n,n","nme":"e9,e7,2s","nmo":"7x,qk","nn ":"9,2,1,1,a,2,7,c,c,3,g,p,9,6,c,7,e,9,8,k,t,7,q,1q,g,5,o,d,1,3,4,6,1,5,3,8,a,3,9,v,7,c,e,2,1j,11,t,c,j,3n,6,j,5,7,m,o,9,3,1,1,1,1,1,1,1,k,7,2,v,t,1,2d,1e,u,1,o,1,13,c,p,6,g,1i,1,5,7,6,1","nn1":"8h,7,gg,1,1,h,6,1,4k","nn2":"ps","nn4":"jj","nna":"6c,1,1,1,1,1,1,1,i,1,1,1,1,1,1,1,1,1,1,di,1,1,1,1,1,1,1,1,1,1,1,1,5r,3p,1,1,1,1,3,1,1,2,1,3,2,1,2,1,1,1,1,1,1,1,1,5,1","nne":"16,2t,26,dw,5,8z,m,z,5,3,1,2,3,d,1h","nnh":"5l","nni":"3u,1,1,1,8n,42,1,1,1,1,1,1,1,1,1,1,n,bz,i,2p,3e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","nno":"3j,11,7,3c,3y,3,35,1p,7w,4p,2t,1,i","nns":"eg,gp,1","nny":"40,d4,65,5r,7j,1,1,1,1","no ":"52,17,b6,h,cp","nob":"oy,4f","noc":"3j,1w,4,6i,3,4u,19","nog":"gt","noh":"7d","nol":"cq","non":"4r,6,14,4w,75,fo","noo":"9d,3h,h,41,3,4f,3y,6c","nor":"0,4,4,4,f,h,z,1,1,1,1,1,1,1,8,l,e,2,3,2,1,4,7,7,13,a,y,1d,4,e,7,e,i,u,4,2e,s,1,1,1,1,1,1,1,1,e,9,7,j,r,1,i,3,a,b,1s,h,3,1,6,11,27,2,h,c,o,1,c,4,6,1,1,h,5,1,1,k,d,e,j,c,k,1,1,i,f,n,3,1,1,1,1,1,1,1,1,1,n,8,g,d,6,1,3,1,e,a,1c,j,t,2,2,4,1,1,1,3,1,1,1,1,1,2,2","not":"80,1,1,1,1,2,1,c,1,1,1,1,4,1,1,2,45,1p,9y,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1,1,j,1,1,3,1,1,1,1,2f","nou":"4k","nov":"3g,dl,7,bk","now":"1q,78,11,2l,4p,9,3n,1d,6p","np ":"35,cq,b,45,8,1,4,1,17","np2":"xk,3","np4":"xd","npi":"ft","nq ":"3i,h,97,9a","nr ":"cl,46,22,e0","nr1":"jk,gw","nr2":"zx,5","nr3":"zt,2,6,2,4,1,1,1,1,1,2","nro":"4k","ns ":"n,8,4,1,2,14,c,16,6,5,8,i,2,e,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,n,6,c,m,7,f,4,b,e,f,6,9,3,8,s,6,3,h,1c,w,1,4,a,3,1,6,j,8,b,2,2,1,d,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,n,c,c,o,r,19,d,1,8,o,f,7,2b,h,4,z,5,5,6,b,1,a,f,b,1,g,3,w,3,6,2,2,d,n,3,1,7,f,11,5,1,1,1,1,h,6,1,o,v,e,n,6,5,2","nsb":"ft,1","nsd":"8y,2,68,dj,53,1,1,1,1,1,1,1,v,1,1,1,1,1,1,3","nse":"b4,hh","nsf":"59,3a,c,4f,4d,6,7j,r","nsg":"74","nsh":"29,1l,1,1,1,j,2q,1b,2,5,1,56,2u,1,1,2,1,q,18,r,1u,3r,1,1,h,5,1,1,4,5,f,3e,i,1c","nsi":"c,3t","nsl":"88,4i,cn","nso":"66,17,1j,bb,k,7i","nst":"8,l,6,1u,e,2e,62,4,3m,2f,co,4b,i,d","nsw":"2r,88,48","nt ":"1k,3,9,1,f,9,k,9,a,m,1i,s,j,1,1,c,q,6,8,7,26,24,1,2h,h,t,6,18,g,6,d,l,2,c,2w,f,1r,1,1,l,6,20,9,6,w,i,r,5,1,4,4,2,2,1,a,1,5,4,g,f,1,2,r,7,3,p,w,v","nta":"5z,3v,18,d7","ntb":"az","nte":"a8,3y,3p,5p,g,4g,2b,8,u,g,1e","nth":"bl,dc,1","nti":"29,4d,79","ntl":"ak,ja","nto":"g,o,2h,61,3b,2t,6r,2c,y,15,35,4e,1","ntp":"ac,x","ntr":"60,l,2,s,o,6,1,1,1,2,1,2,d,19,w,6,v,1e,3a,1i,q,6,3q,z,a,1,s,k,1,1,1,2,1,1,2,2,1,1,e,1,1,1,2f,1,3j,1c,5,2w,3","nts":"f,6i,2j,2n,62,3g,cr,1t,1","ntu":"w7","ntw":"s2,f","nty":"3i,36,4i,ck,84,1,1,1,1,a,15","nu ":"c,9j,1n,dg","nue":"83,v,i,34,2o,3t,5,h,1m,3l,4d","num":"3u,ga,1,1,6c","nut":"1x,55","nve":"is","nvi":"16,8q,cd","nvy":"qc","nw ":"b2,gw,2i","nw1":"21,2,6,1,4,h,5,ao,2,3,2,10,5,8,3,1","nw2":"2x,c0","nw3":"27,bn","nw4":"2m,de","nw5":"ds","nw9":"2b,1,bf,2a","nwa":"8x,ox,1,1,1,4,u,4,1","nwe":"22","nwi":"l5","nwo":"bb,fy,3,1x","nx ":"p8","ny ":"7x,11,3k,2s,1u,65,2g,1k,55,45,1,1,1,1","nyg":"t0","nyr":"40","nz ":"nf","nzi":"5u","o 1":"46,w,cu,db","o 2":"6o,qg","o 3":"o3","o 4":"59,23","o 5":"f2","o 7":"fw,k9","o 8":"hp","o 9":"zb","o a":"7j,1g,e5,ay,1,1,1,1,1,1,1,1,1,1,1,q,1","o b":"f5,6o,u,bq,1","o c":"1g,6n,33,43,9l,90,3,4","o d":"s,g1,g5","o g":"1b,1s,2n","o h":"41,3v","o j":"uh","o l":"33,hv,6n","o m":"6a,ad,1,1,3x,5r,18,7y","o n":"c9,4s","o o":"1j,61,fl,7c","o p":"v0","o r":"8p,6f,au,4n","o s":"7d,u,87,1,1,z,7v,12","o t":"1a,4,3,wd,3,4","o v":"69","o1 ":"ud,u,4j","o10":"ea,9","o14":"us,q","o15":"js,ba,5f","o19":"g6,f0","o20":"vb","o21":"v5","o24":"uw","o3 ":"jm","o33":"uj","o4 ":"10i","o45":"v9","o5 ":"ua,d,1,6,6","o6 ":"er","o7 ":"v8","oab":"vm","oac":"2r,1,53,o,g,5,m,22,1h,1,28,k,a1,90,d","oad":"2,1,5,5,3,3,2,2,1,1,4,2,8,1,1,1,1,2,d,1,1,6,1,6,2,2,1,3,4,1,1,3,1,1,2,7,5,1,1,1,5,5,2,6,1,2,3,3,1,l,2,1,s,4,1,1,1,2,1,1,1,4,1,4,4,e,1,1,1,1,1,1,1,3,3,5,2,a,4,a,7,7,1,5,4,i,a,6,2,3,1,1,4,2,1,1,1,5,1,1,3,3,2,1,1,2,c,2,2,1,2,8,3,5,1,5,1,3,3,3,4,8,1,9,2,2,4,1,a,8,5,8,1,b,1,1,1,3,3,7,1,1,5,1,2,1,2,1,1,1,2,1,3,4,1,5,1,1,1,1,1,2,b,2,5,1,1,6,5,3,2,3,j,6,1,c,2,1,1,1,2,c,e,1,2,1,1,9,6,2,1,1,3,1,1,5,2,2,1,3,1,3,3,2,2,2,2,1,2,5,t,1,1,1,8,6,1,1,1,5,2,w,1,a,5,3,6,4,2,6,2,c,4,n,1,4,2,2,1,4,1,1,9,2,m,a,5,1,1,g,1,1,8,a,5,7,1,x,1,6,1,2,1,3,2,4,1,2,1,1,1,1,1,1,7,9,1,b,b,2,1,5,3,1,3,2,5,2,1,1,1,2,4,3,5,f,6,1,g,1,2,1,2,3,4,1,1,1,1,g,a,2,3,8,m,6,1,3,2,1,1,1,2,1,1,3,2,1,3,4,7,1,8,5,2,7","oag":"ul,1","oak":"j,10,4k,2b,44,8q,4b,1s,3z,26,r,1h","oal":"is,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4p","oan":"5b","oar":"ma,8b","oas":"bu","oat":"3o,34,5d,89,43,20,5i,2,2s,1w","ob ":"x3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1","oba":"7j,43,bi","obb":"t3","obe":"41,s,1j,1,1,1,1,1,1,1,i,1,1,1,1,1,1,1,1,1,1,24,4d,3e,3n,1,1,1,1,1,1,1,1,1,1,1,1,1","obi":"9,zv","obl":"td","obo":"oy,ad","obu":"uj","oby":"ip","oca":"hf","oce":"ov","och":"3j,23,bc,5n,80,53","oci":"22,4q,2o,b,1,4,3,3,19,5,5m,39,22,3e,4r,15,q,1e,1,1,1l,15,2","ock":"3,t,i,p,4,7,3,10,h,1h,4,29,1,c,u,c,1,7,j,1j,g,3,b,1,5,5,2,1,5,q,6,7,1t,y,d,12,1o,1i,1i,e,1o,4,16,1,h,q,1t,28,h,p,6,1,9,n,w,3,4,1u","ocl":"5g","oco":"wc,1,i","ocr":"3v","od ":"9,g,e,1z,s,1,1,1,3,1i,2m,37,3,s,58,5t,c,c,10,1,1y,d,22,q,h,3m,5,1a,16","oda":"a3,pr","odb":"8m,63,3,b4,a0,h","ode":"9y","odf":"2w,c0,cr","odg":"5p,2j,31,x,47,3m,5e","odh":"sb","odk":"34,1","odl":"7s,5g,6f","odm":"5f,56,5z,j3","odo":"ky,fd","odp":"vw","ody":"o5,t","oe ":"3l,4k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,4m,95,2g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,8r,1","oeb":"i,90,2t,ex","oen":"24,a,ba,2j,in","oes":"9c,mp,7","of ":"21,7,c,i,c,11,20,2,60,10,5,a,8,1o,1p,17,1j,2b,4z,u,i,2,d,78","off":"fo,je,o","oft":"cg,9p,dy,4,1,3,1,2","og ":"k,12,7s,l9,1o","oga":"oh,1,2j,1,2,n,8,6","ogh":"gt","ogi":"3i","ogl":"3a,f8","ogm":"xl","ogn":"oe,6r","ogu":"10g","ohe":"77,o7","ohn":"7,1v,15,1b,13,2s,56,1y","oho":"1a,1,3,2,1,2,5u","oil":"xt","oin":"6k,j,1,1,12,bl,5i","oir":"om","ois":"2c,dp","oje":"8x,py","oji":"lt","ok ":"1h,4e,w,1t,h,3x,66,o,17,4d,s","okc":"4c","oke":"96,7,3h,h,41,3,4f,24,1u,29,15,i,3n,e,1w","okk":"uq","okl":"p7,9j,b","oko":"33,w8","oks":"db,50,y,g8","okw":"ug","ol ":"bq,3f,27,1n,1,g,1,2,6,1m,53,1,1,1,1,3,2,3,3,4,1,4,1,13,1,5,4,4,1,1,1,1,1,3,1,5,1,1,1,3x,1,3,1,1,1,1,1,1,1,1,1,1,1,8,4,1,3,2u","ol1":"ml,f,3c,v,3","ol3":"m2","ol6":"rt","ola":"2m,ci,1,s,3,58,aw,u,1q,1c","olb":"61,ap,fs","olc":"er,kz,s","old":"j,5,s,5,2,8,1b,1z,8,1u,7,1,7,4,w,1d,b,c,d,16,8,t,k,9,d,5,1,c,s,24,48,m,s,a,p,e,1,v,b,g,d,h,4,b,8,11,y,2,1d,c,6,1f,e,j,29,d,3","ole":"87,z,k,q,34,2m,94,4j,q,1,3m","olf":"4m,8b,91,1,1r,1,1,2,90","olg":"s5","oli":"a1,gr,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,v,16","olk":"es,4s,6,38,v,7m,4e,2,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,a","oll":"3,6,2z,4t,k,1,1,1,1,1,1d,i,25,m,e,1q,4,e,2d,c,m,i,z,3y,14,1,1,1,1,1,1,1,e,3f,16,r,4e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","olm":"ao,fi,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","oln":"8j,6,62,s,af,5,1e,2f","olo":"3i","ols":"43,h6","olt":"k9,1,1t,b,5l,1,e,1s,g,5m,a","olu":"a8","olv":"0,1,c,d,4,1,9,g,4,9w,c,at,dj","olw":"fo,46","oly":"7t","om ":"1q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,21,5,1k,51,1v,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1j,3,24,1,1,1,e,2j,h,s,4d,a,2c,1s,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2o,2,1,1,1,1","oma":"2v,1,1,1,1,1,1,6q,54,1,1,1,1,1,1,df,2x,20,v,z","omb":"1f,2x,5z,3v,g,kj,t","ome":"1z,6q,4m,12,bl,j,6,1x,1,1,1,1,1,50,f,a","omf":"a1,qm","omg":"yk","omh":"j0","omm":"3r,7e,5e,dt,e,5,3,1,2,3,d,4u","omp":"eu,2k,b2","oms":"1m,3r,2k,1k,o,1d,j3","omw":"i,z,1,7l,4,b","on ":"0,1,2,2,5,3,2,1,5,3,2,1,2,1,1,2,2,4,1,6,2,8,3,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,2,2,6,3,7,8,2,4,g,7,2,6,1,c,1,g,2,4,1,3,1,1,4,1,1,1,1,1,3,1,1,3,6,2,1,4,1,1,1,1,2,1,1,2,1,1,3,5,3,2,1,2,1,4,5,1,6,3,2,6,2,2,1,1,2,9,3,4,2,5,2,2,4,1,1,1,1,6,e,3,2,4,4,4,4,3,2,7,1,4,3,3,1,2,d,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,4,1,l,8,2,1,2,1,4,6,6,d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,2,3,7,3,1,1,6,5,1,3,1,2,1,1,7,3,2,1,2,1,1,d,2,3,2,4,3,2,1,1,1,1,1,1,1,1,1,2,1,1,3,2,2,c,9,2,3,1,1,5,1,1,6,3,4,1,1,f,4,k,9,1,3,3,3,1,1,3,3,2,2,1,1,1,1,1,6,5,1,7,1,1,1,1,4,a,1,1,2,7,2,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,5,1,f,4,1,1,1,4,1,2,1,1,1,4,2,2,5,2,1,4,4,2,2,1,1,1,1,2,1,1,1,3,1,1,2,3,1,1,1,2,1,1,1,2,1,1,2,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,e,4,7,1,1,2,7,2,1,6,1,3,6,6,8,4,1,1,1,1,1,1,1,8,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,3,9,2,1,4,4,2,4,7,3,1,2,3,6,4,1,2,1,1,1,1","ona":"2g,1,1,1,1,1,h,1u,1c,e,1,1,1,1,1,l,1,1,2,6k,1,1,1,1,73,1,1,1,1,1,1,1,1,32,9q","onb":"ax","onc":"88,ay,41,1,4,1,j,1h","ond":"1r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,1,1,1,1,1,1,1,1,1,82,1h,y,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,8,8,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,2,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,2n,6,7,3,1,1,b,5,4,2z,27,20,t,1a,k,5,6,2,1,1,1,5,5,i,4t","one":"d,1l,1,18,2e,2d,2b,7b,1,1,6,5s,4j,1a,a,t,7,6,b,b,1g,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1n,i","onf":"a3","ong":"4r,6,d,r,u,4a,3i,1o,1r,3h,38,2z","oni":"48,95,e7,54,h","onk":"ki,28,a1","onn":"40,43,4h,2p,9l,7i,1,i,3,3l,1,1,1,1","ono":"gt,dg,1,1,1,1,1,1,1,1,1","ons":"z,1a,2g,2,e,1k,1s,7,e,1x,5,2r,k,2z,c,2,a,o,t,o,15,13,2p,1,1,h,5,1,1,o,r,a,q,c,1d,g,2,1a,1a,29,17","ont":"3e,a,6o,x,4h,14,1u,3t,13,g,73,l,v,1,t,2q","onv":"16","ony":"7x,7d","oo ":"c9,45,4k,5e,19","ooc":"ml","ood":"9,g,e,1t,14,1f,3,2m,i,1h,i,q,3,s,12,1h,3,4,1o,u,29,1b,29,c,c,10,1,10,y,d,14,y,q,h,1g,26,5,1a,6,9,h,a","ooe":"yw,1","oog":"3a,f8","ook":"1h,2v,1j,w,1t,h,c,3h,4,d,41,3,1p,o,17,v,24,19,5,g,c,3k,s,4a,b,g","ool":"fo,9,1f,24,1,2,6,1m,53,1,1,1,1,3,2,3,3,4,1,4,1,13,1,5,4,4,1,1,1,1,1,3,1,5,1,1,1,4c,t,2h","oom":"1f,3o,5,5,2k,24,1s,5y,3,16,y,1,1,1,e,2j,h,s,4d,a,1r,l","oon":"fl,4s,4f,a4","oop":"xf","oor":"28,27,1z,1j,5z,6y,1r,16,9b","oos":"80,n7,x","oot":"61,7k,1p,5b,41,3v,82","oov":"v8","ooz":"sy","op ":"10,3f,35,a,s,4d,7o,2a,1,7,1u,x,1w,21,3m","opa":"ru","opb":"5p","ope":"ct,1d,19,3a,4w,1,e,ck","oph":"z7","opk":"h0","opp":"g,2f,1,1,1,1,1,1,42,c,27,27,2w,6,1,1,1,1,1,1,35,34,6x,3m","ops":"bq,lo","opw":"tp","or ":"28,i,1l,4,r,18,d,16,2,1l,17,u,3,15,3,k,g,9,11,e,12,48,2d,1,1,1,2w,1,1,1f,e,1i,q,1,1,1,1,1,1,1,1,1,n,8,g,j,1,i,7,3k","ora":"4f","orb":"kd,34","orc":"5,3,2,a,2,6,1,3,p,1,3,8g,n,v,1,3,7,1,77","ord":"7,y,2,2,8,t,d,4,m,9,3,28,l,1,2,h,12,6,3,5,1y,k,e,5,6,3,1,2,6,2,1,7,1i,d,b,2,3,2,5,s,2,c,4,1,t,f,1,2,2,14,8,6,2,6,r,z,7,l,h,j,b,1c,1,2,g,1,6,9,4,3,6,2,14,i,f,a,2,2,13,1,2,1,1,6,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,2,5,1,3,4,2,1,e,1l,h,g,1,2,t,18,1,5,a,6,1,1,3,b,3","ore":"2t,18,m,24,2d,9,1d,b,4p,1r,t,u,1,10,3n,42,25,8,14,1y,c,m,q,1e,a","orf":"jk,6,2z,9,v,6i,5i,2,2,4,1,1,4,1,1,1,1,1,2,2","org":"2,26,f,29,4,50,y,2y,1h,1,q,1t,4p,q,18,2k,l,8,5h,1,1,1,2c","ori":"25,5e,2o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,g,3t,2l,1h,34,c,1w,3e,1q,d,7,1z,1c","ork":"6q,d,15,o,10,4e,9,10,1s,1i,d,9,b,p,10,1s,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,v,1x,17,d,1,1h,1","orl":"7b,80,1,87,q,1,39,u,2","orm":"71,d3,w,2w,2n,27,3","orn":"g,4,3,2,8,t,l,a,5,9,2f,1p,11,t,p,1v,1d,25,4c,n,2h,2h,20,z,5z,1,1,1,4,c,i,4,1,f","oro":"7w,q,63,9s,n,p,3,3k,5z,d,m,a","orp":"4e,3t,56,bx,i,68","orq":"xz","orr":"33,1,1,1,1,1,1,1,1,1,1,1,29,3h,7h,11,k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,cn,4g,g","ors":"3,1,1,9,f,1y,1n,2g,19,w,4a,1,12,x,9,1t,5,42,13,1v,e,9,6g,p,1u,1,2,1,1,1,1,2,2,q,1,2,1,1,1,1,1,1,1,1,1,1,w,1","ort":"0,4,4,4,2,3,a,7,4,6,3,1,v,1,1,1,1,1,1,1,6,2,5,g,e,2,3,1,1,1,4,4,3,1a,a,m,c,q,g,1,o,7,e,d,6,2,1,4,a,c,4,d,1,3,g,j,2,1,3,l,4,v,1,1,1,1,1,1,1,1,8,4,2,1,8,7,18,2,1,i,3,a,b,1s,9,8,3,2,1,8,4,1,1,1,l,5,1,5,g,25,1,u,3,1,1,9,7,6,1,1,h,4,1,1,1,c,1,1,6,d,5,7,2,1,3,3,3,3,6,4,8,k,1,1,3,2,d,2,7,k,9,7,1,p,4,3,2,n,7,a,1,4,k,4,6,5,3,u,a,9,2,a,2,16","orv":"nr","orw":"jk,q,fj,2,2,4,f","ory":"1d,8,1s,75,6c,1r,88,1s,3r,1,i,7","os ":"2i,bk,3h,ec,1z,1,26","osb":"wc,1","osc":"3f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9p,3f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2g,1,1,1","ose":"13,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1m,1,1,c,17,2n,1,1,1,1,f,19,k,b,16,10,v,23,1f,1v,1,1z,1w,1,1,k,1,1,1,1,1,1,1,80,y,r","osf":"e8,3,5a,65","osh":"w4,4k,1,1,1,1","osi":"73,1m,h9,73","osm":"dh","oss":"0,w,1h,o,1j,17,11,1,11,2w,4,j,1l,r,1c,i,r,57,1g,1,4o,1q,3n,f,3,1t","ost":"3g,3e,11,3w,5h,4a,37,i,3z,v,6q","osv":"4b,3o","osw":"9o,31","osy":"1w,rz,26","ot ":"14,x,6y,1n,25,1q,t,3t,5w,1f,j,p,1n,1,5,2v,1,48","otc":"rk","ote":"4,5,8,3x,2,w,3,2,1,1,1,1,1,1,1d,h,f,18,l,1,7,j,3,e,1,9,5,19,1,2,1,b,1,1,9,2,3,27,14,2o,13,1d,2,7,c,m,k,10,3v,2f,7,2e,u,b,10,g,4","oth":"4j,1,1,w,k,12,3e,1b,8x,30,9k","oti":"dl","otl":"kl,37,9,4","oto":"87,h3","ots":"3h,do,d3,6k","ott":"1g,29,3,48,1,1,1,1,2,1,c,1,1,1,1,4,1,1,2,j,1x,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,b,21,t,3,4,18,5,59,2c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1,1,j,1,1,3,1,1,1,1,m,o,s,d,4k,1b,1,1,1,1,1,1,1,1,1,1","ouc":"a7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3v,2b,fk,5,v","oud":"ab,4,p,4p","oug":"2b,14,1p,3i,24,r,1v,17,6,8w,c,17,p,3,3k,5z,d,m,a","ouh":"jp","oul":"4k,8x,d5,9p","oun":"1k,1e,j,1,2t,b,1v,1d,18,4,1w,1w,l,17,f,1r,c,m,13,1,3a,1,1e,3m,5,b,g,1p,1,1,1,1,a,o,w,o,s,z,d","oup":"gv,6c,2,1","our":"5,2,2,47,1,1f,1c,1i,4,5,x,1j,j,2,2,1,k,u,19,5i,g,4x,e,6,36,7,14,4,t,t,1,19,j,1,5,2,3,g,7,3,3,2,1,1,d,o","ous":"6,19,w,f,6,3,8,8,o,7,c,8,1,j,2,q,l,19,r,4,o,f,3,13,n,1,2,4,2,2,1,1a,x,8,e,3,2f,10,1x,1l,1j,j,4,1,1x,2b,2,1f,1z,2,6,9,10,1l,6,3,5,e,8,q,5,1,3","out":"m,i,2b,y,4,k,8,1d,1m,f,6,3,2,1,1,12,b,c,v,d,o,a,3d,18,d,b,w,6,3,8,5,4,2,1a,1r,e,1,1,1,1,1,1,1,1,3,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1f,k,5,e,12,3,14,2,1f,1,3,2,1,a,1,4,2,6,2,4,1,2,4,2,3,1,a,4,o,6,3,f,m,1,2,2,3,2,1,5,2,4,3,1,1,1,1,1,2,3,9,2,1,1,1,1,1,1,1,1,9,3,l,c","ove":"h,e,8,j,b,1j,2v,9,1p,1,1,1,2,1,f,n,o,1d,i,51,7,1u,3u,o,x,2,v,1,1,1,2,1,1,4,1,1,e,2c,b,s,j,k,d,c,6,2t","ovi":"pl,5n","ow ":"11,s,16,4,1,1,1,5,1,1,v,3,1,3,3,1,k,7,1,1,1,2,1,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,3,a,2,w,1b,1a,1m,1o,1n,7,1b,1,1,1,1,1,2,1,1,1,1,1,y,1,6,f,1,1,1,1,1,1,1,1,2,1,3,1,1,3,1,1,i,1,2,o,q,4,1,2y,q,1c,g,f,a,g,1w,e,5,6,3,1,1,5,1s,1h,2t,6","owa":"fg,d,5","owb":"7w,o,bf,4m,1j,d,p","owc":"ue","owe":"o,9,f,3,77,l,8,t,f,1q,e,d5,4g,1y,3t,4,1,3,1,2","owf":"5i,fd","owg":"3z,p,b,13,bw,1,1,e9","owi":"vy","owl":"9z,5u,4h,28,80,23,j","owm":"zy","own":"b,k,s,3,d,6,10,3e,2b,29,13,3,7,c,z,1b,2,3,1e,k,9,11,z,1n,j,y,2b,2r,1j,c,1,2,16,1,39,8,1h,1,e,g","ows":"2g,bk,lv","owt":"vs","oww":"5i","ox ":"g,1d,7,6t,t,f9,17,34,1i","ox1":"2n,dh,d4,1,2,m,1,h","ox2":"uh","ox3":"tj,5","ox4":"c3,ha,7,2,w","oxa":"d6","oxe":"rm","oxf":"2a,d,3w,5k,1q,2b,50,84,1,2,2,6,1,2,2,9,1,h,2,1","oxg":"he","oxh":"qf,j","oxl":"2j,bk,it","oxo":"hp","oy ":"1p,48,1,1,1,1,1,cq,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,ap","oya":"2,43,m,7,15,2b,m,10,1,1k,x,18,4d,41,34,1,a,1s,k,1l,b,13,2m,28,q","oyd":"2u,ct,l","oyl":"sw","oyn":"s8","oys":"zd","oze":"sy","ozo":"td","p 1":"71,56,8g,75,6g","p 4":"5y,h9,6e","p 6":"5a","p 7":"35,hk","p 9":"8m,ha","p a":"0,a,6,m,fr,3i,d,8p,b,1j,e,c,5,1","p b":"10,e4,3v,ec","p c":"g6,be,2q,1n,1k,a,4,1x","p d":"9g,3,3,1,1w,7,2,f,3,3,6,g,m6","p e":"70,9g,5d,2,1,2,6,1,1,dd,7","p f":"zs,4,2","p g":"25,t,7,25,1q,6,o,5q,1e,x,1,f,32,y,8,5,17,1,2,6,1,1,r,1,4z,26","p h":"25,51,28,6s,dx,7,e,5j","p i":"c,3e,e,67,6w,g8","p j":"fv,1,es","p k":"5a,b1,5,2j,3,b,8,y","p l":"7k,4n,3e,68,1c,5,3s,6t,1a,e,7","p m":"6g,63,n,7q","p n":"ea,lx","p o":"4f,mn,i,d,1g,b","p p":"2y,c0,6,ep","p r":"35,1y,s8,6,a","p s":"7a,k,3w,2k,8n,1,b,1q,3v,3l,1z,1i,2","p t":"jl,7a,3y,s,h,1","p u":"kk","p v":"jo","p w":"0,a,6,m,8e,3,3,1,1w,9,f,3,3,6p,9s,4n","p1 ":"bj,mt,1o","p11":"e6,g","p12":"zw","p13":"es,ll","p14":"zy","p20":"tn,3x,3","p33":"zz,r","p4 ":"xd,32","p6 ":"u7,43","pa ":"85,9i,76,d,2,3x,3l","pa5":"5l","pa6":"37","pa7":"i7","pa8":"i6,3","pa9":"5i","pac":"ei","pad":"gs","pai":"az,ng,1","pak":"10c","pal":"24,18,14,26,9l,2f,bo","pan":"he","pap":"bu","par":"v,c,7,d,1k,2,28,a,1e,1g,19,n,g,s,s,i,2m,4,1,o,d,4,1y,7,c,5,5,2v,3d,r,15,17,8,4,j,2,5,5,i,1l,1w,d,2,x,y","pat":"1m,1k,3w,os,4b","pau":"98,5u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,h8,1,35","pav":"t9","paw":"qs","pb ":"kc,bd","pbr":"5p","pd ":"1o,sx","pde":"a8","pe ":"4a,8j,k,t,19,3a,2k,2c,1,26,1t,8z","pe1":"eq,l2","pe2":"10o,1","pe3":"zr,10,1","pe9":"104,1,1","pea":"2f,1o,f,91,1,1,1,1,9v,41,1j,3q","pec":"32","pee":"67,38,4d,6r,n,7s","peg":"u,2g,f8","pel":"7q,2m,x,a,b0,5u","pem":"k4","pen":"d,17,6t,8r,8q,3x,3r,2,3","pep":"10h","per":"g,1b,o,2,16,x,1g,2o,p,7,2,9,1z,s,1f,d,b,e,6,1f,17,12,10,a,s,2,9,1b,1f,4,3z,6,1t,6f","pes":"2n,66,7b,6w,32","pet":"k,2y,8u,in,11,3s,w","pf ":"5d,a1","pg ":"5q,30,85,94","ph ":"7h,1,1,1,1,2l,9q,2i,1,1,k,1,1,1,1,1,1,1g,j,3m,3z","ph1":"4k","pha":"1w,bn","phe":"3y,4y,jh","phi":"4e,9y,3,be,78","pho":"24,a,5j,5r,2j,in,d","phr":"68","phy":"h0,fg","pic":"pt,a8","pie":"8z,jl,1,1,1,1,1,5t,l,10","pig":"mh","pik":"ly","pil":"h6","pin":"16,69,2t,f,16,3x,3,2d,a1,3m,2","pio":"z9","pip":"3n,e8","pir":"mx,5q,5","pis":"jc","pit":"9l,j6,35,c","pj ":"bl,5g","pjs":"l3","pki":"h0","pl ":"5v,2f,m,ca,1q,2j,7a,8,1o,3","pl1":"8y,2,oy,2,k,8,4,1,1","pl2":"91","pl4":"yl,1,1,1","pl5":"yp","pl9":"z5","pla":"2j,6,7,19,4,1,g,t,e,1p,4,2,3,2j,2,2,1h,o,6,1a,t,2s,14,15,3b,4,a,1b,8,1,21,7,3o,l,11,1f,c,2,5,o,j,c,1","ple":"d2,a6,1u,3e,f,5w","pli":"6y,eo,b7","plo":"aq,r,32,9e","plu":"ng","ply":"8y,2,oy,2,k,1,1,1,1,1,g","pma":"8o","pmc":"9b","pn ":"5p,4b,6d,6n","pne":"ar,lo","po1":"g6,e7,t,1","po2":"v5,6","po3":"jm,ax","po5":"ua,d,1,6,6","po7":"v8","poa":"8j,hk","poc":"3v","pog":"10g","poi":"6k,j,1,1,12,bl,5i","pok":"33","pol":"ib,y,ak","pon":"26,4z,14,3g,3,t,3k,7f,g,13,b,7z","poo":"hc,24,1,1u,53,1,1,1,1,3,2,3,3,4,1,4,1,13,1,5,4,4,1,1,1,1,1,3,1,5,1,1,1,4c,t","pop":"2v,1,1,1,1,1,1,bu,1,1,1,1,1,1,5m","por":"e,o,a,2f,a,29,11,1,g,1,1s,2,5,a,t,4,g,j,3,3,28,1a,c,3a,e,8,4,1,1,1,l,6,5,g,25,1,28,f,1,1,1a,a,x,2,f,7,10,u,3,2,n,m,o,6,5,3,14,b,a,2,16","pos":"73,4o,dg,3z","pot":"9e,18,25,9k,2o,7b","pou":"4h,m5","pp ":"0,12,1w,6p,23,t,2f,76,86,1n,2b","ppe":"g,21,3j,3m,9,46,o,e,1l,3j,13,1b,1j,45,1t,6f","ppi":"7f,2t,f,16,6d,a1,3m","ppo":"73","ppr":"2s,53,14,5,6y,j1,d","pps":"pt","ppy":"2v,1,1,1,1,1,1,bu,1,1,1,1,1,1","pq ":"jh,cx","pr ":"1j,ul","pr1":"q9,1,1,2,7,8,9,4","pr4":"qm","pr5":"qv","pr7":"rj,u,2","pr8":"ri,19","pra":"xz","pre":"c4,5c,8t,1,1,2,7,2,6,9,4,4c,4d","prg":"vs","pri":"6,7,15,3,g,x,4,2u,1x,4n,n,1v,9,1,1m,v,1o,1d,2r,i,9,1,1,1,1,1,1,1,1,1,1,3t,6,e,26,1l,3u","pro":"2s,53,12,2,5,6y,1i,7,7u,w,6,1x,1,1,1,1,1,50,16,8,d,f","pru":"3l","ps ":"ap,1a,37,1q,19,60,1m,2,r,17,g,57,23","pse":"di","psh":"bq,4g,3g,6,ai,3,6,4,1,4,2,2,4,2,3,1,1,1,1,2,7","psi":"9u","pso":"1q,1,1,1,1,1,1,1,c8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","pst":"15,ah,em","psw":"100,f","psy":"71,5d,4p,3x,ex","pt ":"yu","pto":"0,1,2,a,d,4,1,9,6,2,8,4,6t,7,2w,c,2y,2h,28,9,4q,m,1,1,h,5,1,1,4d,5,2,e,a,7,9","pu ":"9c,m,10,bu,8f","pub":"1f,3,p,g,5q,5h,2a,84,1h,5i,1x","pug":"p8","pul":"o3","pum":"qv","pun":"x4","pur":"uy","pus":"7k,ax,4o,20,4j","pw ":"85,83,55,b2,1r","pwe":"tp","px ":"1u,8d,36,16,2x,6x,32,73,1","py ":"o,27,1,1,1,1,1,1,7s,42,1,1,1,1,1,1","pz ":"p,l3","q 1":"36,1c,1x,25,6x,an,1s,33","q 2":"3z,s,8,x","q a":"2,7,l,31,s6,7,2,4","q b":"kz","q c":"3i,2x,ej,ba,1o,5","q d":"8k,4b,8,3,3,1,cu,93","q e":"3z,s,8,d1,2,3n,dv","q f":"3i,uu","q g":"1t,2,1,1a,t,j,y,g,9,q,h,3a,8,a,4d,3a,2s,6,r,5d,5u","q h":"6f,ej,9w,5g","q j":"7c,f4,8e","q k":"4r,8,h,g,9,q,b5,2,1e,1,22,9g","q l":"qk,k,3v,2x,5,1j","q m":"83,4s,8,3,3,1,66,1,5d,3z","q n":"83,h,3,eq,5,c,2,y,13,7,a6","q o":"3i,4,ni,p,c","q p":"3v,bm","q r":"36,5h,a4,76,7q","q s":"1t,2,1,p,ks,5,c,2,i,26,1l,o,6e,5","q t":"3m,70,8,a,kx,9,4","q w":"2,7,l,nk,9y","q1 ":"xz","q14":"yh","q4 ":"yf,1","qa ":"aw,3l,55,3v,9,cx","qb ":"3o,3r,7,l9","qd ":"h0,6o","qe ":"5e,1,31,84,2n,1t,4m","qf ":"nz","qg ":"af,g4,33","qh ":"9u,11,c,6b,6u,55,30","qj ":"bu","ql ":"2b,cu,ad","qn ":"4n,5o,1o,9c","qp ":"9g,ci,5m","qq ":"u,c1,6l,cs","qr ":"42,f,8g,av,33,1v,4w","qs ":"2f,67,m,4f,12,b7","qt ":"c9,ay,8t","qua":"22,1o,5,b,f,1l,f,s,2,7,l,q,3,2c,h,2,g,1v,31,o,e,3,2f,8,4b,18,1i,v,a,i,15,1a,1,u,f,2,2,1,8,8,2,1,4,r,1,3,1,15,1,9,d","que":"3o,6,1f,48,y,1a,1v,1l,2,1k,w,6,28,49,1,26,5,b,3n,2z,21","qui":"g,o,78,1a,f4,r,v,2e,4a","quo":"6r,la","qw ":"hv,5w","qx ":"4f,6b,9,86,ay,37","qy ":"hc,1,2,2","r 1":"a,c,c,1z,j,m,d,2,c,j,v,19,a,3,4,2,k,q,19,t,8,3e,a,z,g,m,b,2m,e,24,3g,g,l,14,b,2h,15,q,r,12,3,d","r 2":"2k,6,18,7,1k,m,42,3r,ee,43,3e,1","r 3":"2g,26,3h,35,2r,1,u,2c,1a,12,5c,9j","r 4":"1u,e,3x,4j,33,5,1z,47,a,bx,3k","r 5":"17,3t,62,7d,ar,2a,c,2o","r 6":"3n,2p,3y,2m,4s,79,1u,2d,r,5i","r 7":"3m,cd,b,m,1,5u,4q,6,7p","r 8":"bm,mh,16,o","r 9":"at,y,8e,7y,4e","r a":"l,k,2s,3t,8,11,69,1f,4,4,2b,4h,85,c,p,1,29","r b":"15,13,9,9,1g,13,1v,2g,b,1e,1d,1a,5,4,64,1,w,s,1,1,1,2,1,1,1,1,1,6,4h,e,4,m,1,e,3,3,4b,7,12,1f","r c":"8,1i,11,1k,1p,17,26,7,1a,20,h,o,f,d,3,1u,r,1o,12,1p,y,1c,1n,1,e,1,1,f,17,r,1x,1b,1t,20,4,d,f","r d":"3v,4d,b,9,34,p,c,2,3o,2j,v,6,30,1,4,1,j,1h,o,2,26,1t,4g,1,j","r e":"3g,9,d,5,a,5,3,d,2,2,5l,40,1i,z,f,9,41,4f,d,a,7,1,1,1,1,1,1,1,1,b,4,4,2,1,8,1,1,1,3,2,1,4m,j,w,1,j,k,4,s","r f":"g,1d,66,1n,1o,8u,2,r,1o,d0","r g":"x,1f,9,a,k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,5,a,5,3,x,g,3,1,1,1,1,1,1,3,5,1,2,1,1,1,1,1,1,5,1,6,8,1,1,1,1,1,1,1,1,1,1u,6,13,1,2b,4,v,v,1,c,r,3,8,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,u,16,g,1,1,1,7,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,b,1,1,1,1,1,1,1,1,1,5,1,b,l,1,1,1,h,1,1,1,1,1,13,1g,2i,9","r h":"3,28,f,1,8,2h,r,10,2c,p,f,4c,17,4d,r,8e,14,8,5,1,5,1,1,4v,5","r i":"14,94,j,5,s,1s,r,iw,3b","r j":"1e,5,12,4y,fl,7o,8,5","r k":"52,10,8b,3j,x,3s,q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1t,4t","r l":"1r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,1,1,1,1,1,1,1,1,1,39,1k,2,1,a,9,6,4w,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,8,8,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,2n,6,7,3,1,1,1,a,5,4,3c,9,11,1,t,a,a,9,1,1,h,2,4,9,n,2,q,k,1,m,5,6,2,1,1,1,5,5,5,d","r m":"5e,p,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,4,2,3,1,2,1,1,2,1,1,1,1,1,5,1,1,1,1,4,2c,1k,l,6,8,4,2,1q,4m,7,g,1,3,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,8,1,1,1,1,1,1,1,1,1,1,36,b,2,a,7,1,1,1,1,1,1,1,1,b,4,4,2,1,8,1,1,1,3,3,9,1j,1,1,1,1,1,1,1,1,1,3,4b","r n":"e,x,t,8,19,1,1,1,1q,1r,x,h,9,5g,3,1q,6,3e,47,1d,7,p,2,4b,16,1,1,1,1,1,4,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,9,1,1,1,3b","r o":"3g,a1,3r,4u,j,f,3c,j,c,3,j,1q,z,58","r p":"2v,5i,4e,24,c,z,16,3b,4y,8,2r,3,1,1,21,g,5,1b,i","r r":"8,l,t,l,47,b,2q,q,1g,c,1p,6,2,m,n,4j,18,i,3a,1n,17,s,a,f,28,23,e,18,f","r s":"5,2l,q,h,5,2p,i,1,8,8,1,1,1,1,3,b,1,d,1r,2,u,e,5,9,3,8,j,1j,q,g,7,1a,7,n,4,7,10,l,h,g,10,u,6,8,1,1,1,4,4,1,4,1,a,5,4,8,6,13,1,i,1f,1,2,9,2,10,1,2,9,9,j,1d,c,13,2,1,1,1,1,1,1,g,k,b,29,9","r t":"1c,2i,3,i,3j,19,52,4o,6,7f,1p,f,2,1q,1q,p,1,2y","r u":"1b,f,1v,1,1,1,2f,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,4,1,1,3,1,2,1,1,2,1,1,1,1,1,5,1,1,1,1,3s,2m,3,57,3,6,b,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,8,1,1,1,1,1,1,1,1,1,1,30,1,1,29,w,27,1,1,1,1,1,4,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,1","r v":"ac,1b,ge,2b","r w":"l,t,5,4k,1,55,6,6,b,3,2v,c,3n,d,8,o,1,1,3,s,q,1,1,1,h,1,1,2,3,6,f,19,2f,a,y,b,1,1,1,7,3b","r0 ":"fn,g","r1 ":"1s,a7,7l,6p,1,1,2,7,8,9,4,5i,1,4,1,11,3,4,2f","r11":"xv,1","r14":"bo","r2 ":"2s,da,6,jp","r23":"102","r3 ":"2u,b3,4y,w,g2,2,6","r32":"107,4","r33":"103,5,4,2","r34":"109,1","r4 ":"2k,bk,ci","r5 ":"qv,5w","r6 ":"as,lx,1","r7 ":"8x,im,u,2,6g,4,1","r8 ":"2j,bk,df,19,27","ra ":"24,1r,53,71,8,w,2x,fh,1,1,1,1,1,1,1,1,1","rab":"l7","rac":"2f,1e,1,9p,1,1,1,1,3c,a,x,5e,g,1i,15,21,m,2b,1e","rad":"1f,8,4,4g,q,1,e,29,d,1j,14,68,1q,q,c,1,z,16,1,k,3,2w,2x,i,39,l,z,y","rae":"w4","raf":"8v","rag":"bk,r,2f,3n,3t,5j,8,22,s,n,1,1","rah":"iu","rai":"1y,1,1,1,1,1,36,o,3,2i,86,15,6q,15,a1","rak":"y0","ral":"0,6l,1i,2w,9h,3l,t,3t,1,8,1,3a","ram":"3i,1h,70,61,cq,13,3","ran":"3j,r,5,8,10,1u,w,4q,g,q,14,18,d,1b,4t,9,6,1g,1,3e,3s,l,1,31,1,1,1,1,1,1,1,1,1,1,1","rap":"2n,61,5,7b,6w,32","rar":"ls,2y","ras":"47,i,3,bh,1s,4p","rat":"bp,3,e0,2v","rav":"a4,bw,1l,1g","raw":"l7,9d,w","ray":"4e,3i,9h,78,2l,7,84,6","rb ":"v,hj,1k,bc","rba":"76,2","rbe":"28,3e,8a,gt","rbi":"kd,dl","rbl":"x,yi","rbo":"g,7g,1q,h3,41,3q,g,w,m,a","rbr":"5,2,2,8s","rbu":"92,3c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9z,7a,8","rby":"86,43,3,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,b5,f,7,2n","rca":"5b,8x,9t,7r","rce":"5,3,2,a,2,6,1,3,p,1,3,8g,n,v,1,3,7,1,77","rch":"m,20,j,9,17,2o,22,2,7,1e,7,2,p,c,o,d,3,1,e,f,3,18,8,b,w,4,1o,1l,1t,c,2y,z,a,7,9,g,i,2,3i,h,10,v,1,c,y,5,1,1","rci":"3r,cs,dt","rcl":"2c,dp,ia","rco":"3o,9n","rcy":"s3","rd ":"7,b,p,2,4,1,1,1,1,3,3,k,3,6,1,6,7,j,c,q,1i,l,1,2,8,9,g,o,4,1,2,5,1,1,2,7,1,1,2,1,5,f,y,k,j,6,3,b,2,u,u,1,6,1,g,2,5,1,4,u,2,4,1,1,1,1,1,1,4,1,9,2,3,2,b,2,c,3,1,2,2,14,8,6,2,6,t,4,2,2,g,9,7,d,8,3,e,j,b,3,o,1,2,3,1,3,1,3,1,2,1,1,1,1,1,1,1,1,1,1,d,7,2,3,2,2,4,1,5,3,1,1,1,1,1,3,6,1,1,1,f,7,3,1,5,c,i,2,9,18,7,1,1,2,3,1,4,4,1,2,1,1,1,1,1,2,1,1,4,2,e,b,1a,h,i,c,n,1,9,4,1,1,3,k,1,5,a,6,1,1,3,b,3","rda":"jy","rde":"y,2w,1,1,1,j,4p,1v,5p,1,1,2,1,q,18,48,24,24,12,32,1l,2a","rdi":"3m,65,c,49,3,1,4,fn,2t,1,h,1,3,2,3,1,i","rdl":"13,b3","rdo":"84,3m,d6","rds":"7,y,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,10,4,5m,5,l,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,18,f,2,6,2,1,7,1v,g,z,j,6v,2j,6,23,a,2,2,8,v,1,2,1,1,6,1,2,1,1,1,2,1,1,1,3,1,1,1,2,6,7,2,1,f,1x,1d","rdw":"ch,eh,47,29,1,2","re ":"8,2,a,2,6,1,3,9,2,a,4,4,5,4,4,7,e,2,1,1,g,e,9,1,1,1,8,1,a,5,2,r,4,1,2,3,c,6,9,3,5,4,2,1,2,5,1,1,4,1,3,2,2,7,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,h,f,b,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,2,2,1,1,1,1,1,1,2,3,1,1,1,2,1,5,2,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,b,3,1,4,4,1,3,3,1,e,b,b,2,c,2,d,3,2,1,1,1,2,1,h,1,5,3,b,b,1,2,1,i,1,9,1,1,1,1,8,1,4,3,1,3,2,d,1,a,b,6,1,1,1,1,1,2,d,1,2,9,j,3,8,2,1,1,1,1,1,1,2,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,1,3,1,1,1,1,1,1,1,2,1,1,1,1,1,5,5,1,1,1,1,5,2,1,1,1,1,1,1,2,2,1,1,1,1,1,2,6,2,4,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,5,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,5,1,2,2,1,1,1,2,1,1,4,1,4,2,2,4,2,3,1,1,1,1,2,7,6,2,c,1,2,y,b,2,1,2,2,3,g,6,2,l,u,1,2,a,1,1,5,3,7,2,1,1,2,1","rea":"1r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,1,1,1,1,1,1,1,1,1,2w,5,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,4,2,3,1,2,1,1,2,1,1,1,1,1,5,1,1,1,1,3n,22,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,8,8,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,7,2g,6,7,2,1,1,1,5,5,1,5,4,5,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,8,1,1,1,1,1,1,1,1,1,1,12,v,19,d,1,9,7,1,1,1,1,1,1,1,1,b,4,4,2,1,6,2,1,1,1,3,3,x,4,8,5,6,2,1,1,1,5,5,i,18","rec":"3d,f8,5n","red":"f,m,2,4c,t,r,13,19,6,l,l,5,12,y,d,1f,n,9,10,4,2v,28,7p,3,4u,r,x,8,1","ree":"0,1,3,1,2,2,1,8,8,1,3,1,2,4,1,q,6,1,1,a,1,c,1,2,1,3,1,1,2,5,4,2,1,2,3,1,1,4,3,2,1,5,1,1,2,1,1,1,1,1,3,4,6,2,4,5,1,1,3,4,2,1,1,1,1,4,5,2,4,1,3,1,1,2,4,6,2,1,1,1,8,6,2,1,4,6,1,1,2,2,1,1,3,2,2,7,1,1,3,1,1,2,1,4,1,n,d,3,2,2,3,2,4,1,2,2,2,1,7,b,1,1,3,2,4,1,3,5,1,2,2,1,4,1,3,2,1,4,3,2,1,4,2,2,1,6,2,1,3,5,a,3,5,1,2,1,1,2,3,4,1,2,1,3,1,1,2,2,2,1,6,2,4,1,1,8,1,3,3,5,3,1,3,4,1,1,2,6,2,3,2,1,2,1,5,2,4,3,b,2,j,1,4,2,4,2,1,8,5,2,4,1,2,1,2,2,2,7,4,6,1,2,1,1,1,3,3,1,h,u,7,2,2,1,1,1,2,1,1,1,1,1,1,1,1,1,2,7,1,2,1,2,2,1,7,4,v,1,3,1,1,4,2,3,1,1,2,1,3,9,2,1,1,2,4,5,7,6,1,1,5,7,3,1,4,1,1,2,6,3,x,c,2,6,9,1,1,1,7,1,1,1,5,1,1,1,1,2,2,1,1,3,1,1,1,1,1,3,1,2,1,3,1,1,1,2,1,5,1,2,3,a,1,1,2,3,4,1,4,1,b,1,1,d,3,7,5,1,2,2,1,7,2,2,1,3,5,1,9,2,1,1,6,2,7,1,1,7,2,2,1,3,2,1,4,1,1,5,6,3,2,1,1,d,1,2,1,1,1,6,1,1,2,3,1,7,1,2,7,e,1,9,1,c,1,1,3,1,3,1,3,2,1,1,3,3,1,1,3,1,9,4,1","reg":"1x,i8,53,y,1,1,1,1,1,1,1,1,1,1,1,1,1c,d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2g,1h","reh":"tz,6t","rei":"6k,25,h9","rel":"6x,1,1e,j,54,2d,59,1,22,1t","rem":"53,2e,4n,5n,5b,81,50","ren":"37,2b,3,1y,6,i,e,d,2,13,83,1,2,4l,a,26,l,26,1c,s,i,1,1,3,1,1,2,1,3,2,1,2,1,1,1,1,1,1,1,1,5,1,2b,1,1,1,1,1,1,1,s,3,1,1,1,1,1,1,3","rep":"p6","rer":"8x,4,po,1,1,1,1,1,1","res":"2t,k,1,n,9,5,1d,2l,r,c,1l,v,16,1,19,34,f,d,d,3,g,19,34,4,2o,1,1,2,7,2,6,9,2,2,32,p,l,3,k,15,y,1n,q","ret":"9l,15,1s,t,a9,4","rev":"ba,ez","rew":"q,2h,z,4,b,5,s,3,24,41,17,59,1,2,6,1,4c,1,1,9p,1,t,2m,r","rex":"rm","rey":"26,5y,8,65,6,1i,3p,2,50,l,3t,5,1,1,1,3,o,4,7,d,j","rf ":"k6,an,g","rfc":"az","rfe":"9d","rfi":"8w,ed,1r","rfo":"et,4r,6,2z,9,v,k,5y,33,1,2,2c,2,2,4,1,1,4,1,1,1,1,1,2,2","rg ":"ba,7q,cu","rg1":"f4,ea","rg2":"t6","rg5":"jn","rg9":"2p","rga":"gs,r,q,5r,2d,s,f,48,1m,1,1,1","rge":"2,26,f,29,4,7,4t,y,2y,1h,1,q,1t,5f,18,7,2d,l,8,7w","rgh":"38,1,1,4,1,1,1,2,6,1,1,1,1,5,1,1,1,1,1,1,1,1,1,2,4,1,3,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,s,9c,1,1,u,7,h,1,1,1,1,4,1,1,1,1,3,1,1,1,1,1,1,4,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,1,4,1,1a,1,g3,g","rgi":"48,ie","rgo":"f2","rgs":"5j,p0","rgy":"2p,2m,h","rh ":"f,5u,9o,7p,u,6o,5d","rh1":"uk,d,j","rha":"0,1,c,d,4,1,9,g,4,1u,82,c,jy,1,1,1,1,a","rho":"66,3s,e5","rhy":"rn,5q","ri ":"nh,i","ria":"25,1i,27,x,h,b,l,8,b,1s,1e,1b,1a,q,4k,1a,1,1t,c,1s,4,h,g,g,s,f,u,5,1l,d,7,12,1,1,7,1e,m,f","rib":"1u","ric":"26,1,h,3,f,3w,1j,1,1,1,1,1,d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3o,19,12,b,2b,1k,1l,37,p,1,1,1,1,1,1,1,1x,2l,13,1,3z,b,n","rid":"4,1,2,2,3,f,h,e,e,1y,f,j,4,1,8,8,6,8,e,1f,4,1a,2,1v,f,k,o,h,5,e,c,9,j,2,l,i,1y,4,7,2,k,2d,1c,w,6,1e,b,1p,h,m,x,1c,2e,1g,9,1e,3,1,2,2,8,1,1,7,b,1,2,1","rie":"2f,10,1,1,1,1,1,1,1,1,1,1,1,1,1,1,12,c2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2g,1,1,1,cm,b,1,1,1,1,n,1","rif":"7g,1q","rig":"q,2f,v,m,13,33,4b,52,7w,4o,4,a,7,3,4","rij":"zh,1,1,1,1,1,1,1,1,1","ril":"e,q,1,4,2n,e,bo,8c,2g","rim":"a7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3v,1y,11","rin":"6,7,15,j,3,1,1,g,1,1,1,1,1,1,1,1,4,4,2u,m,e,b,1,2,5,7,1,1,5,9,o,d,4,c,22,v,1h,1,1,j,b,1,4,9,f,e,2,1,1,1,1,1,1,1h,1o,1d,8,4,3,f,15,1,13,20,6,o,1o,6,19,1b,a,1b,3,1,1c,5,1c,x,1,3,5","rio":"1l,6f,8u,7,f6,4l","rip":"y8","ris":"30,3,1,1,1,1,1,1,1,1,1,1,1,25,14,1g,1x,w,2i,1m,5,2h,k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1,1,h,5c,3e,3b,q,p,1,3,1,1,1,1,1,1,1,1,1,1,9,4,1,3,f,y,5,1,1,r","rit":"6n,13,24,7,e7,1,1,1,1,1,1,1,1,1,1,59,1o,2i","riu":"bt,3t","riv":"s,8w,26,9f,3w,7,4l,1y,10,1g","riz":"1v","rj ":"3x,9o","rju":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,1","rk ":"v,c,7,47,f,11,8,1g,c,20,s,1a,5,12,19,a,1,u,b,p,1,18,7,c,5,5,e,b,l,4y,l,27,b,8,4,j,7,44,f,1x,1,1,1,1","rkb":"28,bo","rkc":"h2,1,1","rke":"22,n,1i,i,3,2,1w,w,4,5,2l,5,c,f,1b,6,1g,5,1h,e,1s,35,9,b,w,f,7,4,a,1b,1r,b,8,2,4,1,5,f,i,1,1,1,b,1,1,r,1v,1,4,e,12,1,c,2b,7,t","rkh":"gv,9r","rki":"9w","rkl":"i5","rks":"2p,2p,a,12,d,15,o,3x,1h,9,9,c,1f,3,p,1i,d,9,8,3,1p,1s,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,v,1x,17,d,1,b,8,y,1","rkv":"gi","rkw":"8s,h9","rky":"1r","rl ":"27,17,4x,16,4d,4u,4v,h,1g,3s,h,3b,d,2w","rla":"2d,18,a4,57,f,g,cw,1,1,1,1,1,1,1o","rld":"fb,1","rle":"s,28,2o,9,1,1,1,1,1,8n,b,1n,1,24,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,14,t,1p,q,1,9,30,q,4,2,z,1k,33","rli":"3v,25,ao,10,9w,46,1,1","rlo":"6e,9b,p,o,3s,5i,e,v,l,32,5b","rls":"8e,1,h4,1,3g","rlt":"b4,dv,63","rly":"79,2","rm ":"nw,2t","rm1":"10m","rm3":"10n","rm9":"j4","rma":"3z,ad","rmb":"st","rme":"ba,a4,9k","rmi":"8,9,c,c,2e,5j,4,8,6,a,1,5,1n,4,6,5,4w,1z,1,9k,6r,1f,1,1,1,1","rml":"3k,dq,2r","rmo":"be,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,ke,3c","rms":"1,p,1j,1,3,4,1j,1,r,1o,l,1v,b,1a,g,3,k,b,2,1i,a,4,2,6,a,4,1q,u,j,j,a,1t,s,4,e,e,d,w,f,7,6,l,q,7,18,3,a,4,w,u,q,3q,h,20,8,3,k,9","rn ":"8,c,2,o,4,3,3,u,f,5,d,6,a,v,c,10,3,h,j,2,x,3o,a,w,u,q,k,15,c,b,c,3,y,17,13,e,9,o,2,p,15,1b,1f,v,q,3,2,c,t,c,m,2f,1u,h,o,8","rna":"p,8,31,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,bj,55","rnb":"tg","rnd":"6m","rne":"g,1a,l,f,9,4w,1,1,1,1,1,1,1,1,1,q,5,n,31,u,19,9,4c,58,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,13,v,2i,c,s,x,t,1,p,13,1,5,2,c,e,3,3,2,1,1,2","rng":"bh","rnh":"5e,99,et,1,1,79","rni":"2l,hd","rnl":"6t,eo,c,5n","rnm":"7x","rno":"hf","rns":"c,b,7l,7g,9p,7l,1,1,1,1,n,1,11,1j,b","rnt":"qw","rnv":"9w","rnw":"8x,2e,fy,6l,1,1,1,4,u,4,1","ro ":"s,3e,13,2n,b,q,4,g9,8k,3,4,o,1,1,1,1,1,1,o","roa":"2,1,5,5,3,3,2,2,1,1,4,2,8,1,1,1,1,2,d,1,1,6,1,6,2,2,1,3,4,1,1,3,1,1,2,6,1,5,1,1,1,5,5,2,6,1,2,3,3,1,l,2,1,s,4,1,1,1,2,1,1,1,4,1,4,4,e,1,1,1,1,1,1,1,3,3,5,2,a,4,a,7,4,3,1,5,4,i,9,1,4,2,2,3,1,1,4,2,1,1,1,5,1,1,3,3,2,1,1,2,c,2,2,1,2,8,3,5,1,5,1,3,3,3,4,8,1,9,2,2,4,1,a,8,5,8,1,b,1,1,1,3,3,7,1,1,5,1,2,1,2,1,1,1,2,1,3,4,1,5,1,1,1,1,1,2,b,2,5,1,1,6,5,2,1,2,3,j,6,1,c,2,1,1,1,2,c,e,1,2,1,1,9,6,2,1,1,3,1,1,5,2,2,1,3,1,3,3,2,2,2,2,1,2,5,t,1,1,1,8,6,1,1,1,5,2,w,1,a,5,3,6,4,2,6,2,c,4,n,1,4,2,2,1,4,1,1,9,2,m,a,5,1,1,g,1,1,8,a,5,7,1,x,1,6,1,2,1,3,2,4,1,2,1,1,1,1,1,1,7,9,1,b,b,2,1,5,3,1,3,2,5,2,1,1,1,2,4,3,5,a,5,6,1,g,1,2,1,2,3,4,1,1,1,1,g,a,2,3,8,m,4,2,1,3,2,1,1,1,2,1,1,3,2,1,3,4,7,1,8,5,2,7","rob":"9,63,1,1,1,1,1,1,1,i,1,1,1,1,1,1,1,1,1,1,24,4d,3e,3n,1,1,1,1,1,1,1,1,1,1,1,1,1,bx,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1","roc":"w,1l,35,3d,c,r,3z,8k,80,53","rod":"32","roe":"i,90,2t,ac,4l","rof":"m5","rog":"oh,1,93","roi":"2c,dp","roj":"8x,py","rok":"uq,2z,1w","rol":"10n","rom":"i,z,1,4,7h,4,a,1,n,1d,ez,6,1x,1,1,1,1,1,21,5,3,1,2,3,9,4,28,2y","ron":"3o,1m,b1,86,3y,39,v,1","roo":"1h,3m,5,5,1e,16,n,h,10,1s,15,d,4g,3,16,4,o,6,1,1,1,y,1z,h,j,9,10,5,s,2q,u,s,5,l,3k,b,g","rop":"bq,5a,70","ror":"wc,1,i","ros":"0,w,10,h,o,8,1,1,10,9,17,12,16,q,1f,q,j,x,o,r,1c,7,b,r,d,1v,1,1z,z,4h,1o,1q,p,30,d,3","rot":"bs,kj","rou":"3f,1p,3i,1p,4,p,w,2,1,19,1d,14,1n,3,1p,m,13,2a,2,1,b,n,w,p,3,3k,50,z,d,m,a","rov":"h,15,b,4e,36,o,1d,be,o,x,14,2w,13,13,d","row":"v,s,1c,a,1u,4s,1m,t,3,j,23,7,n,w,v,7,s,t,3a,2b,1e,f,a,o,1v,1,2,4,5,6,3,1,1,1s,2c,1l,b,g","roy":"2,2s,1b,m,7,z,1,1,1,1,1,1,2b,m,10,1,1k,x,18,1x,l,1v,p,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,27,34,1,a,1s,k,1l,b,13,2m,1x,b,q","rp ":"g,96","rpe":"8d,50,cf,3z,29,1n","rph":"4e,9y,3,2l,fg,l","rpo":"7b,w,3r,7i,1,1u,3z,1d,3,1g,6,4,c,1","rq ":"1v","rqu":"xz","rr ":"88,1c,5n,3q,6g","rra":"3t,1,k,19,ay,e,a,10,3j,3q,a,v,21,8,1,1u,n,1,1,5,1e","rre":"26,66,j,2,4,k,4w,6,1i,3p,2,3s,1t,3t,5,1,1,1,3,o,b,d,j,8,31,1,1,1,1,1,1","rri":"33,1,1,1,1,1,1,1,1,1,1,1,2g,12,b,1,7,7,1,1,e,12,w,5m,1f,l,k,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,1x,4,3,f,15,1,de,g,8","rro":"2z,2n,5v,3i,9i,1,2i,2q,5,6,3,1,1,25,32","rry":"1,58,3,48,83,6,14,15,15,3v,38,n,3n,d,3i","rs ":"1,14,1a,1m,n,4,c,3,1b,9,h,e,5,7,5,1,8,5,9,h,v,f,c,2,5,a,c,m,5,m,2a,b,a,b,1b,7,5,3,6,6,o,z,14,g,r,5,1,a,8,n,4,1,s,h,2,8,7,6,6,4,8,9,k,l,13,1,1d,14,1,15,1j,1j,1,1,1,1,1,1,1,1,1,1,4,6,2,3,h,5,1","rsa":"5z,hy","rse":"3,1,1,9,f,1y,43,o,1h,4a,1,12,15,1,1t,25,1,21,1l,20,1g,7,v,l,6,4,a,2,1,4,2m,p,z,v,1,1,1,1,1,1,1,2,2,1,p,1,2,1,1,1,1,1,1,1,1,1,1,x","rsf":"ng,10","rsh":"8,2,a,2,6,1,3,c,2,b,4,3u,k,1,2,3,1,1,1k,1,1,1,1,1e,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,1,3,7,1,2i,4x,o,1,1,1,1,1,1,3,9,1,1,1,1,3,1q,1,21,1,1,1,4o,5,h,37,1b,1,1,1,1,1,1,1,1,1,1","rsi":"28,bo,b9,4j,28","rsl":"d9","rsn":"5u","rso":"2f,b4,1,1,1,1,24,1,1,1,1,1,1,1,1,bk,2f","rst":"d,1u,1n,1,1,1,h,11,6,5p,c,g,1s,2q,3,1,1,1,1,1,1,1,1,1,n,61,m,2i,3m","rt ":"e,m,i,13,16,p,1g,1c,4,g,1,c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,j,2j,2,1,3,l,5,y,v,m,j,3x,1h,7,1e,2h,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1,1,1,1,1,1,y,f,a,m,d,23,7,7,r,1l,3,14","rta":"sg","rte":"66,4p,1i,5z,2f,8,8c,3y,2j","rtf":"1s,z,5j,3,5,5o,g,4l,68,3,6,3o,b,2,2,1,1,1,5,1,2,6","rth":"0,4,4,4,5,a,7,9,1,3,w,1,1,1,1,1,1,1,8,5,g,e,2,3,2,1,4,7,g,u,a,y,1v,7,r,9,q,4,27,4,v,1,1,1,1,1,1,1,1,c,2,1,8,7,1a,1,i,3,a,8,3,1s,h,3,2,9,x,3m,3,1,1,9,7,6,1,1,h,5,1,1,k,d,5,5,1,2,1,1,3,3,3,9,3,8,1,5,f,1,1,5,d,t,9,8,p,13,a,1,o,a,3,z,j","rti":"2k,r,2,1e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,m,89,22,1e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,ew,3n","rtl":"6a,ec,6,ak,3q,u","rtm":"bk","rto":"o,2i,5,7,j,2c,4,1f,15,1,10,7,n,4,8,5,11,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1a,3i,2,f,16,7,p,8i","rtr":"43","rts":"12,a,50,1,1,1,1,1,1,1,i,1,1,1,1,1,1,1,1,1,1,2a,2,5,a,x,4z,18,22,e,8,4,1,1,1,s,1,1,1,1,1,1,1,1,1,1,1,1,2d,1,28,f,1,1,2h,h,7,8,s,c,i,3,1b,2r,2,16","rtw":"bf","rty":"77,6e,6n,g","ru ":"3s,3w,n,af,10,16,1,5,1,44,9","rub":"w4,3n,1,1,1,1,1,1,1,1,1,1,1","rud":"3l","ruf":"b7","rug":"8g,e,ff,1d,j,5g","rui":"x,18,hj,af","rum":"k,59,bp","run":"mf,4g,1,z,1n,2c,o,17,10","rup":"f9","rur":"s,51,s1,3,4","rus":"2j,6h,53,hz,1","rut":"33,1,1,1,1,1,1,1,1,1,1,1,v,a,4d,9a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5t","rva":"b4,hh","rvi":"5q,4o,dd,58","rw ":"57,fq,5k","rwa":"vv","rwe":"p9,26,2i,4q","rwi":"3q,4f,4,1,1,1,2,1,1,e,i,2,l,1q,3,8,57,1v,i,q,44,u,3,3,1,1,1,2,1,1,1,3,1,1,e,5m,42,2,2,4,f","rwo":"40,bc,7v,1o","rx ":"5k,28","ry ":"1,p,n,3,5,q,1,11,l,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,g,3,h,j,1,4,f,m,r,1,1,1,2,1,2,7,6,f,7,4,4,8,n,e,3,q,a,5,z,n,1p,d,1,7,8,l,t,6,s,b,1,5,g,k,n,4,4,4,5,1,d,f,14,e,19,o,1,1,1,2,1,1,2,2,1,1,e,o,k,x,b,c,c,e,a,1,f,e,8,7,j,n,1,i,2,5,b,b,4,k,1n,g,5,6","rya":"cc,ko","ryb":"o5","ryd":"uj","rye":"2c,dp,kk","ryg":"ik","ryl":"1y,1,66,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,5p,an,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1","ryp":"vz","rys":"4a,g,4j,dp,1n,h,7i","ryt":"ai,m0","rz ":"75,77,aa,9l","s 1":"2d,5,d,f,1e,2y,2,3,7,q,o,x,8,8,1e,1m,d,t,1j,3,i,h,p,3b,1l,1g,1w,o,1,b,e,e,4,17,9,b,n,1,h,d,d,p,e,1u,y,b,3","s 2":"21,9,1q,22,h,2a,3,18,1y,1r,1d,1j,4f,a,1b,7,1i,1f,9,15,2,d,o,1,6,2p,d,10,h,1e,1k,j,1","s 3":"p,1k,2c,1t,4h,30,3n,14,28,h,59,a,25,u,28,o,17,1k","s 4":"77,g,12,7r,d,1b,69,1l,43,1w,w,32","s 5":"6i,k,8o,f,a,22,2r,5o,24,y,3w,1","s 6":"2h,5d,67,2a,6k,l,3h,z,3l,v","s 7":"c8,4s,17,4,4b,40,e,5q,34,l,1","s 8":"fx,q,6q,8r","s 9":"47,i,20,9k,1s,p,2m,19,4y,54","s a":"1,6,7,3n,r,f,2d,1n,9,b,8,3,f,j,d,k,2,2c,4,1q,p,2,o,h,r,v,1r,r,10,b,1o,7,7,14,e,2k,5,3,a,17,x,m,e,h,1r,9,8,n","s b":"f,1,1,1,4,7,5,1,1,1,1,1,1,1,1,4,2,1,1,1,1,2,1,3,1,12,8,19,y,8,35,l,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,i,c,f,1,1,1,4,7,1,3,5,3,1,1,1,2,2,1,3,1b,6,j,4,d,t,8,c,14,5,4,16,1,1,1,1,1,1,1,5,t,1,1,1,1,1y,5,3,3,4,c,r,1l,4,g,j,1,1,b,1g,8,a,1,5,2,h,4,3,b,9,o,4,o,f,t,e,7,3,k,x,9,2,8,3,1,7,8","s c":"12,1b,3n,i,j,7,w,5,6,b,x,g,b,6,f,6,3,2,1v,k,q,c,s,m,3,g,i,1v,1,1,3o,s,4,b,y,1,e,3,6,1,e,8,1,i,x,9,2,46,f,1,h,i,3,2,1b,1l,5","s d":"3,2,2,2,5,9,1,1,7,1,f,7w,u,2s,4,b,1,1,1,3k,28,1,1,1,65,f,2i,67","s e":"3a,p,1,1,l,2,4,4,5,4,2,c,8m,b,v,2,29,4,2,d,q,d,2s,6i,u,j,5m","s f":"2w,1e,b,5,a6,av,o,17,1j,6t","s g":"2f,j,3,4,7,o,8,g,3,j,1,2,c,2,2,1,p,z,a,1k,7,2,r,7,4,6,a,2,6,2c,o,n,3,5,k,2,7,1m,h,16,1,1,1,j,m,h,1,5,x,h,h,5,3h,1m,b,1e","s h":"18,2g,y,q,16,1,h,25,c,8,c,w,r,1,1,7,14,i,13,6,p,5,3q,1,1d,d,2,q,f,1l,x,q,28,n,z,d,3,2,8,d,i,8,1,n,1l,3,c,1e,f,h,9,3","s i":"n,2,7,25,52,2r,l,20,1m,7z,1u,6,8d,1d,19,r","s j":"2f,3t,1a,8a,7,6s,7,5,83","s k":"26,24,b,5,t,2,59,24,37,1n,d,2b,9t","s l":"1i,y,l,42,u,f,2i,1j,1n,11,i,5,12,12,1m,1,1,1,i,7,v,29,r,4,1,1,2,1,1,2,1,2,4,x,1a,9,4,19,g,c,3f,2d,1,1,i,16,4,1","s m":"55,1e,7,2,j,1r,26,1m,i,28,1t,d,1s,w,2,9,f,7,4,12,9,22,b,4,21,5b,1,3c","s n":"2m,12,4x,1,63,t,i,3j,1,1,48,s,7,a,2,8,j,1,i,4,3p,1x,c,1,4,12,2f,1,6,1,2","s o":"21,2w,26,5e,50,6o,2e,14,4,1t,4,3a","s p":"2n,e,19,a,6,1k,1i,17,c,5q,5,k,e,3i,10,1z,3w,b,46,7,13,3x,1,6,d","s q":"10s","s r":"d,a,s,y,5,7,2,a,9,3,12,10,6,2s,8,1,h,5,d,1e,i,1u,e,d,a,p,1,3,p,b,f,7,4,j,f,2,e,2,a,8,g,6,2,6,1,i,3e,1,e,18,o,1,u,16,h,4,9,11,9,j,e,p,18,5,2,5,1,j,3,e,1g,t","s s":"0,5,4,13,q,4,1u,1r,u,6,9,n,6,1z,4,1k,f,5,3,6,3,n,c,a,k,k,q,2,o,1,i,11,1o,c,1,1,1,1,1,w,i,m,1,i,g,10,m,4,18,1,2,m,1,1a,p,x,l,b,6,e,6,3,3,x,1,i,d,g,3,a,p,r,m,6,1,4,6,5,6,5","s t":"3,2i,13,6,19,1f,1i,2j,4,g,8,4i,1y,23,1,4a,2k,1n,3u,a,1,4,7,9,17,2j","s u":"0,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,2,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,2,1,1,2,1,1,2w,2d,25,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,19,1,1,1,2,2,8,2,1,5,3,1,1,1,2,3,1l,i,4,4c,1,1,7,2g,83,2e","s v":"xj","s w":"0,1,1,2,2,1,4,1,1,1,1,4,2,5,1,3,1,d,1,b,4,5d,2,1z,5,1,u,5,1d,c,3d,3n,j,h,1,g,q,p,z,8,q,c,4,1,1,2,1,1,2,1,2,5,k,7,f,25,2,i,1s,1,6j","s y":"o6","s0 ":"jp","s01":"uc","s1 ":"1h,5m,gm,h,1,8r,4,a,9,4,1","s10":"nv,3","s11":"c1,3,2k,8u,1,a,bp","s12":"bt,ci","s14":"10l","s15":"oe","s17":"nq,1,1,cs","s18":"og,86","s2 ":"jq,de,p,1w","s20":"o5","s25":"od,86,1","s27":"o9,1","s3 ":"ne,1,9q","s32":"nn,1,9","s33":"nl,1","s34":"iz","s4 ":"j0,f,g9","s40":"8w","s42":"n9","s5 ":"15,2,io","s6 ":"na,1,q,98,1","s7 ":"e5,9p,9e,2f","s8 ":"f5,hu,7,1","s9 ":"8q,2o,el,7c,26,4","s92":"7l,fl","sa ":"hz,z,4g,2y,54,3u","sa6":"xe,1,1,1","saa":"10f","sac":"7h,fl","sad":"d0","saf":"wr","sag":"nx","sai":"f,ak,97,fz,1,6","sal":"j,y,54,4t,6l,4j,ba,k","sam":"1i,kq,z,1,1,1,39,1,1,1,1,1,1,1,1,1z,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2k,4","san":"3r,26,2,5b,1s,80,1o,1c,2u,18,23,6h","sat":"kq","sau":"3t,6y,6i,c,s,3,1","sav":"ux","say":"gw","sb ":"6g,3o,ar,1,3o,8n,j","sba":"5j","sbo":"wc,1","sbr":"j4","sbu":"q,1l,1,40,1,4,11,1y,1k,q,f,1m,22,1,7,4s,4,26,6k,45,k","sby":"5k","sca":"3f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,c6,y,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2g,1,1,1,fq,1,1,1,1,1,1,1,1,1,1,1","sce":"3e,2e,cw","sch":"jj,6,ez,1z","sco":"3h,8,3,6j,37,3f,8,79,a0,1,1,1,1,1,1,1,1,1,1","scr":"1u","scu":"nd","sd ":"w,z3,r","sda":"o2,4p","sde":"30,a7,1t","sdo":"8e,1,j,2,68,10,9b,1,8a,1,1,1,1,1,1,1,v,1,1,1,1,1,1,3","se ":"4,2,19,w,f,6,3,a,1,5,8,g,7,k,1,j,2,q,l,3,16,r,4,o,f,3,p,e,6,h,1,2,4,c,o,7,8,5,s,8,e,3,9,23,3,10,4,1,16,m,7,10,e,1b,8,j,4,1,1x,1j,s,2,1f,1f,k,2,6,6,3,o,c,1l,9,5,e,8,k,6,5,1,3","se1":"1t,3,m,3,g,1,b0,z,9","se2":"2t","se4":"2h,bk","se9":"j8","sea":"4g,4a,6r,16,1s,1a,6a,4b,d,1,6,6,7,1c,1,e,17,1c,2,2,4,d,f","sed":"9s","sef":"1a,1,1,1,1,1,1,1,1,1,1,1,1,1","sel":"e,p,1g,1l,55,k,4a,25,7x","sem":"74","sen":"6t,eo,a3,f","sep":"7h,1,1,1,1,et,1,1,k,1,1,1,1,1,1,1x","ser":"7h,1,z,1x,q,94,2u,1,2k,2y","ses":"3,2,o,1y,1v,8n,1,28,gq","set":"8z,5d,h7,2j,1,1,1,1,1,1,1,2,2,1,p,1,2,1,1,1,1,1,1,1,1,1,1","sev":"c,a,2p,7v,s,a,v,2r,5e","sex":"8q,5f,j,3,4d,7,1,1,b,1,6a,2j,24,3,4,a,2,1,4,2,1,4,40,1,1,1,1,1,1,1,1,1,r,1,1,1,1,1,1","sey":"7i,1u,s,9c,1,3a,c,7,39,7,v,l,6,4,a,2,1,4,o,3m","sf ":"1k","sfe":"59,ce,6","sfi":"8j,c,4f,a6,1w,r,7o","sfo":"72,76,3,5a,4v,1a,56,4n","sg ":"4y,d5,2y,b8","sg1":"8i,h6","sga":"74,nm","sgo":"33,1,1,1,5,1,1,v,3,1,3,3,1,r,1,1,1,2,1,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,3,a8,1,1,1,1,1,2,1,1,1,1,1,z,l,1,1,1,1,1,1,1,1,2,1,3,1,1,3,1,1,i,1,q","sgr":"1m,7v,o,1d","sh ":"18,2,h,5,d,u,m,16,4,1o,1g,15,t,p,6,21,f,2,h,m,m,o,16,13,1i,l,5,f,47,3e,17,c,3,1f,v,5,2k,1v,1,1,1,1","sha":"v,1k,39,f,1,2,3,1,1,v,5,4l,t,y,1s,1x,z,y,t,1,1,1,1,1,1,3,6,3,1,1,1,1,3,i,13,5,1,1q,1,1,1,1,1,1,1,1,1,1,4k,u,a,1c,1,2v,1,1,1,1,1,1,1,1,1,1,18","shb":"cn,u","she":"1b,9,16,5j,49,1u,22,1,1,2w,e,33,e,3,1,3,1,3,1,2,1,1,1,1,1,1,1,1,1,1,3,1g,2z,2p,1e,1,4,1g,m,21","shg":"63,rd","shi":"8,2,2,8,2,6,1,3,9,2,a,4,4,k,e,2,1,1,g,j,4,1,1,1,7,c,y,4,1,2,3,r,3,b,1,2,5,1,1,4,1,2,1,4,7,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,a,k,h,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,2,2,1,1,1,1,1,1,2,1,2,1,1,1,2,1,5,2,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,b,3,1,4,4,1,3,3,1,e,h,j,2,d,3,3,1,1,2,1,d,4,9,m,1,2,j,1,9,1,3,8,1,4,3,1,3,2,d,1,r,1,1,1,1,1,2,d,1,2,9,j,3,8,2,1,1,1,1,1,1,c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,4,1,1,2,1,1,1,1,1,2,1,1,1,1,3,1,1,1,1,1,1,1,2,1,1,1,1,1,5,5,1,1,1,1,5,2,1,1,2,1,1,2,3,1,1,1,1,2,6,2,4,1,1,1,1,1,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,5,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,5,1,2,2,1,1,1,2,1,1,4,1,4,2,2,4,2,3,1,1,1,1,2,7,2,1,1,4,p,g,1,7,17,2,1f,1,2,a,1,1,i,1,2,1","shl":"6f","shm":"4u,bs","sho":"3a,1d,12,1q,17,r,1b,15,7,o,t,10,3p,c,64,1a,l,20,t,5,t,13,i,a,5,16","shp":"cl","shr":"q,b0,bp","sht":"34,17,39,8s,6t,4o","shu":"96,c7,7z,i","sia":"vr","sic":"gn,1","sid":"c,a,3j,2g,2p,6,e,93,j,1,e,3,57,1e,7,v,l,6,4,a,2,1,4,2z,8,5,38","sie":"8p,h9","sil":"3v,2,62,da,3,1,j,8,ch","sim":"nu","sin":"1y,1,1,1,1,1,9,o,8i,3i,11,8j,4m,1f","sip":"i5","sir":"27,78,4d,2,bz","sis":"4o,b6","sit":"28,4v,6t,b9,4j,3c,1","six":"8v,k1","sj ":"2x,7,17,1,al,1f,fj","sk1":"79,j,1,1,du,10,9,1,1,4d,2","sk2":"7q","sk4":"7i,fl","sk7":"mw","sk8":"7r,jy","sk9":"7a","ska":"zh,1,1,1,1,1,1,1,1,1","ske":"17,1b,bk,q,k6,1r","ski":"71,aa,2t,w,3i,21,27,51,x","sky":"7g,1l,98,3s,av","sl ":"7t,dv,a8,1i","sl4":"2q,8v","sla":"60,bc,1,2,2,dt","sle":"7,81,p,3t,c,7,a2,22,8,1z,2c,1u,1,1,33","sli":"25,dt,3q,af","slo":"2b,30,11,y,dl,ck","sm ":"7j,fl","sm3":"jt","sma":"12,2f,q,i,3,4v,3u,2s,w,w,gb","smc":"6x,eo","sme":"98,ik","smi":"eb,ae,1","smo":"ia,1c,ar,u","sn ":"cc,6p,89,8n","sne":"5u,iz","sno":"9d,3h,h,41,3,4f,3y","so ":"mn","so1":"js,b0,a,g","so2":"uw","so4":"v9","sob":"bm","soc":"22,4q,2o,b,1,4,3,3,19,5,5m,39,22,3e,4r,15,q,1e,1,1,1l,15,2","soh":"1a,1,3,2,1,2","sol":"a1","som":"6s,6j,kt,a","son":"u,w,1,1,1,1,1,1,1,i,o,1,1,1,1,1,1,1,1,1,1,1,p,m,g,1,10,2,e,1,1,1,1,1,l,1,1,2,1g,14,s,2r,1,1,1,1,i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,z,1,1,1,1,1,1,1,1,17,g,4,g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,3,16,k,g,1,1,1,1,1,1,1,1,1,9,q,15,1h,1r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,p,2,y,p,1,1,3,1,1,2,1,3,2,1,2,1,1,1,1,1,1,1,1,5,1,1m,3e,1,1,1,1","sop":"7u,f3,1,4u,1x","sor":"2q,8v,fi","sou":"m,i,39,4,k,8,2z,f,6,3,16,b,c,18,o,a,3d,1l,b,w,6,3,8,8,1,2,31,e,1,1,1,1,1,1,1,1,3,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1f,k,5,e,12,3,14,2,1f,1,3,2,b,1,4,2,6,2,4,3,4,5,b,4,o,o,p,1o,3,l,c","sov":"6k","sow":"o,r,ay","sp ":"c7,ih,2n,6,29,6","sp1":"bj,mt","sp6":"u7,43","spa":"85,7k,9j","spe":"4i,ok","spi":"16,rl","spl":"5j,sk,c,v","spo":"12,a,6x,15,7,2,5,a,k,d,12,3,3u,3a,m,4,1,1,1,w,2l,1,1g,f,d,f,1,1,2h,h,7,2x,b,2r,2,16","spr":"6,7,2l,2y,92,4f,gi","sq ":"3m,2t,6o,et,2y","squ":"22,24,f,1l,17,2,7,l,5,30,j,g,1v,3p,e,2i,4j,7,11,1i,v,a,i,2f,1,1b,2,1,n,21,1","sr ":"1e,3o,cu,d9","sr1":"wn,1,4,1","sr3":"jr","sr5":"wr","sr6":"wp,1","sro":"58,cm","ss ":"0,w,15,c,o,1j,17,21,32,j,14,h,r,1c,i,7,k,4g,20,40,a,m,1q,8,29,16,f,3,2d,v","ss0":"jp","ss1":"eo,ku,12,1","ss2":"zp","ss4":"zo","ss7":"e5,li","ss9":"8q,h9,9i,4","ssa":"za","sse":"2j,1l,2p,1x,20,3d,2,j,3,4d,l,1s,4i,2j,24,3,4,a,2,1,4,2,1,4,40,1,1,1,1,1,1,1,1,1,r,1,1,1,1,1,1","ssi":"bi,55,1,37","ssm":"47,i,3,bh,1s","sso":"6s,12,1m,b,8,cy,1,4u","ssy":"l","st ":"0,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,2,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,2,1,1,1,1,1,1,e,6,l,p,g,5,3,4,5,6,5,h,8,4,2,2,q,f,9,2,e,4,2,8,a,4,2,2,1,1,1,1,1,9,1,8,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,j,c,7,2,5,1,1,1,2,2,5,3,1,1,1,5,1,2,1,1,1,1,1,2,1,5,n,a,4,7,6,g,4,4,2,v,a,1,e,4,4,2,1,2,1,1,1,f,3,1,2,1,3,k,d,l,3,1,1,7,5,5,o,2,1,1,4,i,n,x,9,1,f,4,a,1,3,1,4,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,4,6,b,2,1,5,2,2,1,1,2,1,1,2,4,6,1,k,1,2,2,d,v,k,8,4,1,2,8,1,j,3,1,5,2,2,5,7,1,7,3,4,2,1,3,4,7,1,1,1,4,7,g,7,c,5,7,3,c,1,1,1,7,3,2,4,a,4,3,4,1,8,1,b,1,3,8,a,4,6,1,4,d,3,6","st1":"bv,g8,2","st4":"s1","st5":"cb,fg","sta":"a,v,2,2,8,6,15,1,t,o,1g,d,9,4,2,f,1,e,7,8,a,c,r,n,1n,7,1,7,2,6,3,4,3,m,2,4,1h,13,c,3,41,t,d,c,1,1c,1,5,d,r,7,9,e,7,z,2,l,h,f,2,8,2,2,p,7,4,5,9,7,1w,i,3,a,m,a,1e,b,e,8,e,2,1,1,e","stb":"pc,26,34","stc":"jp,bu,2p,y,5,1,1","ste":"5,3,2,a,2,6,1,3,2,n,1,3,1,1,1,1,1,1,1,1,a,9,5,8,15,3,n,1a,5,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,4,2,3,1,2,1,1,2,1,1,1,1,1,5,1,1,1,1,1,1,1,1,1,9,1,n,15,4,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,1,3,6,1,1,1v,6,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,g,5,h,c,9,2o,3,4,4,4,k,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,8,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,j,n,1,1,1,r,1,v,3,b,2,2,8,5,2,1,1,1,1,1,1,1,1,2,1,8,4,1,3,2,1,8,1,1,1,3,2,1,g,6,1,l,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,7,l,5,14,o,5,v,1,12,1,1,1,1,1,1,1,1,1,1,6,4,d,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9","stg":"3m,77,9,mh,v","sth":"dd,cf","sti":"z,51,1n,1q,3r,3k,5,v,4,7f,1c","stl":"r,k,l,1p,1,1,1e,c,1h,b,g,1v,d,12,1o,1,i,52,1h,1x,f,19,w,l,6,2y,3g,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1f,o,1","stn":"1x","sto":"5,2,2,4,1b,5,a,3,1,10,9,3,f,g,y,1,8,v,b,11,1,5,1,6,11,e,b,n,1g,z,4,e,2,d,r,k,p,b,t,a,8,p,3,o,3,1,c,j,11,h,27,c,2d,1,1,2,7,2,2,1,3,9,4,w,15,14,1,5,o,b,2,t,c,1,6,5,1,3,1,1,1,1,1,1,1,1,1,1,8,1,4,1,3,s,3,4,o,f,3,5,4,1,3,1,2,5","str":"0,1,3,1,2,2,1,8,8,1,3,3,4,1,q,2,4,1,1,a,d,1,2,1,4,8,4,2,1,2,3,1,1,4,3,2,1,5,1,1,2,1,1,1,1,2,2,4,6,2,9,1,1,3,1,3,2,1,1,1,1,1,3,5,6,1,3,1,1,2,4,6,2,1,1,1,e,2,1,4,6,1,1,2,2,1,4,2,2,7,1,1,3,1,1,2,1,4,1,n,d,3,2,2,5,4,5,2,1,7,b,1,1,1,2,2,4,1,3,3,2,1,2,2,1,4,1,1,2,2,1,4,3,2,1,4,2,2,1,6,2,9,a,3,5,3,1,1,5,4,1,2,1,3,1,1,2,2,2,1,8,4,1,1,8,1,3,3,5,4,3,4,1,9,2,3,2,1,2,1,5,6,3,b,2,j,1,4,2,4,2,1,8,5,2,4,1,2,1,2,2,2,4,3,a,1,2,1,1,1,3,3,1,h,u,7,4,1,1,1,2,1,1,1,1,1,1,1,1,1,2,7,1,2,1,2,2,1,7,4,v,1,3,1,1,4,2,3,1,1,2,1,3,9,2,1,1,2,4,5,7,7,1,5,a,1,4,1,1,2,6,10,c,2,g,1,1,7,1,1,1,5,1,1,1,1,2,2,1,1,3,1,1,1,1,1,3,1,2,1,3,1,1,1,2,1,5,1,2,3,a,2,2,3,4,5,a,2,1,1,g,7,5,1,2,2,1,7,2,2,1,3,5,1,1,8,2,1,1,6,2,7,2,b,1,3,2,1,4,1,1,5,6,5,1,1,8,5,1,2,1,1,1,6,1,1,2,3,8,1,2,7,e,1,9,1,b,1,2,3,1,3,1,3,2,1,1,3,3,1,1,3,1,9,4","stu":"101","stw":"5f,1f,9q,4y,dz","sty":"3u,1,1,1,33,a,9d,1,1,1,1,1,1,1,1,1,n,4c,4o,3i,21,1","su ":"wr","sub":"9a,8o","suf":"es,l4,2,1,1,d,2,b","sui":"c4","sum":"eg","sun":"30,c0,4r,3i,3f,5c,n,1,1,1,1,1,1,1i","sup":"o4","sur":"26,cb,6,1i,17,1s,q,2,3e,60,3,2,1,1,1,3,o,b,d,j","sus":"u,ts,3,4,a,2,1,4,2,1,4","sut":"jt","sve":"4b,3o","sw ":"kf,1","sw1":"1u,1,2,bm,2,1h,1,e","sw4":"1r","sw6":"el","swa":"o,99,1q,10,2,d,b,3,18,j,57,4,1l,7j,g,u,2f,y,v,e","swi":"az,3b,5x,7h,8c,f","swo":"h,h,d,1g,6x,31,4,ed,2r","sy ":"l,1b,2m,2j,48,15,4p,3x,8v,26,1o,28","sy1":"bq","syd":"g3","sym":"7x","sys":"7z,g,h5","t 1":"k,p,3t,1v,1,1j,9,5f,15,2m,c,2c,h,k,1,2g,o,x,c,14,y,d,3,w,11,1i","t 2":"1x,1h,37,27,5,21,5m,1i,m,m,1b,1z,4,q,3,2k,5,1,1,37,1m,21,1t,1t","t 3":"5u,9x,24,13,7p,5f,1","t 4":"6m,m,2x,gc","t 5":"58,r3","t 7":"74","t 8":"8x,34,3,mr","t 9":"10,wn","t a":"3,2,4,5,c,a,9,n,20,1,9,4,b,5,t,3,6,g,k,v,k,6,45,47,1,4,3a,2,8,4w,8,3n,3,2,f,3,8,2,d,h,o,9,7,1a,2p,n,4","t b":"i,j,1,2,c,2,2i,17,a,1m,1,1,1u,3,1,2,2,b,5,2,8,1j,2,4,g,1v,h,c,15,6t,p,8,4,l,4,h,8,1i,8,9,1,a,u,b,c,5,7,s,17,c,2,5,1a,5,1,1,3,d,d,4,2,1,1,1,1,1,2,2,1,d,c,1,2,2,1,2,1,1,1,1,1,4,f,e,d","t c":"r,1w,i,9,a,16,g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,16,n,k,1,1,3,1,z,6,6,x,12,3,8,3,y,b,9,r,z,9,k,2,4,1,1,1,1,1,1,1,1,1,1,1,1,22,f,12,27,b,6,1,k,17,i,b,1,1,3,1,6,x,3,r,2,6,1,2,2,c,7,2,1,h,n,10,6,1,8,f,1,1,4,1,5,9,1k,3,2,3,1z,1,3,e,9,9,2","t d":"5,5,n,f,9,1x,1n,18,11,13,w,g,a,1e,6,4,2,5,b,3,3,1,3,3,5,1,1,1,1,1,c,5,1,3i,u,14,d,u,s,2j,k,1d,e,1s,3m,d,2,h,1h,3,m,r,d,3,3,2","t e":"2l,o,1,4,2,1,k,1,1,4,i,2,1,1,1,1,3,4,2,2,1,1,f,7i,10,19,1,b,j,7,k,1,4,3,6,2,2,4,1,5,2,2,5,1,1,f,1,5,11,2m,1,7h,1,1u,2u,1,14,c,r","t f":"4f,a4,36,5v,3a,f,3f,37,1,7,7","t g":"1x,16,9,w,4,6,19,1,1,2,1,3,n,16,1,1,13,4,17,1,1,3,2,5,5,4,2,2,1,4,1,3,2,1,4,26,3,l,1,3,1z,4,3,2,2,1,1m,5,1,2,1,3,2,3,1,h,3,u,27,m,1,1m,e,w,f,1r,a,10,5,6,3t,1,1,1,3,3,12,1,1,1,1,1,1,y","t h":"2t,1n,z,6,1,1f,1,f,11,m,5,x,1l,3,4,1b,6,13,4,80,f,1,e,n,p,w,2a,5,n,6,y,d,8,o,9,54,3,6","t i":"am,2g,fd,3k,3z,2","t j":"1n,f,15,3f,1r,2v,11,1a,1y,6w,84,c,5z","t k":"4a,w,2,f,1f,a0,1,1,i,8,19,4,3,9,6,5,6s,47,5y","t l":"1s,6,1,9,2,b,3,r,c,1f,1x,s,2,8,k,1u,r,28,2,1,5,3,3,2,1,i,d,c,3,3,f,1,6m,20,5,p,q,b,7,a,e,e,f,9,6,f,1,b,54,c,e,1,t,g,5","t m":"0,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,2,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,2,1,1,2,1,1,2g,6,g,1f,2,1,1,1,a,4,2,1,4,h,2,2,1,4,b,16,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,19,1,1,1,2,2,8,1,1,1,5,3,1,1,1,2,3,2,1,c,1,l,12,4,10,m,2q,1,1,7,13,3,1,1,2,2,1,1,1,1,1,1,1,1,1,2,b,5,7,1,3,z,1,1,b,7,4,13,1,b,4,1,3s,23,a,9,v,2,1n,5,l,1,1,1,1,1,1,1,1,1,1,6","t n":"0,2v,q,5,d,32,w,1,4,b,4,6,1,4o,1f,2c,2c,55,1,1,9,7,h,5,2,1,5,1,1n,3,b,3z,3,2,4,1,3,2,1,w,7,3,26,4,3,1,2,4,1,3,1,2,2","t o":"2n,y,71,1c,5,2,3n,c,1a,8y,y,q,19,d,4p","t p":"1i,17,1v,32,4,5,1d,7,11,l,1b,b,6,9,q,7e,22,4,a,1b,1d,i,9,6,7,4,19,28,o,1c,j,p,w,o,c,1","t q":"xx","t r":"21,q,5p,j,1,2a,1s,22,34,c,18,1l,12,c,2v,6,h,5,2,h,6,8,c,8,f,1w,d,b,2e,2v,f","t s":"28,i,y,a,o,24,2,9,b,g,1,z,2k,7,3,7,7,2,n,5,k,i,9,2,9,t,1,1k,6,b,2j,9,1c,17,f,6,3,4,b,h,e,o,1,s,m,1,l,3,1,5,1,3,c,3,3,q,1,1,e,5,8,f,d,7,3,4,1,2,7,7,2,1,3,1,1,6,g,f,1,1,1,1,5,b,1,a,1,1,1,s,3,f,1,c,4,5,2,7,1,2,9,6,g","t t":"1k,21,6,60,4w,73,29,8,3r,2g,1f,7,1u,3,4,r,f,v","t u":"20,3c,3n,58,1d,3a,d,1y,5j,3x,5,1,4,4,2,3,a,1,4,1u,7,3,f,1,1,1,1,1,1,1,2,2,1,p,1,2,1,1,1,1,1,1,1,1,1,1","t w":"1,2,1,1,2,k,3,6,9,e,p,c,2,2y,a,19,1,f,1,1e,b,g,a,p,p,x,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,y,1l,e,2o,7,x,s,1,2,1o,u,g,4,3,3f,1q,x,m,d,3,z,1,c,5,m,1,2,1q,1,11","t y":"73,63,45,1i,m,41,1,3,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4e,1","t1 ":"g5,by,2o,8","t11":"uq","t12":"u9","t14":"ve","t16":"s5","t19":"bv,jk","t2 ":"26","t3 ":"jw","t4 ":"s1,62,14,3","t5 ":"cb,7j,7x","t7 ":"j2","ta ":"59,q,bu,9t,21,3e,2m","tad":"of","taf":"15,2,2,8,9x,f,2,6,3,7,3c,c4,a,2,2","tag":"1g,57,p,p,gn,1m","tai":"15,41,4o,18,j,1,9n,2z,1,o,1a,1,28,l,2f","tal":"14,9l,3i,1p,37,3v,3g,j,f","tam":"6i,2x,6k,2y,5u,2l,8c,g,1,1","tan":"2t,3a,6n,7,2,6n,h,n,4j,9t,1i","tap":"53,1y,aq,7b,9p","tar":"a,3c,20,1p,5,4s,k9,m","tas":"x1","tat":"17,9,7,15,2y,m,4,h,1,l,8,1d,n,1u,2z,1i,4u,p,1,1d,5,3r,y,11,b,5,9,7,6,1q,l,16,23,m","tau":"4a,43,4q,ae,8n","tav":"8,12,4,3,3,u,f,5,d,g,v,c,13,h,j,z,5,5j,q,k,q,f,20,2x,o,2,35,1u,19,e,t,c,4v,9,3,4,1,o,8","tay":"n7,1,1,1","tb ":"d1","tba":"ri","tbo":"um","tbr":"az,ed","tby":"rs","tch":"2j,k,2o,20,1k,6,l,1s,11,18,a,17,q,h,4j,2y,1,1,1,1,1,1,1,1,1,1,p,2d,4,3v,22,n,y,5,1,1","tcl":"c9,4s,2o,50,11,l,4t","td ":"5s,1h,2c,4,a,1h,6,bo,o,at","tdq":"2l","te ":"9,i,7,9,g,x,y,4,d,p,3,6,2,b,r,1,1,1,p,4,1,5,1,1,v,19,6,i,g,c,4,9,5,x,j,1,1,1,a,2,2,9,2,1,o,j,1,11,m,h,a,h,f,1,1,f,5,r,4,n,3,4,p,j,4,1,2e,h,1,5,1q,d,9,6,f,a,5,6,1,w,10,o,g,2,i,1,5,d,1,s,a,1,6,a,l,13,1,1,1,1,1,1,1,1,1,n,e","tea":"y,1n,8,7v","ted":"1q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6c,10,3a,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,dh,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2q,1,1,1,1","tee":"27,9,3o,g,3o,3m,6,5v,8,1,2,1,89,6p","tef":"3p,dn,1,2,2,63,g","tei":"fd,j4","tel":"4,d,3x,2,w,3,2,1,1,1,1,1,1,1d,h,f,18,l,1,7,j,2,1,e,1,e,19,1,2,d,15,1h,14,6,3l,19,4,2,7,c,m,k,7a,7,23,1,a,u,b,10,g,4","tem":"b1,c7","ten":"3u,60,i,2,6,m,4c,3,8,58,c0,9,2v","tep":"3y,4y,nj","ter":"5,3,2,a,2,6,1,3,p,1,3,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,1,1,1,1,1,1,1,1,1,r,1,7,n,1a,5,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,4,2,3,1,2,1,1,2,1,1,1,1,1,5,1,1,1,1,1,1,1,1,1,9,1,n,b,y,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,a,1,3,6,1,1,d,1,2,g,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,8,6,2,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,6,1,k,a,m,b,6,3,1,f,6,2,3,2,2,1,1,1,1,4,6,5,4,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,4,3,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,2,8,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,j,7,g,1,1,1,j,8,1,4,r,3,b,2,2,8,5,2,1,1,1,1,1,1,1,1,2,1,4,4,4,1,3,2,1,8,1,1,1,3,2,1,7,9,6,1,7,f,5,1,5,2,1,1,1,5,3,2,3,1,1,6,7,1,7,2,3,a,8,3,d,q,4,5,1,e,g,1,e,1,b,8,7,a,3,4,2,b,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6","tes":"1b,60,25,9,1z,1n,75,6a,1x","tev":"1q,1,1,1,1,1,1,1,49,17,6s,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5z,13,dc,1,1,1,1,1,1,1,1,1,1","tew":"a1,z","tf ":"2h,bk","tfi":"ee,ed,11","tfo":"2r,5j,3,5,37,3,2e,g,4l,68,3,6,3o,b,2,2,1,1,1,5,1,2,6","tfu":"1s","tga":"3m,77,9,mh,v","th ":"0,4,4,4,2,3,5,5,7,6,4,3,4,8,l,j,c,1,1,1,1,1,1,1,1,1,1,1,4,2,6,1,2,4,7,9,7,3,e,2,3,2,1,5,a,d,12,n,i,o,2,1,1,a,5,4,5,e,4,8,3,1,z,3,1,c,o,4,4,2,v,6,c,2,1,8,7,1i,b,3,a,b,3,i,1,1,a,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,5,1,6,3,7,1,4,1,4,4,2z,e,1,1,1,1,1,1,1,1,3,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,f,3,1,1,7,1,1,7,f,11,2,b,5,a,3,6,6,z,1,1,3,2,d,t,9,6,1,b,9,4,6,c,b,3,3,6,a,1,4,6,3,b,4,9,d,1,2,2,3,2,1,5,2,1,3,3,1,1,1,1,1,5,6,3,2,1,1,1,1,1,1,1,1,n,m","tha":"1u,4,1,1,1,1,1,3,a,1,1,1,1,1,4,d,i,4x,7,5c,1,1,1,1,1g,l,15,1y,b,9,e,4r,1,6,1,1,h,5,1,1,m,2p,7,v,2,2,1,2,e,a,7,9,1r","thb":"8n,ha","the":"4,5,1,1,7,1,3,2,7,3,6,1,2,1,5,2,2,6,b,2,4,1,1,1,1,1,1,1,1,1,1,2,5,1,1,1,1,1,1,1,1,1,4,1,1,8,3,3,d,1,1,3,1,5,1,1,1,8,6,1,1,1,1,1,2,7,3,4,2,7,f,4,7,2,6,5,2,3,1,5,2,1,1,1,3,4,3,4,1,4,2,1,4,a,5,4,6,1,1,3,2,1,1,2,6,4,b,b,8,4,1,2,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,3,5,1,3,1,1,7,1,1,1,2,1,2,c,1,g,7,2,1,1,2,3,2,1,1,1,1,1,1,1,1,1,1,1,1,n,1,3,1,1,1,4,1,1,8,2,5,5,1,1,4,4,6,1,1,1,1,1,1,1,1,b,1,1,5,2,2,3,m,4,6,1,1,6,1,1,5,1,1,3,a,4,17,1,1,1,7,6,2,2,6,1,2,5,9,1,7,4,1,1,1,3,g,4,3,2,4,7,1,1,5,1,2,5,1,8,1,8,5,8,2,1,4,2,2,3,1,1,2,1,1,7,3,2,7,1,7,3,1,4,1,1,3,1,2,1,5,2,5,2,1,2,1,1,2,9,5,1,4,1,3,1,1,1,3,2,1,1,1,2,2,2,1,1,1,1,3,2,1,2,2,2,1,1,4,3,1,5,2,6,5,8,1,2,5,1,f,1,1,c,1,5,4,2,1,1,1,1,1,2,1,1,1,5,1,1,4,1,2,1,1,2,6,1,2,4,2,c,1,3,2,8,2,8,1,2,1,1,8,5,h,4,e,1,1,3,2,1,5,2,9,c,6,4,c,3,4,d,2,3,1,1,2,1,1,1,5,4,1,3","thf":"3s","thg":"ad,c,kh,29","thi":"7s,2p,6n,4n,9c,n","thl":"gz","thm":"vt,3t","tho":"n,s,1g,1,1,1,1,1,1,e,2g,29,r,w,3m,1i,1,1,1,1,1,1,3d,6i,w,14,1k,1q,22,15,v,l,e,n,k","thp":"4h,n1,19","thr":"v,3t,7,57,4k,4q,76,2b,3d,2","ths":"eb,cq,1,2,n,8,6,25,d,1,6,6","thu":"17,r,1,1,1,1,1,a,18,2,a2,ks","thv":"4j","thw":"5h,3c,f,gu,1m,3p,4x","thy":"4j,1,1,1q,b5,9w,15","tib":"68,6a","tic":"3b,2,2i,ay,6","tie":"3s,2d,2,d,1,7,1,1,1,1,1,1,db,1,2,1,1,1,1,1,1,1,6,1,2,e,a,1,1,1,1,1,1,x,1,1,1,1,2k","tig":"7y","tih":"7k,fl","til":"46,8y,df,9d","tim":"1q,1,1,1,1,1,1,1,n,bk,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,69,b1,1,2f","tin":"v,3w,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1d,11,d,1,1,1,1,2,1,c,1,1,1,1,4,1,1,2,4q,14,1h,1e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1,1,j,1,1,3,1,1,1,1,2f,3e,14,3n","tio":"l,e,o,15,2y,m,4,13,8,8,m,j,9,3,b,8,1m,2x,2,1i,1q,34,23,5,14,9,1e,10,y,a,r,b,5,9,7,1w,l,t,2g,m","tip":"3,19,5p,5d,4p,3x,ex","tir":"60,3d,7b,10","tis":"29,1g,6c,3u,32,cu","tit":"z,gt,8i,ag","tiv":"7h,1,1,1,1,3j,ba,1,1,k,1,1,1,1,1,1","tj ":"lz,ae","tla":"49,21,2m,bq,6,3p,3,6s,3q","tle":"r,k,l,1p,1,1,1e,c,r,q,b,g,1v,d,q,1,9,2,10,o,1,4,e,52,1h,10,x,f,h,s,m,9,1,3,i,6,i,2g,23,1d,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,i,x,o,1,3,u,g","tli":"ue","tlo":"cf,1,5,5,2,1,ag","tmo":"bk,p1","tn ":"8,vf","tni":"a6","tnu":"1x","to ":"lt","toa":"ce","tob":"41,eo,hf","toc":"27,1r,3u,1,c,5p,20,41,1i,5c,5x,7,1s,3,4","tof":"103,4,1,3,1,2","toi":"xt","tok":"96,iv,15,45","tol":"3,3f,2j,94,3u,1,u,9y,36,1,3,1,1,1,1,1,1,1,1,1,1,9,4,1,3","tom":"10h","ton":"0,1,2,7,3,3,8,2,4,1,2,7,6,2,8,4,i,w,2,2,1,4,4,1,3,2,8,i,6,n,8,1,8,4,o,3,1,e,1,b,1,7,3,2,2,1,1,8,2,1,2,1,3,c,7,d,1,i,2,5,4,7,1,6,h,6,4,4,4,3,2,7,b,1,i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,y,4,1,2,5,2,b,l,8,7,7,1,l,a,1,2,5,p,3,2,2,f,5,g,7,9,1,2,2,7,5,1,j,3,2,4,3,2,3,9,1,j,9,2,3,7,1,1,d,2,f,4,u,3,3,3,2,6,4,1,1,1,1,1,f,4,1,1,1,f,1,1,2,7,2,2,4,4,4,1,1,3,3,6,4,8,3,6,1,e,l,2,a,d,3,a,6,2,1,2,2,2,1,5,3,3,1,9,1,1,5,1,3,2,2,1,2,1,1,1,1,5,i,7,1,1,2,2,5,2,1,7,3,19,1,y,2,f,3,a,3,6,7,1,1,1,1","too":"dl,2c","top":"10,3f,8k,c0,38","tor":"1d,s,18,11,19,14,s,o,28,3,1b,4s,w,14,13,34,c,s,14,a,1j,1l,7,1w,7,10,z,f,7,q","tos":"2i,bk","tot":"fi,3,87","tou":"5,2,2,bp","tow":"1t,a,6,4e,78,1g,47,26,8n,3,e,1,1h,1a,i,1q,6,l","tp ":"vl","tpe":"ac,x","tpo":"yr","tq ":"1t,3n,a1","tq1":"xz,i","tq4":"yf,1","tr ":"2v,37,1w,6x,dn","tr1":"xu,1,1,1,4","tr7":"8x,py,4,1","tra":"1n,3c,1m,c,1,15,1i,1e,q,3,7,2a,3r,37,e,1,1z,g,t,3t,1,m,2x","tre":"0,1,3,1,2,2,1,8,8,1,3,3,4,1,q,2,4,1,1,a,d,1,2,1,3,1,8,4,2,1,2,3,1,1,4,3,2,1,5,1,1,2,1,1,1,1,1,3,4,6,2,9,1,1,3,4,2,1,1,1,1,4,5,6,1,3,1,1,2,4,1,5,2,1,1,1,d,1,2,1,4,6,1,1,2,2,1,1,3,2,1,1,7,1,1,3,1,1,2,1,4,1,j,4,d,3,2,2,5,4,5,2,1,7,6,5,1,1,3,2,4,1,3,3,2,1,2,2,1,4,1,2,1,2,1,4,3,2,1,4,2,2,1,6,2,9,a,3,5,3,1,1,5,4,1,2,1,3,1,1,2,2,2,1,8,4,1,1,8,1,3,3,5,4,3,4,1,9,2,3,2,1,2,1,5,6,e,2,i,1,1,4,2,4,2,1,8,5,2,4,1,2,1,2,2,2,7,3,7,1,2,1,1,1,3,3,1,c,5,u,7,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,7,1,2,1,2,2,1,7,4,v,1,3,1,1,4,2,2,1,1,1,2,1,3,9,2,1,1,2,4,5,2,5,6,1,1,5,a,1,4,1,1,2,6,x,3,8,1,1,2,2,g,1,1,7,1,1,1,5,1,1,1,1,2,2,1,1,3,1,1,1,1,1,3,1,2,1,3,1,1,1,2,1,5,1,2,3,4,6,2,2,3,4,5,a,2,1,1,g,7,5,1,2,2,1,7,2,2,1,3,5,1,9,2,1,1,6,2,7,2,b,1,3,2,1,4,1,1,5,6,5,1,1,d,1,2,1,1,1,6,1,1,2,3,1,7,1,2,7,e,1,9,1,c,2,3,1,3,1,3,2,1,1,3,3,1,1,3,1,9,1,3","tri":"1m,1k,3c,k,8,1x,5b,49,az,3n,v","tro":"46,13,1,51,4,p,4p,i,j8","tru":"k,8,51,l2,1,6y,3,4","try":"89,1,1,1,2,1,2,d,36,6w,6,6c,1,1,1,2,1,1,2,2,1,1,e,51,5e","ts ":"f,x,2c,2o,1,1,1,1,1,1,1,9,5,4,1,1,1,1,1,1,1,1,1,1,25,5,7,a,x,14,1i,2d,27,13,m,4,1,1,1,d,f,1,1,1,1,1,1,1,1,1,1,1,1,g,1a,n,1,a,17,r,1,e,1,1,2h,h,7,e,6,1,a,f,1,1,k,1c,y,8,z,b,b,2,r,1,e,8","ts1":"wm","ts2":"wj,1","ts5":"jv","tse":"7h,1,cq,2u,1,6i,1m","tsf":"72","tsh":"bj,io,43,2","tsl":"va","tsm":"12,2f,66,7i,2h,ar,u,35","tso":"h6,1s,2i","tsw":"tx","tt ":"68,2p,4,1,2c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,kv,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","tta":"1g","tte":"9e,31,32,1,3,4,1d,29,1q,1a,4f,1g,1q,1f","tti":"v,2u,3,48,1,1,1,1,2,1,c,1,1,1,1,4,1,1,2,5u,28,7q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1,1,j,1,1,3,1,1,1,1,2f","ttl":"64,4f,1c,t,9q,2x,8j,o,1,x","tto":"a,28,88,l,26,l,5r,3v,3q,5a,f","ttr":"36,fl","tts":"9l,g7,5h","tty":"ge,1,1,g3","tu ":"ic,2s","tub":"ol","tud":"101,p","tun":"em,e7","tup":"tl","tur":"7v,1,1,1,1,1,1,1,1,1,6o,8s,z,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4s,2d","tut":"z,gt","tw ":"2i,bk,d9","tw1":"2f,b8","tw2":"dm","tw7":"jb","twa":"6u,4l,a3","twe":"6o,h2,56","twi":"2f,4f,eo,6k","two":"5f,19,4i,5e,aa,1n,70","tx ":"48,bh","ty ":"1c,w,x,d,8,4,1,1,1,5,1y,k,1,3,1z,k,1z,2f,b,2i,1,1,7,1,1,1,1,1,1,1,1,1,6,5,c,7m,s,9,1,1,2,2m,s,2,b,h,1c,1,1,1,1,a,b,10,5,30","tya":"7a,cy,g","tyl":"70,ev,4o","tyn":"1b,2a,1,1,1,3h,73,3,5a,6,49,1,1,1,1,1,1,1,7d,1,1,1,1,1,4,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,1","typ":"xd","tys":"77,ov,1","tyw":"nq","tz ":"f2,b9,2q,48","tzh":"up","u 1":"k9,u,4i","u 2":"49,v,kl","u 3":"2o","u 4":"1y,do,9p","u 5":"1z","u 7":"3h","u a":"c,5y,ds,i,1,bd,t","u b":"a5,9i,5k,7f,14","u c":"2o,50,de,2,1o,53,43","u d":"8b,11,j,3,1k,o,8,9,h,c7,5,5,4,5q,39,8","u e":"3h,b,1c,37,8u,8b,4b","u f":"ho,1","u g":"2a,e,2t,t,4o,2v,1t,2q,e,i,u,7,b,1,b,b,1h,5b,5r","u h":"kw,6,2,8n,w,k,b","u j":"1d,8,63,dj,1h,4,2f,5g,k,b","u k":"54,d,c7,1,1j,f,3,j,am,k","u l":"qr,a,23,1r,41","u m":"ce,9,h,7t,41,1s,1g","u n":"2a,bj,ao,h,66","u o":"3h,b,dd,9w,u,4,7","u p":"fm","u r":"ic,e","u s":"jq,4l,6,29,1,2d,5k","u t":"ay,lt","u w":"c,11,8,6q,11,j,3,1k,o,c5,10,5,5,4","u1 ":"tl","u10":"en","u11":"ta","u12":"eh,ey","u9 ":"tg,1,1","ua ":"b,dg","ual":"3q,dh","uar":"22,24,f,1l,17,2,7,l,35,h,2,g,1v,3p,e,3,2f,8,4b,h,r,1i,v,a,i,2f,1,u,h,2,1,n,21,1","uay":"3v,2q,2c,3,ls,2k,d,8,2,1,v,1,3,1,1f,d","ub ":"0,12,g,p,g,1p,1w,5,7,1k,6,3,h,j,7,3,1,3,1,4,6,4,8,i,3,4,1,4,2,1,y,o,3,7,4,j,2a,x,e,1i,1w,11,4,1,e,16,7,2,6,6,4,1,9,3,4,7,7,4,8,a,1,1,1,d,6,3t,10,3,d,1,2,b,w,a,n,u,1y,1,1,5","ub1":"20,cd","ub3":"jc","ub4":"jd","ub8":"dy,9","uba":"ho,d3,3w","ubb":"zr,1,1,1,1,1,1,1,1,1,1,1,l","ube":"ol","ubh":"2c,dp","ubi":"6,d1,1j","ubl":"1f,60,7,oj","ubs":"9a","ubw":"hy","uby":"w4","uca":"vp,4","ucc":"b7","uce":"a7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3v,hv,5,v","uch":"hj,2,s,3,1","uck":"i,28,6s,23,q,8w,20,1l,b,4,21,7,3k,v","uct":"s3","ud ":"ab,4,p,4p","uda":"y0","udd":"5c,1,i3","ude":"yq,b,1p","udh":"3l","udi":"101","udl":"o,9,o,hk,dy,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1","ue ":"1p,7,k,4v,s,v,i,3,6,h,2e,g,10,18,3t,5,h,4e,t,4d,1d,1,2d,2a,18","uee":"3o,6,1f,48,y,1a,1v,1l,2,1k,w,6,28,49,1,26,5,b,6m","uer":"8x,4,po,1,1,1,1,1,1,p","ues":"ao,65","uev":"l9","uf ":"8p,h9","ufc":"b7","uff":"6e,8e,62,22,8q,2r,1j,2,1,1,d,2,b","ug ":"ek,45,43,2g,5h,6,3b","ugb":"8g,e,ff,1d,j,5g","uge":"6z,1,en,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ugh":"2b,14,e,1b,3i,24,r,1v,17,6,2k,6c,c,17,p,3,3k,t,1,1,1,1,1,1,1,1,1,4x,d,m,a","ugo":"vf","uh ":"z9","uhe":"jp","uid":"oq,1m,2e","uil":"1,27,a8,1g,cd,c,30,s","uin":"g,o,8i","uir":"8c,h5","uis":"25,hj,4h,5y,2x","uit":"x,b7,b9","uk ":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,31,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,r,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1","uke":"1s,1k,49,61,50,4k,4b,49","ul ":"1s,8z,fg,1,6q,1","ula":"kr,2p","ulc":"o3","uld":"6g,s,69,7f","ule":"ny","ulf":"ej","ulh":"el","uli":"f2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ulk":"fk","ull":"18,9,o,1j,j,d,29,38,t,3g,1z,58,2e,l,3a,6e,n","ulm":"ld","uls":"98,qw","ult":"mo,7,3r,1f,1x,p,1,2v,2s","ulu":"vr","ulv":"qo","ulw":"nj,c","um ":"fm,1w,3r,36,9a","uma":"5t","umb":"2d,t,5,a,2,7,9v,4l,2,f,1d,1,1,3a,32,12,46,1,1,7,2i","ume":"t6,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","uml":"10p","umm":"5a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8k,1u,1,1,1,1,1,1,1,1,1,1,1,1","ump":"k,qb","umu":"a5,kz","un ":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,1,1b,c0,3a,5y,1,1,1,1,1,1,1,1,1,1,26,34,28","una":"t9","unc":"l,7e,eg,4e,2,10,59,17","und":"2y,z,3,95,1t,e,1b,5,3,1,n,w,t,j,3,13,3b,3j,2,1g,g,2y,1,1,1,1,1,1,a,p,o,1j,8,j","une":"xp,10","unf":"3k,dq,2r","ung":"3h,2u,b,1v,y,1r,3n,q,17,f,3t,4p,3r,r,2r","unh":"wi","uni":"1c,e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,u,1y,r,9,3,1,1z,14,4,9,37,3,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,26,k,1m,h,c,5,3,1,2g,13,11,1,1,f,1u,w,b,v,1j,1,v,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,12,1o,1,1,1,1,1","unk":"1q,78,3m,4p,9,3n,82,2n","unn":"n9,3n,24,i,i","uns":"8y,2,5m,e7,51,1,1,1,1,1,1,1,v,1,1,1,1,1,1,3","unt":"1k,1y,6c,e,u,20,4t,11,5d,53,i,20,1,1,1,1,a,24,w,1c","uny":"we","uon":"p5","uor":"6r,la","up ":"d6,a1,2,1,6b","upa":"gv","upe":"f9","upo":"26,4z,4k,3,4d","upp":"2h,3j,81,12,1l,3j,2e,1j,45,1t","ups":"15,ah,em","uq ":"6v,eo,ai","ur ":"17,3a,6y,3f,ar,55,2w,u,g,1i","ura":"1y,1,1,1,1,1,27,43,4q,ae,8n,3d,1,1,1,1,1,1,1,1,1","urb":"5,2,2","urc":"2m,1z,2o,2b,1e,7,2,p,10,d,3,1,e,f,3,18,j,w,3d,1t,c,2y,z,a,7,9,g,i,2,3i,h,10,v,1,c,y,5,1,1","ure":"82,w,2,8c,1s,46,63,4h,1,1,1,1,1,1,1,v,1,1,1,1,1,1,3","urg":"38,1,1,4,1,1,1,2,6,1,1,1,1,5,1,1,1,1,1,1,1,1,1,2,4,1,3,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,s,9c,1,1,u,7,h,1,1,1,1,4,1,1,1,1,3,1,1,1,1,1,1,4,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,1,4,1,1a,1,ak,5j","urh":"3i,sc,1,1,1,1,a","uri":"80,o7","urk":"es","url":"uy","urm":"6g,eg","urn":"3h,3c,12,1,1,1,1,1,1,1,1,1,q,5,x,2r,u,19,20,f,49,3,c,1r,z,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,13,v,g,22,c,s,x,t,1,5,g,1,1,1,1,n,1,f,1,5,2,q,3,3,2,1,1,1e","uro":"s,b8,2,1,lr,3,4","urp":"by,52,fg","urr":"26,28,a3,6,1i,3p,2,9e,5,1,1,1,3,o,b,d,j","urs":"5f,6,5p,c,g,4i,j6","urt":"4g,1g,h,4,r,o,u,c,2b,11,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6q,g,5,56,3c","ury":"q,q,v,1,3h,j,1,4,f,m,1y,8,19,3,q,f,1m,22,1,7,4s,4,4,5,e,f,14,e,3w,2a,a,1,t,8,2t,k,1n,r","us ":"u,6q,g,3t,7,2,1,4s,1m,4o,20,4j,3a,21","usa":"vg","usb":"5k","use":"6,19,w,f,6,3,g,o,7,c,8,1,j,2,q,l,20,4,o,f,3,13,n,1,2,4,1f,x,8,e,3,2f,10,1x,1l,1j,j,4,1,1x,2b,2,1f,1z,2,6,9,10,1l,9,5,e,8,q,5,1,3","ush":"98,44,a3","usi":"vr","usk":"zh,1,1,1,1,1,1,1,1,1","uss":"2j,1l,9z,gj,3,4,a,2,1,4,2,1,4","ust":"37,20,2g,1d,6,7n,f9,1,1a","ut ":"1x,4p,d,1,7g,44,2i,l,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,92,e","utc":"33,do","ute":"on","uth":"m,i,1z,1,1,1,1,1,1,1,1,1,1,1,1,y,4,2,c,6,8,2z,f,6,3,2,1,1,12,b,c,v,d,o,a,3d,18,d,b,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,6,3,8,5,4,2,31,e,1,1,1,1,1,1,1,1,3,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1f,k,5,e,12,3,14,2,1f,1,3,2,1,a,1,4,2,6,2,4,1,2,4,5,1,a,4,o,6,3,f,m,1,2,2,3,2,1,5,2,4,3,1,1,1,1,1,5,9,2,1,1,1,1,1,1,1,1,9,3,l,c","uti":"z,gt","utl":"49,4n,1x,dr,a2","utp":"yr","uts":"72","utt":"dh,6c,bg","uxb":"20,by,9","uxt":"mo","uy ":"4a,g,78,c6","v 5":"hx","v 9":"dz","v b":"4w,4,ad,2k","v1 ":"0,l,7o,1,1,1,3o,de,1,1,1,9","v10":"19,an,df","v12":"6","v13":"2,h","v14":"iw","v15":"4","v16":"b,1,f,h","v2 ":"1,1n,9w","v21":"8g,h6","v32":"85,h3","v37":"bp,3","v4 ":"d,i,p","v5 ":"8e,1,f,gp,1,1,4,2,e","v6 ":"u,i8","v7 ":"q","va ":"60,kl,7e","vac":"69","val":"3b,65,5,b,31,1k,94","van":"62,df,bg,4b","vat":"b4,hh","vau":"mo,7,56,1x,p,1,2v","ve ":"h,8,3,u,a,1,1i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2i,19,1x,7,h,7,s,e,c,2f,i,26,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2g,1,1,1,18,1n,9,1c,2,m,7,6,2z,f,f,9,d,q,d,c,6,2t,v,1,1,1,1,1,1,1,1,1,1,b","ved":"v","vel":"a4,9r,3q,4u,18,2w,1,2,40","ven":"1q,1,1,1,1,1,1,1,2e,8,1n,r,g,m,4,6,1,1,1,2,1,2,d,4,i,1p,1,u,8,c,j,12,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,m,2b,w,1,4,h,14,h,1,4,8,9,6,2u,7,d,1,1,1,2,1,1,2,2,1,1,e,32","ver":"0,1,7,4,1,9,4,4,1,8,1,6,4,3,3,4,j,1,6,f,5,d,5,b,4,2,p,c,q,d,h,2,h,s,7,11,2j,4,8,2,1q,6,2,i,k,q,f,y,7,v,p,o,1,f,h,n,b,d,2,o,4,r,3,1,7,3,9,8,1,q,a,1i,1,1,1,18,8,6,4,c,1,c,c,7,f,1s,10,j,1,2,u,1,h,o,8","ves":"bh,b8,l,7w","vey":"7h,1,1,1,1,et,1,1,k,1,1,1,1,1,1","via":"l1","vic":"25,2l,2t,2v,1,15,3,6,7v,34,c,1w,1t,1l,23,7,3b","vid":"55,cl,fo,3","vie":"16,4a,a,i1,2i,8g","vig":"8l,5x,bd","vil":"6y,j,2f,g,y,58,54,n,t,r,t,4n,y,2,1,1,1,1,3,s,4z,1","vin":"i,1m,1,1,h,1,1,1,1,1,1,1,1i,1t,3d,4f,1,1,u,1,18,1,1,1,1,1,1,64,1n,1m,3e,3p,20","vir":"48,wb,1,1,1,1","vis":"85,qg,3,4","viv":"ql,7e","voc":"ov","vod":"34,1","voi":"om","vol":"38,70,8f","von":"29,6p,2,1,2o,3,23,cn,58,28,1,1,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,3,1,3","voo":"ky","vor":"n7","vy ":"98,h4,7m","w 1":"57,b1,3s,g,a,62,2k","w 2":"11,2","w 3":"ub","w 5":"85,9g,9v","w 6":"dk,cv,b","w 7":"81,gn,a1","w a":"13,gh,4y,21,16,6q","w b":"1h,8e,m8,2m","w c":"31,8g,31,j,17,4p,3w,35,z,1j,23,1,37,s","w d":"85,1u,21,15,a,2,7s,cx","w e":"2f,2s,ck,4,3,16,2n,b,7w,3,2,8,68","w f":"sx,1a,3z,1l","w g":"y,t,r,l,1,1,1,5,1,1,v,3,1,3,3,1,r,1,1,1,2,1,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,3,6,9,n,6,34,4,k,30,j,1n,2,1,1,1,1,1,2,1,2,1,10,n,2,1,1,1,1,2,1,3,1,1,3,1,1,i,1,q,f,y,e,b,g,19,3k,2f,5,6,3,2,5,5","w h":"1t,4o,n,dt,8t,5,6,3,2,3e,2z","w i":"2s,43,4h,34,1m,5h,v,4m","w j":"2i,3q,7u,7b","w k":"57,co,3,16,b,10","w l":"53,3i,bl,5p,k,2,1,l,1v","w m":"5o,q,1n,5e,2,24,y,3,48,3u,3o,4","w n":"5o,2d,8i,3,73,2,x","w o":"r3,8,n,20","w p":"hg,q,1,2,80,2","w r":"2,14,1t,3d,6,12,78,7,1j,1o,1,2,4,3,1,i,1w,2a,3a,2,1,1u,4,1p,k","w s":"1l,6,2f,34,17,61,3,4o,3,4d,2,1w,3b,71,e,d","w t":"14,9a,4,k,ld,4,1","w u":"33,1,1,1,5,1,1,v,3,1,3,3,1,r,1,1,1,2,1,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,3,a8,1,1,1,1,1,2,1,2,1,10,n,2,1,1,1,1,2,1,3,1,1,3,1,1,i,1,q","w v":"nt","w w":"13,72,1u,21,7a,5,w,9,5,9f,7","w y":"kf","w1 ":"21,2,6,1,5,b8,6,2,1d,3,1,7g","w10":"2v,5,aq,15,5,2,7t","w11":"2e,b5,5,1t,cn","w12":"1x,pt","w15":"f3","w16":"1u","w17":"dl","w19":"1v","w1d":"2o,c6,f","w1u":"1y,1","w1w":"dk","w2 ":"2x,4s,5x,1b,a,75,h,1","w34":"27,bn","w4 ":"1r,v,de","w5 ":"ds,ea","w6 ":"7b,7a","w7 ":"jb","w9 ":"2b,1,k,av,15,15,bn","wa1":"6f,3,j,1,5,1,7,7,1,1,6u,6f,1,1,1,1,1,1,1n,58","wa2":"l4,1l","wa3":"6w,eo","wa7":"mf,5g","wa8":"mr,55","wad":"cp,d,b,3,27,7o","wag":"3,2,o,a","wak":"je,x,9,5,3a,1,2,2","wal":"j,t,5,k,w,b,2w,q,23,1a,17,3j,19,2h,1f,c,14,4o,1,1,r,1c,i,8,b,x,2,2,4,2,1,19,2,u,1,14,1,1,1,4,u,4,1,1g","wan":"o,99,1q,10,21,15,4l,4,t,s,7j,g,u,2f,y,v,e,r","war":"d,x,1,1,1,1,1,1,1,1,1,1,1,1,1,59,b,1,7,7,1,1,h,4,1,1,1,2,1,1,e,8,a,2,5,g,2,1o,3,8,e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5k,1w,4,3,f,15,1,9,29,3,3,1,1,1,2,1,1,1,3,1,1,e,4s,u,13,a,1p,1v,1,1,1,1","was":"cx,1f,ij,1","wat":"7r,7g,17,1s,9,1,i,2i,2n,12,17,z,a,2f,8,6,u,o,3n","wav":"5o","wax":"f9","way":"f,a,g,q,h,1g,12,3o,8,1g,19,1o,a,s,j,j,9,3,6,9,3,1x,15,f,e,3v,1,8,l,13,b,16,v,g,t,1o,4,o,1b,2i,7,w","wba":"jz","wbe":"l7","wbo":"qh","wbr":"7w,o,g1,1j,12","wc1":"28,5,bc,7","wc2":"et,d","wca":"1b,2a,1,1,3i,cg,86,4a,1,1,1,1,1,1,1,1,1,1,1,1,1,1","wce":"ue","wd1":"u8","wd2":"u0","wd3":"2r","wd6":"tz","wdi":"df","wdl":"t,w","wdo":"3n","we ":"76,j,f3,1,1","wea":"1b,2a,1,1,1,3h,73,3,5a,6,a4,9,1g,1,1,1,1,1,4,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,1","wee":"v4","wel":"22,1g,1z,3c,2y,n,1,2v,2e,4s,1a,1e,p,9,1g,b,13,t,8,1n,c,e,2d,1a,5","wem":"2z,c0,4y,a8","wen":"o,o,3,59,4a,1f,bd,1j,26,5y,7,3","wer":"x,7p,l,8,t,f,24,d5,4g,31","wes":"0,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,2,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,2,1,1,2,1,1,5,1t,h,1v,f,q,1u,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,w,d,1,1,1,2,2,8,2,1,5,3,1,1,1,2,3,12,11,4,1v,w,1i,3,1,1,7,5,5,a,14,2n,1,3,5,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,h,36,c,1,20,1,g,z,c,5,m,1,1,1,2,v,e,3,8,c,o,4,1,3,1,2,3","wey":"ti,4l,14,1,2","wf1":"nz,5","wf2":"o2","wf4":"nh","wf7":"nk","wf8":"o0","wfi":"5i,fd","wga":"3z,p,b,13,13,at,1,1,e9","wha":"59,87,4d","whe":"26,ax,v,2a,6n,af,35","whi":"r,1t,2h,1s,n,2h,14,1m,1,1,1f,a,9,1,3g,3d,36,o,2h,2a,16,i,1,j,n,9,1,5,h,1n,x,8","wic":"i,z,1,x,2,19,4f,4,1,1,1,2,1,1,e,9,4,1,4,2,4,h,10,q,3,8,h,1k,n,10,1j,1v,i,q,v,1q,u,p,u,3,3,1,1,1,2,1,1,1,3,1,1,e,t,q,e,33,8,e,1d,14,1a,b,2,2,3,1,e,1","wid":"mr,55","wig":"63,1,dy,1,1,3,29,6,f,2t,v,a,19,1,1,1,59","wil":"2,h,2,1v,1,1,1,1,1,h,3a,y,1a,2w,3,2h,1,1,1,1,6r,1k,15,2k,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,21,y,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1,3,2,18,2,5","wim":"jw,z,di,12","win":"2o,2,1r,1l,57,c,2p,5x,6,s,1u,4h,8,1o,m,p,1,1a","wir":"ct,g3,1","wis":"5o,16,eo,c6","wit":"6b,ld,t,2u","wj ":"je","wke":"b0","wks":"g5","wl ":"u6,2y","wle":"9z,cj,80,2,w,15","wli":"ft,4h,ej","wma":"zy","wmc":"nb","wn ":"b,1c,3,d,6,10,3e,2b,29,13,3,7,c,z,1b,5,1e,k,9,11,z,1n,j,60,1j,c,1,2,16,1,39,8,1i,e,g","wn1":"63,1,dy,5,22,4q,19,1,1","wn2":"lp,1,1,1,u,f","wn5":"k4,29","wn6":"k3,27,1,5,5v","wn7":"rx","wn8":"qp","wne":"f8","wnh":"b3,oo","wns":"v,c6,9l,2b","wo ":"6o,4i","wod":"34,1","wol":"0,1,c,d,4,1,9,g,4,6d,3j,c,at,1z,bm","woo":"p,e,1t,14,1f,3,2m,i,1h,i,q,3,s,12,1h,3,4,s,w,33,3k,c,c,10,1,10,y,d,14,y,q,h,3m,5,1a,6,9,h,a","wor":"5,2,1,2,7,3,2,6,1,3,2,d,a,1,3,12,3z,2p,9,8,9,n,v,1,3,7,1,q,4,2i,1,3u,o,1l,3c,2f,3,3,3,12,a,16,16","wot":"bb,ls","wpo":"xk,3","wqu":"8x,py,4,1","wr1":"bo,b","wr6":"as","wre":"rm","wri":"4m,46,4b,cy","ws ":"2g,1u,b,5,9a,4b,y","ws1":"1h,ac,8,3","ws5":"15,2","ws9":"be","wsb":"q,b0","wsh":"37,2b,3,cl,1,2","wsr":"58,cm","wst":"zv","wth":"vs","wto":"t1","wv1":"0,2,2,2,5,1,7,2,6,h,1,an,70","wv2":"1,1n,9w","wv4":"d,i,p","wv6":"u","wv7":"q","wwo":"5i","wyc":"e6,g","wyd":"q6,1,1,1e,1","wyl":"10k","wyn":"1n","wyr":"1p","wyt":"76","x 1":"g,54,42,63,9j","x 2":"1t,m,2f,sg","x 3":"yu","x 4":"um","x 6":"48","x 8":"4g,o0","x 9":"f8","x a":"m,c,3i,p0,3,29,j","x b":"24,64,n,7c,96,59,3,4,a,7,2,1,4,1i,b","x c":"78,6q,t,cx,2q,1e,3r,1,2,4,4,n,1,1","x d":"88,n,t,4,2u,r,bv,5,8v,a,1,2,l,a","x e":"4u,c5,h,cn,j,52","x f":"3k,dq,gy,2,1k","x g":"y,w,2e,7,1,14,10,18,11,1e,i,1,9,2z,1a,h,3m,1,1,b,6e,1a,2,b,2e,2w","x h":"78,cg,4f,5,4y,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,y","x i":"20,t5,1","x j":"1c,6g","x k":"4u,q,10,cl","x l":"qb,14,1l,1,6n","x m":"cm,r","x n":"8v,5o,fv,6c","x o":"3k,df,b,6,9w,2,1,9,1,1u","x p":"f8,h","x r":"2e,ba,5g,47,1k,1g,6z,3c,1","x s":"1u,6e,i,5f,e,5,51,4o,10,m,2j,i,1,5,a,18,3u,1,2,l,a,1,1,3,2,1,1,v,1","x t":"a7,i,1,2,7,8c,4s,88","x u":"8q,5f,j,3,4d,8,1,c,6a,4n,3,4,a,7,2,1,4,40,1,1,1,1,1,1,1,1,1,r,1,1,1,1,1,1","x w":"m,c,e,8c,4,10,3d,50,4y,5,5,v,92","x1 ":"2n,dh,7z","x11":"t9","x14":"t8,17","x16":"tx,1","x18":"tb","x2 ":"uh","x23":"yq,b","x3 ":"to","x31":"yr","x39":"tj","x4 ":"c3,c5,55,9,w,40,1,j","x44":"tk","x7 ":"yt","x8 ":"yu","x9b":"2d,bc","xa ":"is,5t","xal":"d6","xan":"24,e3","xbr":"20,by,9","xch":"3l,3i,5r","xe ":"ac","xes":"rm","xet":"yi,1,b,8","xfo":"2a,d,3w,5k,1q,2b,50,84,1,2,2,6,1,2,2,9,1,h,2,1","xga":"he","xh ":"nn","xha":"qf,j,o","xl ":"3u,29,2t","xlc":"ww","xle":"2j,bk,4r,c7","xmo":"yu","xo ":"hp","xox":"hp","xp ":"td","xpe":"2f","xq ":"ni,32,k,56","xr ":"s8","xs ":"fz","xt ":"ja,gs","xto":"la,1e","xty":"sw","xw ":"j4","xwe":"ho","xx ":"o3","xy ":"f9","xz ":"x6","y 1":"1g,1s,5,1d,2,3k,b,44,9,42,1j,2,6u,9,7,18,1,u,v,5k","y 2":"6h,f,5n,i,4,2n,5s,16,7n","y 3":"cy,6,2c,1e,7r,28,2x,2o,1k","y 4":"1e,7,a5,1j,mb","y 5":"1p,fe,97,66","y 6":"hy,91,63","y 8":"o,5,ep","y 9":"ep,5q,a3,2f","y a":"1,m,1,2,e,3,x,1r,5l,1h,5a,3q,34,4v,1d,3e","y b":"f,o,2,1,j,5m,1x,5,7,4l,p,d,3q,8,21,n,8,18,2,42,3,1e,1,10,c,f,f,o,q,4,e,a,6,c,2w","y c":"24,8,1q,1y,d,j,f,3,v,1,1,1,2,1,1,e,3,r,2c,2f,15,h,6,h,2e,1,2,1o,r,v,1m,8,15,1,1,1,2,1,1,1,3,1,1,e,2r,1h,e,7,1,7,f,1f,1,i,5,17,4,1,k,10,4","y d":"7,1e,1x,2u,1h,j,m,b,o,21,k,8,7,3,2,2,5,5n,2b,20,1y,4,8,9,3j,1i,n,g,1,1,1,1,a,1r,3,7,13","y e":"3f,d,v,5,h,20,7i,2f,6,1,2,2,c,6,2,3t,e,dc","y f":"4a,g,cc,1,1,du,34,7,1m","y g":"24,7,p,5,15,8,1,7,u,r,1,1,4,3r,l,7,9,1o,u,q,6,d,a,6,2,6,6,d,7,34,f,h,s,o,5,9,t,r,8,39,4,x,7,t,5,1,1,1,3,k,t,2r","y h":"e,11,8,9,n,g,1v,q,1a,2p,10,v,1,2,1w,8,i,w,x,41,l,10,85,1,h,8,e,6,2f,1o","y i":"4a,4v,49,bk,4r,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,67","y j":"l,6v,1w,6i,2v,3q,m,90,12,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,24,r","y k":"26,6,2g,ar,i,4,9,o,1,1,v,2,1h,c,2,i,9v,i,8,f,5e","y l":"1v,5e,n,u,8,16,56,6,6,8f,4,4,1,b,1e,p,c,g,3,u,2,1,d,l,1l,1x,b,1p,17,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","y m":"3u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,y,l,3,1,4,3,y,2m,2e,s,2,13,1u,39,1b,2a,1i,4c,4s","y n":"1r,6q,7,61,2r,60,1a,g,h,7a,g,2i","y o":"28,h,q,ah,g,x,15,1,1,q,6,1,2,2,84,r,1,n,9,4,1w,o,1,2e,1,i","y p":"30,a,1a,2p,5u,1x,a,6,2,6,5,1,2o,6p,i,1u,u,2,6,2,e,8,5d","y q":"10f","y r":"p,8,g,14,3g,1,1,1,1,1,d,e,p,f,9,2,m,6,t,s,13,h,5,1r,1f,9,6,3,2u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1k,1m,g,8,1,9,4,4,e,f,b,c,g,1n,2q,2,d,1,i,o,1o,8,2p","y s":"1,16,2j,v,8,j,h,c,2,2b,p,2,1i,6,s,1v,17,25,b,6,a,29,6,h,6,8,4,1,1o,k,3,3,5,k,1j,i,1,1,9,7,o,r,1i,g,j,8,o,28,4,5,4,b,10,i,5,d,a,4","y t":"s,23,1,1,1,1,1,1,3k,3,d,1w,1b,l,d,3,15,2h,1,1,1,1,1,1,5z,34,8j,a,12,w,4,1,p","y u":"26,cb,6,n,v,3p,2,15,89,5,1,1,1,3,o,b,d,j","y v":"9w,kb,6c,1,1,1,1","y w":"1,b,b,1,f,1,8,51,j,1d,1,1,1,2,1,1,e,f,o,9,1s,2,6,2i,4e,3,r,b,u,j,12,f,f,1,n,1a,1,1,1,2,1,1,1,3,1,1,e,2p,1,2p,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1,1f,r,f","y y":"8x,py","y1 ":"1l,a5,5c,1,1,9a,1,1,5,8,5,4,15,d,1,1,1,1,a,1,1","y10":"8,bf,4","y11":"s","y12":"k,2,7,w,1v,dq,2r","y13":"a,bo","y14":"w","y16":"4a,b,5","y2 ":"o,pt","y3 ":"p,8,pl,f,24","y4 ":"3,b,y,pr,1m","y5 ":"n,q9","y7 ":"qu","y8 ":"5,2,2,jx,8z","yal":"2,43,m,7,15,17,14,m,10,1,1k,x,18,4d,41,34,1,a,1s,k,1l,b,13,2m,28,q","yam":"no","yan":"cc,ko","yar":"13,1d,5v,m,39,1u,68,g,3i,1a,9f","yat":"9g,28","ybo":"o5,5d","ybr":"6r,kl","ybu":"dc","ycl":"sx","yco":"e6,g","yd ":"q6,1,1,1e,1","yda":"nq,4","yde":"g3,bb,35,3w,7","ydo":"2u,ct,l","ye ":"55,cl","yed":"a9,ke","yel":"91","yen":"2c,dp","yer":"g5,kd,3","yes":"7o,bp","yfi":"4e,5p,9g,5z","yfl":"uc","yfo":"5x,kz,62","yfr":"84,8,gk,l","yga":"ik","ygi":"t0","yha":"nb,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","yhe":"iu,c7","yho":"zt","yin":"is,15","yj ":"1b,sm","yl ":"2p,5g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,gc,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1i","yla":"91,jv,6n","ylb":"bd","yld":"qk,a0","yle":"1y,1,2s,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,j,18,y,9m,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3q,4o,34,5u,6","yll":"5b","ylo":"n7,1,1,1","yls":"el","yma":"rd","yme":"rr","ymi":"ze","ymn":"xd","ymo":"8y,2,oy,2,3,h,1,1,1,1,1,g,2,1,2","ymp":"7x","yn ":"1n","yna":"o0,1,1,1,1,1,1,1","ync":"eh","yne":"1b,2a,1,1,1,3h,73,3,3y,1c,6,5c,4,26,g,f,3c,1,1,1,1,1,4,7,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,1","ynn":"5l,v6,1","yo1":"ea,9","yor":"73,15,o,5e,9,10,1s,1i,d,9,b,p,2s,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,v,1x,1k,1,1h,1","yox":"d6","yp ":"a,6w","ypa":"vu","ypo":"vz,1e","yre":"1p,1o,12,e6,aj","yri":"2o,1c,7l","yrs":"5j","ys ":"7,i,3l,g,7,d,10,4,7,m,18,a,k,1b,a,l,1j,3p,1,1,b,3m,8,m,1b,5,1p,h,i,e,f,1,1,1,2,8,4s,1,j,1,h,2n,6","ysh":"b9,10,3,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,br","ysi":"6l,cv,1,72,7,v,l,6,4,a,2,1,4","yso":"p1","yst":"7z,ez","ysw":"f7","yt ":"9d","yte":"ai","yth":"2t,4d,d0,6a,2p,24","yto":"32,i5,8k,p,1v,7","ywa":"ux","ywe":"nq","ywo":"84,gs,2b","yx ":"4g","yze":"7f,7,1,1,1,1,1,1,1,1,eu,1,1,1,1,1,1,1,1,1,1,1","z 1":"v2,24,3","z 2":"8a,6t,ac","z a":"p,h,t,fl,32,8t","z b":"16,rv,45,3","z c":"68,84","z d":"8a,q,2r,10,e,ca,64,2h,7,a","z e":"55,cl,42,8f","z f":"y7","z g":"1z,9,34,1c,t,4,9,2j,3j,16,1f,3c,k,4,5,16,r,j,4,o","z h":"75,cn,ba,9","z j":"6o,t,4,9,f8,4,7w,9,8","z k":"55,7,6,az,13,6,22,1,k,4,22","z l":"90,fm,2b,73","z m":"cr,e","z n":"28,bo,9j,2w","z o":"hb,9m","z p":"f2","z r":"5i,ro,3","z s":"ec,93,60,1w,36","z t":"75,38","z w":"p,h,74,3h,5k,84,4s","zab":"3k,dq","ze ":"sy","zeb":"6w,eo","zel":"mw","zer":"7f,7,1,1,1,1,1,1,1,1,eu,1,1,1,1,1,1,1,1,1,1,1","zg ":"79","zhe":"up","zie":"5u","zle":"1v","zon":"td,1g","zy ":"be","zz ":"68","zzl":"1v"}};
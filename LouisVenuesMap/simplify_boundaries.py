@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Build simplified county boundaries for the map at several zoom levels.
+Rings are split into shared arcs so each border between two counties is
+simplified once (Douglas-Peucker) and stays identical on both sides, then
+coordinates are rounded and written as compact local GeoJSON / JS files.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import time
+from typing import Dict, List, Tuple
+
+from county_boundaries import BOUNDARIES_FILE, feature_name, iter_polygons, load_geojson
+
+OUTPUT_DIR = 'boundaries'
+
+# Written to the output directory and loaded by index.html: level list plus the coarsest level inline
+BUNDLE_FILE = 'county-boundaries.js'
+
+# index.html only loads the bundle once this script has linked it at the marker (so a missing bundle is never requested)
+INDEX_FILE = 'index.html'
+BUNDLE_MARKER = '<!-- simplified county boundaries (simplify_boundaries.py) -->'
+
+# Zoom level -> (Douglas-Peucker tolerance in degrees, output decimal places)
+LEVELS = {
+    6: (0.01, 3),
+    8: (0.0025, 4),
+    10: (0.0006, 4),
+}
+
+# Grid used to snap input vertices so shared borders match exactly (~1m)
+SNAP_DECIMALS = 5
+
+# Longitude degrees are shorter than latitude degrees at UK latitudes
+LNG_SCALE = math.cos(math.radians(54.0))
+
+Point = Tuple[int, int]
+
+
+def snap_ring(ring, scale: int) -> List[Point]:
+    """Snap a ring to the integer grid and drop repeated points (the closing point included)."""
+    snapped = []
+    for point in ring:
+        key = (round(point[0] * scale), round(point[1] * scale))
+        if not snapped or snapped[-1] != key:
+            snapped.append(key)
+    if len(snapped) > 1 and snapped[0] == snapped[-1]:
+        snapped.pop()
+    return snapped
+
+
+def find_junctions(rings: List[List[Point]]) -> set:
+    """
+    Vertices where borders meet or split: a vertex is a junction if it is seen
+    with different neighbours in different rings (or twice in the same ring).
+    """
+    neighbours = {}
+    junctions = set()
+    for ring in rings:
+        n = len(ring)
+        for i, point in enumerate(ring):
+            pair = frozenset((ring[i - 1], ring[(i + 1) % n]))
+            seen = neighbours.get(point)
+            if seen is None:
+                neighbours[point] = pair
+            elif seen != pair:
+                junctions.add(point)
+    return junctions
+
+
+def canonical_closed_ring(ring: List[Point]) -> List[Point]:
+    """Rotate/orient a junction-free ring so identical rings produce identical arcs."""
+    start = ring.index(min(ring))
+    rotated = ring[start:] + ring[:start]
+    reversed_ring = [rotated[0]] + rotated[:0:-1]
+    return min(rotated, reversed_ring)
+
+
+class ArcIndex:
+    """Deduplicated arcs; each ring becomes a list of (arc_id, reversed) references."""
+
+    def __init__(self):
+        self.arcs: List[List[Point]] = []
+        self._ids: Dict[Tuple[Point, ...], int] = {}
+
+    def add(self, arc: List[Point]) -> Tuple[int, bool]:
+        key = tuple(arc)
+        if key in self._ids:
+            return self._ids[key], False
+        reverse_key = key[::-1]
+        if reverse_key in self._ids:
+            return self._ids[reverse_key], True
+        self._ids[key] = len(self.arcs)
+        self.arcs.append(arc)
+        return len(self.arcs) - 1, False
+
+    def split_ring(self, ring: List[Point], junctions: set) -> List[Tuple[int, bool]]:
+        cuts = [i for i, point in enumerate(ring) if point in junctions]
+        if not cuts:
+            start = ring.index(min(ring))
+            rotated = ring[start:] + ring[:start]
+            closed = canonical_closed_ring(ring)
+            arc_id, reverse = self.add(closed + [closed[0]])
+            return [(arc_id, reverse != (closed != rotated))]
+
+        # Start the ring at a junction and cut it at every junction
+        rotated = ring[cuts[0]:] + ring[:cuts[0]]
+        rotated.append(rotated[0])
+        refs = []
+        start = 0
+        for i in range(1, len(rotated)):
+            if rotated[i] in junctions:
+                refs.append(self.add(rotated[start:i + 1]))
+                start = i
+        return refs
+
+
+def douglas_peucker(points: List[Tuple[float, float]], tolerance: float) -> List[Tuple[float, float]]:
+    """Iterative Douglas-Peucker keeping both end points."""
+    if len(points) < 3:
+        return list(points)
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    tolerance_sq = tolerance * tolerance
+
+    while stack:
+        first, last = stack.pop()
+        (x1, y1), (x2, y2) = points[first], points[last]
+        dx, dy = (x2 - x1) * LNG_SCALE, y2 - y1
+        length_sq = dx * dx + dy * dy
+        max_distance, index = -1.0, first
+
+        for i in range(first + 1, last):
+            px, py = (points[i][0] - x1) * LNG_SCALE, points[i][1] - y1
+            if length_sq == 0:
+                distance = px * px + py * py
+            else:
+                cross = px * dy - py * dx
+                distance = cross * cross / length_sq
+            if distance > max_distance:
+                max_distance, index = distance, i
+
+        if max_distance > tolerance_sq:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def simplify_arc(arc: List[Point], scale: int, tolerance: float, decimals: int) -> List[Tuple[float, float]]:
+    """Simplify one arc and round it to the output precision."""
+    points = [(x / scale, y / scale) for x, y in arc]
+    if arc[0] == arc[-1] and len(arc) > 3:
+        # Closed arc: pin the start and the point farthest from it
+        far = max(range(len(points)), key=lambda i: (points[i][0] - points[0][0]) ** 2 + (points[i][1] - points[0][1]) ** 2)
+        simplified = douglas_peucker(points[:far + 1], tolerance)[:-1] + douglas_peucker(points[far:], tolerance)
+    else:
+        simplified = douglas_peucker(points, tolerance)
+
+    rounded = []
+    for x, y in simplified:
+        point = (round(x, decimals), round(y, decimals))
+        if not rounded or rounded[-1] != point:
+            rounded.append(point)
+    return rounded
+
+
+def assemble_ring(refs, arcs) -> List[List[float]]:
+    """Join simplified arcs back into a closed GeoJSON ring."""
+    ring = []
+    for arc_id, reverse in refs:
+        arc = arcs[arc_id][::-1] if reverse else arcs[arc_id]
+        ring.extend(arc if not ring else arc[1:])
+    if ring and ring[0] != ring[-1]:
+        ring.append(ring[0])
+    return [list(point) for point in ring]
+
+
+def build_topology(features):
+    """Split every ring of every feature into shared arcs."""
+    scale = 10 ** SNAP_DECIMALS
+    shapes = []  # (name, code, [[ring, ring...] per polygon])
+    all_rings = []
+    for feature in features:
+        polygons = []
+        for rings in iter_polygons(feature.get('geometry')):
+            snapped = [snap_ring(ring, scale) for ring in rings]
+            if len(snapped[0]) < 3:
+                continue
+            snapped = [snapped[0]] + [ring for ring in snapped[1:] if len(ring) >= 3]
+            polygons.append(snapped)
+            all_rings.extend(snapped)
+        properties = feature.get('properties') or {}
+        code = next((value for key, value in properties.items() if key.upper().endswith('CD')), '')
+        shapes.append((feature_name(feature), code, polygons))
+
+    junctions = find_junctions(all_rings)
+    arcs = ArcIndex()
+    topology = []
+    for name, code, polygons in shapes:
+        topology.append((name, code, [[arcs.split_ring(ring, junctions) for ring in rings] for rings in polygons]))
+    return topology, arcs.arcs, scale
+
+
+def simplify_level(topology, arcs, scale, tolerance, decimals) -> dict:
+    """Produce a simplified FeatureCollection for one zoom level."""
+    simplified_arcs = [simplify_arc(arc, scale, tolerance, decimals) for arc in arcs]
+    features = []
+    for name, code, polygons in topology:
+        coordinates = []
+        for rings in polygons:
+            assembled = [assemble_ring(refs, simplified_arcs) for refs in rings]
+            if len(assembled[0]) < 4:
+                continue  # Exterior collapsed below the tolerance (tiny island)
+            coordinates.append([assembled[0]] + [ring for ring in assembled[1:] if len(ring) >= 4])
+        if not coordinates:
+            continue
+        features.append({
+            'type': 'Feature',
+            'properties': {'name': name, 'code': code},
+            'geometry': {'type': 'MultiPolygon', 'coordinates': coordinates},
+        })
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def write_outputs(levels: Dict[int, dict], output_dir: str = OUTPUT_DIR) -> str:
+    """Write one GeoJSON + JS file per level and the bundle loaded by index.html; returns the bundle path."""
+    os.makedirs(output_dir, exist_ok=True)
+    zooms = sorted(levels)
+
+    for zoom in zooms:
+        data = json.dumps(levels[zoom], separators=(',', ':'))
+        with open(os.path.join(output_dir, f'counties_z{zoom}.geojson'), 'w', encoding='utf-8') as f:
+            f.write(data)
+        with open(os.path.join(output_dir, f'county-boundaries-z{zoom}.js'), 'w', encoding='utf-8') as f:
+            f.write(f"COUNTY_BOUNDARIES[{zoom}] = {data};\n")
+
+    coarsest = json.dumps(levels[zooms[0]], separators=(',', ':'))
+    bundle_path = os.path.join(output_dir, BUNDLE_FILE)
+    with open(bundle_path, 'w', encoding='utf-8') as f:
+        f.write("// Simplified county boundaries generated by simplify_boundaries.py\n")
+        f.write(f"const COUNTY_BOUNDARY_LEVELS = {json.dumps(zooms)};\n")
+        f.write(f"const COUNTY_BOUNDARY_DIR = '{output_dir.replace(os.sep, '/')}';\n")
+        f.write(f"const COUNTY_BOUNDARIES = {{{zooms[0]}: {coarsest}}};\n")
+    return bundle_path
+
+
+def link_bundle(bundle_path: str, index_file: str = INDEX_FILE) -> bool:
+    """Point index.html's bundle <script> at bundle_path (relative to the page); False if the marker is missing."""
+    with open(index_file, 'r', encoding='utf-8') as f:
+        html = f.read()
+    pattern = re.compile(r'^([ \t]*)(?:<script src="[^"]*"></script>\s*)?' + re.escape(BUNDLE_MARKER) + '$', re.MULTILINE)
+    tag = f'<script src="{bundle_path.replace(os.sep, "/")}"></script> {BUNDLE_MARKER}'
+    html, count = pattern.subn(lambda match: match.group(1) + tag, html)
+    if count:
+        with open(index_file, 'w', encoding='utf-8') as f:
+            f.write(html)
+    return bool(count)
+
+
+def simplify_boundaries(boundaries_file: str = BOUNDARIES_FILE, output_dir: str = OUTPUT_DIR):
+    print("✂️  Simplifying county boundaries...")
+    start = time.perf_counter()
+
+    source_size = os.path.getsize(boundaries_file)
+    features = load_geojson(boundaries_file).get('features', [])
+    topology, arcs, scale = build_topology(features)
+    print(f"🧩 {len(features)} counties -> {len(arcs)} shared arcs "
+          f"({sum(len(arc) for arc in arcs)} vertices)")
+
+    levels = {}
+    for zoom, (tolerance, decimals) in sorted(LEVELS.items()):
+        levels[zoom] = simplify_level(topology, arcs, scale, tolerance, decimals)
+        vertices = sum(len(ring) for feature in levels[zoom]['features']
+                       for polygon in feature['geometry']['coordinates'] for ring in polygon)
+        print(f"  🔍 z{zoom}: tolerance {tolerance}°, {vertices} vertices")
+
+    bundle_path = write_outputs(levels, output_dir)
+
+    print(f"✅ Done in {time.perf_counter() - start:.1f}s (source {source_size / 1e6:.1f} MB)")
+    for zoom in sorted(levels):
+        path = os.path.join(output_dir, f'county-boundaries-z{zoom}.js')
+        print(f"📁 {path}: {os.path.getsize(path) / 1e3:.0f} KB")
+    print(f"📁 {bundle_path}: {os.path.getsize(bundle_path) / 1e3:.0f} KB")
+    if link_bundle(bundle_path):
+        print(f"🔗 {INDEX_FILE} now loads {bundle_path}")
+    else:
+        print(f"⚠️  No bundle marker in {INDEX_FILE} - add <script src=\"{bundle_path}\"></script> to use it")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute simplified county boundaries for the map")
+    parser.add_argument('--boundaries', default=BOUNDARIES_FILE, help="Full-resolution county boundaries GeoJSON")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="Directory for the per-zoom files")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.boundaries):
+        print(f"❌ Boundaries file not found: {args.boundaries}")
+        print("Run `python3 county_boundaries.py --download` first to fetch it.")
+        raise SystemExit(1)
+
+    simplify_boundaries(args.boundaries, args.output_dir)
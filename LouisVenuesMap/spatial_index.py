@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+KD-tree over points on the unit sphere for nearest-neighbour and radius queries.
+Latitude/longitude pairs are converted to 3D unit vectors, so straight-line
+(chord) distances order points exactly like great-circle distances.
+"""
+
+import heapq
+import math
+from typing import Callable, List, Optional, Sequence, Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def to_unit_vector(lat: float, lng: float) -> Tuple[float, float, float]:
+    """Convert a latitude/longitude pair (degrees) to a 3D unit vector."""
+    lat, lng = math.radians(lat), math.radians(lng)
+    cos_lat = math.cos(lat)
+    return cos_lat * math.cos(lng), cos_lat * math.sin(lng), math.sin(lat)
+
+
+def chord_from_km(distance_km: float) -> float:
+    """Chord length on the unit sphere for a great-circle distance."""
+    return 2 * math.sin(min(distance_km / EARTH_RADIUS_KM, math.pi) / 2)
+
+
+def km_from_chord(chord: float) -> float:
+    """Great-circle distance for a chord length on the unit sphere."""
+    return 2 * EARTH_RADIUS_KM * math.asin(min(chord / 2, 1.0))
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2 +
+         math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class SphereKDTree:
+    """
+    Static 3D KD-tree over (lat, lng) points.
+    Queries return (distance_km, index) pairs, nearest first; an optional
+    predicate(index) restricts results without rebuilding the tree.
+    """
+
+    def __init__(self, points: Sequence[Tuple[float, float]]):
+        self.points = [to_unit_vector(lat, lng) for lat, lng in points]
+        self.size = len(self.points)
+        # Nodes are flat lists: index -> (point index, split axis, left node, right node)
+        self._nodes = []
+        self.root = self._build(list(range(self.size)))
+
+    def __len__(self):
+        return self.size
+
+    def _build(self, indices: List[int]) -> int:
+        if not indices:
+            return -1
+        points = self.points
+        spreads = [max(points[i][axis] for i in indices) - min(points[i][axis] for i in indices)
+                   for axis in range(3)]
+        axis = spreads.index(max(spreads))
+        indices.sort(key=lambda i: points[i][axis])
+        middle = len(indices) // 2
+
+        node = len(self._nodes)
+        self._nodes.append(None)
+        left = self._build(indices[:middle])
+        right = self._build(indices[middle + 1:])
+        self._nodes[node] = (indices[middle], axis, left, right)
+        return node
+
+    def nearest(self, lat: float, lng: float, k: int = 1,
+                predicate: Optional[Callable[[int], bool]] = None,
+                max_km: Optional[float] = None) -> List[Tuple[float, int]]:
+        """The k nearest points (optionally matching predicate and within max_km)."""
+        if self.root < 0 or k <= 0:
+            return []
+        target = to_unit_vector(lat, lng)
+        bound = chord_from_km(max_km) ** 2 if max_km is not None else math.inf
+        heap = []  # max-heap of (-squared chord, index)
+        nodes, points = self._nodes, self.points
+        stack = [self.root]
+
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                continue
+            index, axis, left, right = nodes[node]
+            point = points[index]
+            dx, dy, dz = point[0] - target[0], point[1] - target[1], point[2] - target[2]
+            distance = dx * dx + dy * dy + dz * dz
+            worst = -heap[0][0] if len(heap) == k else bound
+
+            if distance <= worst and (predicate is None or predicate(index)):
+                heapq.heappush(heap, (-distance, index))
+                if len(heap) > k:
+                    heapq.heappop(heap)
+                worst = -heap[0][0] if len(heap) == k else bound
+
+            diff = target[axis] - point[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            # Visit the far side only if the splitting plane is closer than the current worst
+            if diff * diff <= worst:
+                stack.append(far)
+            stack.append(near)
+
+        return sorted((km_from_chord(math.sqrt(-d)), i) for d, i in heap)
+
+    def within(self, lat: float, lng: float, radius_km: float,
+               predicate: Optional[Callable[[int], bool]] = None) -> List[Tuple[float, int]]:
+        """All points within radius_km (optionally matching predicate), nearest first."""
+        if self.root < 0:
+            return []
+        target = to_unit_vector(lat, lng)
+        radius = chord_from_km(radius_km)
+        radius_sq = radius * radius
+        results = []
+        nodes, points = self._nodes, self.points
+        stack = [self.root]
+
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                continue
+            index, axis, left, right = nodes[node]
+            point = points[index]
+            dx, dy, dz = point[0] - target[0], point[1] - target[1], point[2] - target[2]
+            distance = dx * dx + dy * dy + dz * dz
+            if distance <= radius_sq and (predicate is None or predicate(index)):
+                results.append((distance, index))
+
+            diff = target[axis] - point[axis]
+            if diff <= radius:
+                stack.append(left)
+            if diff >= -radius:
+                stack.append(right)
+
+        return sorted((km_from_chord(math.sqrt(d)), i) for d, i in results)
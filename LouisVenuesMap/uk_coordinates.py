@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Shared validation of venue coordinates against the UK.
+Whole arrays of coordinates are checked at once with NumPy: a bounding-box
+fast path first, then a point-in-polygon test against the UK land outline
+(the union of the simplified county boundaries). Until simplify_boundaries.py
+has been run that outline does not exist and only the bounding box is
+checked, which also accepts Ireland, the Isle of Man and the sea around them.
+"""
+
+import json
+import os
+
+import numpy as np
+
+# UK approximate bounds:
+# - Latitude: 49.8 to 60.9 (Isles of Scilly to Shetland Islands)
+# - Longitude: -8.2 to 1.8 (Northern Ireland to East Anglia)
+UK_LAT_MIN, UK_LAT_MAX = 49.8, 60.9
+UK_LNG_MIN, UK_LNG_MAX = -8.2, 1.8
+
+# Land outline: the most detailed level written by simplify_boundaries.py
+LAND_FILE = os.path.join('boundaries', 'counties_z10.geojson')
+
+# Points this close to the outline still count as land (piers, seafronts, simplified coast)
+COAST_TOLERANCE_KM = 0.5
+
+KM_PER_DEGREE = 111.32
+
+# Points and edges compared per NumPy block (keeps memory bounded for large sheets)
+BLOCK_SIZE = 1 << 22
+
+
+class UKLandMask:
+    """
+    UK land polygon prepared for vectorised point-in-polygon tests.
+    Edges from every ring are bucketed into latitude slabs so each point is
+    only tested against the edges that span its latitude (even-odd rule).
+    """
+
+    def __init__(self, rings, coast_tolerance_km: float = COAST_TOLERANCE_KM):
+        edges = []
+        for ring in rings:
+            ring = np.asarray(ring, dtype=float)[:, :2]
+            edges.append(np.hstack([ring[:-1], ring[1:]]))
+        edges = np.vstack(edges)
+        # Every non-degenerate edge counts for the coast distance check
+        self.outline_edges = edges[(edges[:, 0] != edges[:, 2]) | (edges[:, 1] != edges[:, 3])]
+        edges = edges[edges[:, 1] != edges[:, 3]]  # horizontal edges never cross the ray
+
+        self.edges = edges
+        self.coast_tolerance = coast_tolerance_km / KM_PER_DEGREE
+        self.min_lng, self.max_lng = edges[:, [0, 2]].min(), edges[:, [0, 2]].max()
+        self.min_lat, self.max_lat = edges[:, [1, 3]].min(), edges[:, [1, 3]].max()
+
+        # Bucket edges into horizontal slabs
+        self.slab_count = max(1, min(65536, len(edges) // 8))
+        self.slab_height = (self.max_lat - self.min_lat) / self.slab_count
+        low = self._slab_index(np.minimum(edges[:, 1], edges[:, 3]))
+        high = self._slab_index(np.maximum(edges[:, 1], edges[:, 3]))
+        spans = high - low + 1
+        edge_ids = np.repeat(np.arange(len(edges)), spans)
+        slab_ids = np.repeat(low, spans) + (np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans))
+        order = np.argsort(slab_ids, kind='stable')
+        self.slab_edges = edge_ids[order]
+        self.slab_starts = np.searchsorted(slab_ids[order], np.arange(self.slab_count + 1))
+
+        # Outline edges bucketed into grid cells for the coast check, built on first use
+        self.scale = np.cos(np.radians((self.min_lat + self.max_lat) / 2))
+        self.cell_keys = None
+
+    @classmethod
+    def from_geojson(cls, path: str = LAND_FILE, **kwargs):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        rings = []
+        for feature in data.get('features', []):
+            geometry = feature.get('geometry') or {}
+            polygons = [geometry['coordinates']] if geometry.get('type') == 'Polygon' else geometry.get('coordinates', [])
+            for polygon in polygons:
+                rings.extend(ring for ring in polygon if len(ring) >= 4)
+        return cls(rings, **kwargs)
+
+    def _slab_index(self, lat):
+        index = ((lat - self.min_lat) / self.slab_height).astype(np.int64)
+        return np.clip(index, 0, self.slab_count - 1)
+
+    def contains(self, lats, lngs) -> np.ndarray:
+        """Boolean array: is each point on UK land (or within the coast tolerance)?"""
+        lats = np.asarray(lats, dtype=float)
+        lngs = np.asarray(lngs, dtype=float)
+        inside = np.zeros(lats.shape, dtype=bool)
+
+        tol = self.coast_tolerance
+        candidates = np.flatnonzero((lats >= self.min_lat - tol) & (lats <= self.max_lat + tol) &
+                                    (lngs >= self.min_lng - tol) & (lngs <= self.max_lng + tol))
+        if len(candidates) == 0:
+            return inside
+
+        # Group candidate points by slab and test each group against that slab's edges
+        slabs = self._slab_index(lats[candidates])
+        order = np.argsort(slabs, kind='stable')
+        candidates, slabs = candidates[order], slabs[order]
+        bounds = np.searchsorted(slabs, np.arange(self.slab_count + 1))
+
+        for slab in np.flatnonzero(np.diff(bounds)):
+            points = candidates[bounds[slab]:bounds[slab + 1]]
+            edges = self.edges[self.slab_edges[self.slab_starts[slab]:self.slab_starts[slab + 1]]]
+            if len(edges) == 0:
+                continue
+            step = max(1, BLOCK_SIZE // len(edges))
+            for start in range(0, len(points), step):
+                block = points[start:start + step]
+                inside[block] = self._crossings(lats[block], lngs[block], edges) % 2 == 1
+
+        # Points just off the simplified coastline
+        if tol > 0:
+            near = candidates[~inside[candidates]]
+            if len(near):
+                inside[near] = self._near_outline(lats[near], lngs[near])
+
+        return inside
+
+    @staticmethod
+    def _crossings(lats, lngs, edges) -> np.ndarray:
+        x1, y1, x2, y2 = (edges[:, i][None, :] for i in range(4))
+        y = lats[:, None]
+        spans = (y1 > y) != (y2 > y)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_cross = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+        return np.count_nonzero(spans & (lngs[:, None] < x_cross), axis=1)
+
+    def _prepare_cells(self):
+        """
+        Bucket every outline edge into the grid cells its bounding box (grown by
+        the coast tolerance) overlaps, so a point only needs the edges of its own cell.
+        """
+        edges, tol, scale = self.outline_edges, self.coast_tolerance, self.scale
+        lengths = np.maximum(np.abs(edges[:, 2] - edges[:, 0]) * scale, np.abs(edges[:, 3] - edges[:, 1]))
+        # Cells about one edge long, so each edge lands in a handful of cells
+        self.cell_size = max(tol, float(np.median(lengths)))
+        self.cell_origin = (self.min_lng * scale - 2 * tol, self.min_lat - 2 * tol)
+        self.cell_columns = int((self.max_lng * scale + 2 * tol - self.cell_origin[0]) / self.cell_size) + 1
+
+        low_x, low_y = self._cell_xy(np.minimum(edges[:, 1], edges[:, 3]) - tol,
+                                     np.minimum(edges[:, 0], edges[:, 2]) - tol / scale)
+        high_x, high_y = self._cell_xy(np.maximum(edges[:, 1], edges[:, 3]) + tol,
+                                       np.maximum(edges[:, 0], edges[:, 2]) + tol / scale)
+        widths = high_x - low_x + 1
+        counts = widths * (high_y - low_y + 1)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        widths = np.repeat(widths, counts)
+        keys = ((np.repeat(low_y, counts) + offsets // widths) * self.cell_columns +
+                np.repeat(low_x, counts) + offsets % widths)
+
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        self.cell_edges = np.repeat(np.arange(len(edges)), counts)[order]
+        self.cell_keys, first = np.unique(keys, return_index=True)
+        self.cell_starts = np.append(first, len(keys))
+
+    def _cell_xy(self, lats, lngs):
+        x = ((lngs * self.scale - self.cell_origin[0]) / self.cell_size).astype(np.int64)
+        y = ((lats - self.cell_origin[1]) / self.cell_size).astype(np.int64)
+        return x, y
+
+    def _near_outline(self, lats, lngs) -> np.ndarray:
+        """Is each point within the coast tolerance of any edge?"""
+        if self.cell_keys is None:
+            self._prepare_cells()
+        tol, scale = self.coast_tolerance, self.scale
+        near = np.zeros(lats.shape, dtype=bool)
+
+        x, y = self._cell_xy(lats, lngs)
+        slots = np.searchsorted(self.cell_keys, y * self.cell_columns + x)
+        slots = np.where(slots < len(self.cell_keys), slots, 0)
+        found = np.flatnonzero(self.cell_keys[slots] == y * self.cell_columns + x)
+
+        # Group the points by cell and measure each group against that cell's edges only
+        found = found[np.argsort(slots[found], kind='stable')]
+        for points in np.split(found, np.flatnonzero(np.diff(slots[found])) + 1):
+            if len(points) == 0:
+                continue
+            slot = slots[points[0]]
+            edges = self.outline_edges[self.cell_edges[self.cell_starts[slot]:self.cell_starts[slot + 1]]]
+            step = max(1, BLOCK_SIZE // len(edges))
+            for start in range(0, len(points), step):
+                block = points[start:start + step]
+                py, px = lats[block, None], lngs[block, None] * scale
+                x1, y1 = edges[None, :, 0] * scale, edges[None, :, 1]
+                dx, dy = edges[None, :, 2] * scale - x1, edges[None, :, 3] - y1
+                t = np.clip(((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy), 0.0, 1.0)
+                distance_sq = (x1 + t * dx - px) ** 2 + (y1 + t * dy - py) ** 2
+                near[block] = distance_sq.min(axis=1) <= tol * tol
+        return near
+
+
+_land_mask = None
+_land_mask_loaded = False
+
+
+def get_land_mask(path: str = LAND_FILE):
+    """Load the UK land outline once; returns None if it has not been generated."""
+    global _land_mask, _land_mask_loaded
+    if not _land_mask_loaded:
+        _land_mask_loaded = True
+        if os.path.exists(path):
+            _land_mask = UKLandMask.from_geojson(path)
+        else:
+            # Expected in a fresh checkout: the outline is built from the ONS download, which is not committed
+            print(f"⚠️  UK land outline not found ({path}) - checking the bounding box only, "
+                  f"which also accepts Ireland. Run county_boundaries.py --download and "
+                  f"simplify_boundaries.py to generate it.")
+    return _land_mask
+
+
+def to_float_array(values) -> np.ndarray:
+    """Convert CSV strings / numbers / None to floats, with NaN for anything unparseable."""
+    result = np.full(len(values), np.nan)
+    for i, value in enumerate(values):
+        try:
+            result[i] = float(value)
+        except (ValueError, TypeError):
+            pass
+    return result
+
+
+def validate_coordinates(lats, lngs, land_mask=None) -> np.ndarray:
+    """
+    Check whole arrays of coordinates at once.
+    Returns a boolean array that is True where the point is on UK land.
+    """
+    lats = to_float_array(lats) if not isinstance(lats, np.ndarray) else lats.astype(float)
+    lngs = to_float_array(lngs) if not isinstance(lngs, np.ndarray) else lngs.astype(float)
+
+    # Bounding-box fast path (also rejects NaN)
+    valid = ((lats >= UK_LAT_MIN) & (lats <= UK_LAT_MAX) &
+             (lngs >= UK_LNG_MIN) & (lngs <= UK_LNG_MAX))
+
+    land_mask = land_mask or get_land_mask()
+    if land_mask is not None and valid.any():
+        indices = np.flatnonzero(valid)
+        valid[indices] = land_mask.contains(lats[indices], lngs[indices])
+
+    return valid
+
+
+def is_coordinate_in_uk(lat, lng) -> bool:
+    """Check a single coordinate pair (strings or numbers)."""
+    return bool(validate_coordinates([lat], [lng])[0])
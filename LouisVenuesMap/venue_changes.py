@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Compare a new export of the venue sheet with the previous snapshot (venues.db,
+or the CSV with coordinates) and report the venues added, removed and modified,
+matched by their stable ids. The change set is written to venue-changes.json;
+with --apply it is merged into the snapshot, and the downstream stages run
+with --changed then only work on those venues.
+"""
+
+import argparse
+import csv
+import json
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from phone_normalizer import EMPTY, INVALID, PhoneNormalizer
+from pipeline_profile import add_profile_argument, profiling, stage
+from venue_record import Venue, with_venue_ids
+from venue_store import CSV_FILE, VENUE_DB_FILE, VenueDatabase, extra_columns
+
+CHANGES_FILE = 'venue-changes.json'
+
+# Filled in by the pipeline rather than the sheet: not compared, and carried over when merging
+DERIVED_COLUMNS = ('Latitude', 'Longitude', 'County')
+
+# Rewritten by fix_phone_numbers.py: compared after normalising, and the snapshot's value kept when equal
+NORMALISED_COLUMNS = ('Phone Number',)
+
+# A change to any of these invalidates the venue's coordinates and county
+ADDRESS_COLUMNS = {'Address1', 'Address2', 'Town', 'PostCode', 'Country'}
+
+# Examples printed per kind of change
+SHOW_EXAMPLES = 5
+
+Rows = Dict[int, Dict[str, str]]
+
+
+class VenueChanges:
+    """Venue ids added, removed and modified (with the columns that changed)."""
+
+    def __init__(self, added: Optional[List[int]] = None, removed: Optional[List[int]] = None,
+                 modified: Optional[Dict[int, List[str]]] = None):
+        self.added = added or []
+        self.removed = removed or []
+        self.modified = modified or {}
+
+    @property
+    def changed_ids(self) -> Set[int]:
+        """Venues the downstream stages need to (re)process."""
+        return set(self.added) | set(self.modified)
+
+    @property
+    def address_changed(self) -> Set[int]:
+        return {venue_id for venue_id, columns in self.modified.items() if ADDRESS_COLUMNS.intersection(columns)}
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.modified)
+
+    def to_dict(self) -> dict:
+        return {
+            'added': self.added,
+            'removed': self.removed,
+            'modified': {str(venue_id): columns for venue_id, columns in self.modified.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'VenueChanges':
+        return cls(data.get('added', []), data.get('removed', []),
+                   {int(venue_id): columns for venue_id, columns in data.get('modified', {}).items()})
+
+    def write(self, path: str = CHANGES_FILE):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str = CHANGES_FILE) -> 'VenueChanges':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def load_changed_ids(path: str = CHANGES_FILE) -> Set[int]:
+    """Ids of the venues added or modified by the last diff (for the stages' --changed option)."""
+    changes = VenueChanges.load(path)
+    print(f"🔁 Only the {len(changes.changed_ids)} venues added or modified in {path}")
+    return changes.changed_ids
+
+
+def read_sheet(path: str) -> Tuple[List[str], Rows]:
+    """Header and id -> row, in sheet order."""
+    with open(path, 'r', encoding='utf-8') as file:
+        reader = csv.DictReader(file)
+        rows = dict(with_venue_ids(reader))
+        return list(reader.fieldnames or []), rows
+
+
+def read_snapshot(previous: Optional[str] = None) -> Tuple[List[str], Rows]:
+    """The previous state: the given CSV, else venues.db if it exists, else the CSV with coordinates."""
+    if previous is None and VenueDatabase.exists():
+        with VenueDatabase() as db:
+            return db.fieldnames(), dict(db.sheet_rows())
+    return read_sheet(previous or CSV_FILE)
+
+
+def same_phone(normalizer: PhoneNormalizer, new: str, old: str) -> bool:
+    """True if the sheet's number is the one fix_phone_numbers.py left in the snapshot (both normalised)."""
+    number, number_type = normalizer.normalize(new)
+    old_number, old_type = normalizer.normalize(old)
+    if number_type == INVALID:
+        # Invalid numbers are kept as they were, blanked by --clear-invalid or mangled by older clean-ups
+        return old_type in (INVALID, EMPTY)
+    return number == old_number
+
+
+def diff_rows(old: Rows, new: Rows, columns: Iterable[str]) -> VenueChanges:
+    """
+    Compare two snapshots column by column (ignoring DERIVED_COLUMNS and
+    surrounding spaces, and NORMALISED_COLUMNS after normalising both values).
+    """
+    columns = [column for column in columns if column not in DERIVED_COLUMNS]
+    normalizer = PhoneNormalizer()
+    changes = VenueChanges()
+    for venue_id, row in new.items():
+        previous = old.get(venue_id)
+        if previous is None:
+            changes.added.append(venue_id)
+            continue
+        changed = []
+        for column in columns:
+            value, previous_value = (row.get(column) or '').strip(), (previous.get(column) or '').strip()
+            if value == previous_value:
+                continue
+            if column in NORMALISED_COLUMNS and same_phone(normalizer, value, previous_value):
+                continue
+            changed.append(column)
+        if changed:
+            changes.modified[venue_id] = changed
+    changes.removed = [venue_id for venue_id in old if venue_id not in new]
+    return changes
+
+
+def merge_rows(old: Rows, new: Rows, changes: VenueChanges) -> Rows:
+    """
+    The new sheet with the pipeline's coordinates and counties carried over
+    from the snapshot, except for venues whose address changed, and the
+    normalised phone numbers kept unless the number itself changed.
+    """
+    address_changed = changes.address_changed
+    merged = {}
+    for venue_id, row in new.items():
+        row = dict(row)
+        previous = old.get(venue_id)
+        if previous is not None and venue_id not in address_changed:
+            for column in DERIVED_COLUMNS:
+                if not (row.get(column) or '').strip():
+                    row[column] = previous.get(column, '')
+        if previous is not None:
+            for column in NORMALISED_COLUMNS:
+                if column in previous and column not in changes.modified.get(venue_id, ()):
+                    row[column] = previous[column]
+        merged[venue_id] = row
+    return merged
+
+
+def merged_fieldnames(old_fieldnames: List[str], new_fieldnames: List[str]) -> List[str]:
+    return new_fieldnames + [column for column in old_fieldnames
+                             if column in DERIVED_COLUMNS and column not in new_fieldnames]
+
+
+def apply_to_database(db: VenueDatabase, merged: Rows, changes: VenueChanges, fieldnames: List[str]):
+    """Delete, upsert and reorder only the venues that changed."""
+    changed, address_changed = changes.changed_ids, changes.address_changed
+    regions = db.column('region')
+    with db.connection:
+        db.delete(changes.removed)
+        upserts = []
+        for position, (venue_id, row) in enumerate(merged.items()):
+            if venue_id in changed:
+                venue = Venue.from_csv_row(row, venue_id)
+                # Regions follow the county, so they survive unless the address moved
+                if venue_id not in address_changed:
+                    venue.region = regions.get(venue_id)
+                upserts.append((position, venue, extra_columns(row)))
+        db.upsert(upserts)
+        moved = db.set_positions({venue_id: position for position, venue_id in enumerate(merged)})
+        db.set_fieldnames(fieldnames)
+    return moved
+
+
+def apply_to_csv(path: str, merged: Rows, fieldnames: List[str]):
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(merged.values())
+
+
+def print_changes(changes: VenueChanges, old: Rows, new: Rows):
+    def label(rows, venue_id):
+        row = rows[venue_id]
+        return f"{venue_id}: {row.get('Name') or 'Unknown'} ({row.get('PostCode') or 'no postcode'})"
+
+    print(f"➕ Added: {len(changes.added)}")
+    for venue_id in changes.added[:SHOW_EXAMPLES]:
+        print(f"   {label(new, venue_id)}")
+    print(f"➖ Removed: {len(changes.removed)}")
+    for venue_id in changes.removed[:SHOW_EXAMPLES]:
+        print(f"   {label(old, venue_id)}")
+    print(f"✏️  Modified: {len(changes.modified)} ({len(changes.address_changed)} with a new address)")
+    for venue_id, columns in list(changes.modified.items())[:SHOW_EXAMPLES]:
+        print(f"   {label(new, venue_id)}: {', '.join(columns)}")
+
+
+def diff_venue_sheet(sheet: str, previous: Optional[str] = None, output: str = CHANGES_FILE,
+                     apply: bool = False) -> VenueChanges:
+    source = previous or (VENUE_DB_FILE if VenueDatabase.exists() else CSV_FILE)
+    print(f"🔍 Comparing {sheet} with {source}...")
+
+    with stage('read snapshot'):
+        old_fieldnames, old = read_snapshot(previous)
+    with stage('read sheet'):
+        new_fieldnames, new = read_sheet(sheet)
+
+    with stage('diff'):
+        changes = diff_rows(old, new, new_fieldnames)
+    print_changes(changes, old, new)
+
+    changes.write(output)
+    print(f"📁 Wrote {output}")
+
+    if apply and changes:
+        with stage('apply'):
+            merged = merge_rows(old, new, changes)
+            fieldnames = merged_fieldnames(old_fieldnames, new_fieldnames)
+            if source == VENUE_DB_FILE:
+                with VenueDatabase() as db:
+                    moved = apply_to_database(db, merged, changes, fieldnames)
+                print(f"🗄️  Updated {VENUE_DB_FILE}: {len(changes.changed_ids)} upserted, "
+                      f"{len(changes.removed)} removed, {moved} moved")
+            else:
+                apply_to_csv(source, merged, fieldnames)
+                print(f"📁 Updated {source}")
+        print("👉 Next: add_county_data.py --changed, fix_phone_numbers.py --changed, "
+              "advanced_geocode.py, then regenerate_data.py")
+    elif apply:
+        print("✅ No changes to apply")
+
+    return changes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Diff a new venue sheet export against the previous snapshot")
+    parser.add_argument('sheet', help="New export of the venue sheet (CSV)")
+    parser.add_argument('--previous', metavar='CSV',
+                        help=f"Previous snapshot (default: {VENUE_DB_FILE} if it exists, else {CSV_FILE})")
+    parser.add_argument('--output', default=CHANGES_FILE, help="Change set file (default: %(default)s)")
+    parser.add_argument('--apply', action='store_true', help="Merge the changes into the snapshot")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiling('venue_changes', args.profile):
+        diff_venue_sheet(args.sheet, args.previous, args.output, args.apply)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Nearest-venue and radius queries over the venue list.
+Venues are indexed in a KD-tree on unit-sphere coordinates; filtered queries
+(by type and/or account manager) use their own smaller tree, built on first
+use and cached, so a filter never has to skip through unrelated venues.
+"""
+
+import argparse
+import os
+import statistics
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from postcode_index import normalize_postcode, split_postcode
+from spatial_index import SphereKDTree
+from venue_store import VENUE_DATA_FILE, load_venue_data, venue_coordinates
+
+# Optional district centroids (see check_postcode_centroids.py) for postcodes with no venues
+CENTROIDS_FILE = 'postcode_district_centroids.csv'
+
+
+class VenueIndex:
+    """
+    Spatial index over venues.
+    Results are lists of (distance_km, venue dict), nearest first.
+    """
+
+    def __init__(self, venues: List[dict]):
+        self.venues = venues
+        self._trees: Dict[Tuple[Optional[str], Optional[str]], Tuple[SphereKDTree, List[int]]] = {}
+        self._postcodes = None
+
+    @classmethod
+    def from_file(cls, path: str = VENUE_DATA_FILE):
+        return cls(load_venue_data(path))
+
+    def tree_for(self, venue_type: Optional[str] = None, manager: Optional[str] = None):
+        """KD-tree (and venue positions) for one type/manager filter, built once."""
+        key = (venue_type.lower() if venue_type else None, manager.lower() if manager else None)
+        if key not in self._trees:
+            positions, points = [], []
+            for position, venue in enumerate(self.venues):
+                if key[0] and venue.get('type', '').lower() != key[0]:
+                    continue
+                if key[1] and venue.get('accountManager', '').lower() != key[1]:
+                    continue
+                coordinates = venue_coordinates(venue)
+                if coordinates:
+                    positions.append(position)
+                    points.append(coordinates)
+            self._trees[key] = (SphereKDTree(points), positions)
+        return self._trees[key]
+
+    def _results(self, matches, positions):
+        return [(distance, self.venues[positions[i]]) for distance, i in matches]
+
+    def nearest(self, lat: float, lng: float, k: int = 10, venue_type: Optional[str] = None,
+                manager: Optional[str] = None, max_km: Optional[float] = None):
+        """The k nearest venues to a point."""
+        tree, positions = self.tree_for(venue_type, manager)
+        return self._results(tree.nearest(lat, lng, k, max_km=max_km), positions)
+
+    def within(self, lat: float, lng: float, radius_km: float, venue_type: Optional[str] = None,
+               manager: Optional[str] = None):
+        """All venues within radius_km of a point."""
+        tree, positions = self.tree_for(venue_type, manager)
+        return self._results(tree.within(lat, lng, radius_km), positions)
+
+    def nearest_many(self, points: Iterable[Tuple[float, float]], k: int = 10, **filters):
+        """Bulk k-nearest: one result list per (lat, lng) point."""
+        return [self.nearest(lat, lng, k, **filters) for lat, lng in points]
+
+    def within_many(self, points: Iterable[Tuple[float, float]], radius_km: float, **filters):
+        """Bulk radius query: one result list per (lat, lng) point."""
+        return [self.within(lat, lng, radius_km, **filters) for lat, lng in points]
+
+    def locate_postcode(self, postcode: str) -> Optional[Tuple[float, float]]:
+        """
+        Approximate a postcode's position without a network lookup: the venues at
+        that exact postcode, then the median of its district, then the optional
+        district centroids file.
+        """
+        if self._postcodes is None:
+            self._postcodes = {}
+            for venue in self.venues:
+                coordinates = venue_coordinates(venue)
+                if coordinates:
+                    for key in (normalize_postcode(venue.get('postCode', '')),
+                                split_postcode(venue.get('postCode', ''))[0]):
+                        if key:
+                            self._postcodes.setdefault(key, []).append(coordinates)
+
+        for key in (normalize_postcode(postcode), split_postcode(postcode)[0]):
+            points = self._postcodes.get(key)
+            if points:
+                return statistics.median(p[0] for p in points), statistics.median(p[1] for p in points)
+
+        if os.path.exists(CENTROIDS_FILE):
+            from check_postcode_centroids import load_district_centroids
+            return load_district_centroids(CENTROIDS_FILE).get(split_postcode(postcode)[0])
+        return None
+
+
+def print_results(results: Sequence[Tuple[float, dict]]):
+    for distance, venue in results:
+        print(f"  {distance:6.2f} km  {venue.get('name', '')} ({venue.get('postCode', '')}) "
+              f"- {venue.get('type', '')}, {venue.get('accountManager', '') or 'no manager'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find venues near a postcode or point")
+    location = parser.add_mutually_exclusive_group(required=True)
+    location.add_argument('--postcode', help="Search around a postcode (resolved from the venue data)")
+    location.add_argument('--lat', type=float, help="Latitude (use with --lng)")
+    parser.add_argument('--lng', type=float, help="Longitude (use with --lat)")
+    parser.add_argument('-k', type=int, default=10, help="Number of nearest venues (default: %(default)s)")
+    parser.add_argument('--radius-km', type=float, help="Return every venue within this distance instead")
+    parser.add_argument('--type', help="Only venues of this type (e.g. JW, Smirnoff)")
+    parser.add_argument('--manager', help="Only venues for this account manager")
+    parser.add_argument('--data', default=VENUE_DATA_FILE, help="Venue data file (default: %(default)s)")
+    args = parser.parse_args()
+
+    index = VenueIndex.from_file(args.data)
+
+    if args.postcode:
+        point = index.locate_postcode(args.postcode)
+        if point is None:
+            print(f"❌ Could not locate postcode {args.postcode}")
+            raise SystemExit(1)
+        print(f"📮 {args.postcode.upper()} ≈ {point[0]:.5f}, {point[1]:.5f}")
+    else:
+        if args.lng is None:
+            parser.error("--lat requires --lng")
+        point = (args.lat, args.lng)
+
+    build_start = time.perf_counter()
+    index.tree_for(args.type, args.manager)
+    build_time = time.perf_counter() - build_start
+
+    query_start = time.perf_counter()
+    if args.radius_km is not None:
+        results = index.within(*point, args.radius_km, venue_type=args.type, manager=args.manager)
+        print(f"📍 {len(results)} venues within {args.radius_km:g} km:")
+    else:
+        results = index.nearest(*point, args.k, venue_type=args.type, manager=args.manager)
+        print(f"📍 {len(results)} nearest venues:")
+    query_time = time.perf_counter() - query_start
+
+    print_results(results)
+    print(f"⚡ Index built in {build_time * 1000:.1f}ms, query took {query_time * 1000:.2f}ms")
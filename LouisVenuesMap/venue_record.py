@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Compact venue record shared by the pipeline scripts.
+A Venue keeps one slot per field instead of a dict per row, interns the
+categorical strings that repeat across the sheet (account managers, counties,
+types...) and stores coordinates as plain floats. It converts to and from the
+CSV rows and the venue-data.js (JSON) objects.
+"""
+
+import hashlib
+import re
+import sys
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from postcode_index import normalize_postcode
+
+# Venue attribute -> CSV column
+CSV_COLUMNS = {
+    'originalOrder': 'OriginalOrder',
+    'type': 'Type',
+    'sheetName': 'SheetName',
+    'name': 'Name',
+    'address1': 'Address1',
+    'address2': 'Address2',
+    'town': 'Town',
+    'postCode': 'PostCode',
+    'country': 'Country',
+    'accountManager': 'Account Manager Name',
+    'accountManagerEmail': 'Account Manager Email',
+    'accountManagerNumber': 'Account Manager Number',
+    'phone': 'Phone Number',
+    'quantity': 'Quantity',
+    'county': 'County',
+}
+
+# What the map shows for blank values
+JSON_DEFAULTS = {
+    'name': 'Unknown Venue',
+    'county': 'Unknown',
+    'country': 'UK',
+    'type': 'Unknown',
+    'quantity': '1',
+}
+
+# Values that repeat across many rows and are interned (stored once)
+INTERNED_FIELDS = {'type', 'sheetName', 'town', 'country', 'county', 'region', 'quantity',
+                   'accountManager', 'accountManagerEmail', 'accountManagerNumber'}
+
+# Ids made from a venue's content (rows without a usable OriginalOrder) start here
+CONTENT_ID_BASE = 10 ** 9
+
+_CSV_ITEMS = list(CSV_COLUMNS.items())
+
+
+def parse_coordinate(value) -> Optional[float]:
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def row_coordinates(row: Dict[str, str]) -> Optional[Tuple[float, float]]:
+    """(lat, lng) of a CSV row, or None if either value is missing (None on short rows) or not a number."""
+    lat, lng = parse_coordinate(row.get('Latitude')), parse_coordinate(row.get('Longitude'))
+    return None if lat is None or lng is None else (lat, lng)
+
+
+def content_key(row: Dict[str, str]) -> str:
+    """Sheet, name and postcode, normalised: what identifies a venue when it has no OriginalOrder."""
+    name = re.sub(r'\s+', ' ', (row.get('Name') or '').strip().lower())
+    return f"{(row.get('SheetName') or '').strip().lower()}|{name}|{normalize_postcode(row.get('PostCode') or '')}"
+
+
+def content_id(key: str) -> int:
+    # 48-bit hash, so ids stay exact in JavaScript
+    return CONTENT_ID_BASE + int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=6).digest(), 'big')
+
+
+def with_venue_ids(rows: Iterable[Dict[str, str]]) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """
+    Pair each sheet row with a stable id: its OriginalOrder number, or for rows
+    without one (or repeating one) a hash of content_key. Inserting or moving
+    rows in the sheet does not change the other venues' ids.
+    """
+    seen = set()
+    for row in rows:
+        order = (row.get('OriginalOrder') or '').strip()
+        venue_id = int(order) if order.isdigit() else None
+        if venue_id is None or venue_id in seen:
+            key = content_key(row)
+            venue_id = content_id(key)
+            repeat = 0
+            while venue_id in seen:
+                repeat += 1
+                venue_id = content_id(f"{key}#{repeat}")
+        seen.add(venue_id)
+        yield venue_id, row
+
+
+class Venue:
+    __slots__ = ('id', 'originalOrder', 'type', 'sheetName', 'name', 'address1', 'address2', 'town',
+                 'postCode', 'country', 'accountManager', 'accountManagerEmail', 'accountManagerNumber',
+                 'phone', 'quantity', 'county', 'region', 'latitude', 'longitude', 'fullAddress')
+
+    def __init__(self, id: int = 0, **fields):
+        self.id = id
+        for name in CSV_COLUMNS:
+            value = fields.get(name) or ''
+            setattr(self, name, sys.intern(value) if name in INTERNED_FIELDS else value)
+        region = fields.get('region')
+        self.region = sys.intern(region) if region else None
+        self.set_coordinates(parse_coordinate(fields.get('latitude')), parse_coordinate(fields.get('longitude')))
+        # Only kept when it differs from the address built from the fields (e.g. geocoders add the county)
+        self.fullAddress = None
+        full_address = fields.get('fullAddress')
+        if full_address and full_address != self.full_address:
+            self.fullAddress = full_address
+
+    @classmethod
+    def from_csv_row(cls, row: Dict[str, str], id: int = 0) -> 'Venue':
+        # Called for every row of the sheet, so the slots are filled directly rather than via __init__
+        venue = cls.__new__(cls)
+        venue.id = id
+        for name, column in _CSV_ITEMS:
+            value = (row.get(column) or '').strip()
+            setattr(venue, name, sys.intern(value) if name in INTERNED_FIELDS else value)
+        venue.region = None
+        venue.fullAddress = None
+        venue.set_coordinates(parse_coordinate((row.get('Latitude') or '').strip()),
+                              parse_coordinate((row.get('Longitude') or '').strip()))
+        return venue
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'Venue':
+        """From a venue-data.js object (the redundant coordinates list is dropped)."""
+        # Used as a json object_hook for every venue, so the slots are filled directly
+        intern = sys.intern
+        get = data.get
+        venue = cls.__new__(cls)
+        venue.id = get('id', 0)
+        venue.originalOrder = str(get('originalOrder') or '')
+        venue.type = intern(get('type') or '')
+        venue.sheetName = intern(get('sheetName') or '')
+        venue.name = get('name') or ''
+        venue.address1 = get('address1') or ''
+        venue.address2 = get('address2') or ''
+        venue.town = intern(get('town') or '')
+        venue.postCode = get('postCode') or ''
+        venue.country = intern(get('country') or '')
+        venue.accountManager = intern(get('accountManager') or '')
+        venue.accountManagerEmail = intern(get('accountManagerEmail') or '')
+        venue.accountManagerNumber = intern(get('accountManagerNumber') or '')
+        venue.phone = get('phone') or ''
+        venue.quantity = intern(str(get('quantity') or ''))
+        venue.county = intern(get('county') or '')
+        region = get('region')
+        venue.region = intern(region) if region else None
+        venue.set_coordinates(parse_coordinate(get('latitude')), parse_coordinate(get('longitude')))
+        venue.fullAddress = None
+        full_address = get('fullAddress')
+        if full_address and full_address != venue.full_address:
+            venue.fullAddress = full_address
+        return venue
+
+    def set_coordinates(self, latitude: Optional[float], longitude: Optional[float]):
+        """Both or neither: a venue with only one coordinate is not geocoded."""
+        if latitude is None or longitude is None:
+            latitude = longitude = None
+        self.latitude = latitude
+        self.longitude = longitude
+
+    def to_csv_row(self) -> Dict[str, str]:
+        row = {column: getattr(self, name) for name, column in CSV_COLUMNS.items()}
+        row['Latitude'] = '' if self.latitude is None else repr(self.latitude)
+        row['Longitude'] = '' if self.longitude is None else repr(self.longitude)
+        return row
+
+    def to_json(self) -> dict:
+        """The venue-data.js object (same keys and order regenerate_data.py has always written)."""
+        country = self.country or 'UK'
+        data = {
+            'id': self.id,
+            'name': self.name or 'Unknown Venue',
+            'address1': self.address1,
+            'address2': self.address2,
+            'town': self.town,
+            'postCode': self.postCode,
+            'county': self.county or 'Unknown',
+            'country': country,
+            'type': self.type or 'Unknown',
+            'accountManager': self.accountManager,
+            'accountManagerEmail': self.accountManagerEmail,
+            'phone': self.phone,
+            'quantity': self.quantity or '1',
+        }
+        if self.latitude is not None:
+            data['latitude'] = self.latitude
+            data['longitude'] = self.longitude
+        data['fullAddress'] = self.fullAddress or ', '.join(
+            part for part in (self.address1, self.address2, self.town, self.postCode, country) if part)
+        if self.region is not None:
+            data['region'] = self.region
+        return data
+
+    @property
+    def full_address(self) -> str:
+        return self.fullAddress or ', '.join(part for part in (self.address1, self.address2, self.town, self.postCode,
+                                           self.country or 'UK') if part)
+
+    @property
+    def coordinates(self) -> Optional[Tuple[float, float]]:
+        return None if self.latitude is None else (self.latitude, self.longitude)
+
+    def get(self, key: str, default=None):
+        """Dict-style access by venue-data.js key, so code written for the JSON objects keeps working."""
+        if key == 'fullAddress':
+            return self.full_address
+        if key == 'coordinates':
+            return self.coordinates
+        value = getattr(self, key, None) if key in Venue.__slots__ else None
+        if key in JSON_DEFAULTS:
+            value = value or JSON_DEFAULTS[key]
+        return default if value is None else value
+
+    def __repr__(self):
+        return f"Venue(id={self.id!r}, name={self.name!r}, postCode={self.postCode!r})"
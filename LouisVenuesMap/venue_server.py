@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Lightweight HTTP API for the venue data (standard library asyncio only).
+Serves filtered, paginated venue queries from in-memory indexes so the map
+can load just the venues it needs instead of the whole of venue-data.js.
+
+  GET /api/venues?type=JW&county=Kent&region=...&bbox=minLng,minLat,maxLng,maxLat&q=text&offset=0&limit=500
+  GET /api/facets   (types, counties and regions with venue counts)
+
+Responses carry an ETag; repeated requests with If-None-Match get a 304.
+"""
+
+import argparse
+import asyncio
+import bisect
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Set
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from venue_store import VENUE_DATA_FILE, load_venue_data, venue_coordinates
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 5000
+
+# Fields that can be filtered on (query parameter -> venue key); repeat a parameter to OR values
+FILTER_FIELDS = {
+    'type': 'type',
+    'county': 'county',
+    'region': 'region',
+    'manager': 'accountManager',
+}
+
+# Fields searched by ?q= (the same ones the map's search box uses)
+SEARCH_FIELDS = ['name', 'fullAddress', 'town', 'county', 'postCode', 'accountManager']
+
+# Encoded responses kept in memory (keyed by ETag + encoding)
+RESPONSE_CACHE_SIZE = 256
+GZIP_MIN_BYTES = 1024
+
+MAX_HEADER_BYTES = 16384
+KEEP_ALIVE_SECONDS = 15
+
+STATUS_TEXT = {200: 'OK', 204: 'No Content', 304: 'Not Modified', 400: 'Bad Request',
+               404: 'Not Found', 405: 'Method Not Allowed', 431: 'Request Header Fields Too Large',
+               500: 'Internal Server Error'}
+
+
+class QueryError(ValueError):
+    """Invalid query parameters (reported to the client as a 400)."""
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class VenueCatalog:
+    """
+    Venues plus the in-memory indexes used to answer queries:
+    exact-match indexes per filter field, a latitude-sorted list for bounding
+    boxes and a trigram index for free-text search.
+    """
+
+    def __init__(self, venues: List[dict], version: str):
+        self.venues = venues
+        self.version = version
+        self.all = range(len(venues))
+
+        self.fields: Dict[str, Dict[str, List[int]]] = {param: defaultdict(list) for param in FILTER_FIELDS}
+        self.search_text = []
+        self.grams: Dict[str, List[int]] = defaultdict(list)
+        by_lat = []
+
+        for position, venue in enumerate(venues):
+            for param, key in FILTER_FIELDS.items():
+                value = str(venue.get(key) or '').strip().lower()
+                if value:
+                    self.fields[param][value].append(position)
+
+            text = '\n'.join(str(venue.get(field) or '') for field in SEARCH_FIELDS).lower()
+            self.search_text.append(text)
+            for gram in trigrams(text):
+                self.grams[gram].append(position)
+
+            coordinates = venue_coordinates(venue)
+            if coordinates:
+                by_lat.append((coordinates[0], coordinates[1], position))
+
+        by_lat.sort()
+        self.lats = [lat for lat, _, _ in by_lat]
+        self.lat_entries = by_lat
+
+    @classmethod
+    def from_file(cls, path: str = VENUE_DATA_FILE):
+        with open(path, 'rb') as f:
+            version = hashlib.sha1(f.read()).hexdigest()[:16]
+        return cls(load_venue_data(path), version)
+
+    def _field_matches(self, param: str, values: List[str]) -> Set[int]:
+        index = self.fields[param]
+        matches = set()
+        for value in values:
+            matches.update(index.get(value.strip().lower(), ()))
+        return matches
+
+    def _bbox_matches(self, bbox: str) -> Set[int]:
+        try:
+            min_lng, min_lat, max_lng, max_lat = (float(part) for part in bbox.split(','))
+        except ValueError:
+            raise QueryError("bbox must be minLng,minLat,maxLng,maxLat")
+        start = bisect.bisect_left(self.lats, min_lat)
+        end = bisect.bisect_right(self.lats, max_lat)
+        return {position for _, lng, position in self.lat_entries[start:end] if min_lng <= lng <= max_lng}
+
+    def _text_matches(self, query: str, candidates: Optional[Set[int]]) -> Set[int]:
+        query = query.strip().lower()
+        if len(query) >= 3:
+            # Intersect the posting lists of the query's trigrams, rarest first
+            postings = sorted((self.grams.get(gram, ()) for gram in trigrams(query)), key=len)
+            found = set(postings[0])
+            for posting in postings[1:]:
+                found.intersection_update(posting)
+                if not found:
+                    break
+            if candidates is not None:
+                found &= candidates
+        else:
+            found = set(candidates if candidates is not None else self.all)
+        return {position for position in found if query in self.search_text[position]}
+
+    def query(self, params: Dict[str, List[str]]) -> List[int]:
+        """Positions of the venues matching every given filter, in data order."""
+        candidates = None
+        # Cheapest filters first: exact field matches, then bounding box, then text
+        for param in FILTER_FIELDS:
+            if params.get(param):
+                matches = self._field_matches(param, params[param])
+                candidates = matches if candidates is None else candidates & matches
+        if params.get('bbox'):
+            matches = self._bbox_matches(params['bbox'][0])
+            candidates = matches if candidates is None else candidates & matches
+        if params.get('q') and params['q'][0].strip():
+            candidates = self._text_matches(params['q'][0], candidates)
+        return sorted(candidates) if candidates is not None else list(self.all)
+
+    def facets(self) -> dict:
+        regions = defaultdict(set)
+        for venue in self.venues:
+            if venue.get('region') and venue.get('region') != 'Other':
+                regions[venue['region']].add(venue.get('county', 'Unknown'))
+        counts = defaultdict(lambda: defaultdict(int))
+        for venue in self.venues:
+            for param in ('type', 'county', 'region'):
+                counts[param][venue.get(FILTER_FIELDS[param]) or 'Unknown'] += 1
+        return {
+            'total': len(self.venues),
+            'version': self.version,
+            'types': dict(sorted(counts['type'].items())),
+            'counties': dict(sorted(counts['county'].items())),
+            'regions': {region: sorted(counties) for region, counties in sorted(regions.items())},
+            'regionCounts': dict(sorted(counts['region'].items())),
+        }
+
+
+class VenueServer:
+    """HTTP/1.1 front end: routing, ETags, gzip and CORS around a VenueCatalog."""
+
+    def __init__(self, data_file: str = VENUE_DATA_FILE):
+        self.data_file = data_file
+        self.catalog = None
+        self._stamp = None
+        self._responses = OrderedDict()
+        self.reload_if_changed()
+
+    def reload_if_changed(self):
+        """Rebuild the indexes when venue-data.js changes on disk."""
+        stat = os.stat(self.data_file)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._stamp:
+            start = time.perf_counter()
+            self.catalog = VenueCatalog.from_file(self.data_file)
+            self._stamp = stamp
+            self._responses.clear()
+            print(f"📁 Indexed {len(self.catalog.venues)} venues from {self.data_file} "
+                  f"in {(time.perf_counter() - start) * 1000:.0f}ms (version {self.catalog.version})")
+
+    def venues_payload(self, params: Dict[str, List[str]]) -> dict:
+        try:
+            offset = max(0, int(params.get('offset', ['0'])[0]))
+            limit = min(MAX_LIMIT, max(1, int(params.get('limit', [str(DEFAULT_LIMIT)])[0])))
+        except ValueError:
+            raise QueryError("offset and limit must be integers")
+
+        positions = self.catalog.query(params)
+        page = positions[offset:offset + limit]
+        return {
+            'total': len(positions),
+            'offset': offset,
+            'limit': limit,
+            'nextOffset': offset + limit if offset + limit < len(positions) else None,
+            'venues': [self.catalog.venues[position] for position in page],
+        }
+
+    def respond(self, method: str, target: str, headers: Dict[str, str]):
+        """Return (status, extra headers, body bytes) for one request."""
+        if method == 'OPTIONS':
+            return 204, {}, b''
+        if method not in ('GET', 'HEAD'):
+            return 405, {'Allow': 'GET, HEAD, OPTIONS'}, json.dumps({'error': 'method not allowed'}).encode()
+
+        url = urlsplit(target)
+        path = url.path.rstrip('/')
+        if path not in ('/api/venues', '/api/facets'):
+            return 404, {}, json.dumps({'error': f'unknown endpoint {url.path}'}).encode()
+
+        self.reload_if_changed()
+        params = parse_qs(url.query)
+        # Each value kept separate, so ?county=A&county=B and ?county=A,B (different results) differ
+        canonical = path + '?' + urlencode(sorted((key, value) for key, values in params.items() for value in values))
+        etag = f'W/"{self.catalog.version}-{hashlib.sha1(canonical.encode()).hexdigest()[:12]}"'
+
+        if_none_match = headers.get('if-none-match', '')
+        if if_none_match and (if_none_match.strip() == '*' or etag in [tag.strip() for tag in if_none_match.split(',')]):
+            return 304, {'ETag': etag}, b''
+
+        accepted = 'gzip' if 'gzip' in headers.get('accept-encoding', '') else 'identity'
+        # Keyed by the encoding asked for; small bodies are sent uncompressed either way
+        key = (etag, accepted)
+        cached = self._responses.get(key)
+        if cached is None:
+            try:
+                payload = self.catalog.facets() if path == '/api/facets' else self.venues_payload(params)
+            except QueryError as e:
+                return 400, {}, json.dumps({'error': str(e)}).encode()
+            body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+            encoding = 'identity'
+            if accepted == 'gzip' and len(body) >= GZIP_MIN_BYTES:
+                body = gzip.compress(body, compresslevel=5)
+                encoding = 'gzip'
+            cached = (body, encoding)
+            self._responses[key] = cached
+            if len(self._responses) > RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+        else:
+            self._responses.move_to_end(key)
+
+        body, encoding = cached
+        extra = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+        if encoding == 'gzip':
+            extra['Content-Encoding'] = 'gzip'
+        return 200, extra, body
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_SECONDS)
+                except asyncio.LimitOverrunError:
+                    # Headers longer than MAX_HEADER_BYTES: say why before hanging up
+                    await self.send(writer, 431, {}, b'{"error":"request headers too large"}', 'GET', False)
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    await self.send(writer, 400, {}, b'{"error":"bad request line"}', 'GET', False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                # Request bodies are not used; drain them so the connection stays in sync
+                try:
+                    length = int(headers.get('content-length', '0') or 0)
+                    if length < 0:
+                        raise ValueError
+                except ValueError:
+                    await self.send(writer, 400, {}, b'{"error":"bad content-length"}', 'GET', False)
+                    break
+                if length:
+                    await reader.readexactly(length)
+
+                keep_alive = (headers.get('connection', '').lower() != 'close' and
+                              (version == 'HTTP/1.1' or headers.get('connection', '').lower() == 'keep-alive'))
+                try:
+                    status, extra, body = self.respond(method.upper(), target, headers)
+                except Exception as e:  # keep serving other requests
+                    print(f"❌ Error handling {target}: {e}")
+                    status, extra, body = 500, {}, json.dumps({'error': 'internal error'}).encode()
+                await self.send(writer, status, extra, body, method.upper(), keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def send(self, writer, status: int, extra: dict, body: bytes, method: str, keep_alive: bool):
+        headers = {
+            'Content-Type': 'application/json; charset=utf-8',
+            'Content-Length': str(len(body)),
+            'Access-Control-Allow-Origin': '*',
+            'Access-Control-Allow-Methods': 'GET, HEAD, OPTIONS',
+            'Access-Control-Allow-Headers': 'If-None-Match',
+            'Access-Control-Expose-Headers': 'ETag',
+            'Connection': 'keep-alive' if keep_alive else 'close',
+        }
+        headers.update(extra)
+        if status in (204, 304):
+            headers.pop('Content-Length')
+            headers.pop('Content-Type')
+            body = b''
+        head = f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+        head += ''.join(f"{name}: {value}\r\n" for name, value in headers.items()) + '\r\n'
+        writer.write(head.encode('latin-1') + (body if method != 'HEAD' else b''))
+        await writer.drain()
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+        print(f"🚀 Venue API listening on http://{host}:{port}/api/venues")
+        async with server:
+            await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve filtered venue queries over HTTP")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="Interface to bind (default: %(default)s)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="Port to listen on (default: %(default)s)")
+    parser.add_argument('--data', default=VENUE_DATA_FILE, help="Venue data file (default: %(default)s)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(VenueServer(args.data).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Venue API stopped")
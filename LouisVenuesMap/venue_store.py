@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Shared loader and writer for the venue list in venue-data.js (the same data the map uses),
+and the optional SQLite venue database. When venues.db exists it is the source
+of truth: stages update only the rows they change and regenerate_data.py
+exports from it instead of reading the CSV.
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import sqlite3
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pipeline_profile import stage
+from postcode_index import normalize_postcode
+from venue_record import CSV_COLUMNS, INTERNED_FIELDS, Venue, parse_coordinate, with_venue_ids
+
+VENUE_DATA_FILE = 'venue-data.js'
+VENUE_DB_FILE = 'venues.db'
+CSV_FILE = 'JW and Smirnoff Venues - Sheet1_with_coords.csv'
+
+# Spatial grid cell size (degrees) for the grid index
+GRID_DEGREES = 0.05
+GRID_COLUMNS = int(360 / GRID_DEGREES) + 1
+
+# Venue fields stored as columns (Venue attribute names); other CSV columns go in 'extra'
+VENUE_COLUMNS = list(CSV_COLUMNS) + ['region', 'latitude', 'longitude']
+
+# CSV columns a Venue holds itself
+_MODELLED_COLUMNS = set(CSV_COLUMNS.values()) | {'Latitude', 'Longitude'}
+
+# Bumped when the table layout changes (older files have to be re-imported)
+SCHEMA_VERSION = 2
+
+# Venues encoded per json call when writing venue-data.js
+WRITE_CHUNK = 1000
+
+
+def load_venue_data(path: str = VENUE_DATA_FILE, object_hook=None) -> list:
+    """Parse the VENUE_DATA array out of venue-data.js."""
+    with stage(f'read {path}'):
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        start = content.find('[')
+        end = content.rfind(']') + 1
+        if start < 0 or end <= start:
+            raise ValueError(f"Could not find the VENUE_DATA array in {path}")
+        return json.loads(content[start:end], object_hook=object_hook)
+
+
+def load_venues(path: str = VENUE_DATA_FILE) -> List[Venue]:
+    """venue-data.js as Venue records (each object is converted as it is parsed)."""
+    return load_venue_data(path, object_hook=Venue.from_json)
+
+
+def write_venue_data(venues: Iterable, comments: List[str], path: str = VENUE_DATA_FILE):
+    """
+    Write venue-data.js a chunk of venues at a time. The output is the same as
+    json.dumps(venues, indent=2) but the whole document is never held in memory.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n' + ''.join(f'// {comment}\n' for comment in comments) + 'const VENUE_DATA = [')
+        separator = '\n'
+        chunk = []
+        
+        def flush():
+            # Strip the chunk's own '[\n' and '\n]' so the chunks join into one array
+            f.write(separator + json.dumps(chunk, indent=2)[2:-2])
+            chunk.clear()
+        
+        for venue in venues:
+            chunk.append(venue.to_json() if isinstance(venue, Venue) else venue)
+            if len(chunk) == WRITE_CHUNK:
+                flush()
+                separator = ',\n'
+        if chunk:
+            flush()
+            separator = ',\n'
+        f.write('\n];\n' if separator != '\n' else '];\n')
+
+
+def venue_coordinates(venue) -> Optional[Tuple[float, float]]:
+    """(latitude, longitude) of a venue, or None if it has not been geocoded."""
+    lat, lng = venue.get('latitude'), venue.get('longitude')
+    if lat is None or lng is None:
+        return None
+    try:
+        return float(lat), float(lng)
+    except (TypeError, ValueError):
+        return None
+
+
+def grid_cell(lat: Optional[float], lng: Optional[float]) -> Optional[int]:
+    """Integer id of the GRID_DEGREES cell containing a point (row-major from the south-west)."""
+    if lat is None or lng is None:
+        return None
+    return int(math.floor((lat + 90) / GRID_DEGREES)) * GRID_COLUMNS + int(math.floor((lng + 180) / GRID_DEGREES))
+
+
+class VenueDatabase:
+    """
+    Venues in SQLite, keyed by their stable venue id (see venue_record.with_venue_ids)
+    and kept in sheet order, with indexes on postcode, county, type, account
+    manager and grid cell. Updates touch only the rows whose value actually changes.
+    """
+
+    SCHEMA = f"""
+        CREATE TABLE IF NOT EXISTS venues (
+            id INTEGER PRIMARY KEY,
+            position INTEGER NOT NULL,
+            {', '.join(f'{name} {"REAL" if name in ("latitude", "longitude") else "TEXT"}' for name in VENUE_COLUMNS)},
+            postcodeKey TEXT,
+            gridCell INTEGER,
+            extra TEXT
+        );
+        CREATE INDEX IF NOT EXISTS venues_position ON venues(position);
+        CREATE INDEX IF NOT EXISTS venues_postcode ON venues(postcodeKey);
+        CREATE INDEX IF NOT EXISTS venues_county ON venues(county);
+        CREATE INDEX IF NOT EXISTS venues_type ON venues(type);
+        CREATE INDEX IF NOT EXISTS venues_manager ON venues(accountManager COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS venues_grid ON venues(gridCell);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    """
+
+    def __init__(self, path: str = VENUE_DB_FILE, recreate: bool = False):
+        """Open (or create) the database; recreate drops an old layout so it can be re-imported."""
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+        # Databases from before the version was recorded are 0 too, but have a venues table without ids
+        columns = {row[1] for row in self.connection.execute('PRAGMA table_info(venues)')}
+        if version not in (0, SCHEMA_VERSION) or (columns and 'id' not in columns):
+            if not recreate:
+                self.connection.close()
+                raise RuntimeError(f"{path} has an old layout (version {version}); "
+                                   f"re-create it with: python3 venue_store.py --import-csv")
+            self.connection.executescript('DROP TABLE IF EXISTS venues; DROP TABLE IF EXISTS meta;')
+        self.connection.executescript(self.SCHEMA)
+        self.connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    @staticmethod
+    def exists(path: str = VENUE_DB_FILE) -> bool:
+        return os.path.exists(path)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if exc[0] is None:
+            self.connection.commit()
+        self.close()
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM venues').fetchone()[0]
+
+    # Import / export
+
+    def import_csv(self, csv_path: str = CSV_FILE) -> int:
+        """Replace the database contents with the sheet."""
+        with open(csv_path, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            fieldnames = reader.fieldnames or []
+            with self.connection:
+                self.connection.execute('DELETE FROM venues')
+                self.set_fieldnames(fieldnames)
+                self.upsert((position, Venue.from_csv_row(row, venue_id), extra_columns(row))
+                            for position, (venue_id, row) in enumerate(with_venue_ids(reader)))
+        return len(self)
+
+    def export_csv(self, csv_path: str = CSV_FILE) -> int:
+        """Write the sheet back out with its original columns."""
+        fieldnames = self.fieldnames()
+        count = 0
+        with open(csv_path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction='ignore')
+            writer.writeheader()
+            for _, row in self.sheet_rows():
+                writer.writerow(row)
+                count += 1
+        return count
+
+    def fieldnames(self) -> List[str]:
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'fieldnames'").fetchone()
+        return json.loads(row[0]) if row else list(CSV_COLUMNS.values()) + ['Latitude', 'Longitude']
+
+    def set_fieldnames(self, fieldnames: List[str]):
+        self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('fieldnames', ?)", (json.dumps(fieldnames),))
+
+    # Reads
+
+    def venues(self, where: str = '', params: Tuple = ()) -> Iterator[Venue]:
+        """Venues in sheet order, optionally filtered by an SQL condition."""
+        for venue, _ in self._venues_with_extra(where, params):
+            yield venue
+
+    def sheet_rows(self, where: str = '', params: Tuple = ()) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """(venue id, CSV row) in sheet order, with the columns the database does not model."""
+        for venue, extra in self._venues_with_extra(where, params):
+            row = venue.to_csv_row()
+            row.update(extra)
+            yield venue.id, row
+
+    def _venues_with_extra(self, where: str = '', params: Tuple = ()):
+        query = f"SELECT id, {', '.join(VENUE_COLUMNS)}, extra FROM venues"
+        if where:
+            query += f" WHERE {where}"
+        text_fields = [(name, name in INTERNED_FIELDS) for name in CSV_COLUMNS]
+        intern = sys.intern
+        for row in self.connection.execute(query + " ORDER BY position", params):
+            # Slots filled directly as in Venue.from_csv_row; zip stops after the CSV fields
+            venue = Venue.__new__(Venue)
+            venue.id = row[0]
+            for (name, interned), value in zip(text_fields, row[1:]):
+                value = value or ''
+                setattr(venue, name, intern(value) if interned else value)
+            region, venue.latitude, venue.longitude = row[-4:-1]
+            venue.region = intern(region) if region else None
+            venue.fullAddress = None
+            yield venue, json.loads(row[-1]) if row[-1] else {}
+
+    def column(self, name: str, where: str = '', params: Tuple = ()) -> Dict[int, object]:
+        """venue id -> value for one column."""
+        return dict(self.rows(name, where=where, params=params))
+
+    def rows(self, *names: str, where: str = '', params: Tuple = ()) -> List[tuple]:
+        """(venue id, *values) tuples for a few columns, in sheet order."""
+        for name in names:
+            if name not in VENUE_COLUMNS:
+                raise ValueError(f"Unknown venue column: {name}")
+        query = f"SELECT id, {', '.join(names)} FROM venues" + (f" WHERE {where}" if where else '')
+        return self.connection.execute(query + " ORDER BY position", params).fetchall()
+
+    def counts(self, name: str) -> List[Tuple[str, int]]:
+        """(value, venue count) for one column, most common first."""
+        if name not in VENUE_COLUMNS:
+            raise ValueError(f"Unknown venue column: {name}")
+        return self.connection.execute(
+            f"SELECT {name}, COUNT(*) AS n FROM venues GROUP BY {name} ORDER BY n DESC, {name}").fetchall()
+
+    def find(self, postcode: Optional[str] = None, county: Optional[str] = None, venue_type: Optional[str] = None,
+             manager: Optional[str] = None, bbox: Optional[Tuple[float, float, float, float]] = None) -> List[Venue]:
+        """Venues matching every given filter (bbox = min_lat, min_lng, max_lat, max_lng), using the indexes."""
+        conditions, params = [], []
+        if postcode:
+            conditions.append('postcodeKey = ?')
+            params.append(normalize_postcode(postcode))
+        if county:
+            conditions.append('county = ?')
+            params.append(county)
+        if venue_type:
+            conditions.append('type = ?')
+            params.append(venue_type)
+        if manager:
+            conditions.append('accountManager = ? COLLATE NOCASE')
+            params.append(manager)
+        if bbox:
+            min_lat, min_lng, max_lat, max_lng = bbox
+            south_west, north_east = grid_cell(min_lat, min_lng), grid_cell(max_lat, max_lng)
+            first_column, last_column = south_west % GRID_COLUMNS, north_east % GRID_COLUMNS
+            # One indexed range per grid row, then the exact box
+            ranges = [(row * GRID_COLUMNS + first_column, row * GRID_COLUMNS + last_column)
+                      for row in range(south_west // GRID_COLUMNS, north_east // GRID_COLUMNS + 1)]
+            conditions.append('(' + ' OR '.join('gridCell BETWEEN ? AND ?' for _ in ranges) + ')')
+            params.extend(value for cell_range in ranges for value in cell_range)
+            conditions.append('latitude BETWEEN ? AND ? AND longitude BETWEEN ? AND ?')
+            params.extend([min_lat, max_lat, min_lng, max_lng])
+        return list(self.venues(' AND '.join(conditions), tuple(params)))
+
+    # Writes
+
+    def upsert(self, rows: Iterable[Tuple[int, Venue, Dict[str, str]]]) -> int:
+        """Insert or replace whole venues, keyed by venue.id: (sheet position, venue, extra CSV columns)."""
+        columns = ['id', 'position'] + VENUE_COLUMNS + ['postcodeKey', 'gridCell', 'extra']
+        updates = ', '.join(f'{name} = excluded.{name}' for name in columns[1:])
+        before = self.connection.total_changes
+        self.connection.executemany(
+            f"INSERT INTO venues ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}",
+            ([venue.id, position] + [getattr(venue, name) for name in VENUE_COLUMNS] +
+             [normalize_postcode(venue.postCode), grid_cell(venue.latitude, venue.longitude),
+              json.dumps(extra) if extra else None]
+             for position, venue, extra in rows))
+        return self.connection.total_changes - before
+
+    def update_column(self, name: str, values: Dict[int, object]) -> int:
+        """Set one column for the given venue ids; rows that already hold the value are not written."""
+        if name not in VENUE_COLUMNS or name in ('latitude', 'longitude'):
+            raise ValueError(f"Use set_coordinates for coordinates; unknown column: {name}")
+        extra_set = ', postcodeKey = ?' if name == 'postCode' else ''
+        before = self.connection.total_changes
+        with self.connection:
+            self.connection.executemany(
+                f"UPDATE venues SET {name} = ?{extra_set} WHERE id = ? AND {name} IS NOT ?",
+                ((value, normalize_postcode(value), venue_id, value) if extra_set else (value, venue_id, value)
+                 for venue_id, value in values.items()))
+        return self.connection.total_changes - before
+
+    def set_coordinates(self, values: Dict[int, Tuple[Optional[float], Optional[float]]]) -> int:
+        """Set (or with (None, None) clear) coordinates for the given venue ids, keeping the grid cell in step."""
+        before = self.connection.total_changes
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE venues SET latitude = ?, longitude = ?, gridCell = ? "
+                "WHERE id = ? AND (latitude IS NOT ? OR longitude IS NOT ?)",
+                ((lat, lng, grid_cell(lat, lng), venue_id, lat, lng)
+                 for venue_id, (lat, lng) in ((i, (parse_coordinate(a), parse_coordinate(b)))
+                                              for i, (a, b) in values.items())))
+        return self.connection.total_changes - before
+
+    def set_positions(self, positions: Dict[int, int]) -> int:
+        """Move venues to their new place in the sheet order (only those that moved are written)."""
+        before = self.connection.total_changes
+        self.connection.executemany("UPDATE venues SET position = ? WHERE id = ? AND position IS NOT ?",
+                                    ((position, venue_id, position) for venue_id, position in positions.items()))
+        return self.connection.total_changes - before
+
+    def delete(self, venue_ids: Iterable[int]) -> int:
+        before = self.connection.total_changes
+        self.connection.executemany("DELETE FROM venues WHERE id = ?", ((venue_id,) for venue_id in venue_ids))
+        return self.connection.total_changes - before
+
+
+def id_condition(venue_ids: Iterable[int]) -> Tuple[str, Tuple]:
+    """WHERE clause (and parameters) matching a set of venue ids, passed as one JSON array."""
+    return 'id IN (SELECT value FROM json_each(?))', (json.dumps(sorted(venue_ids)),)
+
+
+def extra_columns(row: Dict[str, str]) -> Dict[str, str]:
+    """The non-empty CSV columns a Venue does not model (kept in the database's 'extra' column)."""
+    return {column: value for column, value in row.items()
+            if column not in _MODELLED_COLUMNS and column is not None and value}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the SQLite venue database")
+    parser.add_argument('--import-csv', nargs='?', const=CSV_FILE, metavar='CSV',
+                        help="(Re)create venues.db from the sheet (default: %(const)s)")
+    parser.add_argument('--export-csv', nargs='?', const=CSV_FILE, metavar='CSV',
+                        help="Write the database back out as the sheet (default: %(const)s)")
+    parser.add_argument('--postcode', help="Show venues with this postcode")
+    parser.add_argument('--county', help="Show venues in this county")
+    parser.add_argument('--type', help="Show venues of this type")
+    parser.add_argument('--manager', help="Show venues for this account manager")
+    parser.add_argument('--bbox', type=float, nargs=4, metavar=('MIN_LAT', 'MIN_LNG', 'MAX_LAT', 'MAX_LNG'),
+                        help="Show venues inside this box")
+    parser.add_argument('--db', default=VENUE_DB_FILE, help="Database file (default: %(default)s)")
+    args = parser.parse_args()
+
+    with VenueDatabase(args.db, recreate=bool(args.import_csv)) as db:
+        if args.import_csv:
+            print(f"🗄️  Imported {db.import_csv(args.import_csv)} venues from {args.import_csv} into {args.db}")
+        if args.export_csv:
+            print(f"📁 Exported {db.export_csv(args.export_csv)} venues to {args.export_csv}")
+        if any([args.postcode, args.county, args.type, args.manager, args.bbox]):
+            matches = db.find(args.postcode, args.county, args.type, args.manager, args.bbox)
+            print(f"🔍 {len(matches)} venues")
+            for venue in matches[:20]:
+                print(f"  {venue.id:>6}  {venue.get('name')[:40]:<40} {venue.postCode:<9} {venue.get('county'):<20} "
+                      f"{venue.get('type'):<9} {venue.accountManager}")
+            if len(matches) > 20:
+                print(f"  ... and {len(matches) - 20} more")
@@ -0,0 +1 @@
+"""Code shared by the projects in this repository."""
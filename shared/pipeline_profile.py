@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling for the pipeline scripts of every project in this repository
+(each project's pipeline_profile.py re-exports this module).
+Scripts mark their stages with `with stage('read CSV'):`, which costs nothing
+unless profiling is on. With --profile (or PIPELINE_PROFILE set, which child
+scripts inherit) each run writes to the profile directory:
+  <script>.pstats      cProfile data (open with pstats or snakeviz)
+  <script>.collapsed   sampled call stacks, one 'frame;frame count' line per
+                       stack, for flamegraph.pl / speedscope / inferno
+  <script>-stages.json per-stage wall/CPU time, tracemalloc peak, peak RSS
+                       and top allocations
+Stages that run many times (e.g. once per file) only take tracemalloc
+snapshots on their first call, so they stay cheap. Any script can also be
+profiled unmodified, from its project folder:
+  python3 pipeline_profile.py some_script.py [its arguments]
+"""
+
+import argparse
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import runpy
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROFILE_DIR = 'profiles'
+
+# Set to the profile directory while profiling; inherited by child scripts
+PROFILE_ENV = 'PIPELINE_PROFILE'
+
+# Seconds between call-stack samples
+SAMPLE_INTERVAL = 0.005
+
+# Allocation sites reported per stage
+TOP_ALLOCATIONS = 10
+
+# Frames tracemalloc keeps per allocation
+TRACEMALLOC_FRAMES = 1
+
+_active = None
+
+
+def read_rss_kb(field: str) -> Optional[int]:
+    """VmRSS / VmHWM from /proc (Linux only)."""
+    try:
+        with open('/proc/self/status', 'r') as f:
+            match = re.search(rf'^{field}:\s+(\d+) kB', f.read(), re.MULTILINE)
+        return int(match.group(1)) if match else None
+    except OSError:
+        return None
+
+
+def reset_peak_rss() -> bool:
+    """Reset the kernel's peak RSS counter so each stage gets its own peak (Linux only)."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def max_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1e6 if sys.platform == 'darwin' else rss * 1024 / 1e6
+
+
+class StackSampler(threading.Thread):
+    """Samples the main thread's call stack every interval and counts collapsed stacks."""
+
+    def __init__(self, profiler, interval: float = SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.profiler = profiler
+        self.interval = interval
+        self.thread_id = threading.main_thread().ident
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+
+    def run(self):
+        own_file = os.path.abspath(__file__)
+        while not self.stopped.wait(self.interval):
+            if self.profiler.paused:
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                if os.path.abspath(code.co_filename) != own_file:
+                    frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stage_frames = [f"[{name}]" for name in self.profiler.stage_stack]
+            self.stacks[';'.join([self.profiler.script] + stage_frames + frames[::-1])] += 1
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+class PipelineProfiler:
+    def __init__(self, script: str, output_dir: str = PROFILE_DIR, interval: float = SAMPLE_INTERVAL):
+        self.script = script
+        self.output_dir = output_dir
+        self.interval = interval
+        self.stages: Dict[str, dict] = {}
+        self.stage_stack: List[str] = []
+        self.child_peaks: List[list] = []
+        self.paused = False
+        self.profile = cProfile.Profile()
+        self.sampler = None
+        self._start = None
+        self._cpu_start = None
+
+    def start(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        self.per_stage_rss = reset_peak_rss()
+        self._start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self.sampler = StackSampler(self, self.interval)
+        self.sampler.start()
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+        self.sampler.stop()
+        total = {
+            'stage': '(whole run)',
+            'seconds': round(time.perf_counter() - self._start, 4),
+            'cpu_seconds': round(time.process_time() - self._cpu_start, 4),
+            'tracemalloc_peak_mb': round(max([tracemalloc.get_traced_memory()[1] / 1e6] +
+                                             [row['tracemalloc_peak_mb'] for row in self.stages.values()]), 2),
+            # Resetting VmHWM also lowers ru_maxrss, so include the stage peaks
+            'peak_rss_mb': round(max([max_rss_mb()] + [row['peak_rss_mb'] for row in self.stages.values()]), 1),
+        }
+        tracemalloc.stop()
+        self.write(total)
+
+    def peak_rss_mb(self) -> float:
+        if self.per_stage_rss:
+            return read_rss_kb('VmHWM') * 1024 / 1e6
+        return max_rss_mb()
+
+    @contextmanager
+    def stage(self, name: str):
+        # Nested stages reset the peaks, so each stage carries its children's peaks up to its parent
+        self.pause()
+        self.stage_stack.append(name)
+        self.child_peaks.append([0, 0.0])
+        # Top allocations are only kept for a stage's first call, so repeated stages skip the snapshots
+        before = tracemalloc.take_snapshot() if '/'.join(self.stage_stack) not in self.stages else None
+        tracemalloc.reset_peak()
+        if self.per_stage_rss:
+            reset_peak_rss()
+        self.resume()
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            cpu_seconds = time.process_time() - cpu_start
+            self.pause()
+            child_peak, child_rss = self.child_peaks.pop()
+            peak = max(tracemalloc.get_traced_memory()[1], child_peak)
+            peak_rss = max(self.peak_rss_mb(), child_rss)
+            if self.child_peaks:
+                parent = self.child_peaks[-1]
+                parent[0], parent[1] = max(parent[0], peak), max(parent[1], peak_rss)
+            top = tracemalloc.take_snapshot().compare_to(before, 'lineno')[:TOP_ALLOCATIONS] if before else []
+            self.record_stage('/'.join(self.stage_stack), seconds, cpu_seconds, peak, peak_rss, top)
+            self.stage_stack.pop()
+            self.resume()
+
+    def record_stage(self, path: str, seconds: float, cpu_seconds: float, peak: int, peak_rss: float, top):
+        """Stages that run repeatedly (e.g. once per file) are summed into one row."""
+        row = self.stages.get(path)
+        if row is None:
+            row = self.stages[path] = {'stage': path, 'calls': 0, 'seconds': 0.0, 'cpu_seconds': 0.0,
+                                       'tracemalloc_peak_mb': 0.0, 'peak_rss_mb': 0.0, 'rss_mb': 0.0,
+                                       'top_allocations': []}
+        row['calls'] += 1
+        row['seconds'] = round(row['seconds'] + seconds, 4)
+        row['cpu_seconds'] = round(row['cpu_seconds'] + cpu_seconds, 4)
+        row['tracemalloc_peak_mb'] = max(row['tracemalloc_peak_mb'], round(peak / 1e6, 2))
+        row['peak_rss_mb'] = max(row['peak_rss_mb'], round(peak_rss, 1))
+        row['rss_mb'] = round((read_rss_kb('VmRSS') or 0) * 1024 / 1e6, 1)
+        if row['calls'] == 1:
+            row['top_allocations'] = [
+                {'site': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                 'size_diff_mb': round(stat.size_diff / 1e6, 3), 'count_diff': stat.count_diff}
+                for stat in top if stat.size_diff > 0
+            ]
+
+    def pause(self):
+        """Keep the profiler's own bookkeeping out of cProfile and the samples."""
+        self.profile.disable()
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+        self.profile.enable()
+
+    def write(self, total: dict):
+        base = os.path.join(self.output_dir, self.script)
+        self.profile.dump_stats(f"{base}.pstats")
+        with open(f"{base}.collapsed", 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.sampler.stacks.items()):
+                f.write(f"{stack} {count}\n")
+        with open(f"{base}-stages.json", 'w', encoding='utf-8') as f:
+            json.dump({'script': self.script, 'per_stage_peak_rss': self.per_stage_rss,
+                       'stages': list(self.stages.values()) + [total]}, f, indent=2)
+        self.print_report(total)
+
+    def print_report(self, total: dict):
+        print(f"\n⏱️  Profile of {self.script} ({sum(self.sampler.stacks.values())} samples)", file=sys.stderr)
+        print(f"  {'stage':<36}{'calls':>7}{'wall':>9}{'cpu':>9}{'py peak':>11}{'peak RSS':>11}", file=sys.stderr)
+        for row in list(self.stages.values()) + [total]:
+            print(f"  {row['stage'][:36]:<36}{row.get('calls', 1):>7}{row['seconds']:>8.2f}s{row['cpu_seconds']:>8.2f}s"
+                  f"{row['tracemalloc_peak_mb']:>8.1f} MB{row['peak_rss_mb']:>8.1f} MB", file=sys.stderr)
+
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats('cumulative').print_stats(15)
+        print('\n'.join(line for line in stream.getvalue().splitlines()[-20:] if line.strip()), file=sys.stderr)
+        base = os.path.join(self.output_dir, self.script)
+        print(f"📁 {base}.pstats, {base}.collapsed (flame graph), {base}-stages.json", file=sys.stderr)
+
+
+@contextmanager
+def stage(name: str):
+    """Time a pipeline stage when profiling is on (a no-op otherwise)."""
+    if _active is None:
+        yield
+    else:
+        with _active.stage(name):
+            yield
+
+
+@contextmanager
+def profiling(script: str, enabled: bool = False, output_dir: Optional[str] = None):
+    """Profile the enclosed block if enabled or PIPELINE_PROFILE is set."""
+    global _active
+    output_dir = output_dir or os.environ.get(PROFILE_ENV)
+    if not (enabled or output_dir) or _active is not None:
+        yield None
+        return
+
+    output_dir = output_dir or PROFILE_DIR
+    previous_env = os.environ.get(PROFILE_ENV)
+    os.environ[PROFILE_ENV] = os.path.abspath(output_dir)
+    _active = PipelineProfiler(script, output_dir)
+    _active.start()
+    try:
+        yield _active
+    finally:
+        profiler, _active = _active, None
+        profiler.stop()
+        if previous_env is None:
+            os.environ.pop(PROFILE_ENV, None)
+
+
+def add_profile_argument(parser: argparse.ArgumentParser):
+    parser.add_argument('--profile', action='store_true',
+                        help=f"Profile the run: per-stage timings, cProfile, memory and a flame graph in {PROFILE_DIR}/")
+
+
+def script_name(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile a pipeline script without modifying it")
+    parser.add_argument('--output-dir', default=PROFILE_DIR, help="Profile output directory (default: %(default)s)")
+    parser.add_argument('script', help="Script to run, e.g. regenerate_data.py or PrepareDataset.py")
+    parser.add_argument('args', nargs=argparse.REMAINDER, help="Arguments passed to the script")
+    args = parser.parse_args()
+
+    sys.argv = [args.script] + args.args
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.script)))
+    with profiling(script_name(args.script), True, args.output_dir):
+        with stage('run'):
+            runpy.run_path(args.script, run_name='__main__')
+
+
+if __name__ == "__main__":
+    main()